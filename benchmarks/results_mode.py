@@ -0,0 +1,79 @@
+"""
+Result conversion benchmark: `ldap3` Entries (`result_mode="entries"`) vs. `conn.response` (`result_mode="raw"`).
+Runs against the `ldap3` MOCK_SYNC strategy with a synthetic directory, no server is required.
+Only the conversion of a search result is timed, the (mock) search itself is excluded.
+
+    python benchmarks/results_mode.py --objects 5000 --repeat 5
+"""
+
+import argparse, statistics, time
+from ldap3 import MOCK_SYNC, OFFLINE_AD_2012_R2, SUBTREE, Connection, Server
+from tinyLDAP3.results import ldap_entries_to_items, ldap_response_to_items
+
+
+SEARCH_BASE = "DC=example,DC=com"
+RETURNED_ATTRS_TUPLE = (
+    "cn", "department", "displayName", "distinguishedName", "mail", "memberOf", "mobile", "sAMAccountName",
+    "title", "userAccountControl", "whenChanged", "whenCreated",
+)
+
+
+def populate(conn: Connection, objects: int) -> None:
+    for i in range(objects):
+        dn = f"CN=user{i},OU=Users,{SEARCH_BASE}"
+        conn.strategy.add_entry(dn, {
+            "objectClass": ["top", "person", "organizationalPerson", "user"],
+            "objectCategory": "Person",
+            "cn": f"user{i}",
+            "department": f"Department {i % 50}",
+            "displayName": f"User {i}",
+            "distinguishedName": dn,
+            "mail": f"user{i}@example.com",
+            "memberOf": [f"CN=group{j},OU=Groups,{SEARCH_BASE}" for j in range(i % 10)],
+            "mobile": f"+1555{i:07d}",
+            "sAMAccountName": f"user{i:06d}",
+            "title": "Engineer",
+            "userAccountControl": 512,
+            "whenChanged": "20240101000000.0Z",
+            "whenCreated": "20200101000000.0Z",
+        })
+
+
+def measure(conn: Connection, convert, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        # A new search resets the Entries built by the previous conversion
+        conn.search(SEARCH_BASE, "(objectCategory=Person)", SUBTREE, attributes=RETURNED_ATTRS_TUPLE)
+        started_at = time.perf_counter()
+        convert(conn)
+        timings.append(time.perf_counter() - started_at)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    server = Server("benchmark", get_info=OFFLINE_AD_2012_R2)
+    conn = Connection(server, user=f"CN=svc,{SEARCH_BASE}", password="pass", client_strategy=MOCK_SYNC)
+    conn.strategy.add_entry(f"CN=svc,{SEARCH_BASE}", {"userPassword": "pass", "objectClass": ["top", "person"]})
+    populate(conn, args.objects)
+    conn.bind()
+
+    results = {
+        "entries": measure(conn, lambda c: ldap_entries_to_items(c.entries), args.repeat),
+        "raw": measure(conn, lambda c: ldap_response_to_items(c.response), args.repeat),
+    }
+    for mode, timings in results.items():
+        median = statistics.median(timings)
+        print(
+            f"{mode:<8} objects: {args.objects:>7}  median: {median * 1000:9.2f} ms  "
+            f"per object: {median / args.objects * 1e6:7.2f} us"
+        )
+    print(f"speedup: {statistics.median(results['entries']) / statistics.median(results['raw']):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,516 @@
+"""
+Public methods benchmark suite: throughput, latency and memory of `tinyLDAP3Client` & `AsyncTinyLDAP3Client`
+methods against the `ldap3` MOCK_SYNC / MOCK_ASYNC strategies with a synthetic AD-like directory, no server is
+required. The directory is generated from the seed: persons with realistic attributes (30% with a `thumbnailPhoto`),
+groups nested up to 4 levels, computers. The default scale is 100k persons, 10k groups and 10k computers.
+
+Mock searches scan the whole directory, so the latency is dominated by the mock server: `mock_search` is the
+same filter searched on a raw `ldap3` connection, the difference is the client overhead. `iter_attr_values` and
+`replica_sync` aren't benchmarked: the mock doesn't return ranged attributes nor decode the Show Deleted control.
+Mock binds are DN based, so `person_auth` measures the rejected UPN bind path.
+
+Results are saved as JSON, `--compare` prints the median latency ratio against a saved result:
+
+    python benchmarks/suite.py --scale 0.1 --iterations 50
+    python benchmarks/suite.py --scale 0.1 --iterations 50 --compare benchmarks/results/suite-0.2.6-....json
+"""
+
+import argparse, asyncio, contextlib, datetime, gc, json, os, platform, random, statistics, sys, time, tracemalloc
+import ldap3
+from importlib import metadata
+from ldap3 import ASYNC, MOCK_ASYNC, MOCK_SYNC, OFFLINE_AD_2012_R2, SUBTREE, Connection, Server
+from typing import Any, Awaitable, Callable, Optional
+import tinyLDAP3.aio
+import tinyLDAP3.client
+from tinyLDAP3 import AsyncTinyLDAP3Client, tinyLDAP3Client
+
+
+HOST = "benchmark"
+SEARCH_BASE = "DC=example,DC=com"
+SERVICE_DN = f"CN=svc,OU=Service,{SEARCH_BASE}"
+SERVICE_PASS = "Benchmark-Pass-1"
+
+PERSONS, GROUPS, COMPUTERS = 100000, 10000, 10000
+# Share of persons with a photo and the photo size range (bytes)
+PHOTO_SHARE, PHOTO_SIZE = 0.3, (4096, 20480)
+# Groups per person, group nesting: a group is a member of its parent up to the depth
+PERSON_GROUPS, GROUP_FANOUT = 3, 10
+
+PERSON_RETURNED_ATTRS_TUPLE = (
+    "cn", "department", "displayName", "mail", "memberOf", "mobile", "sAMAccountName", "telephoneNumber",
+    "thumbnailPhoto", "title", "userAccountControl", "userPrincipalName", "whenChanged", "whenCreated",
+)
+SEARCH_RETURNED_ATTRS_TUPLE = ("displayName", "mail", "sAMAccountName")
+SEARCH_BY_ATTRS_TUPLE = ("sAMAccountName",)
+
+
+class Directory:
+
+    """
+        Synthetic directory: the mock server (its DIT is shared by all mock connections) and the generated DNs.
+        """
+
+    def __init__(self, scale: float, seed: int):
+        self.rng = random.Random(seed)
+        self.persons = max(int(PERSONS * scale), 10)
+        self.groups = max(int(GROUPS * scale), GROUP_FANOUT)
+        self.computers = max(int(COMPUTERS * scale), 1)
+        self.server = Server(HOST, get_info=OFFLINE_AD_2012_R2)
+        self.photo_bytes = 0
+
+    @staticmethod
+    def person_dn(i: int) -> str:
+        return f"CN=user{i},OU=Users,{SEARCH_BASE}"
+
+    @staticmethod
+    def group_dn(i: int) -> str:
+        return f"CN=group{i},OU=Groups,{SEARCH_BASE}"
+
+    @staticmethod
+    def computer_dn(i: int) -> str:
+        return f"CN=ws{i:06d},OU=Computers,{SEARCH_BASE}"
+
+    def __object(self, dn: str, usn: int, **attrs) -> dict[str, Any]:
+        return {
+            "distinguishedName": dn,
+            "objectGUID": self.rng.randbytes(16),
+            "uSNChanged": usn,
+            "whenCreated": "20200101000000.0Z",
+            "whenChanged": f"2024{self.rng.randint(1, 12):02d}{self.rng.randint(1, 28):02d}000000.0Z",
+            **attrs
+        }
+
+    def populate(self) -> float:
+
+        """
+        Add the objects to the mock DIT.
+        :return:                            Load Time (sec.)
+        """
+
+        started = time.perf_counter()
+        conn = Connection(self.server, user=SERVICE_DN, password=SERVICE_PASS, client_strategy=MOCK_SYNC)
+        conn.strategy.add_entry(SERVICE_DN, {"userPassword": SERVICE_PASS, "objectClass": ["top", "person", "user"]})
+        members: dict[int, list[str]] = {i: [] for i in range(self.groups)}
+        member_of: dict[int, list[str]] = {}
+        for i in range(self.persons):
+            groups = self.rng.sample(range(self.groups), PERSON_GROUPS)
+            member_of[i] = [self.group_dn(g) for g in groups]
+            for g in groups:
+                members[g].append(self.person_dn(i))
+        # Group `i` is a member of the group `i // GROUP_FANOUT` (the root groups are `0..GROUP_FANOUT - 1`)
+        for i in range(GROUP_FANOUT, self.groups):
+            members[i // GROUP_FANOUT].append(self.group_dn(i))
+        usn = 1000
+        for i in range(self.persons):
+            usn += 1
+            photo = b""
+            if self.rng.random() < PHOTO_SHARE:
+                photo = self.rng.randbytes(self.rng.randint(*PHOTO_SIZE))
+                self.photo_bytes += len(photo)
+            conn.strategy.add_entry(self.person_dn(i), self.__object(
+                self.person_dn(i), usn,
+                objectClass=["top", "person", "organizationalPerson", "user"],
+                objectCategory="Person",
+                cn=f"user{i}",
+                sAMAccountName=f"user{i:06d}",
+                userPrincipalName=f"user{i:06d}@example.com",
+                mail=f"user{i:06d}@example.com",
+                displayName=f"User {i} {self.rng.choice(('Smith', 'Jones', 'Taylor', 'Brown', 'Wilson'))}",
+                department=f"Department {i % 50}",
+                title=self.rng.choice(("Engineer", "Analyst", "Manager", "Accountant", "Consultant")),
+                mobile=f"+1555{i:07d}",
+                telephoneNumber=f"+1444{i:07d}",
+                employeeNumber=str(100000 + i),
+                userAccountControl=514 if i % 20 == 0 else 512,
+                memberOf=member_of[i],
+                thumbnailPhoto=photo or [],
+            ))
+        for i in range(self.groups):
+            usn += 1
+            conn.strategy.add_entry(self.group_dn(i), self.__object(
+                self.group_dn(i), usn,
+                objectClass=["top", "group"],
+                objectCategory="Group",
+                cn=f"group{i}",
+                sAMAccountName=f"group{i}",
+                description=f"Synthetic group {i}",
+                member=members[i],
+                memberOf=[self.group_dn(i // GROUP_FANOUT)] if i >= GROUP_FANOUT else [],
+            ))
+        for i in range(self.computers):
+            usn += 1
+            conn.strategy.add_entry(self.computer_dn(i), self.__object(
+                self.computer_dn(i), usn,
+                objectClass=["top", "person", "organizationalPerson", "user", "computer"],
+                objectCategory="Computer",
+                cn=f"ws{i:06d}",
+                sAMAccountName=f"WS{i:06d}$",
+                dNSHostName=f"ws{i:06d}.example.com",
+                operatingSystem=self.rng.choice(("Windows 10 Enterprise", "Windows 11 Enterprise")),
+            ))
+        return time.perf_counter() - started
+
+
+@contextlib.contextmanager
+def mock_connections(directory: Directory):
+
+    """
+    Open the client connections to the mock server: ASYNC connections use MOCK_ASYNC, others MOCK_SYNC.
+    :param directory:                   Synthetic Directory
+    :return:
+    """
+
+    def mock_connection(server: Server, **kwargs) -> Connection:
+        kwargs["client_strategy"] = MOCK_ASYNC if kwargs.get("client_strategy") == ASYNC else MOCK_SYNC
+        return Connection(directory.server, **kwargs)
+
+    modules = (tinyLDAP3.client, tinyLDAP3.aio)
+    for module in modules:
+        module.Connection = mock_connection
+    try:
+        yield
+    finally:
+        for module in modules:
+            module.Connection = Connection
+
+
+def summary(timings: list[float]) -> dict[str, Any]:
+    timings = sorted(timings)
+
+    def quantile(q: float) -> float:
+        return timings[min(int(q * len(timings)), len(timings) - 1)]
+
+    total = sum(timings)
+    return {
+        "iterations": len(timings),
+        "throughput": len(timings) / total if total else None,
+        "latency": {
+            "mean": statistics.fmean(timings),
+            "p50": quantile(0.5),
+            "p95": quantile(0.95),
+            "p99": quantile(0.99),
+            "max": timings[-1],
+        },
+    }
+
+
+def measure(
+        call: Callable[[int], Any],
+        iterations: int,
+        warmup: int,
+        setup: Optional[Callable[[], Any]] = None
+) -> dict[str, Any]:
+
+    """
+    Time the calls, then measure the peak of traced memory allocations of a second run.
+    :param call:                        Callable Accepting the Iteration Number
+    :param iterations:                  Timed Calls
+    :param warmup:                      Untimed Calls Before
+    :param setup:                       Untimed Callable Before Each Call or None
+    :return:
+    """
+
+    for i in range(warmup):
+        if setup is not None:
+            setup()
+        call(i)
+    timings = []
+    for i in range(iterations):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        call(i)
+        timings.append(time.perf_counter() - started)
+    result = summary(timings)
+    # Allocations are traced separately, tracing slows down the calls
+    calls = max(iterations // 5, 1)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for i in range(calls):
+            if setup is not None:
+                setup()
+            call(i)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    result["memory"] = {"peak_bytes": peak, "traced_calls": calls}
+    return result
+
+
+def sync_benchmarks(directory: Directory, client: tinyLDAP3Client) -> dict[str, tuple[Callable, Optional[Callable]]]:
+
+    """
+    Benchmarked calls of the sync client by name: (call, setup or None).
+    :param directory:                   Synthetic Directory
+    :param client:                      Client
+    :return:
+    """
+
+    rng = random.Random(directory.rng.random())
+    persons = [rng.randrange(directory.persons) for _ in range(10000)]
+    raw = Connection(directory.server, user=SERVICE_DN, password=SERVICE_PASS, client_strategy=MOCK_SYNC)
+    raw.bind()
+
+    def person(i: int) -> int:
+        return persons[i % len(persons)]
+
+    def mock_search(i: int) -> None:
+        raw.search(
+            SEARCH_BASE,
+            f"(&(objectCategory=Person)(objectClass=User)(sAMAccountName=user{person(i):06d}))",
+            SUBTREE,
+            attributes=list(PERSON_RETURNED_ATTRS_TUPLE)
+        )
+
+    return {
+        "mock_search": (mock_search, None),
+        "object_detail": (
+            lambda i: client.object_detail(
+                "person", "sAMAccountName", f"user{person(i):06d}",
+                returned_attrs_collection=PERSON_RETURNED_ATTRS_TUPLE
+            ),
+            None
+        ),
+        "objects_detail_many": (
+            lambda i: client.objects_detail_many(
+                "person", "sAMAccountName", [f"user{person(i + j):06d}" for j in range(50)],
+                returned_attrs_collection=SEARCH_RETURNED_ATTRS_TUPLE
+            ),
+            None
+        ),
+        "object_read": (
+            lambda i: client.object_read(
+                ("user",), directory.person_dn(person(i)), returned_attrs_collection=PERSON_RETURNED_ATTRS_TUPLE
+            ),
+            None
+        ),
+        "object_read_many": (
+            lambda i: client.object_read_many(
+                ("user",), [directory.person_dn(person(i + j)) for j in range(50)],
+                returned_attrs_collection=SEARCH_RETURNED_ATTRS_TUPLE
+            ),
+            None
+        ),
+        "objects_search": (
+            lambda i: client.objects_search(
+                "person", f"user{person(i) // 100:04d}",
+                search_by_attrs_collection=SEARCH_BY_ATTRS_TUPLE,
+                returned_attrs_collection=SEARCH_RETURNED_ATTRS_TUPLE
+            ),
+            None
+        ),
+        "iter_objects_search": (
+            lambda i: [
+                page for page in client.iter_objects_search(
+                    "person", f"user{person(i) // 1000:03d}", page_size=200,
+                    search_by_attrs_collection=SEARCH_BY_ATTRS_TUPLE,
+                    returned_attrs_collection=SEARCH_RETURNED_ATTRS_TUPLE
+                )
+            ],
+            None
+        ),
+        # The membership graph is cleared before each call: cold expansions
+        "object_groups": (
+            lambda i: client.object_groups(directory.person_dn(person(i)), strategy="bfs"), client.cache_clear
+        ),
+        "group_members": (
+            lambda i: client.group_members(
+                directory.group_dn(GROUP_FANOUT + person(i) % (directory.groups - GROUP_FANOUT)), strategy="bfs"
+            ),
+            client.cache_clear
+        ),
+        "person_auth": (
+            lambda i: client.person_auth(
+                f"user{person(i):06d}@example.com", "Synthetic-Pass-1", returned_attrs_collection=("mail",)
+            ),
+            None
+        ),
+    }
+
+
+async def async_measure(call: Callable[[int], Awaitable[Any]], iterations: int, concurrency: int) -> dict[str, Any]:
+
+    """
+    Run the calls with the given concurrency: per call latency and the overall throughput.
+    :param call:                        Coroutine Function Accepting the Iteration Number
+    :param iterations:                  Calls
+    :param concurrency:                 Calls in Flight
+    :return:
+    """
+
+    semaphore = asyncio.Semaphore(concurrency)
+    timings = []
+
+    async def timed(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await call(i)
+            timings.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed(i) for i in range(iterations)))
+    elapsed = time.perf_counter() - started
+    result = summary(timings)
+    result["throughput"] = iterations / elapsed
+    result["concurrency"] = concurrency
+    return result
+
+
+async def async_benchmarks(
+        directory: Directory,
+        iterations: int,
+        warmup: int,
+        concurrency: int,
+        selected: Optional[set[str]]
+) -> dict[str, Any]:
+
+    """
+    Benchmark the async client methods.
+    :param directory:                   Synthetic Directory
+    :param iterations:                  Calls per Method
+    :param warmup:                      Untimed Calls Before
+    :param concurrency:                 Calls in Flight
+    :param selected:                    Benchmark Names or None (All)
+    :return:
+    """
+
+    rng = random.Random(directory.rng.random())
+    persons = [rng.randrange(directory.persons) for _ in range(10000)]
+
+    def person(i: int) -> int:
+        return persons[i % len(persons)]
+
+    results = {}
+    async with AsyncTinyLDAP3Client(
+            user_dn=SERVICE_DN, user_pass=SERVICE_PASS, search_base=SEARCH_BASE, hosts=[HOST]
+    ) as client:
+        calls = {
+            "object_detail": lambda i: client.object_detail(
+                "person", "sAMAccountName", f"user{person(i):06d}",
+                returned_attrs_collection=PERSON_RETURNED_ATTRS_TUPLE
+            ),
+            "object_read": lambda i: client.object_read(
+                ("user",), directory.person_dn(person(i)), returned_attrs_collection=PERSON_RETURNED_ATTRS_TUPLE
+            ),
+            "objects_search": lambda i: client.objects_search(
+                "person", f"user{person(i) // 100:04d}",
+                search_by_attrs_collection=SEARCH_BY_ATTRS_TUPLE,
+                returned_attrs_collection=SEARCH_RETURNED_ATTRS_TUPLE
+            ),
+        }
+        for name, call in calls.items():
+            key = f"async.{name}"
+            if selected and key not in selected and name not in selected:
+                continue
+            for i in range(warmup):
+                await call(i)
+            results[key] = await async_measure(call, iterations, concurrency)
+            report(key, results[key])
+    return results
+
+
+def report(name: str, result: dict[str, Any]) -> None:
+    latency = result["latency"]
+    memory = result.get("memory")
+    print(
+        f"{name:<26} ops/s: {result['throughput']:10.1f}  p50: {latency['p50'] * 1000:9.3f} ms  "
+        f"p95: {latency['p95'] * 1000:9.3f} ms  p99: {latency['p99'] * 1000:9.3f} ms"
+        + (f"  peak: {memory['peak_bytes'] / 1024:9.1f} KiB" if memory else "")
+    )
+
+
+def compare(results: dict[str, Any], path: str) -> None:
+
+    """
+    Print the median latency and throughput ratios against a saved result (> 1.0 - slower).
+    :param results:                     Current Results
+    :param path:                        Saved Result JSON File
+    :return:
+    """
+
+    with open(path, encoding="utf-8") as file:
+        baseline = json.load(file)
+    print(f"\nCompared with {baseline['version']} ({baseline['created_at']}):")
+    for name, result in results["results"].items():
+        saved = baseline["results"].get(name)
+        if saved is None:
+            continue
+        ratio = result["latency"]["p50"] / saved["latency"]["p50"]
+        print(
+            f"{name:<26} p50: {ratio:6.2f}x  ops/s: {result['throughput'] / saved['throughput']:6.2f}x"
+            + ("  REGRESSION" if ratio > 1.1 else "")
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="directory size factor of 100k persons")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=16, help="async calls in flight")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--methods", nargs="*", help="benchmark names, e.g. object_detail async.object_detail")
+    parser.add_argument("--output", help="result JSON file, default benchmarks/results/suite-{version}-{time}.json")
+    parser.add_argument("--compare", help="saved result JSON file")
+    args = parser.parse_args()
+
+    try:
+        version = metadata.version("tinyLDAP3")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    selected = set(args.methods) if args.methods else None
+
+    directory = Directory(args.scale, args.seed)
+    load_seconds = directory.populate()
+    print(
+        f"directory: {directory.persons} persons, {directory.groups} groups, {directory.computers} computers, "
+        f"photos: {directory.photo_bytes / 2 ** 20:.1f} MiB, loaded in {load_seconds:.1f} s"
+    )
+
+    results: dict[str, Any] = {}
+    with mock_connections(directory):
+        with tinyLDAP3Client(
+                user_dn=SERVICE_DN, user_pass=SERVICE_PASS, search_base=SEARCH_BASE, hosts=[HOST]
+        ) as client:
+            for name, (call, setup) in sync_benchmarks(directory, client).items():
+                if selected and name not in selected:
+                    continue
+                results[name] = measure(call, args.iterations, args.warmup, setup)
+                report(name, results[name])
+        results.update(
+            asyncio.run(async_benchmarks(directory, args.iterations, args.warmup, args.concurrency, selected))
+        )
+
+    created_at = datetime.datetime.now(datetime.timezone.utc)
+    document = {
+        "suite": "tinyLDAP3",
+        "version": version,
+        "created_at": created_at.isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "ldap3": ldap3.__version__,
+        "platform": platform.platform(),
+        "params": {
+            "scale": args.scale, "iterations": args.iterations, "warmup": args.warmup,
+            "concurrency": args.concurrency, "seed": args.seed,
+        },
+        "directory": {
+            "persons": directory.persons, "groups": directory.groups, "computers": directory.computers,
+            "photo_bytes": directory.photo_bytes, "load_seconds": load_seconds,
+        },
+        "results": results,
+    }
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "results",
+        f"suite-{version}-{created_at.strftime('%Y%m%dT%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2)
+    print(f"saved: {output}")
+    if args.compare:
+        compare(document, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,2 @@
+from .aio import AsyncTinyLDAP3Client
 from .client import tinyLDAP3Client
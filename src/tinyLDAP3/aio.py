@@ -0,0 +1,1010 @@
+import asyncio, contextvars, logging, threading, time
+from collections import OrderedDict
+from ldap3 import (
+    ALL,
+    ASYNC,
+    AUTO_BIND_DEFAULT,
+    BASE,
+    NONE,
+    SUBTREE,
+    Connection,
+    Server
+)
+from ldap3.core.exceptions import LDAPException, LDAPResponseTimeoutError
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Union, Iterable
+from .decorators import ldap_logging
+from .exceptions import LdapBoundError, LdapPoolExhaustedError
+from .hedging import LdapHedgePolicy, ldap_hedge_answer
+from .instrumentation import LdapInstrumentation, ldap_phase
+from .models import LdapChangeSubscriptionModel, LdapObjectsWindowModel
+from .notifications import LdapChangeCheckpoint, LdapChangeEvent, LdapChangeSubscription
+from .plans import ldap_object_detail_plan, ldap_objects_search_plan, ldap_person_auth_plan
+from .pool import LdapConnectionPool, ldap_pooled_rebind
+from .queries import (
+    ldap_object_detail_query_selector,
+    ldap_object_read_query
+)
+from .ranges import ldap_range_attr, ldap_range_merge, ldap_range_pending, ldap_range_request, ldap_range_response
+from .results import LdapResultSet, ldap_response_to_items
+from .schema import LdapObjectDefCache, LdapSchemaCache
+from .selector import LdapServerSelector
+from .sorting import (
+    LdapWindowResult,
+    ldap_server_sort_applied,
+    ldap_server_sort_control,
+    ldap_sort_items,
+    ldap_vlv_control,
+    ldap_vlv_response
+)
+
+
+""" ######################################################### """
+""" **************** TINY LDAP3 ASYNC CLIENT **************** """
+""" ######################################################### """
+
+
+# Abandoned message IDs remembered to drop their late responses. The server may never answer an abandoned operation.
+LDAP_CHANNEL_ABANDONED_SIZE = 1024
+
+
+class _AsyncLdapChannel:
+
+    """
+        Multiplexed `ldap3` ASYNC connection. Responses are correlated to awaiting futures by message ID.
+        """
+
+    def __init__(
+            self,
+            connection: Connection,
+            loop: asyncio.AbstractEventLoop,
+            observer: Optional[Callable[[Connection, float, Optional[BaseException]], Any]] = None
+    ):
+        self.connection = connection
+        self.in_flight = 0
+
+        self.__loop = loop
+        self.__observer = observer
+        self.__lock = threading.Lock()
+        self.__waiters: dict[int, asyncio.Future] = {}
+        # Responses completed before their waiter is registered
+        self.__completed: set[int] = set()
+        self.__abandoned: OrderedDict[int, None] = OrderedDict()
+
+        # The receiver thread of the ASYNC strategy sets an event when the response of a message is complete
+        strategy = connection.strategy
+        set_event_for_message = strategy.set_event_for_message
+
+        def dispatch(message_id: int) -> None:
+            with self.__lock:
+                abandoned = message_id in self.__abandoned
+                if abandoned:
+                    del self.__abandoned[message_id]
+                future = None if abandoned else self.__waiters.pop(message_id, None)
+                if future is None and not abandoned:
+                    self.__completed.add(message_id)
+            if abandoned:
+                # Late response of an abandoned operation, the receiver thread holds `async_lock`
+                strategy._responses.pop(message_id, None)
+                with strategy.event_lock:
+                    strategy._events.pop(message_id, None)
+                return
+            set_event_for_message(message_id)
+            if future is not None:
+                self.__loop.call_soon_threadsafe(self.__resolve, future)
+
+        strategy.set_event_for_message = dispatch
+
+    @staticmethod
+    def __resolve(future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(None)
+
+    async def response(self, message_id: int, timeout: float, range_request: bool = False) -> tuple[list, dict]:
+
+        """
+        Await the complete response of the message.
+        :param message_id:                  LDAP Message ID
+        :param timeout:                     Response Timeout (sec.)
+        :param range_request:               Response of a Ranged Attribute Request
+        :return:
+        """
+
+        # Mock strategies have no receiver thread, the response is already stored
+        if not self.connection.strategy.no_real_dsa:
+            started = time.monotonic()
+            future = self.__loop.create_future()
+            with self.__lock:
+                if message_id in self.__completed:
+                    self.__completed.discard(message_id)
+                    future.set_result(None)
+                else:
+                    self.__waiters[message_id] = future
+            self.in_flight += 1
+            try:
+                await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                err = LDAPResponseTimeoutError("no response from server")
+                self.__observe(started, err)
+                self.abandon(message_id)
+                raise err
+            except asyncio.CancelledError:
+                # The loser of a hedged request: the operation is abandoned on the server
+                self.abandon(message_id)
+                raise
+            else:
+                self.__observe(started, None)
+            finally:
+                self.in_flight -= 1
+                with self.__lock:
+                    self.__waiters.pop(message_id, None)
+        if range_request:
+            with ldap_range_request(self.connection):
+                return self.connection.get_response(message_id)
+        return self.connection.get_response(message_id)
+
+    def abandon(self, message_id: int) -> None:
+
+        """
+        Abandon the operation and drop its partial response. A late response is dropped on receipt.
+        :param message_id:                  LDAP Message ID
+        :return:
+        """
+
+        try:
+            self.connection.abandon(message_id)
+        except LDAPException as err:
+            logging.debug(f"@ LDAP Async Channel @ - Abandon failed: {repr(err)}.")
+        with self.__lock:
+            self.__completed.discard(message_id)
+            self.__abandoned[message_id] = None
+            if len(self.__abandoned) > LDAP_CHANNEL_ABANDONED_SIZE:
+                self.__abandoned.popitem(last=False)
+        # Entries received before the abandon request would be kept by the ASYNC strategy until the unbind
+        strategy = self.connection.strategy
+        if not strategy.no_real_dsa:
+            with strategy.async_lock:
+                strategy._responses.pop(message_id, None)
+            with strategy.event_lock:
+                strategy._events.pop(message_id, None)
+
+    def __observe(self, started: float, error: Optional[BaseException]) -> None:
+        if self.__observer is not None:
+            self.__observer(self.connection, time.monotonic() - started, error)
+
+
+class AsyncTinyLDAP3Client:
+
+    """
+        tinyLDAP3 Async Client. Wrapper for Python `ldap3` Package with ASYNC strategy connections.
+        """
+
+    def __init__(self, **kwargs):
+        super(AsyncTinyLDAP3Client, self).__init__()
+
+        self._search_limit = 1000
+
+        self._connect_timeout = kwargs.get("connect_timeout") or 10
+        self._receive_timeout = kwargs.get("receive_timeout") or 10
+        # Metrics & spans of `LdapInstrumentation`, disabled by default
+        self._instrumentation: Optional[LdapInstrumentation] = kwargs.get("instrumentation")
+        self._connections_count = kwargs.get("async_connections") or 2
+
+        self.__user_dn = kwargs.get("user_dn")
+        self.__user_pass = kwargs.get("user_pass")
+        self.__search_base = kwargs.get("search_base") or SUBTREE
+        # Server info & schema are downloaded once and persisted instead of on every connection bind
+        self.__schema_cache = LdapSchemaCache(
+            path=kwargs.get("schema_cache_path"),
+            check_interval=kwargs.get("schema_check_interval") or 3600
+        ) if kwargs.get("schema_cache_path") else None
+        self.__object_defs = LdapObjectDefCache()
+        # Servers are selected by EWMA latency & error rate, failing hosts are ejected and probed in background
+        self.__server_selector = LdapServerSelector(
+            [
+                Server(
+                    host,
+                    port=636,
+                    use_ssl=True,
+                    get_info=NONE if self.__schema_cache else ALL,
+                    connect_timeout=self._connect_timeout
+                ) for host in kwargs.get("hosts")
+            ],
+            strategy=kwargs.get("server_selection") or "p2c",
+            failure_threshold=kwargs.get("server_failure_threshold") or 3,
+            eject_time=kwargs.get("server_eject_time") or 30,
+            error_penalty=self._connect_timeout,
+            probe=self.__ldap_probe,
+            probe_interval=kwargs.get("server_probe_interval") or 10
+        )
+        # Hedged reads: a read not answered within the hedge delay is repeated on a channel to another host
+        self.__hedge_policy = LdapHedgePolicy(
+            delay=kwargs.get("hedge_delay"),
+            budget=kwargs.get("hedge_budget") or 0.05
+        ) if kwargs.get("hedge") else None
+        self.__channels: list[_AsyncLdapChannel] = []
+        self.__channels_opening: list[asyncio.Future] = []
+        self.__channels_lock = asyncio.Lock()
+        self.__closed = False
+        # The person bind changes the connection identity, so it isn't multiplexed: person auth connections are
+        # opened anonymously, pooled and rebound with the person credentials per login in the default executor
+        self.__auth_connection_pool = LdapConnectionPool(
+            connection_factory=self.__ldap_auth_connection,
+            min_size=0,
+            max_size=kwargs.get("auth_pool_max_size") or 10,
+            idle_timeout=kwargs.get("pool_idle_timeout") or 300,
+            check_interval=kwargs.get("pool_check_interval") or 60,
+            wait_timeout=kwargs.get("pool_wait_timeout") or self._connect_timeout,
+            bind_on_check=False,
+            validator=lambda conn: self.__server_selector.available(conn.server.host),
+            observer=self.__ldap_observe
+        )
+        # Results are always converted from `conn.response` directly, decoders are optional
+        self._attr_decoders = {
+            attr_name.lower(): decoder for attr_name, decoder in (kwargs.get("attr_decoders") or {}).items()
+        } or None
+        if self._instrumentation is not None:
+            self._instrumentation.register_gauges(self.__ldap_gauges)
+
+    @property
+    def server_stats(self) -> dict[str, dict[str, Any]]:
+
+        """
+        Hosts gauges and counters (state, latency, error_rate, requests, errors, ejections, probes) by host.
+        :return:
+        """
+
+        return self.__server_selector.stats
+
+    @property
+    def auth_pool_stats(self) -> dict[str, int]:
+
+        """
+        Person auth connection pool gauges and counters.
+        :return:
+        """
+
+        return self.__auth_connection_pool.stats
+
+    @property
+    def hedge_stats(self) -> Optional[dict[str, int]]:
+
+        """
+        Hedging counters (requests, hedged, wins, budget_exhausted) or None (Hedging Disabled).
+        :return:
+        """
+
+        return self.__hedge_policy.stats if self.__hedge_policy is not None else None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self) -> None:
+
+        """
+        Close multiplexed connections and the person auth connections. Channels still opening are closed once opened.
+        :return:
+        """
+
+        async with self.__channels_lock:
+            self.__closed = True
+            channels, self.__channels = self.__channels, []
+            openings = list(self.__channels_opening)
+        for conn in await asyncio.gather(*openings, return_exceptions=True):
+            if not isinstance(conn, BaseException):
+                conn.unbind()
+        for channel in channels:
+            channel.connection.unbind()
+        self.__auth_connection_pool.close()
+        self.__server_selector.close()
+
+    def __ldap_probe(self, server: Server) -> None:
+
+        """
+        Probe an ejected server: anonymous Root DSE read. Used by the server selector.
+        :param server:                      Server
+        :return:
+        """
+
+        conn = Connection(server, raise_exceptions=True, receive_timeout=self._receive_timeout)
+        try:
+            conn.open()
+            conn.search(search_base="", search_filter="(objectClass=*)", search_scope=BASE, attributes=["1.1"])
+        finally:
+            conn.unbind()
+
+    def __ldap_observe(self, conn: Connection, latency: float, error: Optional[BaseException]) -> None:
+
+        """
+        Record a channel request result of the connection server. Used as the channels observer.
+        :param conn:                        Connection
+        :param latency:                     Request Time (sec.)
+        :param error:                       Request Error or None
+        :return:
+        """
+
+        self.__server_selector.observe(conn, latency, error)
+        if self._instrumentation is not None:
+            self._instrumentation.host_request(conn.server.host, latency, error)
+
+    def __ldap_gauges(self) -> list[tuple[str, dict[str, Any], float]]:
+
+        """
+        Channels and hosts gauges of the instrumentation snapshot.
+        :return:
+        """
+
+        channels = list(self.__channels)
+        gauges = [
+            ("channels", {}, len(channels)),
+            ("channels_in_flight", {}, sum(channel.in_flight for channel in channels)),
+        ]
+        for host, stats in self.server_stats.items():
+            gauges.append(("server_ejected", {"host": host}, int(stats["state"] == "open")))
+            gauges.append(("server_error_rate", {"host": host}, stats["error_rate"]))
+            if stats["latency"] is not None:
+                gauges.append(("server_latency_seconds", {"host": host}, stats["latency"]))
+        return gauges
+
+    def __ldap_connection(self, server: Optional[Server] = None, client_strategy: str = ASYNC) -> Connection:
+
+        """
+        Open a new service account ASYNC connection. Blocking, runs in the default executor.
+        :param server:                      Server or None (Selected by the Server Selector)
+        :param client_strategy:             `ldap3` Client Strategy (`ASYNC_STREAM` for Change Notifications)
+        :return:
+        """
+
+        def open_connection(selected: Server) -> Connection:
+            selected_conn = Connection(
+                selected,
+                client_strategy=client_strategy,
+                raise_exceptions=True,
+                auto_bind=AUTO_BIND_DEFAULT,
+                user=self.__user_dn,
+                password=self.__user_pass,
+                return_empty_attributes=True,
+                # `ldap3` would fetch the ranges with blocking requests inside `get_response`
+                auto_range=False,
+                receive_timeout=self._receive_timeout
+            )
+            with ldap_phase(self._instrumentation, "connect", host=selected.host):
+                selected_conn.open()
+            with ldap_phase(self._instrumentation, "bind", host=selected.host):
+                selected_conn.bind()
+            return selected_conn
+
+        conn = self.__server_selector.connect(open_connection, server)
+        # Notification streams can't run the schema searches: their responses aren't accumulated
+        if conn.bound and self.__schema_cache is not None and client_strategy == ASYNC:
+            self.__schema_cache.attach(conn)
+        return conn
+
+    def __ldap_auth_connection(self) -> Connection:
+
+        """
+        Open a new anonymous SYNC connection for person binds. Used by the auth connection pool.
+        :return:
+        """
+
+        def open_connection(selected: Server) -> Connection:
+            selected_conn = Connection(
+                selected,
+                raise_exceptions=False,
+                receive_timeout=self._receive_timeout
+            )
+            with ldap_phase(self._instrumentation, "connect", host=selected.host):
+                selected_conn.open()
+            return selected_conn
+
+        return self.__server_selector.connect(open_connection)
+
+    def __ldap_person_bind(self, login: str, password: str) -> dict:
+
+        """
+        Bind a pooled connection with the person credentials. Blocking, runs in the default executor.
+        :param login:                       User Login as UPN (`sAMAccountName@example.com`)
+        :param password:                    User Password
+        :return:
+        """
+
+        def bind(conn: Connection) -> dict:
+            # The pooled connection is rebound with the person credentials and reset to anonymous
+            with ldap_phase(self._instrumentation, "bind", host=conn.server.host):
+                return ldap_pooled_rebind(conn, login, password)
+
+        return self.__auth_connection_pool.execute(bind)
+
+    @staticmethod
+    def __ldap_channel_abandoned(opening: asyncio.Future) -> None:
+
+        """
+        Close the connection opened for a cancelled request.
+        :param opening:                     Opening Future
+        :return:
+        """
+
+        if not opening.cancelled() and opening.exception() is None:
+            opening.result().unbind()
+
+    async def __ldap_channel(self, exclude_host: Optional[str] = None) -> Optional[_AsyncLdapChannel]:
+
+        """
+        Get the least loaded service account channel. Channels are opened lazily up to `async_connections`.
+        :param exclude_host:                Host Excluded (Channel of a Hedged Request) or None
+        :return:                            Channel or None (No Other Host for a Hedged Request)
+        """
+
+        log_message = "@ LDAP Async Channel @ - {message}"
+
+        loop = asyncio.get_running_loop()
+        while True:
+            async with self.__channels_lock:
+                if self.__closed:
+                    raise LdapPoolExhaustedError("Async client is closed.")
+                # Channels to an ejected server are taken out of rotation and closed once idle
+                for channel in self.__channels:
+                    if not channel.in_flight and not self.__server_selector.available(channel.connection.server.host):
+                        channel.connection.unbind()
+                self.__channels = [channel for channel in self.__channels if not channel.connection.closed]
+                channels = [
+                    channel for channel in self.__channels
+                    if self.__server_selector.available(channel.connection.server.host)
+                    and channel.connection.server.host != exclude_host
+                ]
+                server = self.__server_selector.select(exclude=[exclude_host]) if exclude_host is not None else None
+                opening = None
+                if len(channels) + len(self.__channels_opening) < self._connections_count \
+                        and (exclude_host is None or server is not None):
+                    # Opened in the executor outside the lock: the other requests use the opened channels meanwhile.
+                    # The executor runs in a copy of the caller context (current method of the instrumentation)
+                    opening = loop.run_in_executor(None, contextvars.copy_context().run, self.__ldap_connection, server)
+                    self.__channels_opening.append(opening)
+                elif channels or exclude_host is not None or not self.__channels_opening:
+                    return min(channels, key=lambda channel: channel.in_flight) if channels else None
+                else:
+                    waiting = list(self.__channels_opening)
+            if opening is None:
+                # No channel yet: await the channels opened by the other requests
+                await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                continue
+            try:
+                # Shielded: the connection opened for a cancelled request is closed once opened
+                conn = await asyncio.shield(opening)
+            except asyncio.CancelledError:
+                opening.add_done_callback(self.__ldap_channel_abandoned)
+                raise
+            finally:
+                async with self.__channels_lock:
+                    self.__channels_opening.remove(opening)
+            # 'conn.bound' - The status of the LDAP session (True / False)
+            if not conn.bound:
+                logging.error(log_message.format(message=f"Error Detail:\n{conn}."))
+                raise LdapBoundError("Bound error occurred.")
+            channel = _AsyncLdapChannel(conn, loop, observer=self.__ldap_observe)
+            async with self.__channels_lock:
+                if not self.__closed:
+                    self.__channels.append(channel)
+                    return channel
+            conn.unbind()
+            raise LdapPoolExhaustedError("Async client is closed.")
+
+    async def __ldap_execute(
+            self,
+            method: str,
+            operation: Callable[[_AsyncLdapChannel], Awaitable[Any]]
+    ) -> Any:
+
+        """
+        Run a read operation on the least loaded channel. With hedging enabled, if the operation isn't completed
+        within the hedge delay, it's repeated on a channel to another host, the first answer wins and the loser
+        is cancelled (abandoned on the server).
+        :param method:                      Method Name (Latency Quantile Key)
+        :param operation:                   Coroutine Function Accepting a Channel
+        :return:
+        """
+
+        channel = await self.__ldap_channel()
+        policy = self.__hedge_policy
+        if policy is None:
+            return await operation(channel)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        primary = asyncio.ensure_future(operation(channel))
+        pending = {primary}
+        try:
+            delay = policy.delay(method)
+            hedge_channel = None
+            if delay is not None and not (await asyncio.wait(pending, timeout=delay))[0]:
+                hedge_channel = await self.__ldap_channel(exclude_host=channel.connection.server.host)
+            if hedge_channel is None or not policy.acquire():
+                result = await primary
+                policy.record(method, loop.time() - started)
+                return result
+            hedge = asyncio.ensure_future(operation(hedge_channel))
+            pending.add(hedge)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                answer = ldap_hedge_answer((primary, hedge), done, pending)
+                if answer is not None:
+                    policy.record(method, loop.time() - started, hedge_won=answer is hedge)
+                    return answer.result()
+        finally:
+            # The loser is cancelled, its operation is abandoned on the server by the channel
+            for task in pending:
+                task.cancel()
+
+    async def __ldap_search(
+            self,
+            search_query: str,
+            returned_attrs_collection: Iterable[str],
+            search_base: str = None,
+            channel: _AsyncLdapChannel = None,
+            method: str = "search"
+    ) -> list[dict[str, Any]]:
+
+        """
+        Send a search request and await the correlated response. Remaining values of ranged attributes are fetched
+        on the same channel.
+        :param search_query:                LDAP Search Filter
+        :param returned_attrs_collection:   Collection of Returned Attributes
+        :param search_base:                 Search Base or None (Client Search Base)
+        :param channel:                     Channel or None (Least Loaded Service Account Channel, Hedged)
+        :param method:                      Method Name (Hedge Delay Key)
+        :return:
+        """
+
+        items, _ = await self.__ldap_controlled_search(
+            search_query, returned_attrs_collection, search_base=search_base, channel=channel, method=method
+        )
+        return items
+
+    async def __ldap_controlled_search(
+            self,
+            search_query: str,
+            returned_attrs_collection: Iterable[str],
+            search_base: str = None,
+            channel: _AsyncLdapChannel = None,
+            controls: Optional[list] = None,
+            size_limit: Optional[int] = None,
+            method: str = "search"
+    ) -> tuple[list[dict[str, Any]], dict]:
+
+        """
+        Send a search request and await the correlated response: Objects dictionaries and the search result with
+        the response controls. Remaining values of ranged attributes are fetched on the same channel.
+        :param search_query:                LDAP Search Filter
+        :param returned_attrs_collection:   Collection of Returned Attributes
+        :param search_base:                 Search Base or None (Client Search Base)
+        :param channel:                     Channel or None (Least Loaded Service Account Channel, Hedged)
+        :param controls:                    Request Controls or None
+        :param size_limit:                  Size Limit or None (`_search_limit`)
+        :param method:                      Method Name (Hedge Delay Key)
+        :return:
+        """
+
+        async def search(search_channel: _AsyncLdapChannel) -> tuple[list[dict[str, Any]], dict]:
+            with ldap_phase(self._instrumentation, "search", host=search_channel.connection.server.host):
+                message_id = search_channel.connection.search(
+                    search_base=search_base or self.__search_base,
+                    search_filter=search_query,
+                    search_scope=SUBTREE,
+                    size_limit=self._search_limit if size_limit is None else size_limit,
+                    attributes=returned_attrs_collection,
+                    controls=controls
+                )
+                response, result = await search_channel.response(message_id, self._receive_timeout)
+            with ldap_phase(self._instrumentation, "decode"):
+                items = ldap_response_to_items(response, self._attr_decoders)
+            if self._instrumentation is not None:
+                self._instrumentation.entries(len(items))
+            await self.__ldap_complete_ranges(search_channel, items)
+            return [values for _, values in items], result
+
+        if channel is not None:
+            return await search(channel)
+        return await self.__ldap_execute(method, search)
+
+    async def __ldap_range_search(
+            self,
+            channel: _AsyncLdapChannel,
+            dn: str,
+            attr_name: str,
+            low: int
+    ) -> tuple[list[Any], Optional[int]]:
+
+        """
+        Read one range of an attribute.
+        :param channel:                     Channel
+        :param dn:                          Object `distinguishedName` Attribute Value
+        :param attr_name:                   Attribute Name
+        :param low:                         Index of the First Value
+        :return:                            Values & Next Range Low Bound (None After the Last Range)
+        """
+
+        with ldap_range_request(channel.connection):
+            message_id = channel.connection.search(
+                search_base=dn,
+                search_filter="(objectClass=*)",
+                search_scope=BASE,
+                attributes=[ldap_range_attr(attr_name, low)]
+            )
+        response, _ = await channel.response(message_id, self._receive_timeout, range_request=True)
+        return ldap_range_response(response, attr_name)
+
+    async def __ldap_range_values(
+            self,
+            channel: _AsyncLdapChannel,
+            dn: str,
+            attr_name: str,
+            low: Optional[int]
+    ) -> list[Any]:
+        values = []
+        while low is not None:
+            range_values, low = await self.__ldap_range_search(channel, dn, attr_name, low)
+            values.extend(range_values)
+        return values
+
+    async def __ldap_complete_ranges(self, channel: _AsyncLdapChannel, items: list[tuple[str, dict[str, Any]]]) -> None:
+
+        """
+        Fetch the remaining values of ranged attributes and merge them into the Objects dictionaries in place.
+        Ranges of different attributes and Objects are requested concurrently on the channel.
+        :param channel:                     Channel
+        :param items:                       (DN, Object Dictionary) Pairs
+        :return:
+        """
+
+        pending = [
+            (dn, values, attr_key, attr_name, low)
+            for dn, values in items for attr_key, attr_name, low in ldap_range_pending(values)
+        ]
+        if not pending:
+            return
+        more_values = await asyncio.gather(
+            *(self.__ldap_range_values(channel, dn, attr_name, low) for dn, _, _, attr_name, low in pending)
+        )
+        for (_, values, attr_key, attr_name, _), range_values in zip(pending, more_values):
+            ldap_range_merge(values, attr_key, attr_name, range_values, self._attr_decoders)
+
+    @ldap_logging
+    async def object_detail(
+            self,
+            object_category: str,
+            attr_name: str,
+            attr_value: str,
+            is_active: bool = False,
+            returned_attrs_collection: Iterable[str] = None
+    ) -> Union[dict[str, Any], tuple[dict, ...], None]:
+
+        """
+        Object (`Person`, `Group` or `Computer`) detail method will return an Object dictionary or a collection of
+        Objects dictionaries.
+        :param object_category:             Object Category: `Person`, `Group` or `Computer`
+        :param attr_name:                   Attribute Name for Searching
+        :param attr_value:                  Attributes Value for Searching
+        :param is_active:                   Person (User) Search Scope (Active or All Users)
+        :param returned_attrs_collection:   Collection of Returned Attributes or None
+        :return:
+        """
+
+        log_message = \
+            f"@ LDAP Object Detail @ - 'ObjectCategory: `{object_category}`, AttrName: `{attr_name}`, Value: `{attr_value}`' - {{message}}"
+
+        plan = ldap_object_detail_plan(
+            object_category=object_category.lower(),
+            attr_name=attr_name,
+            attr_value=attr_value,
+            is_active=is_active,
+            returned_attrs_collection=returned_attrs_collection
+        )
+        search_query = plan.query(attr_value)
+        # Object Detail request
+        resp_raw = await self.__ldap_search(
+            search_query=search_query,
+            returned_attrs_collection=plan.returned_attrs,
+            method="object_detail"
+        )
+        if resp_raw:
+            if len(resp_raw) == 1:
+                return resp_raw[0]
+            else:
+                logging.warning(
+                    log_message.format(
+                        message="More than one LDAP Object were found. Use attributes with unique values."
+                    )
+                )
+                return tuple(sorted(resp_raw, key=lambda item: item[plan.attr_name]))
+        logging.warning(log_message.format(message="LDAP Object not found."))
+        return None
+
+    @ldap_logging
+    async def object_read(
+            self,
+            object_category: Iterable[str],
+            dn: str,
+            returned_attrs_collection: Iterable[str] = None
+    ) -> Union[dict[str, Any], tuple[dict, ...], None]:
+
+        """
+        Object (Any Category or Class) read method will return an Object dictionary or a collection of
+        Objects dictionaries.
+        :param object_category:             Object Categories & Classes Collection
+        :param dn:                          Object `distinguishedName` Attribute Value
+        :param returned_attrs_collection:   Collection of Returned Attributes or None
+        :return:
+        """
+
+        log_message = f"@ LDAP Object Read @ - 'ObjectCategory: `{object_category}`, DN: `{dn}`' - {{message}}"
+
+        if not returned_attrs_collection:
+            # Same defaults as `ldap3.Reader`: all attributes of the object classes definition
+            channel = await self.__ldap_channel()
+            object_def = self.__object_defs.get(object_category, channel.connection)
+            returned_attrs_collection = [attr.name for attr in object_def]
+        search_query = ldap_object_read_query(object_category)
+        resp_raw = await self.__ldap_search(
+            search_query=search_query,
+            returned_attrs_collection=returned_attrs_collection,
+            search_base=dn,
+            method="object_read"
+        )
+        if resp_raw:
+            if len(resp_raw) == 1:
+                return resp_raw[0]
+            else:
+                return tuple(resp_raw)
+        logging.warning(log_message.format(message="LDAP Object not found."))
+        return None
+
+    @ldap_logging
+    async def objects_search(
+            self,
+            object_category: str,
+            attr_value: str,
+            order_by: str = "sAMAccountName",
+            search_by_attrs_collection: Iterable[str] = None,
+            returned_attrs_collection: Iterable[str] = None,
+            search_mode: str = None,
+            compact: bool = False,
+            server_sort: bool = False
+    ) -> Union[tuple[dict, ...], LdapResultSet, None]:
+
+        """
+        Objects (`Person`, `Group` or `Computer`) search method will return a collection of Objects dictionaries
+        or a compact result set.
+        :param object_category:             Object Category: `Person`, `Group` or `Computer`
+        :param attr_value:                  Attributes Value for Searching
+        :param order_by:                    Attribute Name for Sorting
+        :param search_by_attrs_collection:  Searching for Person (User) Based on Attributes from the Collection or None
+        :param returned_attrs_collection:   Collection of Returned Attributes or None
+        :param search_mode:                 Search Mode: `prefix`, `contains`, `anr` or None (Category Default)
+        :param compact:                     Return `LdapResultSet` (Attribute Names Once, Values Tuples)
+        :param server_sort:                 Sort with the Server Side Sort Control (Locally if It's Not Supported)
+        :return:
+        """
+
+        log_message = \
+            f"@ LDAP Objects Search @ - 'ObjectCategory: `{object_category}`, AttrValue: `{attr_value}`' - {{message}}"
+
+        plan = ldap_objects_search_plan(
+            object_category=object_category.lower(),
+            attr_value=attr_value,
+            order_by=order_by,
+            search_by_attrs_collection=search_by_attrs_collection,
+            returned_attrs_collection=returned_attrs_collection,
+            search_mode=search_mode
+        )
+        search_query = plan.query(attr_value)
+        returned_attrs = plan.returned_attrs
+        # Objects Search request. With the server sort the size limit applies to the sorted entries.
+        resp_raw, result = await self.__ldap_controlled_search(
+            search_query=search_query,
+            returned_attrs_collection=returned_attrs,
+            controls=[ldap_server_sort_control(plan.order_by)] if server_sort else None,
+            method="objects_search"
+        )
+        server_sorted = server_sort and ldap_server_sort_applied(result)
+        if resp_raw:
+            if compact:
+                result_set = LdapResultSet.from_dicts(resp_raw, attrs=returned_attrs)
+                return result_set if server_sorted else result_set.sort(plan.order_by)
+            return tuple(resp_raw if server_sorted else ldap_sort_items(resp_raw, plan.order_by))
+        logging.warning(log_message.format(message="LDAP Object(s) not found."))
+        return None
+
+    @ldap_logging
+    async def objects_window(
+            self,
+            object_category: str,
+            attr_value: str,
+            offset: int = 0,
+            limit: int = 50,
+            order_by: str = "sAMAccountName",
+            around_value: str = None,
+            before: int = 0,
+            context_id: bytes = None,
+            search_by_attrs_collection: Iterable[str] = None,
+            returned_attrs_collection: Iterable[str] = None,
+            search_mode: str = None
+    ) -> LdapWindowResult:
+
+        """
+        Objects (`Person`, `Group` or `Computer`) windowed search method will return a window of the server sorted
+        search result (Virtual List View control): `limit` Objects from `offset`, or from `before` Objects before
+        the first Object with the `order_by` value >= `around_value`. Only the window is transferred and
+        the directory must support the Server Side Sort and Virtual List View controls.
+        :param object_category:             Object Category: `Person`, `Group` or `Computer`
+        :param attr_value:                  Attributes Value for Searching
+        :param offset:                      Offset (from 0) of the First Object of the Window
+        :param limit:                       Number of Objects of the Window
+        :param order_by:                    Attribute Name for Sorting
+        :param around_value:                Sort Attribute Value of the Target Object or None (Window by Offset)
+        :param before:                      Number of Objects Before the Target Object (Window by Value)
+        :param context_id:                  `context_id` of the Previous Window of the Same Search or None
+        :param search_by_attrs_collection:  Searching for Person (User) Based on Attributes from the Collection or None
+        :param returned_attrs_collection:   Collection of Returned Attributes or None
+        :param search_mode:                 Search Mode: `prefix`, `contains`, `anr` or None (Category Default)
+        :return:
+        """
+
+        log_message = \
+            f"@ LDAP Objects Window @ - 'ObjectCategory: `{object_category}`, AttrValue: `{attr_value}`' - {{message}}"
+
+        plan = ldap_objects_search_plan(
+            object_category=object_category.lower(),
+            attr_value=attr_value,
+            order_by=order_by,
+            search_by_attrs_collection=search_by_attrs_collection,
+            returned_attrs_collection=returned_attrs_collection,
+            search_mode=search_mode
+        )
+        validated_data = LdapObjectsWindowModel(
+            **{"offset": offset, "limit": limit, "before": before if around_value is not None else 0}
+        ).model_dump()
+        before_count = validated_data["before"]
+        after_count = validated_data["limit"] - before_count - 1
+        if around_value is not None:
+            vlv_control = ldap_vlv_control(before_count, after_count, value=around_value, context_id=context_id)
+        else:
+            vlv_control = ldap_vlv_control(
+                before_count, after_count, offset=validated_data["offset"] + 1, context_id=context_id
+            )
+        resp_raw, result = await self.__ldap_controlled_search(
+            search_query=plan.query(attr_value),
+            returned_attrs_collection=plan.returned_attrs,
+            controls=[ldap_server_sort_control(plan.order_by, critical=True), vlv_control],
+            size_limit=0,
+            method="objects_window"
+        )
+        vlv = ldap_vlv_response(result)
+        if not resp_raw:
+            logging.warning(log_message.format(message="LDAP Object(s) not found."))
+        return LdapWindowResult(
+            items=tuple(resp_raw),
+            offset=max(vlv.target_position - before_count, 1) - 1,
+            total=vlv.content_count,
+            context_id=vlv.context_id
+        )
+
+    @ldap_logging
+    async def iter_attr_values(self, dn: str, attr_name: str = "member") -> AsyncIterator[Any]:
+
+        """
+        Multi-valued attribute async iterator. Values are fetched range by range (`member;range=...`), so attributes
+        with more values than the server `MaxValRange` aren't materialised at once.
+        :param dn:                          Object `distinguishedName` Attribute Value
+        :param attr_name:                   Attribute Name
+        :return:
+        """
+
+        channel = await self.__ldap_channel()
+        decoder = self._attr_decoders.get(attr_name.lower()) if self._attr_decoders else None
+        low = 0
+        while low is not None:
+            values, low = await self.__ldap_range_search(channel, dn, attr_name, low)
+            for value in values:
+                yield decoder(value) if decoder is not None else value
+
+    @ldap_logging
+    async def subscribe(
+            self,
+            search_bases: Iterable[str] = None,
+            object_categories: Iterable[str] = ("person", "group", "computer"),
+            callback: Callable[[LdapChangeEvent], Any] = None,
+            returned_attrs_collection: Iterable[str] = None,
+            checkpoints: dict[str, LdapChangeCheckpoint] = None,
+            page_size: int = 500,
+            max_reconnect_delay: float = 60,
+            catch_up_margin: float = 300
+    ) -> LdapChangeSubscription:
+
+        """
+        Subscribe to the changes of Objects (`Person`, `Group` or `Computer`) with `LDAP_SERVER_NOTIFICATION` searches
+        (AD). Notifications use dedicated `ASYNC_STREAM` connections, events are consumed with `async for` (or
+        by the callback, called by the receiver threads).
+        :param search_bases:                Watched Search Bases (Subtrees) or None (Client Search Base)
+        :param object_categories:           Object Categories: `Person`, `Group` or `Computer`
+        :param callback:                    Events Callback (Called by the Receiver Threads) or None (Iterator)
+        :param returned_attrs_collection:   Collection of Returned Attributes or None (Categories Search Attributes)
+        :param checkpoints:                 Saved `checkpoints` to Catch Up From or None (Changes Since Now)
+        :param page_size:                   Catch-Up Searches Page Size
+        :param max_reconnect_delay:         Maximum Reconnection Delay (sec.)
+        :param catch_up_margin:             Clock Skew Margin (sec.) of the `whenChanged` Catch-Up
+        :return:
+        """
+
+        validated_data = LdapChangeSubscriptionModel(
+            **{
+                "search_bases": tuple(search_bases or (self.__search_base,)),
+                "object_categories": tuple(object_category.lower() for object_category in object_categories),
+                "returned_attrs_collection": returned_attrs_collection,
+                "page_size": page_size
+            }
+        ).model_dump()
+
+        def connect(server: Optional[Server], client_strategy: str) -> Connection:
+            # An ejected host isn't waited for: the changes are caught up on the selected one
+            if server is not None and not self.__server_selector.available(server.host):
+                server = None
+            return self.__ldap_connection(server, client_strategy)
+
+        subscription = LdapChangeSubscription(
+            search_bases=validated_data["search_bases"],
+            connect=connect,
+            object_categories=tuple(object_category.value for object_category in validated_data["object_categories"]),
+            returned_attrs=tuple(validated_data["returned_attrs_collection"]),
+            callback=callback,
+            checkpoints=checkpoints,
+            decoders=self._attr_decoders,
+            page_size=page_size,
+            max_reconnect_delay=max_reconnect_delay,
+            catch_up_margin=catch_up_margin
+        )
+        loop = asyncio.get_running_loop()
+        # Opening the streams & the catch-up searches are blocking
+        return await loop.run_in_executor(None, contextvars.copy_context().run, subscription.start)
+
+    @ldap_logging
+    async def person_auth(
+            self,
+            login: str,
+            password: str,
+            returned_attrs_collection: Iterable[str] = None
+    ) -> tuple[bool, dict[str, Any]]:
+
+        """
+        Person Auth will return a tuple of connection binding values and a dictionary of person attribute values
+        or a dictionary of connection results (Authentication error case).
+        :param login:                       User Login as UPN (`sAMAccountName@example.com`)
+        :param password:                    User Password
+        :param returned_attrs_collection:   Collection of Returned Attributes or None
+        :return:
+        """
+
+        log_message = f"@ LDAP Person Auth @ - 'Login: {login}' - {{message}}"
+
+        plan = ldap_person_auth_plan(
+            login=login, password=password, returned_attrs_collection=returned_attrs_collection
+        )
+        loop = asyncio.get_running_loop()
+        # The bind changes the connection identity, so the user bind isn't multiplexed: it runs on a pooled connection
+        conn_result = await loop.run_in_executor(
+            None, contextvars.copy_context().run, self.__ldap_person_bind, login, password
+        )
+        if conn_result["result"] == 0:
+            # Person attributes are read via the multiplexed service account channel
+            resp_raw = await self.__ldap_search(
+                search_query=ldap_object_detail_query_selector(
+                    "person", "userPrincipalName", login, True
+                ),
+                returned_attrs_collection=plan.returned_attrs,
+                method="person_auth"
+            )
+            return True, resp_raw[0] if resp_raw else {}
+        # conn.bound = False, conn.result["result"] = 49
+        logging.warning(log_message.format(message="LDAP Person invalid credentials."))
+        return False, conn_result
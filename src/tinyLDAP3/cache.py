@@ -0,0 +1,155 @@
+import copy, threading, time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+""" ######################################################### """
+""" ******************* TINY LDAP3 CACHE ******************** """
+""" ######################################################### """
+
+
+# Attributes fetched for a cheap revalidation of a stale cached Object
+LDAP_REVALIDATION_ATTRS_TUPLE = (
+    "uSNChanged",
+    "whenChanged",
+)
+
+
+class _LdapCacheItem:
+
+    """
+        Cached payload with expiration time and Objects change stamps by DN.
+        """
+
+    __slots__ = ("payload", "category", "expires_at", "stamps")
+
+    def __init__(self, payload: Any, category: str, expires_at: float, stamps: Optional[dict[str, tuple]]):
+        self.payload = payload
+        self.category = category
+        self.expires_at = expires_at
+        self.stamps = stamps
+
+
+class LdapResultCache:
+
+    """
+        tinyLDAP3 Result Cache. Thread-safe LRU cache with per-category TTL.
+        Stale items are kept until eviction, so they can be revalidated by the Objects change stamps.
+        """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 60, category_ttl: dict[str, float] = None):
+
+        """
+        :param max_size:                    Maximum Number of Cached Results
+        :param ttl:                         Default Time to Live (sec.)
+        :param category_ttl:                Time to Live (sec.) by Object Category: `person`, `group`, `computer`
+        """
+
+        if max_size < 1:
+            raise ValueError("Cache max_size must be >= 1.")
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._category_ttl = {key.lower(): value for key, value in (category_ttl or {}).items()}
+
+        self.__lock = threading.Lock()
+        self.__items: OrderedDict[Hashable, _LdapCacheItem] = OrderedDict()
+        self.__counters = {
+            "hits": 0, "misses": 0, "stale": 0, "revalidated": 0, "evictions": 0, "invalidations": 0
+        }
+
+    @property
+    def stats(self) -> dict[str, int]:
+
+        """
+        Cache gauges and counters.
+        :return:
+        """
+
+        with self.__lock:
+            return {"size": len(self.__items), **self.__counters}
+
+    def __ttl(self, category: str) -> float:
+        return self._category_ttl.get(category, self._ttl)
+
+    def get(self, key: Hashable) -> tuple[Optional[Any], Optional[dict[str, tuple]]]:
+
+        """
+        Get a cached payload copy. A stale item returns None and its change stamps (None if not revalidatable).
+        :param key:                         Cache Key
+        :return:
+        """
+
+        with self.__lock:
+            item = self.__items.get(key)
+            if item is None:
+                self.__counters["misses"] += 1
+                return None, None
+            self.__items.move_to_end(key)
+            if item.expires_at > time.monotonic():
+                self.__counters["hits"] += 1
+                payload = item.payload
+            else:
+                self.__counters["stale"] += 1
+                return None, item.stamps
+        # Copy outside the lock, cached dictionaries must not be changed by the caller
+        return copy.deepcopy(payload), None
+
+    def set(self, key: Hashable, category: str, payload: Any, stamps: dict[str, tuple] = None) -> None:
+
+        """
+        Cache a payload copy.
+        :param key:                         Cache Key
+        :param category:                    Object Category
+        :param payload:                     Method Result
+        :param stamps:                      Objects Change Stamps by DN or None
+        :return:
+        """
+
+        item = _LdapCacheItem(copy.deepcopy(payload), category, time.monotonic() + self.__ttl(category), stamps)
+        with self.__lock:
+            self.__items[key] = item
+            self.__items.move_to_end(key)
+            while len(self.__items) > self._max_size:
+                self.__items.popitem(last=False)
+                self.__counters["evictions"] += 1
+
+    def refresh(self, key: Hashable) -> Optional[Any]:
+
+        """
+        Extend the TTL of a revalidated item and get the payload copy.
+        :param key:                         Cache Key
+        :return:
+        """
+
+        with self.__lock:
+            item = self.__items.get(key)
+            if item is None:
+                return None
+            item.expires_at = time.monotonic() + self.__ttl(item.category)
+            self.__counters["revalidated"] += 1
+            payload = item.payload
+        return copy.deepcopy(payload)
+
+    def invalidate(self, key: Hashable) -> None:
+
+        """
+        Remove a cached item.
+        :param key:                         Cache Key
+        :return:
+        """
+
+        with self.__lock:
+            if self.__items.pop(key, None) is not None:
+                self.__counters["invalidations"] += 1
+
+    def clear(self) -> None:
+
+        """
+        Remove all cached items.
+        :return:
+        """
+
+        with self.__lock:
+            self.__counters["invalidations"] += len(self.__items)
+            self.__items.clear()
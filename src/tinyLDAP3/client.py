@@ -1,20 +1,78 @@
-import datetime, logging
+import contextvars, datetime, logging, os, sqlite3, threading, time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from ldap3 import (
     ALL,
     AUTO_BIND_DEFAULT,
-    ROUND_ROBIN,
+    NONE,
+    BASE,
     SUBTREE,
-    AttrDef,
+    SYNC,
     Connection,
-    ObjectDef,
     Reader,
-    Server,
-    ServerPool
+    Server
 )
-from typing import Any, Union, Iterable
+from ldap3.core.exceptions import LDAPException, LDAPNoSuchObjectResult
+from typing import IO, Any, Callable, Optional, Union, Iterable
+from .cache import LDAP_REVALIDATION_ATTRS_TUPLE, LdapResultCache
 from .decorators import ldap_logging
+from .deferred import LdapDeferredObject
+from .enumeration import (
+    LDAP_PARTITION_RETRY_ERRORS_TUPLE,
+    LdapPartition,
+    LdapPartitionedEnumeration,
+    ldap_usn_partitions
+)
 from .exceptions import LdapBoundError
-from .models import LdapObjectDetailModel, LdapObjecsSearchModel, LdapPersonAuthModel
+from .export import LdapExportProgress, ldap_export
+from .hedging import LdapHedgeLeg, LdapHedgePolicy, ldap_hedge_answer
+from .instrumentation import LdapInstrumentation, ldap_phase
+from .membership import LDAP_MEMBERSHIP_ATTRS, LdapGroupGraph, LdapMembershipResult, ldap_linked_values
+from .models import (
+    LdapChangeSubscriptionModel,
+    LdapMembershipModel,
+    LdapObjectReadManyModel,
+    LdapObjectsExportModel,
+    LdapObjectsEnumerationModel,
+    LdapObjectsDetailManyModel,
+    LdapObjectsWindowModel,
+    ldap_objects_classes_categories_schema,
+    ldap_objects_deferred_attrs_schema
+)
+from .normalizers import ldap_sam_account_type, ldap_uac_flags
+from .notifications import LdapChangeCheckpoint, LdapChangeEvent, LdapChangeSubscription
+from .paging import LdapPagedSearch, ldap_paged_items, ldap_paged_search
+from .plans import ldap_object_detail_plan, ldap_objects_search_plan, ldap_person_auth_plan
+from .pool import LdapConnectionPool, ldap_pooled_rebind
+from .queries import (
+    ldap_group_members_chain_query,
+    ldap_object_detail_query_selector,
+    ldap_object_groups_chain_query,
+    ldap_object_read_query,
+    ldap_objects_detail_many_query_selector,
+    ldap_objects_partition_query,
+    ldap_objects_read_many_query,
+    ldap_objects_search_scope
+)
+from .results import (
+    LdapObjectsDetailManyResult,
+    LdapResultSet,
+    ldap_attrs_decode,
+    ldap_dn_key,
+    ldap_entries_to_items,
+    ldap_response_to_items
+)
+from .ranges import LdapRangeValues, ldap_items_complete_ranges
+from .replica import LdapReplica, ldap_highest_usn
+from .schema import LdapObjectDefCache, LdapSchemaCache
+from .selector import LdapServerSelector
+from .sorting import (
+    LdapWindowResult,
+    ldap_server_sort_applied,
+    ldap_server_sort_control,
+    ldap_sort_items,
+    ldap_vlv_control,
+    ldap_vlv_response
+)
 
 
 """ ######################################################### """
@@ -35,251 +93,856 @@ class tinyLDAP3Client:
 
         self._connect_timeout = kwargs.get("connect_timeout") or 10
         self._receive_timeout = kwargs.get("receive_timeout") or 10
+        # Metrics & spans of `LdapInstrumentation`, disabled by default
+        self._instrumentation: Optional[LdapInstrumentation] = kwargs.get("instrumentation")
 
         self.__user_dn = kwargs.get("user_dn")
         self.__user_pass = kwargs.get("user_pass")
         self.__search_base = kwargs.get("search_base") or SUBTREE
-        self.__server_pool = ServerPool(
+        # Server info & schema are downloaded once and persisted instead of on every connection bind
+        self.__schema_cache = LdapSchemaCache(
+            path=kwargs.get("schema_cache_path"),
+            check_interval=kwargs.get("schema_check_interval") or 3600
+        ) if kwargs.get("schema_cache_path") else None
+        # ObjectDef definitions of `object_read` by the set of Object Categories & Classes
+        self.__object_defs = LdapObjectDefCache()
+        # Servers are selected by EWMA latency & error rate, failing hosts are ejected and probed in background
+        self.__server_selector = LdapServerSelector(
             [
                 Server(
-                    host, port=636, use_ssl=True, get_info=ALL, connect_timeout=self._connect_timeout
+                    host,
+                    port=636,
+                    use_ssl=True,
+                    get_info=NONE if self.__schema_cache else ALL,
+                    connect_timeout=self._connect_timeout
                 ) for host in kwargs.get("hosts")
             ],
-            ROUND_ROBIN,
-            active=False,
-            exhaust=False
+            strategy=kwargs.get("server_selection") or "p2c",
+            failure_threshold=kwargs.get("server_failure_threshold") or 3,
+            eject_time=kwargs.get("server_eject_time") or 30,
+            error_penalty=self._connect_timeout,
+            probe=self.__ldap_probe,
+            probe_interval=kwargs.get("server_probe_interval") or 10
+        )
+        self._pool_max_size = kwargs.get("pool_max_size") or 10
+        self.__connection_pool = LdapConnectionPool(
+            connection_factory=self.__ldap_connection,
+            min_size=kwargs.get("pool_min_size", 1),
+            max_size=self._pool_max_size,
+            idle_timeout=kwargs.get("pool_idle_timeout") or 300,
+            check_interval=kwargs.get("pool_check_interval") or 60,
+            wait_timeout=kwargs.get("pool_wait_timeout") or self._connect_timeout,
+            validator=self.__ldap_connection_valid,
+            observer=self.__ldap_observe
         )
+        # Person auth connections are opened anonymously and rebound with the person credentials per login
+        self._auth_attrs_source = kwargs.get("auth_attrs_source", "service")
+        if self._auth_attrs_source not in ("service", None):
+            raise ValueError("auth_attrs_source must be one of: 'service', None.")
+        self.__auth_connection_pool = LdapConnectionPool(
+            connection_factory=self.__ldap_auth_connection,
+            min_size=kwargs.get("auth_pool_min_size", 0),
+            max_size=kwargs.get("auth_pool_max_size") or 10,
+            idle_timeout=kwargs.get("pool_idle_timeout") or 300,
+            check_interval=kwargs.get("pool_check_interval") or 60,
+            wait_timeout=kwargs.get("pool_wait_timeout") or self._connect_timeout,
+            bind_on_check=False,
+            validator=self.__ldap_connection_valid,
+            observer=self.__ldap_observe
+        )
+        # Hedged reads: a read not answered within the hedge delay is repeated on a connection to another host
+        self.__hedge_policy = LdapHedgePolicy(
+            delay=kwargs.get("hedge_delay"),
+            budget=kwargs.get("hedge_budget") or 0.05
+        ) if kwargs.get("hedge") else None
+        self.__hedge_executor = ThreadPoolExecutor(
+            max_workers=2 * self._pool_max_size, thread_name_prefix="tinyLDAP3-hedge"
+        ) if self.__hedge_policy is not None else None
+        # Pools of connections to a given host: hedged reads and partitioned enumerations
+        self.__host_pools: dict[str, LdapConnectionPool] = {}
+        self.__host_pools_lock = threading.Lock()
+        # Result cache of `object_detail` & `object_read` is disabled by default
+        self._cache_revalidate = bool(kwargs.get("cache_revalidate"))
+        self.__cache = LdapResultCache(
+            max_size=kwargs.get("cache_max_size"),
+            ttl=kwargs.get("cache_ttl") or 60,
+            category_ttl=kwargs.get("cache_category_ttl")
+        ) if kwargs.get("cache_max_size") else None
+        # Result mode: `entries` builds `ldap3` Entries, `raw` converts `conn.response` to dictionaries directly
+        self._result_mode = kwargs.get("result_mode") or "entries"
+        if self._result_mode not in ("entries", "raw"):
+            raise ValueError("result_mode must be one of: 'entries', 'raw'.")
+        self._attr_decoders = {
+            attr_name.lower(): decoder for attr_name, decoder in (kwargs.get("attr_decoders") or {}).items()
+        } or None
+        # Heavy attributes by Object Category deferred by `object_detail(deferred=True)`
+        self._deferred_attrs = {
+            **ldap_objects_deferred_attrs_schema,
+            **{key.lower(): tuple(value) for key, value in (kwargs.get("deferred_attrs") or {}).items()}
+        }
+        # Memoised membership graph of the `bfs` nested membership strategy
+        self.__group_graph = LdapGroupGraph(
+            ttl=kwargs.get("membership_ttl") or 300,
+            max_size=kwargs.get("membership_max_size") or 100000
+        )
+        # Local SQLite replica serves `object_detail`, `objects_search` & `object_read` while it's fresh enough
+        self._replica_max_staleness = kwargs.get("replica_max_staleness") or 300
+        self.__replica = LdapReplica(
+            path=kwargs.get("replica_path"),
+            attrs=kwargs.get("replica_attrs"),
+            page_size=self._search_limit,
+            full_sync_interval=kwargs.get("replica_full_sync_interval") or 86400
+        ) if kwargs.get("replica_path") else None
+        if self._instrumentation is not None:
+            self._instrumentation.register_gauges(self.__ldap_gauges)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def pool_stats(self) -> dict[str, int]:
+
+        """
+        Service account connection pool gauges and counters.
+        :return:
+        """
+
+        return self.__connection_pool.stats
+
+    @property
+    def auth_pool_stats(self) -> dict[str, int]:
+
+        """
+        Person auth connection pool gauges and counters.
+        :return:
+        """
+
+        return self.__auth_connection_pool.stats
+
+    @property
+    def server_stats(self) -> dict[str, dict[str, Any]]:
+
+        """
+        Hosts gauges and counters (state, latency, error_rate, requests, errors, ejections, probes) by host.
+        :return:
+        """
+
+        return self.__server_selector.stats
+
+    @property
+    def hedge_stats(self) -> Optional[dict[str, int]]:
+
+        """
+        Hedging counters (requests, hedged, wins, budget_exhausted) or None (Hedging Disabled).
+        :return:
+        """
+
+        return self.__hedge_policy.stats if self.__hedge_policy is not None else None
+
+    @property
+    def cache_stats(self) -> Optional[dict[str, int]]:
+
+        """
+        Result cache gauges and counters (hits, misses, stale, revalidated, evictions) or None (Cache Disabled).
+        :return:
+        """
+
+        return self.__cache.stats if self.__cache is not None else None
+
+    @property
+    def schema_cache_stats(self) -> Optional[dict[str, int]]:
+
+        """
+        Schema cache counters (loaded, downloaded, checked, attached) or None (Schema Cache Disabled).
+        :return:
+        """
+
+        return self.__schema_cache.stats if self.__schema_cache is not None else None
+
+    @property
+    def membership_stats(self) -> dict[str, int]:
+
+        """
+        Membership graph gauges and counters (size, hits, misses, expansions, cycles, evictions).
+        :return:
+        """
+
+        return self.__group_graph.stats
+
+    @property
+    def replica_stats(self) -> Optional[dict[str, Any]]:
+
+        """
+        Directory replica state (objects, host, usn, synced_at, full_synced_at, staleness) or None (Replica Disabled).
+        :return:
+        """
+
+        return self.__replica.stats if self.__replica is not None else None
+
+    def cache_clear(self) -> None:
+
+        """
+        Remove all cached results and the membership graph nodes.
+        :return:
+        """
+
+        if self.__cache is not None:
+            self.__cache.clear()
+        self.__group_graph.clear()
+
+    def close(self) -> None:
+
+        """
+        Close pooled connections.
+        :return:
+        """
+
+        self.__connection_pool.close()
+        self.__auth_connection_pool.close()
+        with self.__host_pools_lock:
+            host_pools, self.__host_pools = list(self.__host_pools.values()), {}
+        for host_pool in host_pools:
+            host_pool.close()
+        if self.__hedge_executor is not None:
+            self.__hedge_executor.shutdown(wait=False)
+        self.__server_selector.close()
+
+    def __ldap_probe(self, server: Server) -> None:
+
+        """
+        Probe an ejected server: anonymous Root DSE read. Used by the server selector.
+        :param server:                      Server
+        :return:
+        """
+
+        conn = Connection(server, raise_exceptions=True, receive_timeout=self._receive_timeout)
+        try:
+            conn.open()
+            conn.search(search_base="", search_filter="(objectClass=*)", search_scope=BASE, attributes=["1.1"])
+        finally:
+            conn.unbind()
+
+    def __ldap_observe(self, conn: Connection, latency: float, error: Optional[BaseException]) -> None:
+
+        """
+        Record a pooled request result of the connection server. Used as the connection pools observer.
+        :param conn:                        Connection
+        :param latency:                     Request Time (sec.)
+        :param error:                       Request Error or None
+        :return:
+        """
+
+        self.__server_selector.observe(conn, latency, error)
+        if self._instrumentation is not None:
+            self._instrumentation.host_request(conn.server.host, latency, error)
+
+    def __ldap_gauges(self) -> list[tuple[str, dict[str, Any], float]]:
+
+        """
+        Pools, hosts, cache and membership graph gauges of the instrumentation snapshot.
+        :return:
+        """
+
+        gauges = [
+            (f"pool_{key}", {"pool": pool}, stats[key])
+            for pool, stats in (("service", self.pool_stats), ("auth", self.auth_pool_stats))
+            for key in ("size", "idle", "borrowed")
+        ]
+        for host, stats in self.server_stats.items():
+            gauges.append(("server_ejected", {"host": host}, int(stats["state"] == "open")))
+            gauges.append(("server_error_rate", {"host": host}, stats["error_rate"]))
+            if stats["latency"] is not None:
+                gauges.append(("server_latency_seconds", {"host": host}, stats["latency"]))
+        if self.__cache is not None:
+            gauges.append(("cache_size", {}, self.__cache.stats["size"]))
+        gauges.append(("membership_size", {}, self.__group_graph.stats["size"]))
+        return gauges
+
+    def __ldap_connection_valid(self, conn: Connection) -> bool:
+
+        """
+        Pooled connections to an ejected server are replaced on borrow.
+        :param conn:                        Connection
+        :return:
+        """
+
+        return self.__server_selector.available(conn.server.host)
+
+    def __ldap_connection(self, server: Optional[Server] = None, client_strategy: str = SYNC) -> Connection:
+
+        """
+        Open a new service account connection. Used by the connection pool.
+        :param server:                      Server or None (Selected by the Server Selector)
+        :param client_strategy:             `ldap3` Client Strategy (`ASYNC_STREAM` for Change Notifications)
+        :return:
+        """
+
+        log_message = "@ LDAP Connection @ - {message}"
+
+        def open_connection(selected: Server) -> Connection:
+            # 'conn' example: "{ldap_uri} - ssl - user: {ldap_user} - not lazy - \
+            # bound - open - <local: {local_ip}:{local_port} - remote: {ldap_ip}:{ldap_port}> - \
+            # tls not started - listening - SyncStrategy - internal decoder"
+            selected_conn = Connection(
+                selected,
+                client_strategy=client_strategy,
+                raise_exceptions=True,
+                auto_bind=AUTO_BIND_DEFAULT,
+                user=self.__user_dn,
+                password=self.__user_pass,
+                return_empty_attributes=True,
+                # Ranged attributes are completed by `ldap_items_complete_ranges` after the result conversion
+                auto_range=False,
+                receive_timeout=self._receive_timeout,
+                collect_usage=self._instrumentation is not None
+            )
+            with ldap_phase(self._instrumentation, "connect", host=selected.host):
+                selected_conn.open()
+            with ldap_phase(self._instrumentation, "bind", host=selected.host):
+                selected_conn.bind()
+            return selected_conn
+
+        conn = self.__server_selector.connect(open_connection, server)
+        # 'conn.bound' - The status of the LDAP session (True / False)
+        if conn.bound:
+            # Notification streams can't run the schema searches: their responses aren't accumulated
+            if self.__schema_cache is not None and client_strategy == SYNC:
+                self.__schema_cache.attach(conn)
+            return conn
+        logging.error(log_message.format(message=f"Error Detail:\n{conn}."))
+        raise LdapBoundError("Bound error occurred.")
+
+    def __ldap_auth_connection(self) -> Connection:
+
+        """
+        Open a new anonymous connection for person binds. Used by the auth connection pool.
+        :return:
+        """
+
+        def open_connection(selected: Server) -> Connection:
+            selected_conn = Connection(
+                selected,
+                raise_exceptions=False,
+                return_empty_attributes=True,
+                receive_timeout=self._receive_timeout,
+                collect_usage=self._instrumentation is not None
+            )
+            with ldap_phase(self._instrumentation, "connect", host=selected.host):
+                selected_conn.open()
+            return selected_conn
+
+        return self.__server_selector.connect(open_connection)
+
+    def __ldap_items(self, conn: Connection) -> list[tuple[str, dict[str, Any]]]:
+
+        """
+        Convert the last search result of the connection to (DN, Object dictionary) pairs as per the result mode.
+        Remaining values of ranged attributes are fetched on the same connection.
+        :param conn:                        Connection
+        :return:
+        """
+
+        with ldap_phase(self._instrumentation, "decode"):
+            if self._result_mode == "raw":
+                items = ldap_response_to_items(conn.response, self._attr_decoders)
+            else:
+                items = ldap_entries_to_items(conn.entries, self._attr_decoders)
+        if self._instrumentation is not None:
+            self._instrumentation.entries(len(items))
+        return ldap_items_complete_ranges(conn, items, self._attr_decoders)
+
+    def __ldap_instrumented(self, operation: Callable[[Connection], Any]) -> Callable[[Connection], Any]:
 
-    def __ldap_entries(self, search_query: str, returned_attrs_collection: Iterable[str]) -> list:
+        """
+        Wrap a pooled operation to record the bytes received by the connection.
+        :param operation:                   Callable Accepting a Bound Connection
+        :return:
+        """
+
+        def instrumented_operation(conn: Connection) -> Any:
+            received = conn.usage.bytes_received if conn.usage else 0
+            try:
+                return operation(conn)
+            finally:
+                if conn.usage:
+                    self._instrumentation.bytes_received(conn.usage.bytes_received - received)
 
+        return instrumented_operation
+
+    def __ldap_host_pool(self, server: Server) -> LdapConnectionPool:
+
+        """
+        Connection pool of the server (hedged reads, partitioned enumerations), created on the first use.
+        :param server:                      Server
+        :return:
+        """
+
+        with self.__host_pools_lock:
+            host_pool = self.__host_pools.get(server.host)
+            if host_pool is None:
+                host_pool = self.__host_pools[server.host] = LdapConnectionPool(
+                    connection_factory=lambda: self.__ldap_connection(server),
+                    min_size=0,
+                    max_size=self._pool_max_size,
+                    wait_timeout=self._connect_timeout,
+                    observer=self.__ldap_observe
+                )
+            return host_pool
+
+    def __ldap_execute(self, method: str, operation: Callable[[Connection], Any]) -> Any:
+
+        """
+        Run a read operation via pooled connection. With hedging enabled the operation runs in a worker thread,
+        if it isn't completed within the hedge delay, it's repeated on a connection to another host and the first
+        answer wins. The loser is abandoned: it isn't run if it hasn't started yet, otherwise its connection
+        is closed and discarded.
+        :param method:                      Method Name (Latency Quantile Key)
+        :param operation:                   Callable Accepting a Bound Connection
+        :return:
         """
-        Get entries via connection context manager.
+
+        if self._instrumentation is not None:
+            operation = self.__ldap_instrumented(operation)
+        policy = self.__hedge_policy
+        if policy is None:
+            return self.__connection_pool.execute(operation)
+
+        started = time.monotonic()
+        primary_leg = LdapHedgeLeg(operation)
+        # Worker threads run in a copy of the caller context (current method of the instrumentation)
+        primary = self.__hedge_executor.submit(
+            contextvars.copy_context().run, self.__connection_pool.execute, primary_leg
+        )
+        delay = policy.delay(method)
+        server = None
+        # Without a connection the primary waits for the pool, not for a slow host, so it isn't hedged:
+        # the host of the hedge couldn't be excluded
+        if delay is not None and not wait([primary], timeout=delay).done and primary_leg.host is not None:
+            server = self.__server_selector.select(exclude=[primary_leg.host])
+        if server is None or not policy.acquire():
+            result = primary.result()
+            policy.record(method, time.monotonic() - started)
+            return result
+        hedge_leg = LdapHedgeLeg(operation)
+        hedge = self.__hedge_executor.submit(
+            contextvars.copy_context().run, self.__ldap_host_pool(server).execute, hedge_leg
+        )
+        pending = {primary, hedge}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            answer = ldap_hedge_answer((primary, hedge), done, pending)
+            if answer is not None:
+                break
+        for future, leg in ((primary, primary_leg), (hedge, hedge_leg)):
+            if future in pending and not future.cancel():
+                leg.abandon()
+        policy.record(method, time.monotonic() - started, hedge_won=answer is hedge)
+        return answer.result()
+
+    def __ldap_entries(
+            self,
+            search_query: str,
+            returned_attrs_collection: Iterable[str],
+            method: str = "search"
+    ) -> list[tuple[str, dict[str, Any]]]:
+
+        """
+        Get (DN, Object dictionary) pairs via pooled connection.
+        :param search_query:                LDAP Search Filter
         :param returned_attrs_collection:   Collection of Returned Attributes
+        :param method:                      Method Name (Hedge Delay Key)
         :return:
         """
 
-        log_message = "@ LDAP Entries @ - {message}"
+        items, _ = self.__ldap_controlled_entries(search_query, returned_attrs_collection, method=method)
+        return items
+
+    def __ldap_controlled_entries(
+            self,
+            search_query: str,
+            returned_attrs_collection: Iterable[str],
+            controls: Optional[list] = None,
+            size_limit: Optional[int] = None,
+            method: str = "search"
+    ) -> tuple[list[tuple[str, dict[str, Any]]], dict]:
 
-        # 'conn' example: "{ldap_uri} - ssl - user: {ldap_user} - not lazy - \
-        # bound - open - <local: {local_ip}:{local_port} - remote: {ldap_ip}:{ldap_port}> - \
-        # tls not started - listening - SyncStrategy - internal decoder"
-        with Connection(
-            self.__server_pool,
-            raise_exceptions=True,
-            auto_bind=AUTO_BIND_DEFAULT,
-            user=self.__user_dn,
-            password=self.__user_pass,
-            return_empty_attributes=True,
-            receive_timeout=self._receive_timeout
-        ) as conn:
-            # 'conn.bound' - The status of the LDAP session (True / False)
-            if conn.bound:
+        """
+        Get (DN, Object dictionary) pairs and the search result with the response controls via pooled connection.
+        :param search_query:                LDAP Search Filter
+        :param returned_attrs_collection:   Collection of Returned Attributes
+        :param controls:                    Request Controls or None
+        :param size_limit:                  Size Limit or None (`_search_limit`)
+        :param method:                      Method Name (Hedge Delay Key)
+        :return:
+        """
+
+        def search(conn: Connection) -> tuple[list[tuple[str, dict[str, Any]]], dict]:
+            with ldap_phase(self._instrumentation, "search", host=conn.server.host):
                 conn.search(
                     search_base=self.__search_base,
                     search_filter=search_query,
                     search_scope=SUBTREE,
-                    size_limit=self._search_limit,
-                    attributes=returned_attrs_collection
+                    size_limit=self._search_limit if size_limit is None else size_limit,
+                    attributes=returned_attrs_collection,
+                    controls=controls
                 )
-                return conn.entries
-            logging.error(log_message.format(message=f"Error Detail:\n{conn}."))
-            raise LdapBoundError("Bound error occurred.")
+            # Ranged attributes requests replace the connection result
+            result = conn.result
+            return self.__ldap_items(conn), result
 
-    def __ldap_reader(self, object_category: Iterable[str], dn: str) -> Reader:
+        return self.__ldap_execute(method, search)
+
+    def __ldap_reader(
+            self,
+            object_category: Iterable[str],
+            dn: str,
+            returned_attrs_collection: Iterable[str] = None
+    ) -> list[tuple[str, dict[str, Any]]]:
 
         """
-        Get reader via connection context manager.
+        Get reader (DN, Object dictionary) pairs via pooled connection.
         :param object_category:             Object Categories & Classes Collection
         :param dn:                          Object `distinguishedName` Attribute Value
+        :param returned_attrs_collection:   Collection of Returned Attributes or None
         :return:
         """
 
-        log_message = "@ LDAP Reader @ - {message}"
-
-        with Connection(
-            self.__server_pool,
-            raise_exceptions=True,
-            auto_bind=AUTO_BIND_DEFAULT,
-            user=self.__user_dn,
-            password=self.__user_pass,
-            return_empty_attributes=True,
-            receive_timeout=self._receive_timeout
-        ) as conn:
-            # 'conn.bound' - The status of the LDAP session (True / False)
-            if conn.bound:
-                object_def = ObjectDef(object_category, conn)
-                if any(value in object_category for value in ["computer", "group", "person", "user"]):
-                    object_def += AttrDef("sAMAccountName")
-                return Reader(connection=conn, object_def=object_def, base=dn)
-            logging.error(log_message.format(message=f"Error Detail:\n{conn}."))
-            raise LdapBoundError("Bound error occurred.")
-
-    def __ldap_object_detail_query_selector(
-            self,
-            object_category: str,
-            attr_name: str,
-            attr_value: str,
-            is_active: bool
-    ) -> str:
+        def read(conn: Connection) -> list[tuple[str, dict[str, Any]]]:
+            object_def = self.__object_defs.get(object_category, conn)
+            if self._result_mode == "raw":
+                # Same query and defaults as `ldap3.Reader` without building Entries
+                with ldap_phase(self._instrumentation, "search", host=conn.server.host):
+                    conn.search(
+                        search_base=dn,
+                        search_filter=ldap_object_read_query(object_category),
+                        search_scope=SUBTREE,
+                        attributes=returned_attrs_collection or [attr.name for attr in object_def]
+                    )
+                return self.__ldap_items(conn)
+            with ldap_phase(self._instrumentation, "search", host=conn.server.host):
+                entries = Reader(connection=conn, object_def=object_def, base=dn).search(
+                    attributes=returned_attrs_collection
+                )
+            with ldap_phase(self._instrumentation, "decode"):
+                items = ldap_entries_to_items(entries, self._attr_decoders)
+            if self._instrumentation is not None:
+                self._instrumentation.entries(len(items))
+            return ldap_items_complete_ranges(conn, items, self._attr_decoders)
+
+        return self.__ldap_execute("object_read", read)
+
+    def __ldap_cache_attrs(self, returned_attrs_collection: Optional[Iterable[str]]) -> tuple[str, ...]:
 
         """
-        Object (`Person`, `Group` or `Computer`) detail query selector.
-        :param object_category:             Object Category: `Person`, `Group` or `Computer`
-        :param attr_name:                   Attribute Name for Searching
-        :param attr_value:                  Attributes Value for Searching
-        :param is_active:                   Person (User) Search Scope (Active or All Users)
+        Revalidation attributes missing from the collection of returned attributes.
+        :param returned_attrs_collection:   Collection of Returned Attributes or None (Reader Defaults)
+        :return:
+        """
+
+        if self.__cache is None or not self._cache_revalidate or not returned_attrs_collection:
+            return ()
+        returned_attrs_lower = {attr_name.lower() for attr_name in returned_attrs_collection}
+        return tuple(attr for attr in LDAP_REVALIDATION_ATTRS_TUPLE if attr.lower() not in returned_attrs_lower)
+
+    @staticmethod
+    def __ldap_cache_stamps(items: list[tuple[str, dict[str, Any]]]) -> Optional[dict[str, tuple]]:
+
+        """
+        Objects change stamps by DN or None if any Object has no revalidation attributes.
+        :param items:                       (DN, Object Dictionary) Pairs
         :return:
         """
 
-        match object_category:
-            case "computer":
-                search_query = self.__ldap_computer_detail_query(attr_name=attr_name, attr_value=attr_value)
-            case "group":
-                search_query = self.__ldap_group_detail_query(attr_name=attr_name, attr_value=attr_value)
-            case _:
-                # Person
-                search_query = self.__ldap_person_detail_all_users_query(attr_name=attr_name, attr_value=attr_value)
-                if is_active:
-                    search_query = self.__ldap_person_detail_active_users_query(
-                        attr_name=attr_name, attr_value=attr_value
+        stamps = {}
+        for dn, values in items:
+            values = {key.lower(): value for key, value in values.items()}
+            stamp = tuple(values.get(attr.lower()) for attr in LDAP_REVALIDATION_ATTRS_TUPLE)
+            if None in stamp:
+                return None
+            stamps[dn] = stamp
+        return stamps
+
+    def __ldap_stamps(self, dns: Iterable[str]) -> dict[str, Optional[tuple]]:
+
+        """
+        Read the current Objects change stamps by DN with base scoped searches on one connection.
+        :param dns:                         Objects `distinguishedName` Attribute Values
+        :return:
+        """
+
+        def read(conn: Connection) -> dict[str, Optional[tuple]]:
+            stamps = {}
+            for dn in dns:
+                try:
+                    conn.search(
+                        search_base=dn,
+                        search_filter="(objectClass=*)",
+                        search_scope=BASE,
+                        attributes=LDAP_REVALIDATION_ATTRS_TUPLE
                     )
-        return search_query
+                except LDAPNoSuchObjectResult:
+                    stamps[dn] = None
+                    continue
+                items = self.__ldap_items(conn)
+                stamps[dn] = (self.__ldap_cache_stamps(items) or {}).get(dn) if items else None
+            return stamps
+
+        return self.__connection_pool.execute(read)
 
-    def __ldap_objects_search_query_selector(
+    def __ldap_cache_get(self, cache_key: tuple) -> Optional[Any]:
+
+        """
+        Get a cached result. A stale result is revalidated if enabled and the Objects haven't been changed.
+        :param cache_key:                   Cache Key
+        :return:
+        """
+
+        if self.__cache is None:
+            return None
+        payload, stamps = self.__cache.get(cache_key)
+        if payload is None and stamps and self._cache_revalidate:
+            if self.__ldap_stamps(stamps) == stamps:
+                return self.__cache.refresh(cache_key)
+            self.__cache.invalidate(cache_key)
+        return payload
+
+    def __ldap_cache_set(
             self,
+            cache_key: tuple,
             object_category: str,
-            attr_value: str,
-            search_by_attrs_collection: Iterable[str]
-    ) -> str:
+            payload: Any,
+            items: list[tuple[str, dict[str, Any]]]
+    ) -> None:
 
         """
-        Objects (`Person`, `Group` or `Computer`) search query selector.
-        :param object_category:             Object Category: `Person`, `Group` or `Computer`
-        :param attr_value:                  Attributes Value for Searching
-        :param search_by_attrs_collection:  Searching for Person (User) Based on Attributes from the Collection
+        Cache a method result with the Objects change stamps.
+        :param cache_key:                   Cache Key
+        :param object_category:             Object Category
+        :param payload:                     Method Result
+        :param items:                       (DN, Object Dictionary) Pairs
         :return:
         """
 
-        match object_category:
-            case "computer":
-                search_query = self.__ldap_computers_search_query(attr_value=attr_value)
-            case "group":
-                search_query = self.__ldap_groups_search_query(attr_value=attr_value)
-            case _:
-                # Person
-                search_query = self.__ldap_persons_search_query(
-                    attr_value=attr_value, search_by_attrs_collection=search_by_attrs_collection
-                )
-        return search_query
+        if self.__cache is not None and payload is not None:
+            self.__cache.set(
+                cache_key,
+                category=object_category,
+                payload=payload,
+                stamps=self.__ldap_cache_stamps(items) if self._cache_revalidate else None
+            )
 
     @staticmethod
-    def __ldap_computer_detail_query(attr_name: str, attr_value: str) -> str:
+    def __ldap_read_category(object_category: Iterable[str]) -> str:
 
         """
-        Computer detail query. Strict match.
-        :param attr_name:                   Attribute Name for Searching
-        :param attr_value:                  Attributes Value for Searching
+        Cache TTL category by the first known Object Category or Class.
+        :param object_category:             Object Categories & Classes Collection
         :return:
         """
 
-        return f"""(
-            &(objectCategory=Computer)
-            (!(objectCategory=Group))
-            (!(objectCategory=Person))
-            ({attr_name}={attr_value})
-        )"""
+        return next(
+            (
+                ldap_objects_classes_categories_schema[value] for value in object_category
+                if value in ldap_objects_classes_categories_schema
+            ),
+            "read"
+        )
 
-    @staticmethod
-    def __ldap_computers_search_query(attr_value: str) -> str:
+    def __ldap_deferred_attrs(
+            self,
+            object_category: str,
+            returned_attrs: Iterable[str],
+            attr_name: str
+    ) -> tuple[str, ...]:
 
         """
-        Computers search query.
-        :param attr_value:                  Attributes Value for Searching by `cn`
+        Heavy attributes of the collection of returned attributes, except the searched attribute.
+        :param object_category:             Object Category: `person`, `group` or `computer`
+        :param returned_attrs:              Returned Attributes
+        :param attr_name:                   Attribute Name for Searching
         :return:
         """
 
-        return f"(&(objectCategory=Computer)(!(objectCategory=Group))(!(objectCategory=Person))(cn=*{attr_value}*))"
+        heavy_attrs = {attr.lower() for attr in self._deferred_attrs.get(object_category, ())} - {attr_name.lower()}
+        return tuple(attr for attr in returned_attrs if attr.lower() in heavy_attrs)
 
-    @staticmethod
-    def __ldap_group_detail_query(attr_name: str, attr_value: str) -> str:
+    def __ldap_deferred_loader(
+            self,
+            object_category: str
+    ) -> Callable[[str, tuple[str, ...]], Optional[dict[str, Any]]]:
 
         """
-        Group detail query. Strict match.
-        :param attr_name:                   Attribute Name for Searching
-        :param attr_value:                  Attributes Value for Searching
+        Deferred attributes loader of an `LdapDeferredObject`.
+        :param object_category:             Object Category (Cache TTL Category)
         :return:
         """
 
-        return f"""(
-            &(objectCategory=Group)
-            (!(objectCategory=Computer))
-            (!(objectCategory=Person))
-            ({attr_name}={attr_value})
-        )"""
+        return lambda dn, attrs: self.__ldap_deferred_values(object_category, dn, attrs)
 
-    @staticmethod
-    def __ldap_groups_search_query(attr_value: str) -> str:
+    @ldap_logging
+    def __ldap_deferred_values(
+            self,
+            object_category: str,
+            dn: str,
+            attrs: tuple[str, ...]
+    ) -> Optional[dict[str, Any]]:
 
         """
-        Groups search query.
-        :param attr_value:                  Attributes Value for Searching by `cn`
+        Read deferred attributes of an Object with a base scoped search. Results are cached like `object_detail`.
+        None is returned (by `ldap_logging`) if the Object was deleted or moved since the search.
+        :param object_category:             Object Category (Cache TTL Category)
+        :param dn:                          Object `distinguishedName` Attribute Value
+        :param attrs:                       Deferred Attribute Names
         :return:
         """
 
-        return f"(&(objectCategory=Group)(!(objectCategory=Computer))(!(objectCategory=Person))(cn=*{attr_value}*))"
+        cache_key = ("deferred", ldap_dn_key(dn), attrs)
+        cached = self.__ldap_cache_get(cache_key)
+        if cached is not None:
+            return cached
+        cache_attrs = self.__ldap_cache_attrs(attrs)
 
-    @staticmethod
-    def __ldap_person_detail_active_users_query(attr_name: str, attr_value: str) -> str:
+        def read(conn: Connection) -> list[tuple[str, dict[str, Any]]]:
+            with ldap_phase(self._instrumentation, "search", host=conn.server.host):
+                conn.search(
+                    search_base=dn,
+                    search_filter="(objectClass=*)",
+                    search_scope=BASE,
+                    attributes=attrs + cache_attrs
+                )
+            return self.__ldap_items(conn)
+
+        items = self.__ldap_execute("object_detail_deferred", read)
+        values = {key: value for key, value in items[0][1].items() if key not in cache_attrs} if items else {}
+        self.__ldap_cache_set(cache_key, object_category, values, items)
+        return values
+
+    def __ldap_replica_items(
+            self,
+            object_category: str,
+            returned_attrs: Iterable[str],
+            query: Callable[[LdapReplica], Optional[list[tuple[str, dict[str, Any]]]]]
+    ) -> Optional[list[tuple[str, dict[str, Any]]]]:
 
         """
-        Person detail active users query. Strict match.
-        :param attr_name:                   Attribute Name for Searching
-        :param attr_value:                  Attributes Value for Searching
+        Query the directory replica. None if the replica is disabled, stale, doesn't replicate the returned attributes
+        or can't serve the query, the caller falls back to the directory.
+        :param object_category:             Object Category: `person`, `group` or `computer`
+        :param returned_attrs:              Returned Attributes
+        :param query:                       Replica Query: Replica -> (DN, Object Dictionary) Pairs or None
+        :return:
+        """
+
+        if self.__replica is None:
+            return None
+        try:
+            staleness = self.__replica.staleness()
+            if staleness is None or staleness > self._replica_max_staleness \
+                    or not self.__replica.covers(object_category, returned_attrs):
+                return None
+            items = query(self.__replica)
+        except sqlite3.Error as e:
+            logging.warning(f"@ LDAP Replica @ - Replica query failed, the directory is queried: {e}.")
+            return None
+        if items is not None and self._attr_decoders:
+            for _, values in items:
+                ldap_attrs_decode(values, self._attr_decoders)
+        return items
+
+    def __ldap_membership_chain(self, search_query: str) -> list[str]:
+
+        """
+        DNs of Objects matched by a `LDAP_MATCHING_RULE_IN_CHAIN` query. Paged, not limited by `_search_limit`.
+        :param search_query:                LDAP Search Filter
         :return:
         """
 
-        return f"""(
-            &(objectCategory=Person)(objectClass=User)
-            (!(UserAccountControl:1.2.840.113556.1.4.803:=2))
-            (!(objectCategory=Computer))
-            (!(objectCategory=Group))
-            ({attr_name}={attr_value})
-        )"""
+        def search(conn: Connection) -> list[str]:
+            dns = []
+            for page, _ in ldap_paged_search(
+                    conn,
+                    search_base=self.__search_base,
+                    search_query=search_query,
+                    returned_attrs_collection=["distinguishedName"],
+                    page_size=self._search_limit
+            ):
+                dns.extend(values["distinguishedName"] for values in page)
+            return dns
 
-    @staticmethod
-    def __ldap_person_detail_all_users_query(attr_name: str, attr_value: str) -> str:
+        return self.__connection_pool.execute(search)
+
+    def __ldap_membership_fetch(self, attr_name: str, chunk_size: int):
 
         """
-        Person detail all users query. Strict match.
-        :param attr_name:                   Attribute Name for Searching
-        :param attr_value:                  Attributes Value for Searching
+        Linked attribute reader of the membership graph. Objects are read in chunks on one pooled connection,
+        values are returned as sent by the server (attribute decoders aren't applied).
+        :param attr_name:                   Linked Attribute Name: `member` or `memberOf`
+        :param chunk_size:                  Number of DNs per Search Request
         :return:
         """
 
-        return f"""(
-            &(objectCategory=Person)(objectClass=User)
-            (!(objectCategory=Computer))
-            (!(objectCategory=Group))
-            ({attr_name}={attr_value})
-        )"""
+        def fetch(dns: list[str], groups_only: bool) -> list[tuple[str, tuple[str, ...]]]:
+
+            def read(conn: Connection) -> list[tuple[str, tuple[str, ...]]]:
+                nodes = []
+                for i in range(0, len(dns), chunk_size):
+                    conn.search(
+                        search_base=self.__search_base,
+                        search_filter=ldap_objects_read_many_query(
+                            ("group",) if groups_only else ("top",), dns[i:i + chunk_size]
+                        ),
+                        search_scope=SUBTREE,
+                        size_limit=chunk_size,
+                        attributes=[attr_name]
+                    )
+                    items = ldap_items_complete_ranges(conn, ldap_response_to_items(conn.response))
+                    nodes.extend((dn, ldap_linked_values(values, attr_name)) for dn, values in items)
+                return nodes
 
-    @staticmethod
-    def __ldap_persons_search_query(attr_value: str, search_by_attrs_collection: Iterable[str]) -> str:
+            return self.__connection_pool.execute(read)
+
+        return fetch
+
+    def __ldap_membership(self, direction: str, dn: str, strategy: str, chunk_size: int) -> LdapMembershipResult:
 
         """
-        Persons search query.
-        :param attr_value:                  Attributes Value for Searching
-        :param search_by_attrs_collection:  Searching for Person (User) Based on Attributes from the Collection
+        Transitive membership by the strategy.
+        :param direction:                   Expansion Direction: `groups` (of an Object) or `members` (of a Group)
+        :param dn:                          Object `distinguishedName` Attribute Value
+        :param strategy:                    `chain` (Server-Side) or `bfs` (Client-Side with the Memoised Graph)
+        :param chunk_size:                  Number of DNs per Search Request of the `bfs` Strategy
         :return:
         """
 
-        search_filter = "".join([f"({attr_name}={attr_value}*)" for attr_name in search_by_attrs_collection])
-        return f"""(
-            &(objectCategory=Person)(objectClass=User)
-            (!(objectCategory=Computer))
-            (!(objectCategory=Group))
-            (|{search_filter})
-        )"""
+        log_message = f"@ LDAP Membership @ - 'Direction: `{direction}`, DN: `{dn}`' - {{message}}"
+
+        validated_data = LdapMembershipModel(
+            **{
+                "dn": dn,
+                "strategy": strategy.lower() if isinstance(strategy, str) else strategy,
+                "chunk_size": chunk_size
+            }
+        ).model_dump()
+        if validated_data["strategy"] == "chain":
+            search_query = ldap_object_groups_chain_query(dn) if direction == "groups" \
+                else ldap_group_members_chain_query(dn)
+            dns = self.__ldap_membership_chain(search_query)
+            return LdapMembershipResult(dns=tuple(sorted(dns, key=str.lower)), cycles=())
+        result = self.__group_graph.expand(
+            dn,
+            direction=direction,
+            fetch=self.__ldap_membership_fetch(LDAP_MEMBERSHIP_ATTRS[direction], validated_data["chunk_size"])
+        )
+        if result.cycles:
+            logging.warning(
+                log_message.format(
+                    message=f"Membership cycles were found: {', '.join(f'{m} -> {g}' for m, g in result.cycles)}."
+                )
+            )
+        return result
 
     @staticmethod
     def pwd_expiration(attr_value: int) -> datetime:
@@ -311,20 +974,7 @@ class tinyLDAP3Client:
         :return:
         """
 
-        sat_value_schema = {
-            0: "SAM_DOMAIN_OBJECT",
-            268435456: "SAM_GROUP_OBJECT",
-            268435457: "SAM_NON_SECURITY_GROUP_OBJECT",
-            536870912: "SAM_ALIAS_OBJECT",
-            536870913: "SAM_NON_SECURITY_ALIAS_OBJECT",
-            805306368: "SAM_NORMAL_USER_ACCOUNT",
-            805306369: "SAM_MACHINE_ACCOUNT",
-            805306370: "SAM_TRUST_ACCOUNT",
-            1073741824: "SAM_APP_BASIC_GROUP",
-            1073741825: "SAM_APP_QUERY_GROUP",
-            2147483647: "SAM_ACCOUNT_TYPE_MAX",
-        }
-        return sat_value_schema[sat_value] if sat_value in sat_value_schema.keys() else "sAMAccountType Unknown"
+        return ldap_sam_account_type(sat_value) or "sAMAccountType Unknown"
 
     @staticmethod
     def uac_description(uac_value: int) -> str:
@@ -350,7 +1000,21 @@ class tinyLDAP3Client:
             328226: "Disabled, Smartcard Required, Password Doesn't Expire & Not Required",
             2163200: "Enabled, Password Doesn't Expire, Use Des Key Only"
         }
-        return uac_value_schema[uac_value] if uac_value in uac_value_schema.keys() else "userAccountControl Unknown"
+        if uac_value in uac_value_schema.keys():
+            return uac_value_schema[uac_value]
+        # Other combinations are described by their flag names
+        return ", ".join(sorted(ldap_uac_flags(uac_value))) or "userAccountControl Unknown"
+
+    @staticmethod
+    def uac_flags(uac_value: int) -> frozenset[str]:
+
+        """
+        Flag names of the `userAccountControl` attribute bits, e.g. {"ACCOUNTDISABLE", "NORMAL_ACCOUNT"}.
+        :param uac_value:               `userAccountControl` Attribute Value
+        :return:
+        """
+
+        return ldap_uac_flags(uac_value)
 
     @ldap_logging
     def object_detail(
@@ -359,7 +1023,8 @@ class tinyLDAP3Client:
             attr_name: str,
             attr_value: str,
             is_active: bool = False,
-            returned_attrs_collection: Iterable[str] = None
+            returned_attrs_collection: Iterable[str] = None,
+            deferred: bool = False
     ) -> Union[dict[str, Any], tuple[dict, ...], None]:
 
         """
@@ -370,50 +1035,193 @@ class tinyLDAP3Client:
         :param attr_value:                  Attributes Value for Searching
         :param is_active:                   Person (User) Search Scope (Active or All Users)
         :param returned_attrs_collection:   Collection of Returned Attributes or None
+        :param deferred:                    Read the Heavy Attributes on the First Access (`LdapDeferredObject`)
         :return:
         """
 
         log_message = \
             f"@ LDAP Object Detail @ - 'ObjectCategory: `{object_category}`, AttrName: `{attr_name}`, Value: `{attr_value}`' - {{message}}"
 
-        validated_data = LdapObjectDetailModel(
-            **{
-                "method_type": "detail",
-                "object_category": object_category.lower(),
-                "attr_name": attr_name,
-                "attr_value": attr_value,
-                "returned_attrs_collection": returned_attrs_collection
-            }
-        ).model_dump()
-        search_query = self.__ldap_object_detail_query_selector(
-            object_category=validated_data["object_category"],
-            attr_name=validated_data["attr_name"],
-            attr_value=validated_data["attr_value"],
-            is_active=is_active
+        plan = ldap_object_detail_plan(
+            object_category=object_category.lower(),
+            attr_name=attr_name,
+            attr_value=attr_value,
+            is_active=is_active,
+            returned_attrs_collection=returned_attrs_collection
         )
-        # Object Detail request
-        resp_raw = self.__ldap_entries(
-            search_query=search_query,
-            returned_attrs_collection=tuple(validated_data["returned_attrs_collection"])
+        search_query = plan.query(attr_value)
+        deferred_attrs = self.__ldap_deferred_attrs(plan.object_category, plan.returned_attrs, plan.attr_name) \
+            if deferred else ()
+        returned_attrs = tuple(attr for attr in plan.returned_attrs if attr not in deferred_attrs)
+        resp_raw = self.__ldap_replica_items(
+            plan.object_category,
+            returned_attrs,
+            lambda replica: replica.detail(plan.object_category, plan.attr_name, attr_value, is_active, returned_attrs)
         )
+        # Replica results aren't cached
+        cache_key = None
+        cache_attrs = ()
+        if resp_raw is None:
+            cache_key = ("detail", plan.object_category, plan.attr_name, attr_value, is_active, returned_attrs)
+            cached = self.__ldap_cache_get(cache_key)
+            if cached is not None:
+                return cached
+            cache_attrs = self.__ldap_cache_attrs(returned_attrs)
+            # Object Detail request
+            resp_raw = self.__ldap_entries(
+                search_query=search_query,
+                returned_attrs_collection=returned_attrs + cache_attrs,
+                method="object_detail"
+            )
         if resp_raw:
+            def result_item(dn: str, values: dict[str, Any]) -> dict[str, Any]:
+                item = {key: value for key, value in values.items() if key not in cache_attrs}
+                if deferred_attrs:
+                    return LdapDeferredObject(
+                        item, dn, deferred_attrs, self.__ldap_deferred_loader(plan.object_category)
+                    )
+                return item
+
             if len(resp_raw) == 1:
-                return {attr.key: attr.value for attr in resp_raw[0]}
+                resp_result = result_item(*resp_raw[0])
             else:
                 logging.warning(
                     log_message.format(
                         message="More than one LDAP Object were found. Use attributes with unique values."
                     )
                 )
-                return tuple(
+                resp_result = tuple(
                     sorted(
-                        [{attr.key: attr.value for attr in item} for item in resp_raw],
-                        key=lambda item: item[validated_data["attr_name"]]
+                        [result_item(dn, values) for dn, values in resp_raw],
+                        key=lambda item: item[plan.attr_name]
                     )
                 )
+            if cache_key is not None:
+                self.__ldap_cache_set(cache_key, plan.object_category, resp_result, resp_raw)
+            return resp_result
         logging.warning(log_message.format(message="LDAP Object not found."))
         return None
 
+    @ldap_logging
+    def objects_detail_many(
+            self,
+            object_category: str,
+            attr_name: str,
+            attr_values: Iterable[str],
+            is_active: bool = False,
+            returned_attrs_collection: Iterable[str] = None,
+            chunk_size: int = 200,
+            workers: int = 1
+    ) -> LdapObjectsDetailManyResult:
+
+        """
+        Objects (`Person`, `Group` or `Computer`) bulk detail method will return Objects dictionaries by requested
+        values with missing and duplicate values. Values are searched in chunks with `(|(attr=v1)(attr=v2)...)` filters.
+        :param object_category:             Object Category: `Person`, `Group` or `Computer`
+        :param attr_name:                   Attribute Name for Searching
+        :param attr_values:                 Attribute Values for Searching
+        :param is_active:                   Person (User) Search Scope (Active or All Users)
+        :param returned_attrs_collection:   Collection of Returned Attributes or None
+        :param chunk_size:                  Number of Values per Search Filter
+        :param workers:                     Number of Chunk Groups Searched in Parallel on Pooled Connections
+        :return:
+        """
+
+        log_message = \
+            f"@ LDAP Objects Detail Many @ - 'ObjectCategory: `{object_category}`, AttrName: `{attr_name}`' - {{message}}"
+
+        validated_data = LdapObjectsDetailManyModel(
+            **{
+                "method_type": "detail",
+                "object_category": object_category.lower(),
+                "attr_name": attr_name,
+                "attr_values": tuple(attr_values),
+                "returned_attrs_collection": returned_attrs_collection,
+                "chunk_size": chunk_size,
+                "workers": workers
+            }
+        ).model_dump()
+        attr_name = validated_data["attr_name"]
+        returned_attrs = tuple(validated_data["returned_attrs_collection"])
+
+        # Values are matched case-insensitively, the first spelling of a repeated value is kept
+        requested_values: dict[str, str] = {}
+        repeated_values = []
+        for attr_value in validated_data["attr_values"]:
+            if attr_value.lower() in requested_values:
+                repeated_values.append(attr_value)
+            else:
+                requested_values[attr_value.lower()] = attr_value
+        unique_values = tuple(requested_values.values())
+        chunks = [unique_values[i:i + chunk_size] for i in range(0, len(unique_values), chunk_size)]
+
+        def search_chunks(chunks_part: list[tuple[str, ...]]) -> list[dict[str, Any]]:
+
+            def search(conn: Connection) -> list[dict[str, Any]]:
+                objects = []
+                for chunk in chunks_part:
+                    search_query = ldap_objects_detail_many_query_selector(
+                        object_category=validated_data["object_category"],
+                        attr_name=attr_name,
+                        attr_values=chunk,
+                        is_active=is_active
+                    )
+                    for page, _ in ldap_paged_search(
+                            conn,
+                            search_base=self.__search_base,
+                            search_query=search_query,
+                            returned_attrs_collection=returned_attrs,
+                            page_size=self._search_limit,
+                            decoders=self._attr_decoders
+                    ):
+                        objects.extend(page)
+                return objects
+
+            # Chunks of the part share one pooled connection
+            return self.__connection_pool.execute(search)
+
+        workers = min(workers, len(chunks)) or 1
+        if workers == 1:
+            resp_raw = search_chunks(chunks)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                resp_raw = [
+                    item for part in executor.map(search_chunks, [chunks[i::workers] for i in range(workers)])
+                    for item in part
+                ]
+
+        matches: dict[str, list[dict]] = {key: [] for key in requested_values}
+        attr_name_lower = attr_name.lower()
+        for item in resp_raw:
+            item_value = next((value for key, value in item.items() if key.lower() == attr_name_lower), None)
+            for value in item_value if isinstance(item_value, list) else [item_value]:
+                if isinstance(value, str) and value.lower() in matches:
+                    matches[value.lower()].append(item)
+
+        objects, missing_values, duplicate_values = {}, [], []
+        for key, items in matches.items():
+            attr_value = requested_values[key]
+            if not items:
+                missing_values.append(attr_value)
+            elif len(items) == 1:
+                objects[attr_value] = items[0]
+            else:
+                duplicate_values.append(attr_value)
+                objects[attr_value] = tuple(items)
+        if missing_values or duplicate_values:
+            logging.warning(
+                log_message.format(
+                    message=f"LDAP Objects not found: {len(missing_values)}, "
+                            f"more than one LDAP Object were found: {len(duplicate_values)}."
+                )
+            )
+        return LdapObjectsDetailManyResult(
+            objects=objects,
+            missing=tuple(missing_values),
+            duplicates=tuple(duplicate_values),
+            repeated=tuple(repeated_values)
+        )
+
     @ldap_logging
     def object_read(
             self,
@@ -431,17 +1239,117 @@ class tinyLDAP3Client:
         :return:
         """
 
+        object_category = tuple(object_category)
         log_message = f"@ LDAP Object Read @ - 'ObjectCategory: `{object_category}`, DN: `{dn}`' - {{message}}"
 
-        resp_raw = self.__ldap_reader(object_category, dn).search(attributes=returned_attrs_collection)
+        returned_attrs = tuple(returned_attrs_collection) if returned_attrs_collection else None
+        category = self.__ldap_read_category(object_category)
+        # Reader defaults (all ObjectDef attributes) aren't replicated
+        resp_raw = self.__ldap_replica_items(
+            category, returned_attrs, lambda replica: replica.read(category, dn, returned_attrs)
+        ) if returned_attrs else None
+        if resp_raw:
+            if len(resp_raw) == 1:
+                return resp_raw[0][1]
+            return tuple([values for _, values in resp_raw])
+        cache_key = ("read", object_category, dn, returned_attrs)
+        cached = self.__ldap_cache_get(cache_key)
+        if cached is not None:
+            return cached
+        cache_attrs = self.__ldap_cache_attrs(returned_attrs)
+        resp_raw = self.__ldap_reader(object_category, dn, returned_attrs + cache_attrs if returned_attrs else None)
         if resp_raw:
             if len(resp_raw) == 1:
-                return {attr.key: attr.value for attr in resp_raw[0]}
+                resp_result = {key: value for key, value in resp_raw[0][1].items() if key not in cache_attrs}
             else:
-                return tuple([{attr.key: attr.value for attr in item} for item in resp_raw])
+                resp_result = tuple(
+                    [
+                        {key: value for key, value in values.items() if key not in cache_attrs}
+                        for _, values in resp_raw
+                    ]
+                )
+            self.__ldap_cache_set(cache_key, category, resp_result, resp_raw)
+            return resp_result
         logging.warning(log_message.format(message="LDAP Object not found."))
         return None
 
+    @ldap_logging
+    def object_read_many(
+            self,
+            object_category: Iterable[str],
+            dns: Iterable[str],
+            returned_attrs_collection: Iterable[str] = None,
+            chunk_size: int = 200
+    ) -> dict[str, Optional[dict[str, Any]]]:
+
+        """
+        Objects (Any Category or Class) batch read method will return a dictionary of Object dictionaries
+        (None if not found) by requested DN. Objects are read by DN (no subtree) under the search base with
+        a `distinguishedName` filter per chunk of DNs on one connection.
+        :param object_category:             Object Categories & Classes Collection
+        :param dns:                         Objects `distinguishedName` Attribute Values
+        :param returned_attrs_collection:   Collection of Returned Attributes or None (Reader Defaults)
+        :param chunk_size:                  Number of DNs per Search Request (1-1000)
+        :return:
+        """
+
+        log_message = f"@ LDAP Objects Read Many @ - 'ObjectCategory: `{object_category}`' - {{message}}"
+
+        validated_data = LdapObjectReadManyModel(
+            **{
+                "object_category": tuple(object_category),
+                "dns": tuple(dns),
+                "chunk_size": chunk_size
+            }
+        ).model_dump()
+        object_category = validated_data["object_category"]
+        category = self.__ldap_read_category(object_category)
+        returned_attrs = tuple(returned_attrs_collection) if returned_attrs_collection else None
+
+        # Repeated DNs are read once, cached Objects aren't read
+        requested_dns: dict[str, str] = {}
+        for dn in validated_data["dns"]:
+            requested_dns.setdefault(ldap_dn_key(dn), dn)
+        objects: dict[str, Optional[dict[str, Any]]] = {}
+        pending_dns = []
+        for dn in requested_dns.values():
+            objects[dn] = self.__ldap_cache_get(("read_dn", object_category, dn, returned_attrs))
+            if objects[dn] is None:
+                pending_dns.append(dn)
+        cache_attrs = self.__ldap_cache_attrs(returned_attrs)
+
+        def read(conn: Connection) -> list[tuple[str, dict[str, Any]]]:
+            object_def = self.__object_defs.get(object_category, conn)
+            attributes = returned_attrs + cache_attrs if returned_attrs else [attr.name for attr in object_def]
+            items = []
+            chunk_size = validated_data["chunk_size"]
+            for i in range(0, len(pending_dns), chunk_size):
+                with ldap_phase(self._instrumentation, "search", host=conn.server.host):
+                    conn.search(
+                        search_base=self.__search_base,
+                        search_filter=ldap_objects_read_many_query(object_category, pending_dns[i:i + chunk_size]),
+                        search_scope=SUBTREE,
+                        size_limit=chunk_size,
+                        attributes=attributes
+                    )
+                items.extend(self.__ldap_items(conn))
+            return items
+
+        if pending_dns:
+            for dn, values in self.__connection_pool.execute(read):
+                requested_dn = requested_dns.get(ldap_dn_key(dn))
+                if requested_dn is None:
+                    continue
+                resp_result = {key: value for key, value in values.items() if key not in cache_attrs}
+                objects[requested_dn] = resp_result
+                self.__ldap_cache_set(
+                    ("read_dn", object_category, requested_dn, returned_attrs), category, resp_result, [(dn, values)]
+                )
+        missing_count = sum(value is None for value in objects.values())
+        if missing_count:
+            logging.warning(log_message.format(message=f"LDAP Objects not found: {missing_count}."))
+        return objects
+
     @ldap_logging
     def objects_search(
             self,
@@ -450,50 +1358,501 @@ class tinyLDAP3Client:
             order_by: str = "sAMAccountName",
             search_by_attrs_collection: Iterable[str] = None,
             returned_attrs_collection: Iterable[str] = None,
-    ) -> Union[tuple[dict, ...], None]:
+            search_mode: str = None,
+            compact: bool = False,
+            server_sort: bool = False
+    ) -> Union[tuple[dict, ...], LdapResultSet, None]:
 
         """
-        Objects (`Person`, `Group` or `Computer`) search method will return a collection of Objects dictionaries.
+        Objects (`Person`, `Group` or `Computer`) search method will return a collection of Objects dictionaries
+        or a compact result set.
         :param object_category:             Object Category: `Person`, `Group` or `Computer`
         :param attr_value:                  Attributes Value for Searching
         :param order_by:                    Attribute Name for Sorting
         :param search_by_attrs_collection:  Searching for Person (User) Based on Attributes from the Collection or None
         :param returned_attrs_collection:   Collection of Returned Attributes or None
+        :param search_mode:                 Search Mode: `prefix`, `contains`, `anr` or None (Category Default)
+        :param compact:                     Return `LdapResultSet` (Attribute Names Once, Values Tuples)
+        :param server_sort:                 Sort with the Server Side Sort Control (Locally if It's Not Supported)
         :return:
         """
 
         log_message = \
             f"@ LDAP Objects Search @ - 'ObjectCategory: `{object_category}`, AttrValue: `{attr_value}`' - {{message}}"
 
-        validated_data = LdapObjecsSearchModel(
+        plan = ldap_objects_search_plan(
+            object_category=object_category.lower(),
+            attr_value=attr_value,
+            order_by=order_by,
+            search_by_attrs_collection=search_by_attrs_collection,
+            returned_attrs_collection=returned_attrs_collection,
+            search_mode=search_mode
+        )
+        search_query = plan.query(attr_value)
+        returned_attrs = plan.returned_attrs
+        search_by_attrs, search_mode = ldap_objects_search_scope(
+            plan.object_category, plan.search_by_attrs, plan.search_mode
+        )
+        resp_raw = self.__ldap_replica_items(
+            plan.object_category,
+            returned_attrs,
+            lambda replica: replica.search(
+                plan.object_category, attr_value, search_by_attrs, search_mode, returned_attrs, self._search_limit
+            )
+        )
+        server_sorted = False
+        if resp_raw is None:
+            # Objects Search request. With the server sort the size limit applies to the sorted entries.
+            resp_raw, result = self.__ldap_controlled_entries(
+                search_query=search_query,
+                returned_attrs_collection=returned_attrs,
+                controls=[ldap_server_sort_control(plan.order_by)] if server_sort else None,
+                method="objects_search"
+            )
+            server_sorted = server_sort and ldap_server_sort_applied(result)
+        if resp_raw:
+            items = [values for _, values in resp_raw]
+            if compact:
+                result_set = LdapResultSet.from_dicts(items, attrs=returned_attrs)
+                return result_set if server_sorted else result_set.sort(plan.order_by)
+            return tuple(items if server_sorted else ldap_sort_items(items, plan.order_by))
+        logging.warning(log_message.format(message="LDAP Object(s) not found."))
+        return None
+
+    @ldap_logging
+    def objects_window(
+            self,
+            object_category: str,
+            attr_value: str,
+            offset: int = 0,
+            limit: int = 50,
+            order_by: str = "sAMAccountName",
+            around_value: str = None,
+            before: int = 0,
+            context_id: bytes = None,
+            search_by_attrs_collection: Iterable[str] = None,
+            returned_attrs_collection: Iterable[str] = None,
+            search_mode: str = None
+    ) -> LdapWindowResult:
+
+        """
+        Objects (`Person`, `Group` or `Computer`) windowed search method will return a window of the server sorted
+        search result (Virtual List View control): `limit` Objects from `offset`, or from `before` Objects before
+        the first Object with the `order_by` value >= `around_value`. Only the window is transferred, the replica
+        isn't used and the directory must support the Server Side Sort and Virtual List View controls.
+        :param object_category:             Object Category: `Person`, `Group` or `Computer`
+        :param attr_value:                  Attributes Value for Searching
+        :param offset:                      Offset (from 0) of the First Object of the Window
+        :param limit:                       Number of Objects of the Window
+        :param order_by:                    Attribute Name for Sorting
+        :param around_value:                Sort Attribute Value of the Target Object or None (Window by Offset)
+        :param before:                      Number of Objects Before the Target Object (Window by Value)
+        :param context_id:                  `context_id` of the Previous Window of the Same Search or None
+        :param search_by_attrs_collection:  Searching for Person (User) Based on Attributes from the Collection or None
+        :param returned_attrs_collection:   Collection of Returned Attributes or None
+        :param search_mode:                 Search Mode: `prefix`, `contains`, `anr` or None (Category Default)
+        :return:
+        """
+
+        log_message = \
+            f"@ LDAP Objects Window @ - 'ObjectCategory: `{object_category}`, AttrValue: `{attr_value}`' - {{message}}"
+
+        plan = ldap_objects_search_plan(
+            object_category=object_category.lower(),
+            attr_value=attr_value,
+            order_by=order_by,
+            search_by_attrs_collection=search_by_attrs_collection,
+            returned_attrs_collection=returned_attrs_collection,
+            search_mode=search_mode
+        )
+        validated_data = LdapObjectsWindowModel(
+            **{"offset": offset, "limit": limit, "before": before if around_value is not None else 0}
+        ).model_dump()
+        before_count = validated_data["before"]
+        after_count = validated_data["limit"] - before_count - 1
+        if around_value is not None:
+            vlv_control = ldap_vlv_control(before_count, after_count, value=around_value, context_id=context_id)
+        else:
+            vlv_control = ldap_vlv_control(
+                before_count, after_count, offset=validated_data["offset"] + 1, context_id=context_id
+            )
+        resp_raw, result = self.__ldap_controlled_entries(
+            search_query=plan.query(attr_value),
+            returned_attrs_collection=plan.returned_attrs,
+            controls=[ldap_server_sort_control(plan.order_by, critical=True), vlv_control],
+            size_limit=0,
+            method="objects_window"
+        )
+        vlv = ldap_vlv_response(result)
+        if not resp_raw:
+            logging.warning(log_message.format(message="LDAP Object(s) not found."))
+        return LdapWindowResult(
+            items=tuple(values for _, values in resp_raw),
+            offset=max(vlv.target_position - before_count, 1) - 1,
+            total=vlv.content_count,
+            context_id=vlv.context_id
+        )
+
+    @ldap_logging
+    def iter_objects_search(
+            self,
+            object_category: str,
+            attr_value: str,
+            page_size: int = 500,
+            search_by_attrs_collection: Iterable[str] = None,
+            returned_attrs_collection: Iterable[str] = None,
+            search_mode: str = None
+    ) -> LdapPagedSearch:
+
+        """
+        Objects (`Person`, `Group` or `Computer`) paged search method will return an iterator of Objects dictionaries.
+        Results aren't limited by `_search_limit` and aren't sorted. The search state is kept by the server per
+        connection, a stopped search is resumed by continuing the iteration on its held connection.
+        :param object_category:             Object Category: `Person`, `Group` or `Computer`
+        :param attr_value:                  Attributes Value for Searching
+        :param page_size:                   Simple Paged Results Page Size
+        :param search_by_attrs_collection:  Searching for Person (User) Based on Attributes from the Collection or None
+        :param returned_attrs_collection:   Collection of Returned Attributes or None
+        :param search_mode:                 Search Mode: `prefix`, `contains`, `anr` or None (Category Default)
+        :return:
+        """
+
+        plan = ldap_objects_search_plan(
+            object_category=object_category.lower(),
+            attr_value=attr_value,
+            order_by="sAMAccountName",
+            search_by_attrs_collection=search_by_attrs_collection,
+            returned_attrs_collection=returned_attrs_collection,
+            search_mode=search_mode
+        )
+        search_query = plan.query(attr_value)
+        return LdapPagedSearch(
+            connection_pool=self.__connection_pool,
+            search_base=self.__search_base,
+            search_query=search_query,
+            returned_attrs_collection=plan.returned_attrs,
+            page_size=page_size,
+            decoders=self._attr_decoders
+        )
+
+    @ldap_logging
+    def usn_partitions(self, count: int, low: int = 0) -> tuple[LdapPartition, ...]:
+
+        """
+        `uSNChanged` window partitions of `iter_objects_partitioned` bound by the `highestCommittedUSN` of a selected
+        host. Update sequence numbers are local to a domain controller, so the windows are searched on this host.
+        :param count:                       Number of Windows
+        :param low:                         Lower Bound of the Second Window
+        :return:
+        """
+
+        server = self.__server_selector.select()
+        high = self.__ldap_host_pool(server).execute(ldap_highest_usn)
+        if high is None:
+            raise LDAPException(f"highestCommittedUSN of `{server.host}` isn't available.")
+        return ldap_usn_partitions(low, max(high, low), count, host=server.host)
+
+    @ldap_logging
+    def iter_objects_partitioned(
+            self,
+            object_category: str,
+            partitions: Iterable[LdapPartition],
+            is_active: bool = False,
+            returned_attrs_collection: Iterable[str] = None,
+            page_size: int = 500,
+            workers: int = 4,
+            ordered: bool = False,
+            retries: int = 2,
+            spread_hosts: bool = True
+    ) -> LdapPartitionedEnumeration:
+
+        """
+        Objects (`Person`, `Group` or `Computer`) partitioned enumeration will return an iterator over all Objects
+        dictionaries of the partitions (`ldap_ou_partitions`, `ldap_prefix_partitions`, `usn_partitions`).
+        Partitions are searched concurrently with paged searches, each on its own pooled connection. With
+        `spread_hosts` the partitions are spread over the hosts, a retried partition moves to another host.
+        :param object_category:             Object Category: `Person`, `Group` or `Computer`
+        :param partitions:                  Enumeration Partitions
+        :param is_active:                   Person (User) Search Scope (Active or All Users)
+        :param returned_attrs_collection:   Collection of Returned Attributes or None
+        :param page_size:                   Simple Paged Results Page Size
+        :param workers:                     Number of Partitions Searched Concurrently
+        :param ordered:                     Return the Partitions in Their Order (Pages Are Buffered per Partition)
+        :param retries:                     Retries of a Failed Partition
+        :param spread_hosts:                Spread the Partitions over the Hosts
+        :return:
+        """
+
+        validated_data = LdapObjectsEnumerationModel(
             **{
-                "method_type": "search",
                 "object_category": object_category.lower(),
-                "attr_value": attr_value,
-                "order_by": order_by,
-                "search_by_attrs_collection": search_by_attrs_collection,
-                "returned_attrs_collection": returned_attrs_collection
+                "returned_attrs_collection": returned_attrs_collection,
+                "page_size": page_size,
+                "workers": workers,
+                "retries": retries
             }
         ).model_dump()
-        search_query = self.__ldap_objects_search_query_selector(
-            object_category=validated_data["object_category"],
-            attr_value=validated_data["attr_value"],
-            search_by_attrs_collection=validated_data["search_by_attrs_collection"]
-        )
-        # Objects Search request
-        resp_raw = self.__ldap_entries(
-            search_query=search_query,
-            returned_attrs_collection=tuple(validated_data["returned_attrs_collection"])
+        returned_attrs = tuple(validated_data["returned_attrs_collection"])
+        servers = {server.host: server for server in self.__server_selector.servers}
+        # Hosts failed by a partition, skipped by its retries
+        failed_hosts: dict[int, list[str]] = {}
+
+        def partition_server(index: int, partition: LdapPartition) -> Optional[Server]:
+            if partition.host is not None:
+                return servers[partition.host]
+            if not spread_hosts or len(servers) == 1:
+                return None
+            failed = failed_hosts.get(index, [])
+            preferred = list(servers.values())[index % len(servers)]
+            if preferred.host not in failed and self.__server_selector.available(preferred.host):
+                return preferred
+            return self.__server_selector.select(exclude=failed) or self.__server_selector.select()
+
+        def source(index: int, partition: LdapPartition, attempt: int):
+            server = partition_server(index, partition)
+            connection_pool = self.__ldap_host_pool(server) if server is not None else self.__connection_pool
+            host = server.host if server is not None else None
+            try:
+                with connection_pool.connection() as conn:
+                    host = conn.server.host
+                    for items, _ in ldap_paged_items(
+                            conn,
+                            search_base=partition.search_base or self.__search_base,
+                            search_query=ldap_objects_partition_query(
+                                validated_data["object_category"], partition.search_filter, is_active
+                            ),
+                            returned_attrs_collection=returned_attrs,
+                            page_size=page_size,
+                            decoders=self._attr_decoders
+                    ):
+                        yield items
+            except LDAP_PARTITION_RETRY_ERRORS_TUPLE:
+                if host is not None:
+                    failed_hosts.setdefault(index, []).append(host)
+                raise
+
+        partitions = tuple(partitions)
+        unknown_hosts = {partition.host for partition in partitions if partition.host is not None} - set(servers)
+        if unknown_hosts:
+            raise ValueError(f"Partition hosts aren't client hosts: {', '.join(sorted(unknown_hosts))}.")
+        return LdapPartitionedEnumeration(
+            partitions=partitions,
+            source=source,
+            workers=validated_data["workers"],
+            ordered=ordered,
+            retries=validated_data["retries"]
         )
-        if resp_raw:
-            return tuple(
-                sorted(
-                    [{attr.key: attr.value for attr in item} for item in resp_raw],
-                    key=lambda item: item[validated_data["order_by"]]
-                )
+
+    @ldap_logging
+    def export_objects(
+            self,
+            object_category: str,
+            destination: Union[str, os.PathLike, IO[str]],
+            export_format: str = "ndjson",
+            attrs_profile: str = "detail",
+            returned_attrs_collection: Iterable[str] = None,
+            is_active: bool = False,
+            compress: bool = None,
+            page_size: int = 500,
+            partitions: Iterable[LdapPartition] = None,
+            workers: int = 4,
+            progress: Callable[[LdapExportProgress], None] = None,
+            progress_interval: int = 1000
+    ) -> LdapExportProgress:
+
+        """
+        Objects (`Person`, `Group` or `Computer`) export method will stream all Objects of the category to an NDJSON
+        or CSV file page by page: the memory doesn't grow with the directory size. Values are normalized: FILETIME
+        attributes and datetimes to ISO 8601, GUIDs to `{...}`, other bytes to base64.
+        :param object_category:             Object Category: `Person`, `Group` or `Computer`
+        :param destination:                 File Path (Gzip if It Ends with `.gz`) or Text Stream
+        :param export_format:               Export Format: `ndjson` or `csv`
+        :param attrs_profile:               Returned Attributes Profile: `detail` or `search`
+        :param returned_attrs_collection:   Collection of Returned Attributes or None (Profile Attributes)
+        :param is_active:                   Person (User) Search Scope (Active or All Users)
+        :param compress:                    Gzip the File or None (By the `.gz` Path Suffix)
+        :param page_size:                   Simple Paged Results Page Size
+        :param partitions:                  Partitions Searched Concurrently (`iter_objects_partitioned`) or None
+        :param workers:                     Number of Partitions Searched Concurrently
+        :param progress:                    Progress Callback or None
+        :param progress_interval:           Number of Objects Between Progress Callbacks
+        :return:                            Number of Objects, Elapsed Time, Throughput and Written Bytes
+        """
+
+        validated_data = LdapObjectsExportModel(
+            **{
+                "object_category": object_category.lower(),
+                "attrs_profile": attrs_profile,
+                "export_format": export_format,
+                "returned_attrs_collection": returned_attrs_collection,
+                "page_size": page_size
+            }
+        ).model_dump()
+        object_category = validated_data["object_category"].value
+        returned_attrs = tuple(validated_data["returned_attrs_collection"])
+        if partitions is not None:
+            items = self.iter_objects_partitioned(
+                object_category,
+                partitions,
+                is_active=is_active,
+                returned_attrs_collection=returned_attrs,
+                page_size=page_size,
+                workers=workers
             )
-        logging.warning(log_message.format(message="LDAP Object(s) not found."))
-        return None
+        else:
+            items = LdapPagedSearch(
+                connection_pool=self.__connection_pool,
+                search_base=self.__search_base,
+                search_query=ldap_objects_partition_query(object_category, is_active=is_active),
+                returned_attrs_collection=returned_attrs,
+                page_size=page_size,
+                decoders=self._attr_decoders
+            )
+        return ldap_export(
+            items,
+            destination,
+            attrs=returned_attrs,
+            export_format=validated_data["export_format"].value,
+            compress=compress,
+            progress=progress,
+            progress_interval=progress_interval
+        )
+
+    @ldap_logging
+    def object_groups(self, dn: str, strategy: str = "chain", chunk_size: int = 200) -> LdapMembershipResult:
+
+        """
+        Groups of an Object including the nested groups (effective membership). The primary group isn't included.
+        :param dn:                          Object `distinguishedName` Attribute Value
+        :param strategy:                    `chain` - One `LDAP_MATCHING_RULE_IN_CHAIN` Search (AD Only),
+                                            `bfs` - Batched `memberOf` Reads Level by Level with the Memoised Graph
+        :param chunk_size:                  Number of DNs per Search Request of the `bfs` Strategy
+        :return:
+        """
+
+        return self.__ldap_membership("groups", dn, strategy, chunk_size)
+
+    @ldap_logging
+    def group_members(self, dn: str, strategy: str = "chain", chunk_size: int = 200) -> LdapMembershipResult:
+
+        """
+        Members of a Group including the members of nested groups (the nested groups are included too).
+        :param dn:                          Group `distinguishedName` Attribute Value
+        :param strategy:                    `chain` - One `LDAP_MATCHING_RULE_IN_CHAIN` Search (AD Only),
+                                            `bfs` - Batched `member` Reads Level by Level with the Memoised Graph
+        :param chunk_size:                  Number of DNs per Search Request of the `bfs` Strategy
+        :return:
+        """
+
+        return self.__ldap_membership("members", dn, strategy, chunk_size)
+
+    @ldap_logging
+    def iter_attr_values(self, dn: str, attr_name: str = "member") -> LdapRangeValues:
+
+        """
+        Multi-valued attribute iterator. Values are fetched range by range (`member;range=...`), so attributes
+        with more values than the server `MaxValRange` aren't materialised at once.
+        :param dn:                          Object `distinguishedName` Attribute Value
+        :param attr_name:                   Attribute Name
+        :return:
+        """
+
+        return LdapRangeValues(
+            connection_pool=self.__connection_pool,
+            dn=dn,
+            attr_name=attr_name,
+            decoders=self._attr_decoders
+        )
+
+    @ldap_logging
+    def replica_sync(self, full: bool = False) -> dict[str, Any]:
+
+        """
+        Synchronize the directory replica: a full pull on the first sync, after a sync server change and every
+        `replica_full_sync_interval`, otherwise the Objects changed and deleted since the last sync. The sync
+        connection is opened to the server of the last sync, `uSNChanged` values are local to a domain controller.
+        :param full:                        Force a Full Pull
+        :return:                            Sync Mode, Numbers of Upserted & Deleted Objects, Highest `uSNChanged`
+        """
+
+        if self.__replica is None:
+            raise ValueError("Replica is disabled, set the replica_path client option.")
+        host = self.__replica.stats["host"]
+        server = next(
+            (
+                server for server in self.__server_selector.servers
+                if server.host == host and self.__server_selector.available(host)
+            ),
+            None
+        )
+        try:
+            conn = self.__ldap_connection(server)
+        except LDAPException:
+            if server is None:
+                raise
+            # The last sync server is unavailable, the selected server is pulled in full
+            conn = self.__ldap_connection()
+        try:
+            return self.__replica.sync(conn, self.__search_base, full=full)
+        finally:
+            conn.unbind()
+
+    @ldap_logging
+    def subscribe(
+            self,
+            search_bases: Iterable[str] = None,
+            object_categories: Iterable[str] = ("person", "group", "computer"),
+            callback: Callable[[LdapChangeEvent], Any] = None,
+            returned_attrs_collection: Iterable[str] = None,
+            checkpoints: dict[str, LdapChangeCheckpoint] = None,
+            page_size: int = 500,
+            max_reconnect_delay: float = 60,
+            catch_up_margin: float = 300
+    ) -> LdapChangeSubscription:
+
+        """
+        Subscribe to the changes of Objects (`Person`, `Group` or `Computer`) with `LDAP_SERVER_NOTIFICATION` searches
+        (AD) instead of polling. Events are delivered to the callback or by iterating the subscription. Dropped
+        connections are reopened and the missed changes are caught up by `uSNChanged` (`whenChanged` after a host
+        change). Membership changes are notified for the groups: `memberOf` is a back link.
+        :param search_bases:                Watched Search Bases (Subtrees) or None (Client Search Base)
+        :param object_categories:           Object Categories: `Person`, `Group` or `Computer`
+        :param callback:                    Events Callback (Called by the Receiver Threads) or None (Iterator)
+        :param returned_attrs_collection:   Collection of Returned Attributes or None (Categories Search Attributes)
+        :param checkpoints:                 Saved `checkpoints` to Catch Up From or None (Changes Since Now)
+        :param page_size:                   Catch-Up Searches Page Size
+        :param max_reconnect_delay:         Maximum Reconnection Delay (sec.)
+        :param catch_up_margin:             Clock Skew Margin (sec.) of the `whenChanged` Catch-Up
+        :return:
+        """
+
+        validated_data = LdapChangeSubscriptionModel(
+            **{
+                "search_bases": tuple(search_bases or (self.__search_base,)),
+                "object_categories": tuple(object_category.lower() for object_category in object_categories),
+                "returned_attrs_collection": returned_attrs_collection,
+                "page_size": page_size
+            }
+        ).model_dump()
+
+        def connect(server: Optional[Server], client_strategy: str) -> Connection:
+            # An ejected host isn't waited for: the changes are caught up on the selected one
+            if server is not None and not self.__server_selector.available(server.host):
+                server = None
+            return self.__ldap_connection(server, client_strategy)
+
+        return LdapChangeSubscription(
+            search_bases=validated_data["search_bases"],
+            connect=connect,
+            object_categories=tuple(object_category.value for object_category in validated_data["object_categories"]),
+            returned_attrs=tuple(validated_data["returned_attrs_collection"]),
+            callback=callback,
+            checkpoints=checkpoints,
+            decoders=self._attr_decoders,
+            page_size=page_size,
+            max_reconnect_delay=max_reconnect_delay,
+            catch_up_margin=catch_up_margin
+        ).start()
 
     @ldap_logging
     def person_auth(
@@ -505,7 +1864,8 @@ class tinyLDAP3Client:
 
         """
         Person Auth will return a tuple of connection binding values and a dictionary of person attribute values
-        or a dictionary of connection results (Authentication error case).
+        or a dictionary of connection results (Authentication error case). Binds reuse pooled connections,
+        person attributes are read according to the `auth_attrs_source` client option.
         :param login:                       User Login as UPN (`sAMAccountName@example.com`)
         :param password:                    User Password
         :param returned_attrs_collection:   Collection of Returned Attributes or None
@@ -514,33 +1874,35 @@ class tinyLDAP3Client:
 
         log_message = f"@ LDAP Person Auth @ - 'Login: {login}' - {{message}}"
 
-        validated_data = LdapPersonAuthModel(
-            **{
-                "login": login,
-                "password": password,
-                "returned_attrs_collection": returned_attrs_collection
-            }
-        ).model_dump()
-        conn = Connection(
-            self.__server_pool,
-            raise_exceptions=False,
-            user=validated_data["login"],
-            password=validated_data["password"],
-            receive_timeout=self._receive_timeout
+        plan = ldap_person_auth_plan(
+            login=login, password=password, returned_attrs_collection=returned_attrs_collection
         )
-        conn.bind()
-        if conn.result["result"] == 0:
-            conn.search(
-                search_base=self.__search_base,
-                search_filter=self.__ldap_person_detail_active_users_query(
-                    attr_name="userPrincipalName", attr_value=validated_data["login"]
-                ),
-                search_scope=SUBTREE,
-                attributes=tuple(validated_data["returned_attrs_collection"])
+        returned_attrs = plan.returned_attrs
+
+        def bind(conn: Connection) -> tuple[bool, dict[str, Any]]:
+            # The pooled connection is rebound with the person credentials and reset to anonymous
+            with ldap_phase(self._instrumentation, "bind", host=conn.server.host):
+                result = ldap_pooled_rebind(conn, login, password)
+            return result["result"] == 0, result
+
+        is_bound, resp_result = self.__auth_connection_pool.execute(bind)
+        if not is_bound:
+            # conn.bound = False, conn.result["result"] = 49
+            logging.warning(log_message.format(message="LDAP Person invalid credentials."))
+            return False, resp_result
+        if self._auth_attrs_source == "service":
+            # Person attributes are read via the service account pool (and the result cache if enabled)
+            cache_key = ("auth", login.lower(), returned_attrs)
+            cached = self.__ldap_cache_get(cache_key)
+            if cached is not None:
+                return True, cached
+            resp_raw = self.__ldap_entries(
+                search_query=ldap_object_detail_query_selector("person", "userPrincipalName", login, True),
+                returned_attrs_collection=returned_attrs,
+                method="person_auth"
             )
-            resp_result = {attr.key: attr.value for attr in conn.entries[0]}
-            conn.unbind()
-            return True, resp_result
-        # conn.bound = False, conn.result["result"] = 49
-        logging.warning(log_message.format(message="LDAP Person invalid credentials."))
-        return False, conn.result
+            resp_result = resp_raw[0][1] if resp_raw else {}
+            self.__ldap_cache_set(cache_key, "person", resp_result, resp_raw)
+        elif self._auth_attrs_source is None:
+            resp_result = {}
+        return True, resp_result
@@ -1,4 +1,4 @@
-import logging
+import functools, inspect, logging
 from ldap3.core.exceptions import (
     LDAPAttributeError,
     LDAPInvalidCredentialsResult,
@@ -10,7 +10,8 @@ from ldap3.core.exceptions import (
     LDAPSocketSendError,
 )
 from pydantic import ValidationError
-from .exceptions import LdapConnectionError, LdapUnexpectedError
+from typing import Optional
+from .exceptions import LdapConnectionError, LdapPoolExhaustedError, LdapUnexpectedError
 
 
 """ ######################################################### """
@@ -18,14 +19,131 @@ from .exceptions import LdapConnectionError, LdapUnexpectedError
 """ ######################################################### """
 
 
+def _ldap_error_handler(err: Exception, log_message: str) -> None:
+
+    """
+    Log and convert an LDAP Method error
+    :param err:         Raised Error
+    :param log_message: Log Message Template
+    :return:
+    """
+
+    if isinstance(err, LDAPNoSuchObjectResult):
+        # Object Reader by DN Not Found
+        logging.warning(log_message.format(message=f"Warning Detail: {repr(err)}."))
+        return None
+    logging.error(log_message.format(message=f"Error Detail: {repr(err)}."))
+    if isinstance(err, (LDAPAttributeError, LDAPObjectClassError, ValidationError)):
+        raise err
+    if isinstance(
+            err,
+            (
+                LDAPInvalidCredentialsResult,
+                LDAPPasswordIsMandatoryError,   # No User Password Error (None or "")
+                LDAPSocketOpenError,
+                LDAPSocketReceiveError,
+                LDAPSocketSendError,
+                LdapPoolExhaustedError
+            )
+    ):
+        raise LdapConnectionError("Connection has been failed.")
+    raise LdapUnexpectedError("Unexpected error occurred.")
+
+
+class LdapLoggedIterator:
+
+    """
+        Base of the iterators returned by `ldap_logging` methods. Errors raised during the iteration are logged
+        and converted like the method errors, a not found Object ends the iteration.
+        """
+
+    _log_message: Optional[str] = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return self._next()
+        except StopIteration:
+            raise
+        except Exception as err:
+            if self._log_message is None:
+                raise
+            _ldap_error_handler(err, self._log_message)
+        raise StopIteration
+
+    def _next(self):
+        raise NotImplementedError
+
+
 def ldap_logging(ldap_method):
 
     """
-    Connection & Methods Logging Decorator
+    Connection & Methods Logging Decorator. Coroutine methods are wrapped with an async wrapper, async generators
+    with an async generator wrapper. Errors of returned `LdapLoggedIterator` iterations are handled on iteration.
+    Calls of a client with `LdapInstrumentation` record the method latency, errors and span.
     :param ldap_method: LDAP Method
     :return:
     """
 
+    method_name = ldap_method.__name__
+    log_message = f"@ LDAP {repr(method_name)} Method @ - {{message}}"
+
+    if inspect.isasyncgenfunction(ldap_method):
+
+        @functools.wraps(ldap_method)
+        async def async_gen_wrapped(*args, **kwargs):
+
+            """
+            Connection & Async Generator Methods Log Wrapper
+            :return:
+            """
+
+            if logging.root.isEnabledFor(logging.DEBUG):
+                # Params are formatted only if they are logged
+                logging.debug(log_message.format(message=f"Query Params:\nArgs: {args}\nKwargs: {kwargs}."))
+
+            try:
+                async for item in ldap_method(*args, **kwargs):
+                    yield item
+            except Exception as err:
+                _ldap_error_handler(err, log_message)
+        return async_gen_wrapped
+
+    if inspect.iscoroutinefunction(ldap_method):
+
+        @functools.wraps(ldap_method)
+        async def async_wrapped(*args, **kwargs):
+
+            """
+            Connection & Coroutine Methods Log Wrapper
+            :return:
+            """
+
+            if logging.root.isEnabledFor(logging.DEBUG):
+                # Params are formatted only if they are logged
+                logging.debug(log_message.format(message=f"Query Params:\nArgs: {args}\nKwargs: {kwargs}."))
+
+            instrumentation = getattr(args[0], "_instrumentation", None) if args else None
+            if instrumentation is None:
+                try:
+                    # Return Union[tuple, dict, None]
+                    return await ldap_method(*args, **kwargs)
+                except Exception as err:
+                    return _ldap_error_handler(err, log_message)
+
+            token = instrumentation.method_start(method_name)
+            try:
+                result = await ldap_method(*args, **kwargs)
+            except Exception as err:
+                instrumentation.method_end(token, err)
+                return _ldap_error_handler(err, log_message)
+            instrumentation.method_end(token)
+            return result
+        return async_wrapped
+
+    @functools.wraps(ldap_method)
     def wrapped(*args, **kwargs):
 
         """
@@ -33,29 +151,28 @@ def ldap_logging(ldap_method):
         :return:
         """
 
-        log_message = f"@ LDAP {repr(ldap_method.__name__)} Method @ - {{message}}"
-        logging.debug(log_message.format(message=f"Query Params:\nArgs: {args}\nKwargs: {kwargs}."))
+        if logging.root.isEnabledFor(logging.DEBUG):
+            # Params are formatted only if they are logged
+            logging.debug(log_message.format(message=f"Query Params:\nArgs: {args}\nKwargs: {kwargs}."))
 
-        try:
-            # Return Union[tuple, dict, None]
-            return ldap_method(*args, **kwargs)
-        except LDAPNoSuchObjectResult as err:
-            # Object Reader by DN Not Found
-            logging.warning(log_message.format(message=f"Warning Detail: {repr(err)}."))
-            return None
-        except (LDAPAttributeError, LDAPObjectClassError, ValidationError) as err:
-            logging.error(log_message.format(message=f"Error Detail: {repr(err)}."))
-            raise err
-        except (
-                LDAPInvalidCredentialsResult,
-                LDAPPasswordIsMandatoryError,   # No User Password Error (None or "")
-                LDAPSocketOpenError,
-                LDAPSocketReceiveError,
-                LDAPSocketSendError
-        ) as err:
-            logging.error(log_message.format(message=f"Error Detail: {repr(err)}."))
-            raise LdapConnectionError("Connection has been failed.")
-        except Exception as err:
-            logging.error(log_message.format(message=f"Error Detail: {repr(err)}."))
-            raise LdapUnexpectedError("Unexpected error occurred.")
+        instrumentation = getattr(args[0], "_instrumentation", None) if args else None
+        if instrumentation is None:
+            try:
+                # Return Union[tuple, dict, None]
+                result = ldap_method(*args, **kwargs)
+            except Exception as err:
+                return _ldap_error_handler(err, log_message)
+        else:
+            token = instrumentation.method_start(method_name)
+            try:
+                result = ldap_method(*args, **kwargs)
+            except Exception as err:
+                instrumentation.method_end(token, err)
+                return _ldap_error_handler(err, log_message)
+            instrumentation.method_end(token)
+
+        if isinstance(result, LdapLoggedIterator):
+            # Iterators search lazily: their errors are raised on iteration
+            result._log_message = log_message
+        return result
     return wrapped
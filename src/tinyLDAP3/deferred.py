@@ -0,0 +1,98 @@
+import copy, threading
+from typing import Any, Callable, Iterable, Optional
+from .exceptions import LdapDeferredError
+
+
+""" ######################################################### """
+""" ***************** TINY LDAP3 DEFERRED ******************* """
+""" ######################################################### """
+
+
+class LdapDeferredObject(dict):
+
+    """
+        Object dictionary with deferred attributes. Deferred attributes aren't fetched by the search, they are read
+        together on the first access (`obj["thumbnailPhoto"]`, `obj.get("memberOf")` or `load()`) with one
+        base scoped read of the Object. Until then iteration, `keys()`, `in` and serialization see only
+        the fetched attributes.
+        """
+
+    def __init__(
+            self,
+            values: dict[str, Any],
+            dn: str,
+            deferred_attrs: Iterable[str],
+            loader: Callable[[str, tuple[str, ...]], Optional[dict[str, Any]]]
+    ):
+
+        """
+        :param values:                      Fetched Attributes
+        :param dn:                          Object `distinguishedName` Attribute Value
+        :param deferred_attrs:              Deferred Attribute Names
+        :param loader:                      Read of the Deferred Attributes by the DN & Names (None - Not Found)
+        """
+
+        super().__init__(values)
+        self.dn = dn
+
+        self.__deferred = {attr_name.lower(): attr_name for attr_name in deferred_attrs if attr_name not in values}
+        self.__loader = loader
+        self.__lock = threading.Lock()
+
+    @property
+    def deferred(self) -> tuple[str, ...]:
+
+        """
+        Deferred attributes that haven't been loaded yet.
+        :return:
+        """
+
+        return tuple(self.__deferred.values())
+
+    def __is_deferred(self, key: Any) -> bool:
+        return isinstance(key, str) and key.lower() in self.__deferred
+
+    def load(self) -> "LdapDeferredObject":
+
+        """
+        Read all deferred attributes, missing ones are set to None. Concurrent first accesses read them once.
+        `LdapDeferredError` (a `KeyError`) is raised if the Object was deleted or moved since the search.
+        :return:
+        """
+
+        with self.__lock:
+            if self.__deferred:
+                attrs = tuple(self.__deferred.values())
+                loaded = self.__loader(self.dn, attrs)
+                if loaded is None:
+                    raise LdapDeferredError(f"Deferred attributes of '{self.dn}' can't be read: Object not found.")
+                values = {key.lower(): value for key, value in loaded.items()}
+                for attr_name in attrs:
+                    dict.__setitem__(self, attr_name, values.get(attr_name.lower()))
+                self.__deferred.clear()
+        return self
+
+    def __missing__(self, key: Any) -> Any:
+        if self.__is_deferred(key):
+            return dict.__getitem__(self.load(), self.__deferred_name(key))
+        raise KeyError(key)
+
+    def __deferred_name(self, key: str) -> str:
+        # Loaded attributes are stored under the deferred attribute names
+        return next((attr_name for attr_name in self if attr_name.lower() == key.lower()), key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key not in self and self.__is_deferred(key):
+            return dict.get(self.load(), self.__deferred_name(key), default)
+        return dict.get(self, key, default)
+
+    def __copy__(self) -> "LdapDeferredObject":
+        return LdapDeferredObject(dict(self), self.dn, self.deferred, self.__loader)
+
+    def __deepcopy__(self, memo: dict) -> "LdapDeferredObject":
+        # Cached copies keep their deferred attributes and load them independently
+        return LdapDeferredObject(copy.deepcopy(dict(self), memo), self.dn, self.deferred, self.__loader)
+
+    def __reduce__(self):
+        # Pickled as a plain dictionary of the loaded attributes: the loader is bound to the client
+        return dict, (dict(self),)
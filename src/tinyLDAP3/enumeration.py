@@ -0,0 +1,307 @@
+import logging, queue, threading
+from ldap3.core.exceptions import LDAPBusyResult, LDAPUnavailableResult
+from typing import Any, Callable, Generator, Iterable, Iterator, NamedTuple, Optional
+from .decorators import LdapLoggedIterator
+from .exceptions import LdapPoolExhaustedError
+from .filters import LdapAnd, LdapFilter, LdapGreaterOrEqual, LdapNot
+from .results import ldap_dn_key
+from .selector import LDAP_HOST_ERRORS_TUPLE
+
+
+""" ######################################################### """
+""" *************** TINY LDAP3 ENUMERATION ****************** """
+""" ######################################################### """
+
+
+# Partition errors retried on another connection: unavailable host, busy server, exhausted pool
+LDAP_PARTITION_RETRY_ERRORS_TUPLE = (
+    *LDAP_HOST_ERRORS_TUPLE,
+    LDAPBusyResult,
+    LDAPUnavailableResult,
+    LdapPoolExhaustedError,
+)
+
+# Lower bounds of the default prefix partitions. The first partition has no lower bound and includes values
+# sorted before `0` (e.g. `_svc`), the last one has no upper bound.
+LDAP_PREFIX_BOUNDARIES_TUPLE = ("0", "a", "c", "e", "g", "i", "k", "m", "o", "q", "s", "u", "w")
+
+# End of a partition stream in the pages queue
+_LDAP_PARTITION_DONE = object()
+
+
+class LdapPartition(NamedTuple):
+
+    """
+        Enumeration partition: a part of the keyspace searched with its own paged search.
+        `key`           - Partition label (logs & stats).
+        `search_base`   - Partition search base or None (Client Search Base).
+        `search_filter` - Filter node combined with the Object category filter or None.
+        `host`          - Host the partition is searched on, also when retried, or None (Any Host).
+        """
+
+    key: str
+    search_base: Optional[str] = None
+    search_filter: Optional[LdapFilter] = None
+    host: Optional[str] = None
+
+
+def ldap_ou_partitions(search_bases: Iterable[str]) -> tuple[LdapPartition, ...]:
+
+    """
+    Partition by OU: a subtree search per search base. The OUs mustn't be nested, or the objects are returned twice.
+    :param search_bases:                OUs `distinguishedName` Attribute Values
+    :return:
+    """
+
+    return tuple(LdapPartition(key=search_base, search_base=search_base) for search_base in search_bases)
+
+
+def _ldap_range_filter(attr_name: str, low: Optional[str], high: Optional[str]) -> Optional[LdapFilter]:
+    # LDAP has no strict "less" match: `low <= value < high` is `(attr>=low)(!(attr>=high))`
+    bounds = []
+    if low is not None:
+        bounds.append(LdapGreaterOrEqual(attr_name, low))
+    if high is not None:
+        bounds.append(LdapNot(LdapGreaterOrEqual(attr_name, high)))
+    if not bounds:
+        return None
+    return bounds[0] if len(bounds) == 1 else LdapAnd(tuple(bounds))
+
+
+def ldap_prefix_partitions(
+        attr_name: str = "sAMAccountName",
+        boundaries: Optional[Iterable[str]] = None
+) -> tuple[LdapPartition, ...]:
+
+    """
+    Partition by value ranges of a string attribute, in the attribute order. Values are compared by the attribute
+    matching rule (case-insensitive for `sAMAccountName`), objects without the attribute aren't returned.
+    :param attr_name:                   Attribute Name
+    :param boundaries:                  Sorted Lower Bounds of the Ranges After the First or None (`0-9`, `a-z`)
+    :return:
+    """
+
+    bounds = [None, *(boundaries if boundaries is not None else LDAP_PREFIX_BOUNDARIES_TUPLE), None]
+    return tuple(
+        LdapPartition(
+            key=f"{attr_name}:[{low or ''}, {high or ''})",
+            search_filter=_ldap_range_filter(attr_name, low, high)
+        ) for low, high in zip(bounds, bounds[1:])
+    )
+
+
+def ldap_usn_partitions(low: int, high: int, count: int, host: Optional[str] = None) -> tuple[LdapPartition, ...]:
+
+    """
+    Partition by `uSNChanged` windows of equal width, in the attribute order. The first window has no lower bound
+    and the last one has no upper bound, so objects changed during the enumeration aren't missed.
+    Update sequence numbers are local to a domain controller, all windows must be searched on the host of the bounds.
+    :param low:                         Lower Bound of the Second Window (e.g. the Lowest Expected USN)
+    :param high:                        Upper Bound of the Windows Before the Last (e.g. `highestCommittedUSN`)
+    :param count:                       Number of Windows
+    :param host:                        Host of the Update Sequence Numbers or None (Single Host)
+    :return:
+    """
+
+    if count < 1 or high < low:
+        raise ValueError("USN partitions require: count >= 1 and low <= high.")
+    if count == 1:
+        return (LdapPartition(key="uSNChanged:[, )", host=host),)
+    step = max((high - low) // max(count - 2, 1), 1)
+    bounds = [None, *(str(low + i * step) for i in range(count - 1)), None]
+    return tuple(
+        LdapPartition(
+            key=f"uSNChanged:[{low_bound or ''}, {high_bound or ''})",
+            search_filter=_ldap_range_filter("uSNChanged", low_bound, high_bound),
+            host=host
+        ) for low_bound, high_bound in zip(bounds, bounds[1:])
+    )
+
+
+class LdapPartitionedEnumeration(LdapLoggedIterator):
+
+    """
+        Partitioned enumeration iterator over Objects dictionaries. Partitions are searched concurrently by
+        `workers` threads and their pages are merged through bounded queues: a worker waits while the queue is
+        full, so at most about `(workers + queue_pages) * page_size` objects are held in memory. With `ordered`
+        the partitions are returned one after another in their order, otherwise pages are returned as they arrive.
+        A failed partition is retried alone, up to `retries` times, objects already returned by the failed attempt
+        are skipped by DN (the DNs of running partitions are kept until they complete).
+        """
+
+    def __init__(
+            self,
+            partitions: Iterable[LdapPartition],
+            source: Callable[[int, LdapPartition, int], Generator[list[tuple[str, dict[str, Any]]], None, None]],
+            workers: int = 4,
+            ordered: bool = False,
+            retries: int = 2,
+            retry_delay: float = 1,
+            queue_pages: int = 2
+    ):
+
+        """
+        :param partitions:                  Partitions
+        :param source:                      Generator Function of the Pages of (DN, Object dictionary) Pairs
+                                            of a Partition by Its Index, the Partition and the Attempt Number
+        :param workers:                     Number of Partitions Searched Concurrently
+        :param ordered:                     Return the Partitions in Their Order
+        :param retries:                     Retries of a Failed Partition
+        :param retry_delay:                 Time (sec.) Before a Retry
+        :param queue_pages:                 Pages Buffered per Partition (Ordered) or per Worker
+        """
+
+        self.partitions = tuple(partitions)
+
+        self.__source = source
+        self._workers = max(min(workers, len(self.partitions)), 1)
+        self._ordered = ordered
+        self._retries = retries
+        self._retry_delay = retry_delay
+
+        self.__lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__counters = {
+            "partitions": len(self.partitions), "completed": 0, "retries": 0, "pages": 0, "objects": 0,
+            "duplicates": 0
+        }
+        if ordered:
+            self.__queues = [queue.Queue(maxsize=queue_pages) for _ in self.partitions]
+        else:
+            self.__queues = [queue.Queue(maxsize=queue_pages * self._workers)]
+        self.__iterator = self.__iterate()
+
+    @property
+    def stats(self) -> dict[str, int]:
+
+        """
+        Enumeration counters: partitions, completed, retries, pages, objects, duplicates (skipped after a retry).
+        :return:
+        """
+
+        with self.__lock:
+            return dict(self.__counters)
+
+    def _next(self) -> dict[str, Any]:
+        return next(self.__iterator)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __put(self, pages: queue.Queue, message: tuple[int, Any]) -> bool:
+
+        """
+        Put a message to the queue, waiting while it's full.
+        :param pages:                       Pages Queue
+        :param message:                     Partition Index and a Page, the End Marker or an Error
+        :return:                            False if the Enumeration Is Closed
+        """
+
+        while not self.__stop.is_set():
+            try:
+                pages.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def __run(self, index: int) -> None:
+
+        """
+        Search a partition and put its pages to the queue. Runs in a worker thread.
+        :param index:                       Partition Index
+        :return:
+        """
+
+        partition = self.partitions[index]
+        pages = self.__queues[index if self._ordered else 0]
+        returned: set[str] = set()
+        attempt = 0
+        while not self.__stop.is_set():
+            source_pages = self.__source(index, partition, attempt)
+            try:
+                for items in source_pages:
+                    if attempt:
+                        count = len(items)
+                        items = [(dn, values) for dn, values in items if ldap_dn_key(dn) not in returned]
+                        with self.__lock:
+                            self.__counters["duplicates"] += count - len(items)
+                    if attempt < self._retries:
+                        returned.update(ldap_dn_key(dn) for dn, _ in items)
+                    with self.__lock:
+                        self.__counters["pages"] += 1
+                        self.__counters["objects"] += len(items)
+                    if not self.__put(pages, (index, [values for _, values in items])):
+                        return
+                self.__put(pages, (index, _LDAP_PARTITION_DONE))
+                return
+            except LDAP_PARTITION_RETRY_ERRORS_TUPLE as err:
+                if attempt >= self._retries:
+                    self.__put(pages, (index, err))
+                    return
+                attempt += 1
+                with self.__lock:
+                    self.__counters["retries"] += 1
+                logging.warning(
+                    f"@ LDAP Enumeration @ - Partition `{partition.key}` failed: {repr(err)}, "
+                    f"retry {attempt} of {self._retries}."
+                )
+                self.__stop.wait(self._retry_delay)
+            except Exception as err:
+                self.__put(pages, (index, err))
+                return
+            finally:
+                # The pooled connection is returned before a retry or when the enumeration is closed
+                source_pages.close()
+
+    def __work(self, indexes: Iterator[int]) -> None:
+
+        """
+        Worker thread: search the partitions in their order until none is left or the enumeration is closed.
+        :param indexes:                     Shared Iterator of the Partition Indexes
+        :return:
+        """
+
+        while not self.__stop.is_set():
+            with self.__lock:
+                index = next(indexes, None)
+            if index is None:
+                return
+            self.__run(index)
+
+    def __iterate(self) -> Iterator[dict[str, Any]]:
+        # Partitions are taken in order, so the partition returned next never waits for a free worker. Daemon
+        # threads: an enumeration left unfinished without `close` mustn't block the interpreter exit.
+        indexes = iter(range(len(self.partitions)))
+        for number in range(self._workers):
+            threading.Thread(
+                target=self.__work, args=(indexes,), name=f"tinyLDAP3-enumeration-{number}", daemon=True
+            ).start()
+        try:
+            pending = len(self.partitions)
+            while pending:
+                pages = self.__queues[len(self.partitions) - pending if self._ordered else 0]
+                _, page = pages.get()
+                if page is _LDAP_PARTITION_DONE:
+                    pending -= 1
+                    with self.__lock:
+                        self.__counters["completed"] += 1
+                elif isinstance(page, BaseException):
+                    raise page
+                else:
+                    yield from page
+        finally:
+            self.__stop.set()
+
+    def close(self) -> None:
+
+        """
+        Stop the enumeration: workers return their connections to the pools after the current page.
+        :return:
+        """
+
+        self.__stop.set()
+        self.__iterator.close()
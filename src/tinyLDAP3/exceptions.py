@@ -29,5 +29,13 @@ class LdapConnectionError(LdapBaseError):
     pass
 
 
+class LdapDeferredError(LdapBaseError, KeyError):
+    pass
+
+
 class LdapUnexpectedError(LdapBaseError):
     pass
+
+
+class LdapPoolExhaustedError(LdapConnectionError):
+    pass
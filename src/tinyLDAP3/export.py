@@ -0,0 +1,231 @@
+import base64, csv, datetime, gzip, io, json, os, time
+from typing import IO, Any, Callable, Iterable, NamedTuple, Optional, Union
+from .normalizers import (
+    LDAP_FILETIME_ATTRS_TUPLE,
+    LDAP_GUID_ATTRS_TUPLE,
+    LDAP_SID_ATTRS_TUPLE,
+    ldap_filetime_to_datetime,
+    ldap_guid_to_str,
+    ldap_sid_to_str
+)
+
+
+""" ######################################################### """
+""" ****************** TINY LDAP3 EXPORT ******************** """
+""" ######################################################### """
+
+
+LDAP_EXPORT_FORMATS_TUPLE = ("ndjson", "csv")
+
+
+class LdapExportProgress(NamedTuple):
+
+    """
+        Export progress reported by `progress` callbacks and returned as the export result.
+        `objects`            - Number of written Objects.
+        `seconds`            - Elapsed time (sec.).
+        `objects_per_second` - Throughput.
+        `bytes`              - Size of the written data (compressed with gzip) or None (not known yet).
+        """
+
+    objects: int
+    seconds: float
+    objects_per_second: float
+    bytes: Optional[int] = None
+
+
+def _ldap_export_scalar(value: Any) -> Any:
+    # JSON & CSV values: bytes to base64, datetimes to ISO 8601, intervals to seconds, flag sets to sorted lists
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return value
+
+
+def _ldap_export_filetime(value: Any) -> Any:
+    if isinstance(value, int) or (isinstance(value, str) and value.lstrip("-").isdigit()):
+        value = ldap_filetime_to_datetime(value)
+    elif isinstance(value, datetime.datetime) and value.year in (1601, 9999):
+        # ldap3 formats the "never" values as the first and the last representable dates
+        value = None
+    return _ldap_export_scalar(value)
+
+
+def _ldap_export_guid(value: Any) -> Any:
+    if isinstance(value, bytes) and len(value) == 16:
+        return ldap_guid_to_str(value)
+    return _ldap_export_scalar(value)
+
+
+def _ldap_export_sid(value: Any) -> Any:
+    if isinstance(value, bytes) and len(value) >= 8:
+        return ldap_sid_to_str(value)
+    return _ldap_export_scalar(value)
+
+
+def ldap_export_normalizers(attrs: Iterable[str]) -> dict[str, Callable[[Any], Any]]:
+
+    """
+    Value normalizers of the exported attributes, selected once per export by the attribute name.
+    :param attrs:                       Exported Attribute Names
+    :return:                            Normalizers by Attribute Name
+    """
+
+    filetime_attrs = {attr_name.lower() for attr_name in LDAP_FILETIME_ATTRS_TUPLE}
+    guid_attrs = {attr_name.lower() for attr_name in LDAP_GUID_ATTRS_TUPLE}
+    sid_attrs = {attr_name.lower() for attr_name in LDAP_SID_ATTRS_TUPLE}
+    normalizers = {}
+    for attr_name in attrs:
+        if attr_name.lower() in filetime_attrs:
+            normalizers[attr_name] = _ldap_export_filetime
+        elif attr_name.lower() in guid_attrs:
+            normalizers[attr_name] = _ldap_export_guid
+        elif attr_name.lower() in sid_attrs:
+            normalizers[attr_name] = _ldap_export_sid
+        else:
+            normalizers[attr_name] = _ldap_export_scalar
+    return normalizers
+
+
+class LdapExportWriter:
+
+    """
+        Incremental NDJSON or CSV writer of Objects dictionaries with the attributes in a fixed order. Each Object
+        is normalized and written as it arrives, nothing is kept after the write. Multi-valued attributes are
+        JSON arrays in NDJSON and values joined by `multi_value_separator` in CSV.
+        """
+
+    def __init__(
+            self,
+            stream: IO[str],
+            attrs: Iterable[str],
+            export_format: str = "ndjson",
+            multi_value_separator: str = ";"
+    ):
+
+        """
+        :param stream:                      Text Stream
+        :param attrs:                       Exported Attribute Names (NDJSON Keys & CSV Columns)
+        :param export_format:               Export Format: `ndjson` or `csv`
+        :param multi_value_separator:       Separator of the Values of Multi-Valued Attributes in CSV
+        """
+
+        if export_format not in LDAP_EXPORT_FORMATS_TUPLE:
+            raise ValueError(f"Export format must be one of: {', '.join(LDAP_EXPORT_FORMATS_TUPLE)}.")
+        self.attrs = tuple(attrs)
+        self.objects = 0
+
+        self.__stream = stream
+        self.__separator = multi_value_separator
+        self.__normalizers = ldap_export_normalizers(self.attrs)
+        # Object keys are matched case-insensitively to the attribute names
+        self.__attrs_lower = {attr_name.lower(): attr_name for attr_name in self.attrs}
+        self.__csv_writer = csv.writer(stream) if export_format == "csv" else None
+        if self.__csv_writer is not None:
+            self.__csv_writer.writerow(self.attrs)
+
+    def __normalize(self, attr_name: str, value: Any) -> Any:
+        normalizer = self.__normalizers[attr_name]
+        if isinstance(value, list):
+            return [normalizer(item) for item in value]
+        return normalizer(value)
+
+    def write(self, item: dict[str, Any]) -> None:
+
+        """
+        Write an Object. Attributes out of the exported ones are skipped, missing attributes are written as null
+        (NDJSON) or an empty value (CSV).
+        :param item:                        Object Dictionary
+        :return:
+        """
+
+        values = dict.fromkeys(self.attrs)
+        for key, value in item.items():
+            attr_name = key if key in self.__normalizers else self.__attrs_lower.get(key.lower())
+            if attr_name is not None:
+                values[attr_name] = self.__normalize(attr_name, value)
+        if self.__csv_writer is None:
+            self.__stream.write(json.dumps(values, ensure_ascii=False, separators=(",", ":")))
+            self.__stream.write("\n")
+        else:
+            self.__csv_writer.writerow(
+                [
+                    self.__separator.join(str(item_value) for item_value in value) if isinstance(value, list)
+                    else ("" if value is None else value)
+                    for value in values.values()
+                ]
+            )
+        self.objects += 1
+
+
+def ldap_export(
+        items: Iterable[dict[str, Any]],
+        destination: Union[str, os.PathLike, IO[str]],
+        attrs: Iterable[str],
+        export_format: str = "ndjson",
+        compress: Optional[bool] = None,
+        multi_value_separator: str = ";",
+        progress: Optional[Callable[[LdapExportProgress], None]] = None,
+        progress_interval: int = 1000
+) -> LdapExportProgress:
+
+    """
+    Stream Objects dictionaries to an NDJSON or CSV file. Objects are written one by one from the iterator,
+    so the memory doesn't grow with the number of exported Objects.
+    :param items:                       Objects Dictionaries Iterator (e.g. a Paged Search)
+    :param destination:                 File Path or Text Stream
+    :param attrs:                       Exported Attribute Names
+    :param export_format:               Export Format: `ndjson` or `csv`
+    :param compress:                    Gzip the File or None (By the `.gz` Path Suffix)
+    :param multi_value_separator:       Separator of the Values of Multi-Valued Attributes in CSV
+    :param progress:                    Progress Callback or None
+    :param progress_interval:           Number of Objects Between Progress Callbacks
+    :return:                            Final Progress
+    """
+
+    def current(size: Optional[int] = None) -> LdapExportProgress:
+        seconds = time.perf_counter() - started
+        return LdapExportProgress(
+            objects=writer.objects,
+            seconds=seconds,
+            objects_per_second=writer.objects / seconds if seconds > 0 else 0.0,
+            bytes=size
+        )
+
+    if export_format not in LDAP_EXPORT_FORMATS_TUPLE:
+        raise ValueError(f"Export format must be one of: {', '.join(LDAP_EXPORT_FORMATS_TUPLE)}.")
+    path = None if hasattr(destination, "write") else os.fspath(destination)
+    if path is None:
+        stream, raw = destination, None
+    else:
+        if compress is None:
+            compress = path.endswith(".gz")
+        raw = open(path, "wb")
+        stream = io.TextIOWrapper(
+            gzip.GzipFile(fileobj=raw, mode="wb") if compress else raw, encoding="utf-8", newline=""
+        )
+
+    started = time.perf_counter()
+    try:
+        writer = LdapExportWriter(stream, attrs, export_format, multi_value_separator)
+        for item in items:
+            writer.write(item)
+            if progress is not None and writer.objects % progress_interval == 0:
+                progress(current())
+    finally:
+        if path is not None:
+            # Closes the gzip member and the file
+            stream.close()
+            raw.close()
+        close = getattr(items, "close", None)
+        if close is not None:
+            close()
+    result = current(os.path.getsize(path) if path is not None else None)
+    if progress is not None:
+        progress(result)
+    return result
@@ -0,0 +1,211 @@
+import re
+from ldap3.core.exceptions import LDAPAttributeError
+from ldap3.utils.conv import escape_filter_chars
+from typing import NamedTuple, Optional, Union
+
+
+""" ######################################################### """
+""" ******************* TINY LDAP3 FILTERS ****************** """
+""" ######################################################### """
+
+
+# Attribute description: name or OID with options (RFC 4512), e.g. `member;range=0-1499`
+ldap_attr_description_regex = re.compile(r"^(?:[a-zA-Z][a-zA-Z0-9-]*|[0-9]+(?:\.[0-9]+)*)(?:;[a-zA-Z0-9=-]+)*$")
+
+# Single-valued attributes: an equality on one value makes negations of other values redundant
+LDAP_SINGLE_VALUED_ATTRS_TUPLE = (
+    "objectcategory",
+)
+
+
+class LdapParam(NamedTuple):
+
+    """
+        Filter template parameter. Substituted with an escaped value on formatting.
+        """
+
+    name: str
+
+
+class LdapEq(NamedTuple):
+    attr: str
+    value: Union[str, LdapParam]
+
+
+class LdapGreaterOrEqual(NamedTuple):
+    attr: str
+    value: Union[str, LdapParam]
+
+
+class LdapPresent(NamedTuple):
+    attr: str
+
+
+class LdapSubstring(NamedTuple):
+    attr: str
+    initial: Union[str, LdapParam, None] = None
+    any: tuple[Union[str, LdapParam], ...] = ()
+    final: Union[str, LdapParam, None] = None
+
+
+class LdapExtensible(NamedTuple):
+    attr: str
+    rule: str
+    value: Union[str, LdapParam]
+
+
+class LdapNot(NamedTuple):
+    child: "LdapFilter"
+
+
+class LdapAnd(NamedTuple):
+    children: tuple["LdapFilter", ...]
+
+
+class LdapOr(NamedTuple):
+    children: tuple["LdapFilter", ...]
+
+
+LdapFilter = Union[LdapEq, LdapGreaterOrEqual, LdapPresent, LdapSubstring, LdapExtensible, LdapNot, LdapAnd, LdapOr]
+
+
+def _ldap_single_value_key(value: Union[str, LdapParam]) -> Optional[str]:
+
+    """
+    Comparison key of a single-valued attribute value: `objectCategory` is matched by the short name or the DN
+    of the schema class. None for a parameter, its value is unknown until the formatting.
+    :param value:                       Value or Parameter
+    :return:
+    """
+
+    if isinstance(value, LdapParam):
+        return None
+    value = value.strip().lower()
+    return value[3:].split(",", 1)[0] if value.startswith("cn=") else value
+
+
+def _ldap_negation_redundant(node: LdapFilter, equalities: dict[str, str]) -> bool:
+
+    """
+    The node negates another known value of a single-valued attribute constrained by an equality.
+    :param node:                        Filter Node
+    :param equalities:                  Equality Value Keys by Lower Case Single-Valued Attribute Name
+    :return:
+    """
+
+    if not isinstance(node, LdapNot) or not isinstance(node.child, LdapEq):
+        return False
+    attr = node.child.attr.lower()
+    return attr in equalities and _ldap_single_value_key(node.child.value) not in (None, equalities[attr])
+
+
+def ldap_filter_optimize(node: LdapFilter) -> LdapFilter:
+
+    """
+    Filter optimization: flatten nested `&` and `|`, drop duplicate clauses, double negations and negations
+    of other values of single-valued attributes, unwrap single clause `&` and `|`.
+    :param node:                        Filter Node
+    :return:
+    """
+
+    match node:
+        case LdapNot(child):
+            child = ldap_filter_optimize(child)
+            return child.child if isinstance(child, LdapNot) else LdapNot(child)
+        case LdapAnd(children) | LdapOr(children):
+            node_type = type(node)
+            flat_children = []
+            for child in (ldap_filter_optimize(child) for child in children):
+                for item in child.children if isinstance(child, node_type) else (child,):
+                    # Nodes are tuples, `(a=1)` and `(a>=1)` are equal tuples of different types
+                    if not any(type(other) is type(item) and other == item for other in flat_children):
+                        flat_children.append(item)
+            if node_type is LdapAnd:
+                equalities = {
+                    child.attr.lower(): _ldap_single_value_key(child.value) for child in flat_children
+                    if isinstance(child, LdapEq) and child.attr.lower() in LDAP_SINGLE_VALUED_ATTRS_TUPLE
+                    and _ldap_single_value_key(child.value) is not None
+                }
+                flat_children = [child for child in flat_children if not _ldap_negation_redundant(child, equalities)]
+            if len(flat_children) == 1:
+                return flat_children[0]
+            return node_type(tuple(flat_children))
+    return node
+
+
+def _ldap_attr(attr: str) -> str:
+    if not ldap_attr_description_regex.fullmatch(attr):
+        raise LDAPAttributeError(f"Invalid attribute description: '{attr}'.")
+    return attr
+
+
+def _ldap_value(value: Union[str, LdapParam]) -> str:
+    if isinstance(value, LdapParam):
+        return f"{{{value.name}}}"
+    # Braces are doubled for the template formatting
+    return escape_filter_chars(str(value)).replace("{", "{{").replace("}", "}}")
+
+
+def _ldap_filter_params(node: LdapFilter) -> bool:
+    match node:
+        case LdapAnd(children) | LdapOr(children):
+            return any(_ldap_filter_params(child) for child in children)
+        case LdapNot(child):
+            return _ldap_filter_params(child)
+        case LdapPresent():
+            return False
+        case LdapSubstring(_, initial, any_values, final):
+            return any(isinstance(value, LdapParam) for value in (initial, *any_values, final))
+    return isinstance(node.value, LdapParam)
+
+
+def _ldap_filter_template(node: LdapFilter) -> str:
+    match node:
+        case LdapAnd(children):
+            return "(&" + "".join(_ldap_filter_template(child) for child in children) + ")"
+        case LdapOr(children):
+            return "(|" + "".join(_ldap_filter_template(child) for child in children) + ")"
+        case LdapNot(child):
+            return "(!" + _ldap_filter_template(child) + ")"
+        case LdapEq(attr, value):
+            return f"({_ldap_attr(attr)}={_ldap_value(value)})"
+        case LdapGreaterOrEqual(attr, value):
+            return f"({_ldap_attr(attr)}>={_ldap_value(value)})"
+        case LdapPresent(attr):
+            return f"({_ldap_attr(attr)}=*)"
+        case LdapSubstring(attr, initial, any_values, final):
+            components = [
+                _ldap_value(initial) if initial is not None else "",
+                *(_ldap_value(value) for value in any_values),
+                _ldap_value(final) if final is not None else ""
+            ]
+            return f"({_ldap_attr(attr)}={'*'.join(components)})"
+        case LdapExtensible(attr, rule, value):
+            return f"({_ldap_attr(attr)}:{rule}:={_ldap_value(value)})"
+    raise TypeError(f"Unknown filter node: {node!r}.")
+
+
+def ldap_filter_compile(node: LdapFilter) -> str:
+
+    """
+    Compile a filter node to the wire filter. Values are escaped as per RFC 4515, parameters are left
+    as `{name}` fields for `ldap_filter_format`. Filters without parameters are returned ready to send.
+    :param node:                        Filter Node
+    :return:
+    """
+
+    template = _ldap_filter_template(node)
+    # Literal braces are doubled in templates only, parameterless filters never pass `ldap_filter_format`
+    return template if _ldap_filter_params(node) else template.format()
+
+
+def ldap_filter_format(template: str, **params: str) -> str:
+
+    """
+    Substitute escaped parameter values into a compiled filter template.
+    :param template:                    Compiled Filter Template
+    :param params:                      Parameter Values by Name
+    :return:
+    """
+
+    return template.format(**{name: escape_filter_chars(value) for name, value in params.items()})
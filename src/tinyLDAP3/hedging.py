@@ -0,0 +1,196 @@
+import socket, threading
+from collections import deque
+from ldap3 import Connection
+from typing import Any, Callable, Optional
+
+
+""" ######################################################### """
+""" ************** TINY LDAP3 HEDGED REQUESTS *************** """
+""" ######################################################### """
+
+
+class _LdapHedgeAbandonedError(Exception):
+
+    """
+        The operation of an abandoned hedge leg. Not a stale connection error: the pool doesn't repeat it.
+        """
+
+
+class LdapHedgePolicy:
+
+    """
+        Thread-safe hedged requests policy. A read not completed within the hedge delay is issued to a second host,
+        the first answer wins. The delay is fixed or the observed latency quantile of the method. Hedges are limited
+        by a token budget: every request adds `budget` tokens, every hedge spends one token, so the extra load
+        doesn't exceed the `budget` fraction of requests.
+        """
+
+    def __init__(
+            self,
+            delay: Optional[float] = None,
+            budget: float = 0.05,
+            quantile: float = 0.95,
+            window: int = 200,
+            min_samples: int = 20,
+            max_tokens: float = 10
+    ):
+
+        """
+        :param delay:                       Hedge Delay (sec.) or None (Observed Latency Quantile of the Method)
+        :param budget:                      Maximum Fraction of Hedged Requests
+        :param quantile:                    Latency Quantile of the Adaptive Delay
+        :param window:                      Number of Latest Latencies per Method
+        :param min_samples:                 Latencies Required Before the Adaptive Delay Hedges a Method
+        :param max_tokens:                  Maximum Number of Saved Tokens (Burst of Hedges)
+        """
+
+        if not 0 < budget <= 1:
+            raise ValueError("Hedge budget must satisfy: 0 < budget <= 1.")
+        if not 0 < quantile < 1:
+            raise ValueError("Hedge quantile must satisfy: 0 < quantile < 1.")
+
+        self._delay = delay
+        self._budget = budget
+        self._quantile = quantile
+        self._window = window
+        self._min_samples = min_samples
+        self._max_tokens = max_tokens
+
+        self.__lock = threading.Lock()
+        self.__tokens = 0.0
+        self.__latencies: dict[str, deque[float]] = {}
+        self.__counters = {"requests": 0, "hedged": 0, "wins": 0, "budget_exhausted": 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+
+        """
+        Hedging counters: requests, hedged (hedges fired), wins (hedges answered first), budget_exhausted
+        (hedges skipped by the budget).
+        :return:
+        """
+
+        with self.__lock:
+            return dict(self.__counters)
+
+    def delay(self, method: str) -> Optional[float]:
+
+        """
+        Hedge delay of the method. Counts the request and adds its budget tokens.
+        :param method:                      Method Name
+        :return:                            Delay (sec.) or None (Not Hedged: Not Enough Latency Samples)
+        """
+
+        with self.__lock:
+            self.__counters["requests"] += 1
+            self.__tokens = min(self.__tokens + self._budget, self._max_tokens)
+            if self._delay is not None:
+                return self._delay
+            latencies = self.__latencies.get(method)
+            if latencies is None or len(latencies) < self._min_samples:
+                return None
+            return sorted(latencies)[int(self._quantile * (len(latencies) - 1))]
+
+    def acquire(self) -> bool:
+
+        """
+        Spend a budget token on a hedge.
+        :return:                            The Hedge Is Allowed
+        """
+
+        with self.__lock:
+            if self.__tokens < 1:
+                self.__counters["budget_exhausted"] += 1
+                return False
+            self.__tokens -= 1
+            self.__counters["hedged"] += 1
+            return True
+
+    def record(self, method: str, latency: float, hedge_won: bool = False) -> None:
+
+        """
+        Record the latency of a completed request.
+        :param method:                      Method Name
+        :param latency:                     Request Time (sec.) Until the First Answer
+        :param hedge_won:                   The Hedge Answered First
+        :return:
+        """
+
+        with self.__lock:
+            latencies = self.__latencies.get(method)
+            if latencies is None:
+                latencies = self.__latencies[method] = deque(maxlen=self._window)
+            latencies.append(latency)
+            self.__counters["wins"] += hedge_won
+
+
+class LdapHedgeLeg:
+
+    """
+        Operation of a hedged request leg on a pooled `ldap3` SYNC connection. A SYNC connection holds its lock until
+        the response, so an Abandon request can't be sent on it: the socket of the abandoned leg is shut down instead,
+        which abandons the outstanding operation on the server, and the connection is discarded by the pool.
+        An abandoned leg that hasn't got a connection yet isn't run.
+        """
+
+    def __init__(self, operation: Callable[[Connection], Any]):
+        self.host: Optional[str] = None
+
+        self.__operation = operation
+        self.__lock = threading.Lock()
+        self.__connection: Optional[Connection] = None
+        self.__abandoned = False
+
+    def __call__(self, conn: Connection) -> Any:
+        with self.__lock:
+            if self.__abandoned:
+                raise _LdapHedgeAbandonedError("Hedged request abandoned.")
+            self.__connection = conn
+            self.host = conn.server.host
+        try:
+            return self.__operation(conn)
+        except Exception as err:
+            if self.__abandoned:
+                raise _LdapHedgeAbandonedError("Hedged request abandoned.") from err
+            raise
+        finally:
+            with self.__lock:
+                self.__connection = None
+                abandoned = self.__abandoned
+            # Answered while abandoned: the socket may be shut down, the connection mustn't return to the pool
+            if abandoned and not conn.closed:
+                conn.strategy.close()
+
+    def abandon(self) -> None:
+
+        """
+        Abandon the leg: shut down the socket of the running operation.
+        :return:
+        """
+
+        with self.__lock:
+            self.__abandoned = True
+            conn = self.__connection
+        # Mock strategies have no socket
+        if conn is not None and conn.socket is not None:
+            try:
+                conn.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+def ldap_hedge_answer(legs: tuple[Any, Any], done: set, pending: set) -> Optional[Any]:
+
+    """
+    First answer of a hedged request: a succeeded leg, the failed primary only if both legs have failed.
+    Works with both `concurrent.futures.Future` and `asyncio.Future` legs.
+    :param legs:                        (Primary, Hedge) Futures
+    :param done:                        Completed Futures
+    :param pending:                     Pending Futures
+    :return:                            Future or None (Wait for the Pending Leg)
+    """
+
+    for leg in legs:
+        if leg in done and leg.exception() is None:
+            return leg
+    return None if pending else legs[0]
@@ -0,0 +1,439 @@
+import bisect, contextvars, threading, time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+try:
+    from opentelemetry import context as otel_context, trace as otel_trace
+except ImportError:
+    # Optional: span context of `LdapOtelSpanHook`
+    otel_context = otel_trace = None
+
+
+""" ######################################################### """
+""" *************** TINY LDAP3 INSTRUMENTATION ************** """
+""" ######################################################### """
+
+
+LDAP_METRICS_PREFIX = "tinyldap3_"
+
+# Histogram upper bounds: request phases & methods latency (sec.), entries & bytes counts
+LDAP_LATENCY_BUCKETS_TUPLE = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LDAP_SIZE_BUCKETS_TUPLE = (0, 1, 10, 100, 1000, 10000, 100000, 1000000, 10000000)
+
+# Public method of the current call, the label of the phases, entries and bytes metrics
+_ldap_current_method: contextvars.ContextVar[str] = contextvars.ContextVar("tinyldap3_method", default="")
+
+_LDAP_NULL_CONTEXT = nullcontext()
+
+
+def _ldap_labels_key(labels: Optional[dict[str, Any]]) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((key, str(value)) for key, value in labels.items())) if labels else ()
+
+
+class LdapMetricsCollector:
+
+    """
+        Metrics collector interface. Collectors receive every observation, e.g. to forward them to a metrics
+        backend. Metric names are passed without the `tinyldap3_` prefix.
+        """
+
+    def observe(self, name: str, value: float, labels: Optional[dict[str, Any]] = None) -> None:
+
+        """
+        Record a histogram observation.
+        :param name:                        Metric Name
+        :param value:                       Observed Value
+        :param labels:                      Metric Labels or None
+        :return:
+        """
+
+    def inc(self, name: str, value: float = 1, labels: Optional[dict[str, Any]] = None) -> None:
+
+        """
+        Increment a counter.
+        :param name:                        Metric Name
+        :param value:                       Increment
+        :param labels:                      Metric Labels or None
+        :return:
+        """
+
+
+class LdapInMemoryCollector(LdapMetricsCollector):
+
+    """
+        Thread-safe in-memory collector: cumulative histograms & counters for snapshots and Prometheus export.
+        """
+
+    def __init__(self, buckets: Optional[dict[str, Iterable[float]]] = None):
+
+        """
+        :param buckets:                     Histogram Upper Bounds by Metric Name or None (Defaults)
+        """
+
+        self._buckets = {name: tuple(sorted(bounds)) for name, bounds in (buckets or {}).items()}
+
+        self.__lock = threading.Lock()
+        self.__histograms: dict[tuple[str, tuple], list] = {}
+        self.__counters: dict[tuple[str, tuple], float] = {}
+
+    def __bounds(self, name: str) -> tuple[float, ...]:
+        bounds = self._buckets.get(name)
+        if bounds is None:
+            bounds = LDAP_LATENCY_BUCKETS_TUPLE if name.endswith("_seconds") else LDAP_SIZE_BUCKETS_TUPLE
+        return bounds
+
+    def observe(self, name: str, value: float, labels: Optional[dict[str, Any]] = None) -> None:
+        key = (name, _ldap_labels_key(labels))
+        with self.__lock:
+            histogram = self.__histograms.get(key)
+            if histogram is None:
+                bounds = self.__bounds(name)
+                # Bounds, bucket counts (the last is +Inf), sum
+                histogram = self.__histograms[key] = [bounds, [0] * (len(bounds) + 1), 0.0]
+            histogram[1][bisect.bisect_left(histogram[0], value)] += 1
+            histogram[2] += value
+
+    def inc(self, name: str, value: float = 1, labels: Optional[dict[str, Any]] = None) -> None:
+        key = (name, _ldap_labels_key(labels))
+        with self.__lock:
+            self.__counters[key] = self.__counters.get(key, 0) + value
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+
+        """
+        Counters and histograms with cumulative bucket counts.
+        :return:
+        """
+
+        with self.__lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self.__counters.items())
+            ]
+            histograms = []
+            for (name, labels), (bounds, counts, total) in sorted(self.__histograms.items(), key=lambda item: item[0]):
+                cumulative, buckets = 0, {}
+                for bound, count in zip((*bounds, float("inf")), counts):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                histograms.append(
+                    {"name": name, "labels": dict(labels), "count": cumulative, "sum": total, "buckets": buckets}
+                )
+        return {"counters": counters, "histograms": histograms}
+
+    def clear(self) -> None:
+
+        """
+        Reset all metrics.
+        :return:
+        """
+
+        with self.__lock:
+            self.__histograms.clear()
+            self.__counters.clear()
+
+
+class LdapSpanHook:
+
+    """
+        Span hook interface, called around public methods and their phases (connect, bind, search, decode).
+        """
+
+    def start(self, name: str, attributes: dict[str, Any]) -> Any:
+
+        """
+        Start a span.
+        :param name:                        Span Name, e.g. `tinyldap3.object_detail` or `tinyldap3.search`
+        :param attributes:                  Span Attributes
+        :return:                            Span Passed to `end`
+        """
+
+    def end(self, span: Any, error: Optional[BaseException] = None) -> None:
+
+        """
+        End a span.
+        :param span:                        Span Returned by `start`
+        :param error:                       Raised Error or None
+        :return:
+        """
+
+
+class LdapOtelSpanHook(LdapSpanHook):
+
+    """
+        OpenTelemetry span hook. Phase spans are children of the method span: a started span is attached
+        to the current context until it ends. The `opentelemetry` package isn't required by tinyLDAP3,
+        pass a tracer of your setup.
+        """
+
+    def __init__(self, tracer: Any):
+
+        """
+        :param tracer:                      `opentelemetry.trace.Tracer`
+        """
+
+        if otel_context is None:
+            raise ImportError("LdapOtelSpanHook requires the 'opentelemetry-api' package.")
+
+        self.__tracer = tracer
+
+    def start(self, name: str, attributes: dict[str, Any]) -> Any:
+        otel_span = self.__tracer.start_span(name, attributes=attributes)
+        return otel_span, otel_context.attach(otel_trace.set_span_in_context(otel_span))
+
+    def end(self, span: Any, error: Optional[BaseException] = None) -> None:
+        otel_span, context_token = span
+        try:
+            if error is not None:
+                otel_span.record_exception(error)
+                otel_span.set_attribute("error.type", type(error).__name__)
+        finally:
+            otel_context.detach(context_token)
+            otel_span.end()
+
+
+class LdapInstrumentation:
+
+    """
+        tinyLDAP3 Instrumentation. Methods decorated with `ldap_logging` record their latency and errors,
+        the clients record the phases latency (connect, bind, search, decode), entries returned, bytes received,
+        requests and errors by host. Observations are passed to the collectors, spans to the span hooks.
+        Pool & cache gauges are read on snapshot.
+        """
+
+    def __init__(
+            self,
+            collectors: Optional[Iterable[LdapMetricsCollector]] = None,
+            span_hooks: Optional[Iterable[LdapSpanHook]] = None
+    ):
+
+        """
+        :param collectors:                  Metrics Collectors or None (One In-Memory Collector)
+        :param span_hooks:                  Span Hooks or None
+        """
+
+        self.collectors = list(collectors) if collectors is not None else [LdapInMemoryCollector()]
+        self.span_hooks = list(span_hooks or ())
+
+        self.__lock = threading.Lock()
+        self.__gauges: list[Callable[[], Iterable[tuple[str, dict[str, Any], float]]]] = []
+
+    def register_gauges(self, callback: Callable[[], Iterable[tuple[str, dict[str, Any], float]]]) -> None:
+
+        """
+        Register a gauges callback, called on snapshot.
+        :param callback:                    Callable Returning (Name, Labels, Value) Gauges
+        :return:
+        """
+
+        with self.__lock:
+            self.__gauges.append(callback)
+
+    def observe(self, name: str, value: float, labels: Optional[dict[str, Any]] = None) -> None:
+        for collector in self.collectors:
+            collector.observe(name, value, labels)
+
+    def inc(self, name: str, value: float = 1, labels: Optional[dict[str, Any]] = None) -> None:
+        for collector in self.collectors:
+            collector.inc(name, value, labels)
+
+    def __spans_start(self, name: str, attributes: dict[str, Any]) -> list[tuple[LdapSpanHook, Any]]:
+        return [(hook, hook.start(name, attributes)) for hook in self.span_hooks]
+
+    @staticmethod
+    def __spans_end(spans: list[tuple[LdapSpanHook, Any]], error: Optional[BaseException]) -> None:
+        for hook, span in reversed(spans):
+            hook.end(span, error)
+
+    def method_start(self, method: str) -> tuple:
+
+        """
+        Start a public method call.
+        :param method:                      Method Name
+        :return:                            Call Token Passed to `method_end`
+        """
+
+        context_token = _ldap_current_method.set(method)
+        spans = self.__spans_start(f"tinyldap3.{method}", {"ldap.method": method}) if self.span_hooks else []
+        return method, context_token, spans, time.perf_counter()
+
+    def method_end(self, token: tuple, error: Optional[BaseException] = None) -> None:
+
+        """
+        End a public method call: record the latency and the error.
+        :param token:                       Call Token Returned by `method_start`
+        :param error:                       Raised Error or None
+        :return:
+        """
+
+        method, context_token, spans, started = token
+        self.observe("method_duration_seconds", time.perf_counter() - started, {"method": method})
+        if error is not None:
+            self.inc("method_errors_total", labels={"method": method, "type": type(error).__name__})
+        self.__spans_end(spans, error)
+        _ldap_current_method.reset(context_token)
+
+    @contextmanager
+    def phase(self, phase: str, **attributes) -> Iterator[None]:
+
+        """
+        Time a request phase of the current method.
+        :param phase:                       Phase: `connect`, `bind`, `search` or `decode`
+        :param attributes:                  Span Attributes, e.g. `host`
+        :return:
+        """
+
+        method = _ldap_current_method.get()
+        spans = self.__spans_start(
+            f"tinyldap3.{phase}", {"ldap.method": method, "ldap.phase": phase, **attributes}
+        ) if self.span_hooks else []
+        started = time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as err:
+            error = err
+            raise
+        finally:
+            self.observe("phase_duration_seconds", time.perf_counter() - started, {"method": method, "phase": phase})
+            self.__spans_end(spans, error)
+
+    def entries(self, count: int) -> None:
+
+        """
+        Record the number of entries returned by a search of the current method.
+        :param count:                       Number of Entries
+        :return:
+        """
+
+        self.observe("entries_returned", count, {"method": _ldap_current_method.get()})
+
+    def bytes_received(self, count: int) -> None:
+
+        """
+        Record the number of bytes received by an operation of the current method.
+        :param count:                       Number of Bytes
+        :return:
+        """
+
+        self.observe("bytes_received", count, {"method": _ldap_current_method.get()})
+
+    def host_request(self, host: str, latency: float, error: Optional[BaseException] = None) -> None:
+
+        """
+        Record a request of the host.
+        :param host:                        Host
+        :param latency:                     Request Time (sec.)
+        :param error:                       Request Error or None
+        :return:
+        """
+
+        self.observe("host_request_duration_seconds", latency, {"host": host})
+        if error is not None:
+            self.inc("host_errors_total", labels={"host": host, "type": type(error).__name__})
+
+    def gauges(self) -> list[dict[str, Any]]:
+
+        """
+        Current values of the registered gauges.
+        :return:
+        """
+
+        with self.__lock:
+            callbacks = list(self.__gauges)
+        return [
+            {"name": name, "labels": dict(labels), "value": value}
+            for callback in callbacks for name, labels, value in callback()
+        ]
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+
+        """
+        Counters & histograms of the first in-memory collector and the gauges.
+        :return:
+        """
+
+        collector = next(
+            (collector for collector in self.collectors if isinstance(collector, LdapInMemoryCollector)), None
+        )
+        snapshot = collector.snapshot() if collector is not None else {"counters": [], "histograms": []}
+        snapshot["gauges"] = self.gauges()
+        return snapshot
+
+    def prometheus(self) -> str:
+
+        """
+        Snapshot in the Prometheus text exposition format.
+        :return:
+        """
+
+        return ldap_metrics_prometheus(self.snapshot())
+
+
+def ldap_phase(instrumentation: Optional[LdapInstrumentation], phase: str, **attributes):
+
+    """
+    Phase context of the instrumentation or a no-op context (Instrumentation Disabled).
+    :param instrumentation:             Instrumentation or None
+    :param phase:                       Phase: `connect`, `bind`, `search` or `decode`
+    :param attributes:                  Span Attributes
+    :return:
+    """
+
+    if instrumentation is None:
+        return _LDAP_NULL_CONTEXT
+    return instrumentation.phase(phase, **attributes)
+
+
+def _ldap_prometheus_label_value(value: Any) -> str:
+    # Backslash, double quote and line feed are escaped as per the text exposition format
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _ldap_prometheus_labels(labels: dict[str, Any], **extra) -> str:
+    labels = {**labels, **extra}
+    if not labels:
+        return ""
+    values = ",".join(f'{key}="{_ldap_prometheus_label_value(value)}"' for key, value in labels.items())
+    return f"{{{values}}}"
+
+
+def _ldap_prometheus_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+def ldap_metrics_prometheus(snapshot: dict[str, list[dict[str, Any]]]) -> str:
+
+    """
+    Metrics snapshot in the Prometheus text exposition format.
+    :param snapshot:                    Snapshot of `LdapInstrumentation.snapshot`
+    :return:
+    """
+
+    lines, typed = [], set()
+
+    def type_line(name: str, metric_type: str) -> None:
+        if name not in typed:
+            typed.add(name)
+            lines.append(f"# TYPE {name} {metric_type}")
+
+    for item in snapshot.get("counters", ()):
+        name = LDAP_METRICS_PREFIX + item["name"]
+        type_line(name, "counter")
+        lines.append(f"{name}{_ldap_prometheus_labels(item['labels'])} {_ldap_prometheus_number(item['value'])}")
+    # Samples of a metric family must be consecutive
+    for item in sorted(snapshot.get("gauges", ()), key=lambda gauge: gauge["name"]):
+        name = LDAP_METRICS_PREFIX + item["name"]
+        type_line(name, "gauge")
+        lines.append(f"{name}{_ldap_prometheus_labels(item['labels'])} {_ldap_prometheus_number(item['value'])}")
+    for item in snapshot.get("histograms", ()):
+        name = LDAP_METRICS_PREFIX + item["name"]
+        type_line(name, "histogram")
+        for bound, count in item["buckets"].items():
+            labels = _ldap_prometheus_labels(item["labels"], le=_ldap_prometheus_number(bound))
+            lines.append(f"{name}_bucket{labels} {count}")
+        lines.append(f"{name}_sum{_ldap_prometheus_labels(item['labels'])} {_ldap_prometheus_number(item['sum'])}")
+        lines.append(f"{name}_count{_ldap_prometheus_labels(item['labels'])} {item['count']}")
+    return "\n".join(lines) + "\n"
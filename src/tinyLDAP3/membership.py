@@ -0,0 +1,225 @@
+import threading, time
+from collections import OrderedDict
+from typing import Callable, Iterable, NamedTuple
+from .results import ldap_dn_key
+
+
+""" ######################################################### """
+""" ***************** TINY LDAP3 MEMBERSHIP ***************** """
+""" ######################################################### """
+
+
+# Linked attribute of each expansion direction: groups of an Object or members of a Group
+LDAP_MEMBERSHIP_ATTRS = {
+    "groups": "memberOf",
+    "members": "member",
+}
+
+
+class LdapMembershipResult(NamedTuple):
+
+    """
+        Transitive membership result.
+        `dns`    - Groups of an Object or members of a Group including the nested ones, sorted case-insensitively.
+        `cycles` - Membership edges (member DN, group DN) closing a cycle. Always empty for the `chain` strategy.
+        """
+
+    dns: tuple[str, ...]
+    cycles: tuple[tuple[str, str], ...]
+
+
+class _LdapGraphNode(NamedTuple):
+    dn: str
+    edges: tuple[str, ...]
+    expires_at: float
+
+
+class LdapGroupGraph:
+
+    """
+        Thread-safe memoised membership graph for the client-side (`bfs`) expansion. Linked attribute values of each
+        Object are read once and reused by the later expansions until `ttl` expires. Objects are read in batches,
+        one batch per level of the expansion.
+        """
+
+    def __init__(self, ttl: float = 300, max_size: int = 100000):
+
+        """
+        :param ttl:                         Node Time to Live (sec.)
+        :param max_size:                    Maximum Number of Nodes (LRU Eviction)
+        """
+
+        if max_size < 1:
+            raise ValueError("Graph max_size must be >= 1.")
+
+        self._ttl = ttl
+        self._max_size = max_size
+
+        self.__lock = threading.Lock()
+        self.__nodes: OrderedDict[tuple[str, str], _LdapGraphNode] = OrderedDict()
+        self.__counters = {"hits": 0, "misses": 0, "expansions": 0, "cycles": 0, "evictions": 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+
+        """
+        Graph gauges and counters.
+        :return:
+        """
+
+        with self.__lock:
+            return {"size": len(self.__nodes), **self.__counters}
+
+    def clear(self) -> None:
+
+        """
+        Remove all nodes.
+        :return:
+        """
+
+        with self.__lock:
+            self.__nodes.clear()
+
+    def __nodes_get(
+            self,
+            direction: str,
+            dns: Iterable[str],
+            fetch: Callable[[list[str], bool], list[tuple[str, tuple[str, ...]]]],
+            groups_only: bool
+    ) -> dict[str, _LdapGraphNode]:
+
+        """
+        Nodes by DN key. Missing and expired nodes are read with one `fetch` call.
+        :param direction:                   Expansion Direction: `groups` or `members`
+        :param dns:                         Objects DNs
+        :param fetch:                       Read the Linked Attribute of Objects: (DNs, Groups Only) -> (DN, Values)
+        :param groups_only:                 Only Groups Have Edges, Other Objects Aren't Returned by `fetch`
+        :return:
+        """
+
+        now = time.monotonic()
+        nodes, pending = {}, {}
+        with self.__lock:
+            for dn in dns:
+                key = ldap_dn_key(dn)
+                node = self.__nodes.get((direction, key))
+                if node is not None and node.expires_at > now:
+                    self.__nodes.move_to_end((direction, key))
+                    nodes[key] = node
+                    self.__counters["hits"] += 1
+                else:
+                    pending[key] = dn
+                    self.__counters["misses"] += 1
+        if not pending:
+            return nodes
+        fetched = {ldap_dn_key(dn): (dn, edges) for dn, edges in fetch(list(pending.values()), groups_only)}
+        expires_at = time.monotonic() + self._ttl
+        with self.__lock:
+            for key, dn in pending.items():
+                # Objects not returned by `fetch` are leaves: not groups, deleted or out of the search base
+                node_dn, edges = fetched.get(key, (dn, ()))
+                node = _LdapGraphNode(node_dn, tuple(edges), expires_at)
+                self.__nodes[(direction, key)] = node
+                self.__nodes.move_to_end((direction, key))
+                nodes[key] = node
+            while len(self.__nodes) > self._max_size:
+                self.__nodes.popitem(last=False)
+                self.__counters["evictions"] += 1
+        return nodes
+
+    @staticmethod
+    def __back_edges(start_key: str, edges: dict[str, tuple[str, ...]]) -> list[tuple[str, str]]:
+
+        """
+        Edges closing a cycle, found with an iterative depth-first search.
+        :param start_key:                   DN Key of the Expanded Object
+        :param edges:                       Edges DN Keys by DN Key
+        :return:
+        """
+
+        back_edges = []
+        # 1 - on the current path, 2 - done
+        state = {start_key: 1}
+        stack = [(start_key, iter(edges.get(start_key, ())))]
+        while stack:
+            key, children = stack[-1]
+            for child in children:
+                child_state = state.get(child)
+                if child_state == 1:
+                    back_edges.append((key, child))
+                elif child_state is None:
+                    state[child] = 1
+                    stack.append((child, iter(edges.get(child, ()))))
+                    break
+            else:
+                state[key] = 2
+                stack.pop()
+        return back_edges
+
+    def expand(
+            self,
+            dn: str,
+            direction: str,
+            fetch: Callable[[list[str], bool], list[tuple[str, tuple[str, ...]]]]
+    ) -> LdapMembershipResult:
+
+        """
+        Breadth-first transitive expansion. Every Object is expanded once, so membership cycles are terminated
+        and reported.
+        :param dn:                          Expanded Object `distinguishedName` Attribute Value
+        :param direction:                   Expansion Direction: `groups` (of an Object) or `members` (of a Group)
+        :param fetch:                       Read the Linked Attribute of Objects: (DNs, Groups Only) -> (DN, Values)
+        :return:
+        """
+
+        if direction not in LDAP_MEMBERSHIP_ATTRS:
+            raise ValueError(f"direction must be one of: {', '.join(map(repr, LDAP_MEMBERSHIP_ATTRS))}.")
+
+        start_key = ldap_dn_key(dn)
+        # Objects reached via an edge by DN key
+        reached: dict[str, str] = {}
+        edges: dict[str, tuple[str, ...]] = {}
+        frontier, start = [dn], True
+        while frontier:
+            # `memberOf` values are groups. The expanded Object of `groups` may be of any category, members of
+            # `members` are expanded only if they are groups.
+            nodes = self.__nodes_get(direction, frontier, fetch, groups_only=not (start and direction == "groups"))
+            next_frontier = []
+            for node_key, node in nodes.items():
+                edges[node_key] = tuple(ldap_dn_key(edge) for edge in node.edges)
+                for edge_key, edge_dn in zip(edges[node_key], node.edges):
+                    if edge_key not in reached:
+                        reached[edge_key] = edge_dn
+                        if edge_key != start_key:
+                            next_frontier.append(edge_dn)
+            frontier, start = next_frontier, False
+
+        names = {start_key: dn, **reached}
+        cycles = [
+            (names[key], names[child]) if direction == "groups" else (names[child], names[key])
+            for key, child in self.__back_edges(start_key, edges)
+        ]
+        with self.__lock:
+            self.__counters["expansions"] += 1
+            self.__counters["cycles"] += len(cycles)
+        return LdapMembershipResult(
+            dns=tuple(sorted(reached.values(), key=str.lower)),
+            cycles=tuple(cycles)
+        )
+
+
+def ldap_linked_values(values: dict, attr_name: str) -> tuple[str, ...]:
+
+    """
+    Values of a linked attribute from an Object dictionary as a tuple of DNs.
+    :param values:                      Object Dictionary
+    :param attr_name:                   Linked Attribute Name (Case-Insensitive)
+    :return:
+    """
+
+    for key, value in values.items():
+        if key.lower() == attr_name.lower():
+            if value is None:
+                return ()
+            return tuple(value) if isinstance(value, list) else (value,)
+    return ()
@@ -2,7 +2,7 @@ import re
 from enum import Enum
 from ldap3.core.exceptions import LDAPAttributeError
 from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import Iterable, Optional, Union
+from typing import Annotated, Iterable, Optional, Union
 
 
 """ ######################################################### """
@@ -131,6 +131,14 @@ LDAP_PERSON_SEARCH_RETURNED_ATTRS_TUPLE = (
     "whenCreated",
 )
 
+# Heavy attributes (binary blobs & long multi-valued lists) of `object_detail(deferred=True)`: they are read
+# on the first access instead of by the search
+ldap_objects_deferred_attrs_schema = {
+    "computer": ("servicePrincipalName",),
+    "group": ("member", "memberOf"),
+    "person": ("memberOf", "servicePrincipalName", "thumbnailPhoto"),
+}
+
 ldap_objects_returned_attrs_schema = {
     "computer": {
         "detail": LDAP_COMPUTER_DETAIL_RETURNED_ATTRS_TUPLE,
@@ -146,6 +154,14 @@ ldap_objects_returned_attrs_schema = {
     }
 }
 
+# Object Classes & Categories of `object_read` mapped to the Object Category
+ldap_objects_classes_categories_schema = {
+    "computer": "computer",
+    "group": "group",
+    "person": "person",
+    "user": "person",
+}
+
 # Fullmatch, no symbols !#$%&'*+/=?^_`{|}~- and no first '\"' after '^(?:[a-z0-9]+(?:\.[a-z0-9]+)*|'
 ldap_upn_regex_rfc822based = re.compile(
     r"""^(?:[a-z0-9]+(?:\.[a-z0-9]+)*|(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*\")
@@ -162,6 +178,27 @@ class LdapObjectsCategoriesEnum(str, Enum):
     computer = "computer"
 
 
+class LdapSearchModesEnum(str, Enum):
+    prefix = "prefix"
+    contains = "contains"
+    anr = "anr"
+
+
+class LdapMembershipStrategiesEnum(str, Enum):
+    chain = "chain"
+    bfs = "bfs"
+
+
+class LdapAttrsProfilesEnum(str, Enum):
+    detail = "detail"
+    search = "search"
+
+
+class LdapExportFormatsEnum(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
 class LdapBaseModel(BaseModel):
     method_type: str = Field(exclude=True)
     object_category: LdapObjectsCategoriesEnum
@@ -192,10 +229,93 @@ class LdapObjectDetailModel(LdapBaseModel):
     attr_value: str = Field(min_length=1)
 
 
+class LdapObjectsDetailManyModel(LdapBaseModel):
+    attr_name: str = Field(min_length=1)
+    attr_values: tuple[Annotated[str, Field(min_length=1)], ...]
+    chunk_size: int = Field(ge=1, le=1000)
+    workers: int = Field(ge=1)
+
+
+class LdapObjectsEnumerationModel(BaseModel):
+    object_category: LdapObjectsCategoriesEnum
+    returned_attrs_collection: Optional[Union[Iterable[str], None]] = None
+    page_size: int = Field(ge=1, le=1000)
+    workers: int = Field(ge=1)
+    retries: int = Field(ge=0)
+
+    @model_validator(mode="before")
+    def _set_returned_attrs_field(cls, values: dict) -> dict:
+        object_category = values["object_category"]
+        if not values["returned_attrs_collection"] and object_category in ldap_objects_returned_attrs_schema:
+            values["returned_attrs_collection"] = ldap_objects_returned_attrs_schema[object_category]["search"]
+        return values
+
+
+class LdapObjectsExportModel(BaseModel):
+    object_category: LdapObjectsCategoriesEnum
+    attrs_profile: LdapAttrsProfilesEnum
+    export_format: LdapExportFormatsEnum
+    returned_attrs_collection: Optional[Union[Iterable[str], None]] = None
+    page_size: int = Field(ge=1, le=1000)
+
+    @model_validator(mode="before")
+    def _set_returned_attrs_field(cls, values: dict) -> dict:
+        profile = ldap_objects_returned_attrs_schema.get(values["object_category"], {})
+        if not values["returned_attrs_collection"] and values["attrs_profile"] in profile:
+            values["returned_attrs_collection"] = profile[values["attrs_profile"]]
+        return values
+
+
+class LdapObjectsWindowModel(BaseModel):
+    offset: int = Field(ge=0)
+    limit: int = Field(ge=1, le=1000)
+    before: int = Field(ge=0)
+
+    @model_validator(mode="before")
+    def _check_before_field(cls, values: dict) -> dict:
+        if isinstance(values["before"], int) and isinstance(values["limit"], int) \
+                and values["before"] >= values["limit"]:
+            raise ValueError("The window must include the target Object: before < limit.")
+        return values
+
+
+class LdapObjectReadManyModel(BaseModel):
+    object_category: tuple[Annotated[str, Field(min_length=1)], ...] = Field(min_length=1)
+    dns: tuple[Annotated[str, Field(min_length=1)], ...]
+    chunk_size: int = Field(ge=1, le=1000)
+
+
+class LdapMembershipModel(BaseModel):
+    dn: str = Field(min_length=1)
+    strategy: LdapMembershipStrategiesEnum
+    chunk_size: int = Field(ge=1, le=1000)
+
+
+class LdapChangeSubscriptionModel(BaseModel):
+    search_bases: tuple[Annotated[str, Field(min_length=1)], ...] = Field(min_length=1)
+    object_categories: tuple[LdapObjectsCategoriesEnum, ...] = Field(min_length=1)
+    returned_attrs_collection: Optional[Union[Iterable[str], None]] = None
+    page_size: int = Field(ge=1, le=1000)
+
+    @model_validator(mode="before")
+    def _set_returned_attrs_field(cls, values: dict) -> dict:
+        if not values["returned_attrs_collection"]:
+            # Search attributes of all subscribed categories
+            values["returned_attrs_collection"] = tuple(
+                dict.fromkeys(
+                    attr_name for object_category in values["object_categories"]
+                    if object_category in ldap_objects_returned_attrs_schema
+                    for attr_name in ldap_objects_returned_attrs_schema[object_category]["search"]
+                )
+            )
+        return values
+
+
 class LdapObjecsSearchModel(LdapBaseModel):
     attr_value: str = Field(min_length=1)
     order_by: str = Field(min_length=1)
     search_by_attrs_collection: Optional[Union[Iterable[str], None]] = None
+    search_mode: Optional[LdapSearchModesEnum] = None
 
     @model_validator(mode="before")
     def _set_search_by_attrs_field(cls, values: dict) -> dict:
@@ -0,0 +1,338 @@
+import datetime, struct, uuid
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional, Union
+
+try:
+    import numpy
+except ImportError:
+    # Optional: vectorized FILETIME columns of `ldap_normalize_columns`
+    numpy = None
+
+
+""" ######################################################### """
+""" **************** TINY LDAP3 NORMALIZERS ***************** """
+""" ######################################################### """
+
+
+# Integer8 attributes holding a FILETIME: 100-nanosecond intervals since January 1, 1601 (UTC)
+LDAP_FILETIME_ATTRS_TUPLE = (
+    "accountExpires",
+    "badPasswordTime",
+    "lastLogoff",
+    "lastLogon",
+    "lastLogonTimestamp",
+    "lockoutTime",
+    "msDS-UserPasswordExpiryTimeComputed",
+    "pwdLastSet",
+)
+
+# Octet string attributes holding a GUID in the little-endian byte order of AD
+LDAP_GUID_ATTRS_TUPLE = (
+    "msExchMailboxGuid",
+    "objectGUID",
+)
+
+# Octet string attributes holding a binary SID
+LDAP_SID_ATTRS_TUPLE = (
+    "objectSid",
+    "sIDHistory",
+)
+
+# Bit flags of the `userAccountControl` & `msDS-User-Account-Control-Computed` attributes
+ldap_uac_flags_schema = {
+    0x1: "SCRIPT",
+    0x2: "ACCOUNTDISABLE",
+    0x8: "HOMEDIR_REQUIRED",
+    0x10: "LOCKOUT",
+    0x20: "PASSWD_NOTREQD",
+    0x40: "PASSWD_CANT_CHANGE",
+    0x80: "ENCRYPTED_TEXT_PWD_ALLOWED",
+    0x100: "TEMP_DUPLICATE_ACCOUNT",
+    0x200: "NORMAL_ACCOUNT",
+    0x800: "INTERDOMAIN_TRUST_ACCOUNT",
+    0x1000: "WORKSTATION_TRUST_ACCOUNT",
+    0x2000: "SERVER_TRUST_ACCOUNT",
+    0x10000: "DONT_EXPIRE_PASSWORD",
+    0x20000: "MNS_LOGON_ACCOUNT",
+    0x40000: "SMARTCARD_REQUIRED",
+    0x80000: "TRUSTED_FOR_DELEGATION",
+    0x100000: "NOT_DELEGATED",
+    0x200000: "USE_DES_KEY_ONLY",
+    0x400000: "DONT_REQ_PREAUTH",
+    0x800000: "PASSWORD_EXPIRED",
+    0x1000000: "TRUSTED_TO_AUTH_FOR_DELEGATION",
+    0x4000000: "PARTIAL_SECRETS_ACCOUNT",
+}
+
+ldap_sam_account_types_schema = {
+    0: "SAM_DOMAIN_OBJECT",
+    268435456: "SAM_GROUP_OBJECT",
+    268435457: "SAM_NON_SECURITY_GROUP_OBJECT",
+    536870912: "SAM_ALIAS_OBJECT",
+    536870913: "SAM_NON_SECURITY_ALIAS_OBJECT",
+    805306368: "SAM_NORMAL_USER_ACCOUNT",
+    805306369: "SAM_MACHINE_ACCOUNT",
+    805306370: "SAM_TRUST_ACCOUNT",
+    1073741824: "SAM_APP_BASIC_GROUP",
+    1073741825: "SAM_APP_QUERY_GROUP",
+    2147483647: "SAM_ACCOUNT_TYPE_MAX",
+}
+
+# FILETIME of January 1, 1970 and the "never" values: 0 (not set) and the largest Integer8 (never expires)
+_LDAP_FILETIME_EPOCH = 116444736000000000
+_LDAP_FILETIME_NEVER = (0, 0x7FFFFFFFFFFFFFFF)
+_LDAP_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_LDAP_EPOCH_NAIVE = datetime.datetime(1970, 1, 1)
+# Microseconds since January 1, 1970 of the last representable datetime
+_LDAP_MAX_MICROSECONDS = (datetime.datetime.max - _LDAP_EPOCH_NAIVE) // datetime.timedelta(microseconds=1)
+
+
+def ldap_filetime_to_datetime(value: Union[int, str], naive: bool = False) -> Optional[datetime.datetime]:
+
+    """
+    Normalization of a FILETIME attribute value (`pwdLastSet`, `accountExpires`, ...) to a UTC datetime.
+    :param value:                       FILETIME Attribute Value
+    :param naive:                       Naive UTC Datetime (as `pwd_expiration`) Instead of an Aware One
+    :return:                            None for Not Set or Never Expires Values
+    """
+
+    value = int(value)
+    if value in _LDAP_FILETIME_NEVER or value < 0:
+        return None
+    try:
+        return (_LDAP_EPOCH_NAIVE if naive else _LDAP_EPOCH) + datetime.timedelta(
+            microseconds=(value - _LDAP_FILETIME_EPOCH) // 10
+        )
+    except OverflowError:
+        return None
+
+
+def ldap_guid_to_str(value: bytes) -> str:
+
+    """
+    Normalization of a GUID attribute value (`objectGUID`) to the registry format `{...}` of AD.
+    :param value:                       GUID Attribute Value Bytes
+    :return:
+    """
+
+    return f"{{{uuid.UUID(bytes_le=value)}}}"
+
+
+def ldap_sid_to_str(value: bytes) -> str:
+
+    """
+    Normalization of a SID attribute value (`objectSid`) to the string format `S-1-5-21-...`.
+    :param value:                       SID Attribute Value Bytes
+    :return:
+    """
+
+    # Revision, number of sub-authorities, 48-bit big-endian authority, 32-bit little-endian sub-authorities
+    sub_authorities = struct.unpack_from(f"<{value[1]}I", value, 8)
+    authority = int.from_bytes(value[2:8], "big")
+    return "-".join(("S", str(value[0]), str(authority), *map(str, sub_authorities)))
+
+
+@lru_cache(maxsize=4096)
+def ldap_uac_flags(value: int) -> frozenset[str]:
+
+    """
+    Decoding of the `userAccountControl` bit flags. Results are memoized: a directory has a few distinct values.
+    :param value:                       `userAccountControl` Attribute Value
+    :return:                            Flag Names (Unknown Bits as Hex Values)
+    """
+
+    value = int(value)
+    flags = {name for bit, name in ldap_uac_flags_schema.items() if value & bit}
+    unknown = value & ~sum(ldap_uac_flags_schema)
+    flags.update(hex(1 << bit) for bit in range(unknown.bit_length()) if unknown >> bit & 1)
+    return frozenset(flags)
+
+
+def ldap_sam_account_type(value: int) -> Optional[str]:
+
+    """
+    Name of the `sAMAccountType` attribute value.
+    :param value:                       `sAMAccountType` Attribute Value
+    :return:                            None for Unknown Values
+    """
+
+    return ldap_sam_account_types_schema.get(int(value))
+
+
+def _ldap_is_integer(value: Any) -> bool:
+    return isinstance(value, int) or (isinstance(value, str) and value.lstrip("-").isdigit())
+
+
+def _ldap_normalize_filetime(value: Any) -> Any:
+    if _ldap_is_integer(value):
+        return ldap_filetime_to_datetime(value, naive=True)
+    if isinstance(value, datetime.datetime):
+        # ldap3 formats the "never" values as the first and the last representable dates
+        if value.year in (1601, 9999):
+            return None
+        if value.tzinfo is not None:
+            return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _ldap_normalize_guid(value: Any) -> Any:
+    return ldap_guid_to_str(value) if isinstance(value, bytes) and len(value) == 16 else value
+
+
+def _ldap_normalize_sid(value: Any) -> Any:
+    return ldap_sid_to_str(value) if isinstance(value, bytes) and len(value) >= 8 else value
+
+
+def _ldap_normalize_uac(value: Any) -> Any:
+    return ldap_uac_flags(int(value)) if _ldap_is_integer(value) else value
+
+
+def _ldap_normalize_sam_account_type(value: Any) -> Any:
+    return (ldap_sam_account_type(value) or value) if _ldap_is_integer(value) else value
+
+
+# Value normalizers by lower case attribute name
+ldap_normalizers_schema = {
+    **{attr_name.lower(): _ldap_normalize_filetime for attr_name in LDAP_FILETIME_ATTRS_TUPLE},
+    **{attr_name.lower(): _ldap_normalize_guid for attr_name in LDAP_GUID_ATTRS_TUPLE},
+    **{attr_name.lower(): _ldap_normalize_sid for attr_name in LDAP_SID_ATTRS_TUPLE},
+    "msds-user-account-control-computed": _ldap_normalize_uac,
+    "samaccounttype": _ldap_normalize_sam_account_type,
+    "useraccountcontrol": _ldap_normalize_uac,
+}
+
+# Normalizers of attributes with a few distinct values: applied once per distinct value through a lookup table
+_LDAP_LOOKUP_NORMALIZERS = (_ldap_normalize_sam_account_type, _ldap_normalize_uac)
+
+
+def ldap_normalizers_merge(
+        normalizers: Optional[dict[str, Callable[[Any], Any]]] = None
+) -> dict[str, Callable[[Any], Any]]:
+
+    """
+    Default value normalizers extended (or overridden) by custom ones.
+    :param normalizers:                 Value Normalizers by Attribute Name or None
+    :return:                            Value Normalizers by Lower Case Attribute Name
+    """
+
+    if not normalizers:
+        return ldap_normalizers_schema
+    return {
+        **ldap_normalizers_schema,
+        **{attr_name.lower(): normalizer for attr_name, normalizer in normalizers.items()}
+    }
+
+
+def ldap_normalize_value(value: Any, normalizer: Callable[[Any], Any]) -> Any:
+
+    """
+    Apply a value normalizer to a shaped attribute value.
+    :param value:                       Attribute Value: None, a Single Value or a List of Values
+    :param normalizer:                  Value Normalizer
+    :return:
+    """
+
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [normalizer(item) for item in value]
+    return normalizer(value)
+
+
+def ldap_normalize_items(
+        items: Iterable[dict[str, Any]],
+        normalizers: Optional[dict[str, Callable[[Any], Any]]] = None
+) -> list[dict[str, Any]]:
+
+    """
+    Normalize Objects dictionaries in place: FILETIME attributes to naive UTC datetimes (None for Not Set or Never),
+    `userAccountControl` to flag names sets, `sAMAccountType` to names, GUIDs and SIDs to strings.
+    :param items:                       Objects Dictionaries
+    :param normalizers:                 Additional Value Normalizers by Attribute Name or None
+    :return:                            Objects Dictionaries
+    """
+
+    schema = ldap_normalizers_merge(normalizers)
+    items = items if isinstance(items, list) else list(items)
+    # Normalizers are looked up once per key, Objects dictionaries repeat the same keys
+    key_normalizers, key_tables = {}, {}
+    for item in items:
+        for key, value in item.items():
+            if key not in key_normalizers:
+                key_normalizers[key] = schema.get(key.lower())
+                if key_normalizers[key] in _LDAP_LOOKUP_NORMALIZERS:
+                    key_tables[key] = {}
+            normalizer = key_normalizers[key]
+            if normalizer is None:
+                continue
+            table = key_tables.get(key)
+            if table is None or isinstance(value, list):
+                item[key] = ldap_normalize_value(value, normalizer)
+            else:
+                if value not in table:
+                    table[value] = ldap_normalize_value(value, normalizer)
+                item[key] = table[value]
+    return items
+
+
+def ldap_normalize_columns(
+        attrs: Iterable[str],
+        columns: Iterable[Iterable[Any]],
+        normalizers: Optional[dict[str, Callable[[Any], Any]]] = None,
+        vectorize: Optional[bool] = None
+) -> list[list[Any]]:
+
+    """
+    Normalize columns of attribute values (see `ldap_normalize_items`). Integer FILETIME columns are converted
+    with NumPy when it is installed.
+    :param attrs:                       Attribute Names of the Columns
+    :param columns:                     Columns of Attribute Values
+    :param normalizers:                 Additional Value Normalizers by Attribute Name or None
+    :param vectorize:                   Use NumPy for FILETIME Columns or None (When Installed)
+    :return:                            Normalized Columns
+    """
+
+    if vectorize and numpy is None:
+        raise ImportError("Vectorized normalization requires the 'numpy' package.")
+    vectorize = numpy is not None if vectorize is None else vectorize
+    schema = ldap_normalizers_merge(normalizers)
+    result = []
+    for attr_name, column in zip(attrs, columns):
+        column = list(column)
+        normalizer = schema.get(attr_name.lower())
+        if normalizer is _ldap_normalize_filetime and vectorize and _ldap_is_integer_column(column):
+            result.append(_ldap_filetime_column(column))
+        elif normalizer in _LDAP_LOOKUP_NORMALIZERS:
+            result.append(_ldap_lookup_column(column, normalizer))
+        elif normalizer is not None:
+            result.append([ldap_normalize_value(value, normalizer) for value in column])
+        else:
+            result.append(column)
+    return result
+
+
+def _ldap_is_integer_column(column: list[Any]) -> bool:
+    return all(value is None or _ldap_is_integer(value) for value in column)
+
+
+def _ldap_lookup_column(column: list[Any], normalizer: Callable[[Any], Any]) -> list[Any]:
+    try:
+        table = {value: ldap_normalize_value(value, normalizer) for value in set(column)}
+    except TypeError:
+        # Multi-valued (list) values aren't hashable
+        return [ldap_normalize_value(value, normalizer) for value in column]
+    return [table[value] for value in column]
+
+
+def _ldap_filetime_column(column: list[Any]) -> list[Optional[datetime.datetime]]:
+    # Digit strings of raw responses are parsed by NumPy, None values are masked as "not set"
+    values = [0 if value is None else value for value in column]
+    values = numpy.array(values, dtype=numpy.int64 if all(type(value) is int for value in values) else None)
+    values = values.astype(numpy.int64)
+    microseconds = (values - _LDAP_FILETIME_EPOCH) // 10
+    invalid = (values == 0) | (values == _LDAP_FILETIME_NEVER[1]) | (values < 0) \
+        | (microseconds > _LDAP_MAX_MICROSECONDS)
+    result = numpy.where(invalid, 0, microseconds).astype("datetime64[us]").astype(object).tolist()
+    for i in numpy.flatnonzero(invalid).tolist():
+        result[i] = None
+    return result
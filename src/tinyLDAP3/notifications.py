@@ -0,0 +1,646 @@
+import asyncio, datetime, logging, queue, threading, time
+from collections import OrderedDict
+from ldap3 import ASYNC_STREAM, SUBTREE, SYNC, Connection, Server
+from ldap3.core.exceptions import LDAPException
+from typing import Any, Callable, Iterable, NamedTuple, Optional
+from .exceptions import LdapBoundError
+from .models import ldap_objects_classes_categories_schema
+from .normalizers import ldap_guid_to_str, ldap_uac_flags
+from .paging import ldap_paged_search
+from .queries import (
+    ldap_deleted_objects_query,
+    ldap_deleted_objects_since_query,
+    ldap_objects_changed_query,
+    ldap_objects_changed_since_query
+)
+from .replica import LDAP_SHOW_DELETED_CONTROL, ldap_highest_usn
+from .results import ldap_dn_key, ldap_domain_root, ldap_response_to_items
+
+
+""" ######################################################### """
+""" *************** TINY LDAP3 NOTIFICATIONS **************** """
+""" ######################################################### """
+
+
+# LDAP_SERVER_NOTIFICATION control (AD): the search stays open and returns an entry for each changed Object.
+# The filter must be `(objectClass=*)`, changes are typed by the `objectClass` values of the entries.
+LDAP_NOTIFICATION_CONTROL_OID = "1.2.840.113556.1.4.528"
+LDAP_NOTIFICATION_CONTROL = (LDAP_NOTIFICATION_CONTROL_OID, True, None)
+
+# Default `MaxNotificationPerConn` of AD: notification searches per connection
+LDAP_NOTIFICATION_MAX_BASES = 5
+
+# Attributes required by the change events: identity, change type, change tracking and the account state
+LDAP_NOTIFICATION_SYSTEM_ATTRS_TUPLE = (
+    "distinguishedName",
+    "isDeleted",
+    "lastKnownParent",
+    "objectClass",
+    "objectGUID",
+    "uSNChanged",
+    "uSNCreated",
+    "userAccountControl",
+)
+
+LDAP_CHANGE_TYPES_TUPLE = ("added", "modified", "deleted")
+
+# Object Classes in the order of precedence: `computer` is derived from `user`
+_LDAP_CHANGE_CLASSES_TUPLE = ("computer", "group", "user", "person")
+
+# End marker of the events queues
+_LDAP_SUBSCRIPTION_CLOSED = object()
+
+
+class LdapChangeEvent(NamedTuple):
+
+    """
+        Directory change event.
+        `change_type`     - `added`, `modified` or `deleted`.
+        `object_category` - `person`, `group` or `computer`.
+        `dn`              - Object `distinguishedName` (of the tombstone for deleted Objects).
+        `guid`            - Object `objectGUID` string.
+        `usn`             - `uSNChanged` of the change on `host`.
+        `host`            - Host the change was read from.
+        `values`          - Object dictionary of the returned attributes.
+        `catch_up`        - Read by the catch-up search after a (re)connection instead of being notified.
+        """
+
+    change_type: str
+    object_category: str
+    dn: str
+    guid: Optional[str]
+    usn: int
+    host: str
+    values: dict[str, Any]
+    catch_up: bool = False
+
+    @property
+    def disabled(self) -> Optional[bool]:
+
+        """
+        `ACCOUNTDISABLE` flag of `userAccountControl` (Person & Computer) or None (No `userAccountControl`).
+        :return:
+        """
+
+        value = next((value for key, value in self.values.items() if key.lower() == "useraccountcontrol"), None)
+        if value is None:
+            return None
+        flags = value if isinstance(value, (set, frozenset)) else ldap_uac_flags(int(value))
+        return "ACCOUNTDISABLE" in flags
+
+
+class LdapChangeCheckpoint(NamedTuple):
+
+    """
+        Position of a subscription search base: the changes up to `usn` on `host` are delivered.
+        `host` - Host of the update sequence numbers.
+        `usn`  - Highest delivered (or committed at the registration) `uSNChanged` on the host.
+        `time` - Time (epoch sec.) of the last notification or registration.
+        """
+
+    host: str
+    usn: int
+    time: float
+
+
+def ldap_change_event(
+        dn: str,
+        values: dict[str, Any],
+        host: str,
+        object_categories: Iterable[str],
+        catch_up: bool = False
+) -> Optional[LdapChangeEvent]:
+
+    """
+    Change event of a notified (or caught up) Object dictionary.
+    :param dn:                          Object `distinguishedName` Attribute Value
+    :param values:                      Object Dictionary with the System Attributes
+    :param host:                        Host the Change Was Read From
+    :param object_categories:           Subscribed Object Categories
+    :param catch_up:                    Read by a Catch-Up Search
+    :return:                            None for Objects of Other Categories
+    """
+
+    values_lower = {key.lower(): value for key, value in values.items()}
+    classes = values_lower.get("objectclass") or ()
+    classes = {value.lower() for value in ((classes,) if isinstance(classes, str) else classes)}
+    object_category = next(
+        (
+            ldap_objects_classes_categories_schema[object_class] for object_class in _LDAP_CHANGE_CLASSES_TUPLE
+            if object_class in classes
+        ),
+        None
+    )
+    if object_category is None or object_category not in object_categories:
+        return None
+
+    guid = values_lower.get("objectguid")
+    usn = int(values_lower.get("usnchanged") or 0)
+    if str(values_lower.get("isdeleted")).upper() == "TRUE":
+        change_type = "deleted"
+    elif usn and int(values_lower.get("usncreated") or 0) == usn:
+        change_type = "added"
+    else:
+        change_type = "modified"
+    return LdapChangeEvent(
+        change_type=change_type,
+        object_category=object_category,
+        dn=values_lower.get("distinguishedname") or dn,
+        guid=ldap_guid_to_str(guid) if isinstance(guid, bytes) else (str(guid) if guid else None),
+        usn=usn,
+        host=host,
+        values=values,
+        catch_up=catch_up
+    )
+
+
+class _LdapNotificationStream:
+
+    """
+        Notification searches of up to `LDAP_NOTIFICATION_MAX_BASES` search bases on one connection.
+        """
+
+    def __init__(self, search_bases: tuple[str, ...]):
+        self.search_bases = search_bases
+        self.connection: Optional[Connection] = None
+        # Search base by the message ID of its notification search
+        self.message_ids: dict[int, str] = {}
+        # Host of the last connection, reconnections prefer it: update sequence numbers are local to a host
+        self.server: Optional[Server] = None
+        self.ended = False
+        self.failures = 0
+        self.retry_at = 0.0
+
+    @property
+    def alive(self) -> bool:
+        conn = self.connection
+        return conn is not None and not self.ended and not conn.closed and conn.bound and conn.listening
+
+
+class LdapChangeSubscription:
+
+    """
+        Change notification subscription. Each search base is watched with an `LDAP_SERVER_NOTIFICATION` search
+        on an `ASYNC_STREAM` connection, notified entries are delivered as `LdapChangeEvent`s to the callback
+        or through the (sync or async) iterator. A dropped connection is reopened with an exponential backoff,
+        then the changes missed in between are caught up: by `uSNChanged` on the same host, by `whenChanged`
+        (minus `catch_up_margin`) on another one. A change both notified and caught up is delivered once, events
+        of different Objects may arrive out of the `uSNChanged` order.
+        """
+
+    def __init__(
+            self,
+            search_bases: Iterable[str],
+            connect: Callable[[Optional[Server], str], Connection],
+            object_categories: Iterable[str] = ("person", "group", "computer"),
+            returned_attrs: Iterable[str] = (),
+            callback: Optional[Callable[[LdapChangeEvent], Any]] = None,
+            checkpoints: Optional[dict[str, LdapChangeCheckpoint]] = None,
+            decoders: Optional[dict[str, Callable[[Any], Any]]] = None,
+            page_size: int = 500,
+            reconnect_delay: float = 1,
+            max_reconnect_delay: float = 60,
+            catch_up_margin: float = 300,
+            check_interval: float = 1,
+            queue_size: int = 10000,
+            dedupe_size: int = 10000
+    ):
+
+        """
+        :param search_bases:                Watched Search Bases (Subtrees)
+        :param connect:                     Open a Bound Connection by the Server (None - Selected) & Strategy
+        :param object_categories:           Object Categories of the Events
+        :param returned_attrs:              Returned Attributes in Addition to the System Attributes
+        :param callback:                    Events Callback or None (Iterator Delivery)
+        :param checkpoints:                 Checkpoints by Search Base to Catch Up From or None (Since Now)
+        :param decoders:                    Attribute Decoders by Lower Case Attribute Name or None
+        :param page_size:                   Catch-Up Searches Page Size
+        :param reconnect_delay:             First Reconnection Delay (sec.), Doubled After Each Failure
+        :param max_reconnect_delay:         Maximum Reconnection Delay (sec.)
+        :param catch_up_margin:             Clock Skew Margin (sec.) of the `whenChanged` Catch-Up on Another Host
+        :param check_interval:              Interval (sec.) of the Connection Checks
+        :param queue_size:                  Events Buffered for the Sync Iterator
+        :param dedupe_size:                 Objects Remembered to Skip Duplicated Deliveries
+        """
+
+        search_bases = tuple(dict.fromkeys(search_bases))
+        self.search_bases = search_bases
+        self.object_categories = tuple(object_categories)
+        self.attrs = tuple(dict.fromkeys((*LDAP_NOTIFICATION_SYSTEM_ATTRS_TUPLE, *returned_attrs)))
+
+        self.__connect = connect
+        self.__callback = callback
+        self.__decoders = decoders
+        self._page_size = page_size
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._catch_up_margin = catch_up_margin
+        self._check_interval = check_interval
+        self._dedupe_size = dedupe_size
+
+        self.__lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        self.__streams = [
+            _LdapNotificationStream(search_bases[i:i + LDAP_NOTIFICATION_MAX_BASES])
+            for i in range(0, len(search_bases), LDAP_NOTIFICATION_MAX_BASES)
+        ]
+        self.__checkpoints: dict[str, LdapChangeCheckpoint] = dict(checkpoints or {})
+        # Last delivered `uSNChanged` (and its host) by `objectGUID`
+        self.__delivered: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self.__events = queue.Queue(maxsize=queue_size)
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__async_events: Optional[asyncio.Queue] = None
+        self.__counters = {"events": 0, "catch_up": 0, "duplicates": 0, "reconnects": 0, "failures": 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+
+        """
+        Subscription gauges and counters: streams, connected, events, catch_up, duplicates, reconnects, failures.
+        :return:
+        """
+
+        with self.__lock:
+            return {
+                "streams": len(self.__streams),
+                "connected": sum(stream.alive for stream in self.__streams),
+                **self.__counters
+            }
+
+    @property
+    def checkpoints(self) -> dict[str, LdapChangeCheckpoint]:
+
+        """
+        Checkpoints by search base. Saved checkpoints resume a new subscription without missing changes.
+        :return:
+        """
+
+        with self.__lock:
+            return dict(self.__checkpoints)
+
+    @property
+    def closed(self) -> bool:
+        return self.__stop.is_set()
+
+    def start(self) -> "LdapChangeSubscription":
+
+        """
+        Register the notification searches and start the watcher thread. Errors of the first connection are raised.
+        :return:
+        """
+
+        try:
+            for stream in self.__streams:
+                self.__open(stream)
+        except BaseException:
+            self.close()
+            raise
+        self.__thread = threading.Thread(target=self.__watch, name="tinyLDAP3-notifications", daemon=True)
+        self.__thread.start()
+        return self
+
+    def close(self) -> None:
+
+        """
+        Abandon the notification searches, close the connections and end the iterators.
+        :return:
+        """
+
+        if self.__stop.is_set():
+            return
+        self.__stop.set()
+        if self.__thread is not None and self.__thread is not threading.current_thread():
+            self.__thread.join()
+        for stream in self.__streams:
+            self.__close_stream(stream)
+        try:
+            self.__events.put_nowait(_LDAP_SUBSCRIPTION_CLOSED)
+        except queue.Full:
+            # The iterator checks the closed state while waiting
+            pass
+        with self.__lock:
+            loop, async_events = self.__loop, self.__async_events
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(async_events.put_nowait, _LDAP_SUBSCRIPTION_CLOSED)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def __iter__(self) -> "LdapChangeSubscription":
+        return self
+
+    def __next__(self) -> LdapChangeEvent:
+        while True:
+            try:
+                event = self.__events.get(timeout=self._check_interval)
+            except queue.Empty:
+                if self.__stop.is_set():
+                    raise StopIteration
+                continue
+            if event is _LDAP_SUBSCRIPTION_CLOSED:
+                self.__events.put(event)
+                raise StopIteration
+            return event
+
+    def __aiter__(self) -> "LdapChangeSubscription":
+        return self
+
+    async def __anext__(self) -> LdapChangeEvent:
+        with self.__lock:
+            if self.__loop is None:
+                # Events are delivered to the loop of the first async consumer from now on
+                self.__loop = asyncio.get_running_loop()
+                self.__async_events = asyncio.Queue()
+                if self.__stop.is_set():
+                    self.__events.put_nowait(_LDAP_SUBSCRIPTION_CLOSED)
+        # Events queued before, or by a delivery waiting for room in the full queue
+        while not self.__events.empty():
+            self.__async_events.put_nowait(self.__events.get_nowait())
+        event = await self.__async_events.get()
+        if event is _LDAP_SUBSCRIPTION_CLOSED:
+            self.__async_events.put_nowait(event)
+            raise StopAsyncIteration
+        return event
+
+    def __watch(self) -> None:
+
+        """
+        Watcher thread: reopen the dropped streams with an exponential backoff.
+        :return:
+        """
+
+        while not self.__stop.wait(self._check_interval):
+            for stream in self.__streams:
+                if stream.alive or time.monotonic() < stream.retry_at or self.__stop.is_set():
+                    continue
+                if stream.connection is not None:
+                    logging.warning(
+                        f"@ LDAP Notifications @ - Connection to `{stream.server.host}` dropped, reconnecting."
+                    )
+                    self.__close_stream(stream)
+                try:
+                    self.__open(stream)
+                except Exception as err:
+                    # The watcher outlives any failure: the stream is retried later
+                    stream.failures += 1
+                    delay = min(self._reconnect_delay * 2 ** (stream.failures - 1), self._max_reconnect_delay)
+                    stream.retry_at = time.monotonic() + delay
+                    with self.__lock:
+                        self.__counters["failures"] += 1
+                    logging.warning(
+                        f"@ LDAP Notifications @ - Reconnection failed: {repr(err)}, retry in {delay:.0f} sec."
+                    )
+                    continue
+                with self.__lock:
+                    self.__counters["reconnects"] += 1
+
+    def __open(self, stream: _LdapNotificationStream) -> None:
+
+        """
+        Open the stream connection, register its notification searches and catch up the missed changes.
+        :param stream:                      Notification Stream
+        :return:
+        """
+
+        try:
+            conn = self.__connect(stream.server, SYNC)
+        except (LDAPException, LdapBoundError, OSError):
+            if stream.server is None:
+                raise
+            # The previous host is down: changes are caught up by `whenChanged` on another one
+            conn = self.__connect(None, SYNC)
+        try:
+            # Read before the registration, changes committed after it are notified
+            highest_usn = ldap_highest_usn(conn)
+            stream.connection = self.__connect(conn.server, ASYNC_STREAM)
+            stream.server = conn.server
+            stream.message_ids = {}
+            stream.ended = False
+            self.__register(stream)
+            self.__catch_up_stream(conn, stream, highest_usn)
+            stream.failures = 0
+        except BaseException:
+            # The missed changes aren't caught up: the stream is reopened by the watcher
+            self.__close_stream(stream)
+            raise
+        finally:
+            conn.unbind()
+
+    def __catch_up_stream(self, conn: Connection, stream: _LdapNotificationStream, highest_usn: Optional[int]) -> None:
+
+        """
+        Catch up the search bases of a stream and move their checkpoints to the registration.
+        :param conn:                        Bound SYNC Connection to the Stream Host
+        :param stream:                      Notification Stream
+        :param highest_usn:                 Highest Committed USN of the Host Before the Registration
+        :return:
+        """
+
+        host = conn.server.host
+        for search_base in stream.search_bases:
+            with self.__lock:
+                checkpoint = self.__checkpoints.get(search_base)
+            if checkpoint is not None:
+                self.__catch_up(conn, search_base, checkpoint)
+            with self.__lock:
+                checkpoint = self.__checkpoints.get(search_base)
+                usn = checkpoint.usn if checkpoint is not None and checkpoint.host == host else 0
+                self.__checkpoints[search_base] = LdapChangeCheckpoint(
+                    host=host, usn=max(usn, highest_usn or 0), time=time.time()
+                )
+
+    def __register(self, stream: _LdapNotificationStream) -> None:
+
+        """
+        Send the notification searches. Their entries are received by the `ASYNC_STREAM` receiver thread.
+        :param stream:                      Notification Stream
+        :return:
+        """
+
+        conn = stream.connection
+        strategy = conn.strategy
+
+        def accumulate_stream(message_id: int, response: dict) -> None:
+            search_base = stream.message_ids.get(message_id)
+            if search_base is None:
+                return
+            # Notification searches never complete, their entries mustn't be accumulated
+            with strategy.async_lock:
+                strategy._responses.pop(message_id, None)
+            if response.get("type") == "searchResEntry":
+                self.__receive(search_base, conn.server.host, response)
+            elif response.get("type") == "searchResDone":
+                stream.ended = True
+                logging.warning(
+                    f"@ LDAP Notifications @ - Notification search of `{search_base}` ended: "
+                    f"{response.get('description')} {response.get('message') or ''}".rstrip() + "."
+                )
+
+        strategy.accumulate_stream = accumulate_stream
+        for search_base in stream.search_bases:
+            message_id = conn.search(
+                search_base=search_base,
+                search_filter="(objectClass=*)",
+                search_scope=SUBTREE,
+                attributes=list(self.attrs),
+                controls=[LDAP_NOTIFICATION_CONTROL, LDAP_SHOW_DELETED_CONTROL]
+            )
+            stream.message_ids[message_id] = search_base
+
+    def __receive(self, search_base: str, host: str, response: dict) -> None:
+
+        """
+        Deliver a notified entry and advance the checkpoint. Runs in the receiver thread.
+        :param search_base:                 Search Base of the Notification Search
+        :param host:                        Host of the Connection
+        :param response:                    Search Result Entry
+        :return:
+        """
+
+        for dn, values in ldap_response_to_items((response,), self.__decoders):
+            event = ldap_change_event(dn, values, host, self.object_categories)
+            with self.__lock:
+                checkpoint = self.__checkpoints.get(search_base)
+                usn = int(next((value for key, value in values.items() if key.lower() == "usnchanged"), 0) or 0)
+                if checkpoint is not None and checkpoint.host == host:
+                    self.__checkpoints[search_base] = LdapChangeCheckpoint(
+                        host=host, usn=max(checkpoint.usn, usn), time=time.time()
+                    )
+            if event is not None:
+                self.__deliver(event)
+
+    def __catch_up(self, conn: Connection, search_base: str, checkpoint: LdapChangeCheckpoint) -> None:
+
+        """
+        Deliver the changes since the checkpoint: by `uSNChanged` on the checkpoint host, by `whenChanged` otherwise.
+        :param conn:                        Bound SYNC Connection
+        :param search_base:                 Search Base
+        :param checkpoint:                  Search Base Checkpoint
+        :return:
+        """
+
+        host = conn.server.host
+        if checkpoint.host == host:
+            usn = checkpoint.usn + 1
+            changed_queries = [ldap_objects_changed_query(category, usn) for category in self.object_categories]
+            deleted_query = ldap_deleted_objects_query(usn)
+        else:
+            changed_since = datetime.datetime.fromtimestamp(
+                checkpoint.time - self._catch_up_margin, tz=datetime.timezone.utc
+            )
+            changed_queries = [
+                ldap_objects_changed_since_query(category, changed_since) for category in self.object_categories
+            ]
+            deleted_query = ldap_deleted_objects_since_query(changed_since)
+
+        for search_query in changed_queries:
+            for page, _ in ldap_paged_search(
+                    conn,
+                    search_base=search_base,
+                    search_query=search_query,
+                    returned_attrs_collection=self.attrs,
+                    page_size=self._page_size,
+                    decoders=self.__decoders
+            ):
+                for values in page:
+                    self.__deliver_caught_up(values, host)
+
+        # Tombstones are moved to the Deleted Objects container, they are matched by the last known parent
+        base_key = ldap_dn_key(search_base)
+        for page, _ in ldap_paged_search(
+                conn,
+                search_base=ldap_domain_root(search_base),
+                search_query=deleted_query,
+                returned_attrs_collection=LDAP_NOTIFICATION_SYSTEM_ATTRS_TUPLE,
+                page_size=self._page_size,
+                controls=[LDAP_SHOW_DELETED_CONTROL],
+                decoders=self.__decoders
+        ):
+            for values in page:
+                parent = next((value for key, value in values.items() if key.lower() == "lastknownparent"), None)
+                parent_key = ldap_dn_key(parent) if parent else ""
+                if parent_key == base_key or parent_key.endswith("," + base_key):
+                    self.__deliver_caught_up(values, host)
+
+    def __deliver_caught_up(self, values: dict[str, Any], host: str) -> None:
+        event = ldap_change_event("", values, host, self.object_categories, catch_up=True)
+        if event is not None:
+            self.__deliver(event)
+
+    def __deliver(self, event: LdapChangeEvent) -> None:
+
+        """
+        Deliver an event once: a change both notified and caught up is skipped the second time.
+        :param event:                       Change Event
+        :return:
+        """
+
+        # Objects are matched by the DN if `objectGUID` isn't returned
+        object_key = event.guid or ldap_dn_key(event.dn)
+        with self.__lock:
+            delivered = self.__delivered.get(object_key)
+            if delivered is not None and delivered[0] == event.host and delivered[1] >= event.usn:
+                self.__counters["duplicates"] += 1
+                return
+            self.__delivered[object_key] = (event.host, event.usn)
+            self.__delivered.move_to_end(object_key)
+            if len(self.__delivered) > self._dedupe_size:
+                self.__delivered.popitem(last=False)
+            self.__counters["events"] += 1
+            if event.catch_up:
+                self.__counters["catch_up"] += 1
+            loop, async_events = self.__loop, self.__async_events
+            if self.__callback is None and loop is None:
+                # Under the lock: the first async consumer moves the queued events to its loop
+                try:
+                    self.__events.put_nowait(event)
+                    return
+                except queue.Full:
+                    pass
+
+        if self.__callback is not None:
+            try:
+                self.__callback(event)
+            except Exception as err:
+                logging.error(f"@ LDAP Notifications @ - Callback failed: {repr(err)}.")
+        elif loop is not None:
+            loop.call_soon_threadsafe(async_events.put_nowait, event)
+        else:
+            # A slow consumer holds the receiver thread: the server stops sending until the queue has room
+            while not self.__stop.is_set():
+                try:
+                    self.__events.put(event, timeout=self._check_interval)
+                    return
+                except queue.Full:
+                    continue
+
+    @staticmethod
+    def __close_stream(stream: _LdapNotificationStream) -> None:
+
+        """
+        Abandon the notification searches and close the stream connection.
+        :param stream:                      Notification Stream
+        :return:
+        """
+
+        conn, stream.connection = stream.connection, None
+        if conn is None:
+            return
+        try:
+            if not conn.closed:
+                for message_id in stream.message_ids:
+                    conn.abandon(message_id)
+            conn.unbind()
+        except (LDAPException, OSError) as err:
+            logging.debug(f"@ LDAP Notifications @ - Close failed: {repr(err)}.")
+        stream.message_ids = {}
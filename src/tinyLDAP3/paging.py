@@ -0,0 +1,170 @@
+from ldap3 import SUBTREE, Connection
+from typing import Any, Callable, Iterable, Iterator, Optional
+from .decorators import LdapLoggedIterator
+from .pool import LdapConnectionPool
+from .ranges import ldap_items_complete_ranges
+from .results import ldap_response_to_items
+
+
+""" ######################################################### """
+""" ****************** TINY LDAP3 PAGING ******************** """
+""" ######################################################### """
+
+
+# Simple Paged Results Control (RFC 2696)
+LDAP_PAGED_RESULTS_CONTROL_OID = "1.2.840.113556.1.4.319"
+
+
+def ldap_paged_items(
+        conn: Connection,
+        search_base: str,
+        search_query: str,
+        returned_attrs_collection: Iterable[str],
+        page_size: int = 500,
+        cookie: Optional[bytes] = None,
+        search_scope: str = SUBTREE,
+        controls: Optional[list] = None,
+        decoders: Optional[dict[str, Callable[[Any], Any]]] = None
+) -> Iterator[tuple[list[tuple[str, dict[str, Any]]], Optional[bytes]]]:
+
+    """
+    Paged search generator. Yields a page of (DN, Object dictionary) pairs and the cookie of the next page
+    (None on the last page). Remaining values of ranged attributes are fetched on the same connection.
+    :param conn:                        Bound Connection
+    :param search_base:                 Search Base
+    :param search_query:                LDAP Search Filter
+    :param returned_attrs_collection:   Collection of Returned Attributes
+    :param page_size:                   Page Size
+    :param cookie:                      Paging Cookie to Resume From or None
+    :param search_scope:                Search Scope
+    :param controls:                    Additional Request Controls or None
+    :param decoders:                    Attribute Decoders by Lower Case Attribute Name or None
+    :return:
+    """
+
+    while True:
+        conn.search(
+            search_base=search_base,
+            search_filter=search_query,
+            search_scope=search_scope,
+            attributes=returned_attrs_collection,
+            paged_size=page_size,
+            paged_cookie=cookie,
+            controls=controls
+        )
+        response_control = (conn.result.get("controls") or {}).get(LDAP_PAGED_RESULTS_CONTROL_OID)
+        cookie = response_control["value"]["cookie"] if response_control else None
+        items = ldap_items_complete_ranges(conn, ldap_response_to_items(conn.response, decoders), decoders)
+        yield items, cookie or None
+        if not cookie:
+            break
+
+
+def ldap_paged_search(
+        conn: Connection,
+        search_base: str,
+        search_query: str,
+        returned_attrs_collection: Iterable[str],
+        page_size: int = 500,
+        cookie: Optional[bytes] = None,
+        search_scope: str = SUBTREE,
+        controls: Optional[list] = None,
+        decoders: Optional[dict[str, Callable[[Any], Any]]] = None
+) -> Iterator[tuple[list[dict[str, Any]], Optional[bytes]]]:
+
+    """
+    Paged search generator. Yields a page of Objects dictionaries and the cookie of the next page (None on the last page).
+    Remaining values of ranged attributes are fetched on the same connection.
+    :param conn:                        Bound Connection
+    :param search_base:                 Search Base
+    :param search_query:                LDAP Search Filter
+    :param returned_attrs_collection:   Collection of Returned Attributes
+    :param page_size:                   Page Size
+    :param cookie:                      Paging Cookie to Resume From or None
+    :param search_scope:                Search Scope
+    :param controls:                    Additional Request Controls or None
+    :param decoders:                    Attribute Decoders by Lower Case Attribute Name or None
+    :return:
+    """
+
+    for items, next_cookie in ldap_paged_items(
+            conn, search_base, search_query, returned_attrs_collection, page_size, cookie, search_scope, controls,
+            decoders
+    ):
+        yield [values for _, values in items], next_cookie
+
+
+class LdapPagedSearch(LdapLoggedIterator):
+
+    """
+        Paged search iterator over Objects dictionaries. Only one page is kept in memory.
+        The pooled connection is held until the iterator is exhausted or closed. Paging cookies are single use and
+        the server keeps the paged search state per connection, so a stopped search is resumed by continuing
+        the iteration, not by a new search with the cookie.
+        """
+
+    def __init__(
+            self,
+            connection_pool: LdapConnectionPool,
+            search_base: str,
+            search_query: str,
+            returned_attrs_collection: Iterable[str],
+            page_size: int = 500,
+            decoders: Optional[dict[str, Callable[[Any], Any]]] = None
+    ):
+
+        """
+        :param connection_pool:             Connection Pool
+        :param search_base:                 Search Base
+        :param search_query:                LDAP Search Filter
+        :param returned_attrs_collection:   Collection of Returned Attributes
+        :param page_size:                   Page Size
+        :param decoders:                    Attribute Decoders by Lower Case Attribute Name or None
+        """
+
+        # Cookie of the page after the fully consumed pages, None before the first page or after the last page
+        self.cookie = None
+        self.pages = 0
+        self.done = False
+
+        self.__connection_pool = connection_pool
+        self.__search_base = search_base
+        self.__search_query = search_query
+        self.__returned_attrs_collection = tuple(returned_attrs_collection)
+        self.__page_size = page_size
+        self.__decoders = decoders
+        self.__iterator = self.__iterate()
+
+    def _next(self) -> dict[str, Any]:
+        return next(self.__iterator)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iterate(self) -> Iterator[dict[str, Any]]:
+        with self.__connection_pool.connection() as conn:
+            for page, next_cookie in ldap_paged_search(
+                    conn,
+                    search_base=self.__search_base,
+                    search_query=self.__search_query,
+                    returned_attrs_collection=self.__returned_attrs_collection,
+                    page_size=self.__page_size,
+                    decoders=self.__decoders
+            ):
+                self.pages += 1
+                yield from page
+                # Advanced after the page is consumed: a consumer stopped within the page hasn't got its rest
+                self.cookie = next_cookie
+        self.done = True
+
+    def close(self) -> None:
+
+        """
+        Stop the search and return the connection to the pool.
+        :return:
+        """
+
+        self.__iterator.close()
@@ -0,0 +1,261 @@
+from functools import lru_cache
+from pydantic import ValidationError
+from typing import Any, Iterable, NamedTuple, Optional
+from .filters import ldap_filter_format
+from .models import (
+    LdapObjectDetailModel,
+    LdapObjecsSearchModel,
+    LdapPersonAuthModel,
+    ldap_upn_regex_rfc822based,
+)
+from .queries import ldap_object_detail_query_template, ldap_objects_search_query_selector
+
+
+""" ######################################################### """
+""" ****************** TINY LDAP3 PLANS ********************* """
+""" ######################################################### """
+
+
+# Placeholder of the value-level fields on a plan compilation
+_LDAP_PLAN_PLACEHOLDER = "placeholder"
+
+# Number of memoised plans of each method
+LDAP_PLANS_CACHE_SIZE = 1024
+
+
+class LdapObjectDetailPlan(NamedTuple):
+
+    """
+        Precompiled `object_detail` request: validated parameters, returned attributes and the filter template.
+        """
+
+    object_category: str
+    attr_name: str
+    returned_attrs: tuple[str, ...]
+    query_template: str
+
+    def query(self, attr_value: str) -> str:
+        return ldap_filter_format(self.query_template, attr_value=attr_value)
+
+
+class LdapObjectsSearchPlan(NamedTuple):
+
+    """
+        Precompiled `objects_search` request: validated parameters and returned attributes.
+        """
+
+    object_category: str
+    order_by: str
+    search_by_attrs: Optional[tuple[str, ...]]
+    returned_attrs: tuple[str, ...]
+    search_mode: Optional[str]
+
+    def query(self, attr_value: str) -> str:
+        return ldap_objects_search_query_selector(
+            object_category=self.object_category,
+            attr_value=attr_value,
+            search_by_attrs_collection=self.search_by_attrs,
+            search_mode=self.search_mode
+        )
+
+
+class LdapPersonAuthPlan(NamedTuple):
+
+    """
+        Precompiled `person_auth` request: returned attributes.
+        """
+
+    returned_attrs: tuple[str, ...]
+
+
+def _ldap_enum_value(value: Any) -> Any:
+    return value.value if hasattr(value, "value") else value
+
+
+def _ldap_attrs_key(returned_attrs_collection: Optional[Iterable[str]]) -> Optional[tuple[str, ...]]:
+    return tuple(returned_attrs_collection) if returned_attrs_collection else None
+
+
+def _ldap_object_detail_model_plan(validated_data: dict, is_active: bool) -> LdapObjectDetailPlan:
+    object_category = _ldap_enum_value(validated_data["object_category"])
+    return LdapObjectDetailPlan(
+        object_category=object_category,
+        attr_name=validated_data["attr_name"],
+        returned_attrs=tuple(validated_data["returned_attrs_collection"]),
+        query_template=ldap_object_detail_query_template(object_category, validated_data["attr_name"], is_active)
+    )
+
+
+@lru_cache(maxsize=LDAP_PLANS_CACHE_SIZE)
+def _ldap_object_detail_plan(
+        object_category: str,
+        attr_name: str,
+        is_active: bool,
+        returned_attrs: Optional[tuple[str, ...]]
+) -> LdapObjectDetailPlan:
+    validated_data = LdapObjectDetailModel(
+        **{
+            "method_type": "detail",
+            "object_category": object_category,
+            "attr_name": attr_name,
+            "attr_value": _LDAP_PLAN_PLACEHOLDER,
+            "returned_attrs_collection": returned_attrs
+        }
+    ).model_dump()
+    return _ldap_object_detail_model_plan(validated_data, is_active)
+
+
+def ldap_object_detail_plan(
+        object_category: str,
+        attr_name: str,
+        attr_value: str,
+        is_active: bool,
+        returned_attrs_collection: Optional[Iterable[str]]
+) -> LdapObjectDetailPlan:
+
+    """
+    `object_detail` plan. The parameters shape is validated once per combination, the value is checked per call.
+    Invalid input is validated by `LdapObjectDetailModel` and raises the same errors.
+    :param object_category:             Object Category: `person`, `group` or `computer`
+    :param attr_name:                   Attribute Name for Searching
+    :param attr_value:                  Attributes Value for Searching
+    :param is_active:                   Person (User) Search Scope (Active or All Users)
+    :param returned_attrs_collection:   Collection of Returned Attributes or None
+    :return:
+    """
+
+    returned_attrs = _ldap_attrs_key(returned_attrs_collection)
+    if isinstance(attr_value, str) and attr_value:
+        try:
+            return _ldap_object_detail_plan(object_category, attr_name, bool(is_active), returned_attrs)
+        except (TypeError, ValidationError):
+            pass
+    validated_data = LdapObjectDetailModel(
+        **{
+            "method_type": "detail",
+            "object_category": object_category,
+            "attr_name": attr_name,
+            "attr_value": attr_value,
+            "returned_attrs_collection": returned_attrs
+        }
+    ).model_dump()
+    return _ldap_object_detail_model_plan(validated_data, bool(is_active))
+
+
+def _ldap_objects_search_model_plan(validated_data: dict) -> LdapObjectsSearchPlan:
+    search_by_attrs = validated_data["search_by_attrs_collection"]
+    return LdapObjectsSearchPlan(
+        object_category=_ldap_enum_value(validated_data["object_category"]),
+        order_by=validated_data["order_by"],
+        search_by_attrs=tuple(search_by_attrs) if search_by_attrs else None,
+        returned_attrs=tuple(validated_data["returned_attrs_collection"]),
+        search_mode=_ldap_enum_value(validated_data["search_mode"])
+    )
+
+
+@lru_cache(maxsize=LDAP_PLANS_CACHE_SIZE)
+def _ldap_objects_search_plan(
+        object_category: str,
+        order_by: str,
+        search_by_attrs: Optional[tuple[str, ...]],
+        returned_attrs: Optional[tuple[str, ...]],
+        search_mode: Optional[str]
+) -> LdapObjectsSearchPlan:
+    validated_data = LdapObjecsSearchModel(
+        **{
+            "method_type": "search",
+            "object_category": object_category,
+            "attr_value": _LDAP_PLAN_PLACEHOLDER,
+            "order_by": order_by,
+            "search_by_attrs_collection": search_by_attrs,
+            "returned_attrs_collection": returned_attrs,
+            "search_mode": search_mode
+        }
+    ).model_dump()
+    return _ldap_objects_search_model_plan(validated_data)
+
+
+def ldap_objects_search_plan(
+        object_category: str,
+        attr_value: str,
+        order_by: str,
+        search_by_attrs_collection: Optional[Iterable[str]],
+        returned_attrs_collection: Optional[Iterable[str]],
+        search_mode: Optional[str]
+) -> LdapObjectsSearchPlan:
+
+    """
+    `objects_search` plan. The parameters shape is validated once per combination, the value is checked per call.
+    Invalid input is validated by `LdapObjecsSearchModel` and raises the same errors.
+    :param object_category:             Object Category: `person`, `group` or `computer`
+    :param attr_value:                  Attributes Value for Searching
+    :param order_by:                    Attribute Name for Sorting
+    :param search_by_attrs_collection:  Searching for Person (User) Based on Attributes from the Collection or None
+    :param returned_attrs_collection:   Collection of Returned Attributes or None
+    :param search_mode:                 Search Mode: `prefix`, `contains`, `anr` or None
+    :return:
+    """
+
+    search_by_attrs = _ldap_attrs_key(search_by_attrs_collection)
+    returned_attrs = _ldap_attrs_key(returned_attrs_collection)
+    if isinstance(attr_value, str) and attr_value:
+        try:
+            return _ldap_objects_search_plan(object_category, order_by, search_by_attrs, returned_attrs, search_mode)
+        except (TypeError, ValidationError):
+            pass
+    validated_data = LdapObjecsSearchModel(
+        **{
+            "method_type": "search",
+            "object_category": object_category,
+            "attr_value": attr_value,
+            "order_by": order_by,
+            "search_by_attrs_collection": search_by_attrs,
+            "returned_attrs_collection": returned_attrs,
+            "search_mode": search_mode
+        }
+    ).model_dump()
+    return _ldap_objects_search_model_plan(validated_data)
+
+
+@lru_cache(maxsize=LDAP_PLANS_CACHE_SIZE)
+def _ldap_person_auth_plan(returned_attrs: Optional[tuple[str, ...]]) -> LdapPersonAuthPlan:
+    validated_data = LdapPersonAuthModel(
+        **{
+            "login": f"{_LDAP_PLAN_PLACEHOLDER}@example.com",
+            "password": _LDAP_PLAN_PLACEHOLDER,
+            "returned_attrs_collection": returned_attrs
+        }
+    ).model_dump()
+    return LdapPersonAuthPlan(returned_attrs=tuple(validated_data["returned_attrs_collection"]))
+
+
+def ldap_person_auth_plan(
+        login: str,
+        password: str,
+        returned_attrs_collection: Optional[Iterable[str]]
+) -> LdapPersonAuthPlan:
+
+    """
+    `person_auth` plan. The login format & the password length are checked per call, logins aren't memoised.
+    Invalid input is validated by `LdapPersonAuthModel` and raises the same errors.
+    :param login:                       User Login as UPN (`sAMAccountName@example.com`)
+    :param password:                    User Password
+    :param returned_attrs_collection:   Collection of Returned Attributes or None
+    :return:
+    """
+
+    returned_attrs = _ldap_attrs_key(returned_attrs_collection)
+    if isinstance(login, str) and isinstance(password, str) and len(password) >= 8 \
+            and ldap_upn_regex_rfc822based.fullmatch(login):
+        try:
+            return _ldap_person_auth_plan(returned_attrs)
+        except (TypeError, ValidationError):
+            pass
+    validated_data = LdapPersonAuthModel(
+        **{
+            "login": login,
+            "password": password,
+            "returned_attrs_collection": returned_attrs
+        }
+    ).model_dump()
+    return LdapPersonAuthPlan(returned_attrs=tuple(validated_data["returned_attrs_collection"]))
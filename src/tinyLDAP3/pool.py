@@ -0,0 +1,384 @@
+import functools, logging, threading, time
+from collections import deque
+from contextlib import contextmanager
+from ldap3 import ANONYMOUS, BASE, Connection
+from ldap3.core.exceptions import (
+    LDAPBindError,
+    LDAPException,
+    LDAPSessionTerminatedByServerError,
+    LDAPSocketReceiveError,
+    LDAPSocketSendError,
+)
+from typing import Any, Callable, Iterator, Optional
+from .exceptions import LdapPoolExhaustedError
+
+
+""" ######################################################### """
+""" **************** TINY LDAP3 CONNECTION POOL ************* """
+""" ######################################################### """
+
+
+# Errors of an already opened socket. The connection is stale, the operation can be repeated on a new one.
+LDAP_STALE_CONNECTION_ERRORS_TUPLE = (
+    LDAPSessionTerminatedByServerError,
+    LDAPSocketReceiveError,
+    LDAPSocketSendError,
+)
+
+
+# Operations timed for the observer. Borrows aren't: streamed results hold the connection during consumer time.
+LDAP_OBSERVED_OPERATIONS_TUPLE = (
+    "compare",
+    "extended",
+    "modify",
+    "rebind",
+    "search",
+)
+
+
+def ldap_pooled_rebind(conn: Connection, user: str, password: str) -> dict:
+
+    """
+    Rebind a pooled connection with the credentials and reset it to anonymous before the release: the credentials
+    aren't kept and the identity isn't lent to the next borrower. A failed bind leaves the session anonymous (RFC 4511).
+    :param conn:                        Pooled Connection
+    :param user:                        User
+    :param password:                    Password
+    :return:                            Bind Result
+    """
+
+    try:
+        conn.rebind(user=user, password=password, read_server_info=False)
+        result = dict(conn.result)
+    finally:
+        conn.user = conn.password = None
+        conn.authentication = ANONYMOUS
+    if result["result"] == 0:
+        conn.rebind(read_server_info=False)
+    return result
+
+
+class _PooledConnection:
+
+    """
+        Pooled connection with usage timestamps.
+        """
+
+    __slots__ = ("connection", "created_at", "last_used", "last_checked")
+
+    def __init__(self, connection: Connection):
+        self.connection = connection
+        self.created_at = self.last_used = self.last_checked = time.monotonic()
+
+
+class LdapConnectionPool:
+
+    """
+        tinyLDAP3 Connection Pool. Thread-safe pool of bound `ldap3` connections.
+        """
+
+    def __init__(
+            self,
+            connection_factory: Callable[[], Connection],
+            min_size: int = 1,
+            max_size: int = 10,
+            idle_timeout: float = 300,
+            check_interval: float = 60,
+            wait_timeout: float = 10,
+            bind_on_check: bool = True,
+            validator: Optional[Callable[[Connection], bool]] = None,
+            observer: Optional[Callable[[Connection, float, Optional[BaseException]], Any]] = None
+    ):
+
+        """
+        :param connection_factory:          Callable Returning a New Bound Connection
+        :param min_size:                    Number of Connections Kept Open on Idle Eviction
+        :param max_size:                    Maximum Number of Opened Connections
+        :param idle_timeout:                Idle Time (sec.) After Which a Connection Is Closed
+        :param check_interval:              Idle Time (sec.) After Which a Connection Is Checked on Borrow
+        :param wait_timeout:                Time (sec.) to Wait for a Free Connection
+        :param bind_on_check:               Rebind an Unbound Connection on Health Check with Its Credentials
+        :param validator:                   Callable Rejecting an Idle Connection on Borrow (e.g. Ejected Server)
+        :param observer:                    Callable Accepting the Connection, Operation Time (sec.) & Error or None
+        """
+
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy: 0 <= min_size <= max_size, max_size >= 1.")
+
+        self._min_size = min_size
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._check_interval = check_interval
+        self._wait_timeout = wait_timeout
+        self._bind_on_check = bind_on_check
+
+        self.__connection_factory = connection_factory
+        self.__validator = validator
+        self.__observer = observer
+        self.__condition = threading.Condition(threading.Lock())
+        self.__idle: deque[_PooledConnection] = deque()
+        self.__size = 0
+        self.__closed = False
+        self.__counters = {"created": 0, "discarded": 0, "evicted": 0, "rebound": 0, "waits": 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+
+        """
+        Pool gauges and counters.
+        :return:
+        """
+
+        with self.__condition:
+            return {
+                "size": self.__size,
+                "idle": len(self.__idle),
+                "borrowed": self.__size - len(self.__idle),
+                **self.__counters
+            }
+
+    def __create(self) -> _PooledConnection:
+
+        """
+        Create a new pooled connection. The slot must be reserved by the caller.
+        :return:
+        """
+
+        try:
+            item = _PooledConnection(self.__observed(self.__connection_factory()))
+        except BaseException:
+            with self.__condition:
+                self.__size -= 1
+                self.__condition.notify()
+            raise
+        with self.__condition:
+            self.__counters["created"] += 1
+        return item
+
+    def __observed(self, conn: Connection) -> Connection:
+
+        """
+        Time each operation of a new connection for the observer. `ldap3` reports a socket closed during a rebind
+        as a bind error, it's raised as a stale connection error: the connection is discarded and the operation
+        is repeated.
+        :param conn:                        Connection
+        :return:
+        """
+
+        def observe(started: float, error: Optional[BaseException]) -> None:
+            if self.__observer is not None:
+                self.__observer(conn, time.monotonic() - started, error)
+
+        def observed(operation: Callable[..., Any]) -> Callable[..., Any]:
+            @functools.wraps(operation)
+            def observed_operation(*args, **kwargs) -> Any:
+                started = time.monotonic()
+                try:
+                    result = operation(*args, **kwargs)
+                except LDAPBindError as err:
+                    if not conn.closed:
+                        observe(started, err)
+                        raise
+                    stale_err = LDAPSocketReceiveError(f"{err} (connection closed)")
+                    observe(started, stale_err)
+                    raise stale_err from err
+                except Exception as err:
+                    observe(started, err)
+                    raise
+                observe(started, None)
+                return result
+            return observed_operation
+
+        for operation_name in LDAP_OBSERVED_OPERATIONS_TUPLE:
+            setattr(conn, operation_name, observed(getattr(conn, operation_name)))
+        return conn
+
+    def __check(self, item: _PooledConnection) -> bool:
+
+        """
+        Health check of an idle connection. Rebind an unbound connection or probe an open one with Root DSE read.
+        Without `bind_on_check` an unbound connection is probed anonymously.
+        :param item:                        Pooled Connection
+        :return:
+        """
+
+        conn = item.connection
+        try:
+            if conn.closed:
+                return False
+            if not conn.bound and self._bind_on_check:
+                conn.bind(read_server_info=False)
+                with self.__condition:
+                    self.__counters["rebound"] += 1
+            else:
+                conn.search(search_base="", search_filter="(objectClass=*)", search_scope=BASE, attributes=["1.1"])
+        except LDAPException as err:
+            logging.debug(f"@ LDAP Connection Pool @ - Health check failed: {repr(err)}.")
+            return False
+        item.last_checked = time.monotonic()
+        return conn.bound or not self._bind_on_check
+
+    @staticmethod
+    def __close(item: _PooledConnection) -> None:
+
+        """
+        Close a connection quietly.
+        :param item:                        Pooled Connection
+        :return:
+        """
+
+        try:
+            item.connection.unbind()
+        except LDAPException:
+            pass
+
+    def __evict_idle(self) -> list[_PooledConnection]:
+
+        """
+        Pop expired idle connections above the pool minimum size. Must be called under the pool lock.
+        :return:
+        """
+
+        evicted = []
+        deadline = time.monotonic() - self._idle_timeout
+        # Left side of the deque holds the least recently used connections
+        while self.__idle and self.__size > self._min_size and self.__idle[0].last_used < deadline:
+            evicted.append(self.__idle.popleft())
+            self.__size -= 1
+        self.__counters["evicted"] += len(evicted)
+        return evicted
+
+    def _acquire(self) -> _PooledConnection:
+
+        """
+        Borrow a connection: the most recently used idle one, a new one or wait for a release.
+        :return:
+        """
+
+        deadline = time.monotonic() + self._wait_timeout
+        while True:
+            with self.__condition:
+                if self.__closed:
+                    raise LdapPoolExhaustedError("Connection pool is closed.")
+                evicted = self.__evict_idle()
+                item = None
+                if self.__idle:
+                    item = self.__idle.pop()
+                elif self.__size < self._max_size:
+                    self.__size += 1
+                else:
+                    self.__counters["waits"] += 1
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self.__condition.wait(remaining):
+                        raise LdapPoolExhaustedError("Connection pool exhausted.")
+                    continue
+            for evicted_item in evicted:
+                self.__close(evicted_item)
+            if item is None:
+                return self.__create()
+            if self.__validator is not None and not self.__validator(item.connection):
+                self.__close(item)
+                with self.__condition:
+                    self.__counters["discarded"] += 1
+                return self.__create()
+            if item.connection.closed or time.monotonic() - item.last_used > self._check_interval:
+                if not self.__check(item):
+                    # Stale connection: replace it keeping the reserved slot
+                    self.__close(item)
+                    with self.__condition:
+                        self.__counters["discarded"] += 1
+                    return self.__create()
+            return item
+
+    def _release(self, item: _PooledConnection, discard: bool = False) -> None:
+
+        """
+        Return a borrowed connection.
+        :param item:                        Pooled Connection
+        :param discard:                     Close the Connection Instead of Returning
+        :return:
+        """
+
+        discard = discard or item.connection.closed
+        with self.__condition:
+            if discard or self.__closed:
+                self.__size -= 1
+                self.__counters["discarded"] += discard
+            else:
+                item.last_used = time.monotonic()
+                self.__idle.append(item)
+            evicted = self.__evict_idle()
+            self.__condition.notify()
+        if discard or self.__closed:
+            self.__close(item)
+        for evicted_item in evicted:
+            self.__close(evicted_item)
+
+    @contextmanager
+    def connection(self) -> Iterator[Connection]:
+
+        """
+        Borrow a connection via context manager. A connection with a socket error is discarded.
+        :return:
+        """
+
+        item = self._acquire()
+        try:
+            yield item.connection
+        except LDAP_STALE_CONNECTION_ERRORS_TUPLE:
+            self._release(item, discard=True)
+            raise
+        except BaseException:
+            self._release(item)
+            raise
+        else:
+            self._release(item)
+
+    def execute(self, operation: Callable[[Connection], Any]) -> Any:
+
+        """
+        Run the operation on a borrowed connection. Repeat it once on a new connection if the socket is stale.
+        :param operation:                   Callable Accepting a Bound Connection
+        :return:
+        """
+
+        try:
+            with self.connection() as conn:
+                return operation(conn)
+        except LDAP_STALE_CONNECTION_ERRORS_TUPLE as err:
+            logging.warning(f"@ LDAP Connection Pool @ - Stale connection, retrying: {repr(err)}.")
+        with self.connection() as conn:
+            return operation(conn)
+
+    def warm_up(self) -> None:
+
+        """
+        Open connections up to the pool minimum size.
+        :return:
+        """
+
+        items = []
+        while True:
+            with self.__condition:
+                if self.__closed or self.__size >= self._min_size:
+                    break
+                self.__size += 1
+            items.append(self.__create())
+        for item in items:
+            self._release(item)
+
+    def close(self) -> None:
+
+        """
+        Close the pool and all idle connections. Borrowed connections are closed on release.
+        :return:
+        """
+
+        with self.__condition:
+            self.__closed = True
+            items = list(self.__idle)
+            self.__idle.clear()
+            self.__size -= len(items)
+            self.__condition.notify_all()
+        for item in items:
+            self.__close(item)
@@ -0,0 +1,350 @@
+import datetime
+from functools import lru_cache
+from typing import Iterable, Optional
+from .filters import (
+    LdapAnd,
+    LdapEq,
+    LdapExtensible,
+    LdapFilter,
+    LdapGreaterOrEqual,
+    LdapNot,
+    LdapOr,
+    LdapParam,
+    LdapSubstring,
+    ldap_filter_compile,
+    ldap_filter_format,
+    ldap_filter_optimize,
+)
+
+
+""" ######################################################### """
+""" ****************** TINY LDAP3 QUERIES ******************* """
+""" ######################################################### """
+
+
+# `objectCategory` is single-valued, so the category equality alone excludes the other categories
+LDAP_COMPUTER_FILTER = LdapEq("objectCategory", "Computer")
+LDAP_GROUP_FILTER = LdapEq("objectCategory", "Group")
+LDAP_PERSON_FILTER = LdapAnd((LdapEq("objectCategory", "Person"), LdapEq("objectClass", "User")))
+LDAP_ACTIVE_USERS_FILTER = LdapNot(LdapExtensible("userAccountControl", "1.2.840.113556.1.4.803", "2"))
+
+# LDAP_MATCHING_RULE_IN_CHAIN: the DN is matched through the whole chain of a linked attribute (AD only)
+LDAP_MATCHING_RULE_IN_CHAIN_OID = "1.2.840.113556.1.4.1941"
+
+# Computers and Groups are searched by `cn`
+LDAP_CN_SEARCH_BY_ATTRS_TUPLE = (
+    "cn",
+)
+
+
+def ldap_object_category_filter(object_category: str, is_active: bool = False) -> LdapFilter:
+
+    """
+    Object (`Person`, `Group` or `Computer`) category filter.
+    :param object_category:             Object Category: `Person`, `Group` or `Computer`
+    :param is_active:                   Person (User) Search Scope (Active or All Users)
+    :return:
+    """
+
+    match object_category:
+        case "computer":
+            return LDAP_COMPUTER_FILTER
+        case "group":
+            return LDAP_GROUP_FILTER
+        case _:
+            # Person
+            if is_active:
+                return LdapAnd((LDAP_PERSON_FILTER, LDAP_ACTIVE_USERS_FILTER))
+            return LDAP_PERSON_FILTER
+
+
+def ldap_object_query(object_category: str, search_filter: LdapFilter, is_active: bool = False) -> str:
+
+    """
+    Compile the Object category filter combined with an attribute filter.
+    :param object_category:             Object Category: `Person`, `Group` or `Computer`
+    :param search_filter:               Attribute Filter Node
+    :param is_active:                   Person (User) Search Scope (Active or All Users)
+    :return:
+    """
+
+    return ldap_filter_compile(
+        ldap_filter_optimize(LdapAnd((ldap_object_category_filter(object_category, is_active), search_filter)))
+    )
+
+
+@lru_cache(maxsize=256)
+def ldap_object_detail_query_template(object_category: str, attr_name: str, is_active: bool) -> str:
+
+    """
+    Compiled Object detail query template with the `attr_value` parameter.
+    :param object_category:             Object Category: `Person`, `Group` or `Computer`
+    :param attr_name:                   Attribute Name for Searching
+    :param is_active:                   Person (User) Search Scope (Active or All Users)
+    :return:
+    """
+
+    return ldap_object_query(object_category, LdapEq(attr_name, LdapParam("attr_value")), is_active)
+
+
+@lru_cache(maxsize=256)
+def ldap_objects_search_query_template(
+        object_category: str,
+        search_by_attrs_tuple: tuple[str, ...],
+        search_mode: str
+) -> str:
+
+    """
+    Compiled Objects search query template with the `attr_value` parameter.
+    :param object_category:             Object Category: `Person`, `Group` or `Computer`
+    :param search_by_attrs_tuple:       Attribute Names for Searching
+    :param search_mode:                 Search Mode: `prefix`, `contains` or `anr`
+    :return:
+    """
+
+    value = LdapParam("attr_value")
+    match search_mode:
+        case "anr":
+            # Ambiguous Name Resolution: indexed prefix match over the naming attributes
+            search_filter = LdapEq("anr", value)
+        case "contains":
+            search_filter = LdapOr(
+                tuple(LdapSubstring(attr_name, "", (value,), "") for attr_name in search_by_attrs_tuple)
+            )
+        case _:
+            search_filter = LdapOr(tuple(LdapSubstring(attr_name, value) for attr_name in search_by_attrs_tuple))
+    return ldap_object_query(object_category, search_filter)
+
+
+def ldap_objects_partition_query(
+        object_category: str,
+        search_filter: Optional[LdapFilter] = None,
+        is_active: bool = False
+) -> str:
+
+    """
+    Objects of a category in an enumeration partition.
+    :param object_category:             Object Category: `Person`, `Group` or `Computer`
+    :param search_filter:               Partition Filter Node or None (All Objects of the Category)
+    :param is_active:                   Person (User) Search Scope (Active or All Users)
+    :return:
+    """
+
+    if search_filter is None:
+        return ldap_filter_compile(ldap_object_category_filter(object_category, is_active))
+    return ldap_object_query(object_category, search_filter, is_active)
+
+
+def ldap_object_detail_query_selector(
+        object_category: str,
+        attr_name: str,
+        attr_value: str,
+        is_active: bool
+) -> str:
+
+    """
+    Object (`Person`, `Group` or `Computer`) detail query selector. Strict match, the value is escaped.
+    :param object_category:             Object Category: `Person`, `Group` or `Computer`
+    :param attr_name:                   Attribute Name for Searching
+    :param attr_value:                  Attributes Value for Searching
+    :param is_active:                   Person (User) Search Scope (Active or All Users)
+    :return:
+    """
+
+    return ldap_filter_format(
+        ldap_object_detail_query_template(object_category, attr_name, is_active), attr_value=attr_value
+    )
+
+
+def ldap_objects_detail_many_query_selector(
+        object_category: str,
+        attr_name: str,
+        attr_values: Iterable[str],
+        is_active: bool
+) -> str:
+
+    """
+    Objects (`Person`, `Group` or `Computer`) detail query selector for a batch of values. Values are escaped.
+    :param object_category:             Object Category: `Person`, `Group` or `Computer`
+    :param attr_name:                   Attribute Name for Searching
+    :param attr_values:                 Attribute Values for Searching
+    :param is_active:                   Person (User) Search Scope (Active or All Users)
+    :return:
+    """
+
+    return ldap_object_query(
+        object_category, LdapOr(tuple(LdapEq(attr_name, attr_value) for attr_value in attr_values)), is_active
+    )
+
+
+def ldap_objects_search_scope(
+        object_category: str,
+        search_by_attrs_collection: Optional[Iterable[str]],
+        search_mode: Optional[str] = None
+) -> tuple[tuple[str, ...], str]:
+
+    """
+    Searched attributes and search mode of an Objects search.
+    By default Persons are searched by a prefix, Computers and Groups by a `cn` substring.
+    :param object_category:             Object Category: `Person`, `Group` or `Computer`
+    :param search_by_attrs_collection:  Searching for Person (User) Based on Attributes from the Collection
+    :param search_mode:                 Search Mode: `prefix`, `contains`, `anr` or None
+    :return:
+    """
+
+    if object_category == "person":
+        return tuple(search_by_attrs_collection), search_mode or "prefix"
+    return LDAP_CN_SEARCH_BY_ATTRS_TUPLE, search_mode or "contains"
+
+
+def ldap_objects_search_query_selector(
+        object_category: str,
+        attr_value: str,
+        search_by_attrs_collection: Iterable[str],
+        search_mode: Optional[str] = None
+) -> str:
+
+    """
+    Objects (`Person`, `Group` or `Computer`) search query selector. The value is escaped.
+    By default Persons are searched by a prefix, Computers and Groups by a `cn` substring.
+    :param object_category:             Object Category: `Person`, `Group` or `Computer`
+    :param attr_value:                  Attributes Value for Searching
+    :param search_by_attrs_collection:  Searching for Person (User) Based on Attributes from the Collection
+    :param search_mode:                 Search Mode: `prefix`, `contains`, `anr` or None
+    :return:
+    """
+
+    search_by_attrs_tuple, search_mode = ldap_objects_search_scope(
+        object_category, search_by_attrs_collection, search_mode
+    )
+    return ldap_filter_format(
+        ldap_objects_search_query_template(object_category, search_by_attrs_tuple, search_mode),
+        attr_value=attr_value
+    )
+
+
+def ldap_object_read_query(object_category: Iterable[str]) -> str:
+
+    """
+    Object read query: all Object Categories & Classes are required, as `ldap3.Reader` query.
+    :param object_category:             Object Categories & Classes Collection
+    :return:
+    """
+
+    return ldap_filter_compile(
+        ldap_filter_optimize(LdapAnd(tuple(LdapEq("objectClass", object_class) for object_class in object_category)))
+    )
+
+
+def ldap_objects_read_many_query(object_category: Iterable[str], dns: Iterable[str]) -> str:
+
+    """
+    Objects read query for a batch of DNs. Values are escaped.
+    :param object_category:             Object Categories & Classes Collection
+    :param dns:                         Objects `distinguishedName` Attribute Values
+    :return:
+    """
+
+    return ldap_filter_compile(
+        ldap_filter_optimize(
+            LdapAnd(
+                (
+                    *(LdapEq("objectClass", object_class) for object_class in object_category),
+                    LdapOr(tuple(LdapEq("distinguishedName", dn) for dn in dns))
+                )
+            )
+        )
+    )
+
+
+def ldap_object_groups_chain_query(dn: str) -> str:
+
+    """
+    Groups of an Object, including nested groups (`LDAP_MATCHING_RULE_IN_CHAIN`). The DN is escaped.
+    :param dn:                          Object `distinguishedName` Attribute Value
+    :return:
+    """
+
+    return ldap_filter_format(
+        ldap_object_query("group", LdapExtensible("member", LDAP_MATCHING_RULE_IN_CHAIN_OID, LdapParam("dn"))),
+        dn=dn
+    )
+
+
+def ldap_group_members_chain_query(dn: str) -> str:
+
+    """
+    Members of a Group, including members of nested groups (`LDAP_MATCHING_RULE_IN_CHAIN`). The DN is escaped.
+    :param dn:                          Group `distinguishedName` Attribute Value
+    :return:
+    """
+
+    return ldap_filter_format(
+        ldap_filter_compile(LdapExtensible("memberOf", LDAP_MATCHING_RULE_IN_CHAIN_OID, LdapParam("dn"))),
+        dn=dn
+    )
+
+
+def ldap_objects_changed_query(object_category: str, usn: Optional[int] = None) -> str:
+
+    """
+    Objects of a category changed since the update sequence number, or all Objects of the category.
+    :param object_category:             Object Category: `Person`, `Group` or `Computer`
+    :param usn:                         Lowest `uSNChanged` Value or None (All Objects)
+    :return:
+    """
+
+    if usn is None:
+        return ldap_filter_compile(ldap_object_category_filter(object_category))
+    return ldap_object_query(object_category, LdapGreaterOrEqual("uSNChanged", str(usn)))
+
+
+def ldap_deleted_objects_query(usn: int) -> str:
+
+    """
+    Deleted Objects (tombstones) since the update sequence number. Requires the Show Deleted control.
+    :param usn:                         Lowest `uSNChanged` Value
+    :return:
+    """
+
+    return ldap_filter_compile(LdapAnd((LdapEq("isDeleted", "TRUE"), LdapGreaterOrEqual("uSNChanged", str(usn)))))
+
+
+def ldap_generalized_time(value: datetime.datetime) -> str:
+
+    """
+    GeneralizedTime assertion value (`whenChanged`, `whenCreated`) of a datetime. Naive datetimes are UTC.
+    :param value:                       Datetime
+    :return:
+    """
+
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc)
+    return value.strftime("%Y%m%d%H%M%S.0Z")
+
+
+def ldap_objects_changed_since_query(object_category: str, changed_since: datetime.datetime) -> str:
+
+    """
+    Objects of a category changed since the time. Unlike `uSNChanged`, `whenChanged` is comparable between hosts.
+    :param object_category:             Object Category: `Person`, `Group` or `Computer`
+    :param changed_since:               Lowest `whenChanged` Value
+    :return:
+    """
+
+    return ldap_object_query(object_category, LdapGreaterOrEqual("whenChanged", ldap_generalized_time(changed_since)))
+
+
+def ldap_deleted_objects_since_query(changed_since: datetime.datetime) -> str:
+
+    """
+    Deleted Objects (tombstones) since the time. Requires the Show Deleted control.
+    :param changed_since:               Lowest `whenChanged` Value
+    :return:
+    """
+
+    return ldap_filter_compile(
+        LdapAnd(
+            (LdapEq("isDeleted", "TRUE"), LdapGreaterOrEqual("whenChanged", ldap_generalized_time(changed_since)))
+        )
+    )
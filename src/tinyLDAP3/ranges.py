@@ -0,0 +1,257 @@
+from contextlib import contextmanager
+from ldap3 import BASE, Connection
+from ldap3.utils.config import get_config_parameter
+from typing import Any, Callable, Iterator, Optional
+from .decorators import LdapLoggedIterator
+from .pool import LdapConnectionPool
+from .results import ldap_attr_decode, ldap_attr_value
+
+
+""" ######################################################### """
+""" ************* TINY LDAP3 RANGED ATTRIBUTES ************** """
+""" ######################################################### """
+
+
+# Range retrieval attribute option. AD returns at most `MaxValRange` values of a multi-valued attribute
+# as `member;range=0-1499`, the last range is returned as `member;range=1500-*`
+LDAP_RANGE_OPTION = ";range="
+
+
+def ldap_range_parse(attr_key: str) -> Optional[tuple[str, int, Optional[int]]]:
+
+    """
+    Parse a ranged attribute type.
+    :param attr_key:                    Attribute Type, e.g. `member;range=0-1499`
+    :return:                            Attribute Name, Range Low & High Bounds (None for the Last Range) or None
+    """
+
+    i = attr_key.lower().find(LDAP_RANGE_OPTION)
+    if i == -1:
+        return None
+    low, _, high = attr_key[i + len(LDAP_RANGE_OPTION):].partition("-")
+    return attr_key[:i], int(low), None if high == "*" else int(high)
+
+
+def ldap_range_attr(attr_name: str, low: int) -> str:
+
+    """
+    Ranged attribute type of the remaining values.
+    :param attr_name:                   Attribute Name
+    :param low:                         Index of the First Value
+    :return:
+    """
+
+    return f"{attr_name}{LDAP_RANGE_OPTION}{low}-*"
+
+
+@contextmanager
+def ldap_range_request(conn: Connection) -> Iterator[Connection]:
+
+    """
+    Disable `return_empty_attributes` for a range request. The requested `member;range=1500-*` type is never
+    returned as is, `ldap3` would add it as an empty attribute and fail to remove the original one.
+    :param conn:                        Bound Connection
+    :return:
+    """
+
+    empty_attributes, conn.empty_attributes = conn.empty_attributes, False
+    try:
+        yield conn
+    finally:
+        conn.empty_attributes = empty_attributes
+
+
+def ldap_range_response(response: list[dict], attr_name: str) -> tuple[list[Any], Optional[int]]:
+
+    """
+    Values of a range request response and the index of the next range.
+    :param response:                    Base Scoped Search Response Messages
+    :param attr_name:                   Attribute Name
+    :return:                            Values & Next Range Low Bound (None After the Last Range)
+    """
+
+    for item in response or ():
+        if item.get("type") != "searchResEntry":
+            continue
+        for key, values in item["attributes"].items():
+            attr_range = ldap_range_parse(key)
+            if attr_range is not None and attr_range[0].lower() == attr_name.lower():
+                high = attr_range[2]
+                return list(values), None if high is None else high + 1
+        for key, values in item["attributes"].items():
+            if key.lower() == attr_name.lower():
+                return list(values) if isinstance(values, list) else [values], None
+    return [], None
+
+
+def ldap_range_pending(values: dict[str, Any]) -> list[tuple[str, str, Optional[int]]]:
+
+    """
+    Ranged attributes of an Object dictionary with values left on the server.
+    :param values:                      Object Dictionary
+    :return:                            Ranged Attribute Types, Names and Next Range Low Bounds
+    """
+
+    # `ldap3.Reader` prefixes the attributes missing from the ObjectDef, ranged types are among them
+    prefix = get_config_parameter("ABSTRACTION_OPERATIONAL_ATTRIBUTE_PREFIX")
+    pending = []
+    for key in values:
+        attr_range = ldap_range_parse(key)
+        # DirSync returns `0-0` & `1-1` ranges for the added and removed values
+        if attr_range is not None and attr_range[1:] not in ((0, 0), (1, 1)):
+            attr_name, _, high = attr_range
+            if prefix and attr_name.startswith(prefix):
+                attr_name = attr_name[len(prefix):]
+            pending.append((key, attr_name, None if high is None else high + 1))
+    return pending
+
+
+def ldap_range_merge(
+        values: dict[str, Any],
+        attr_key: str,
+        attr_name: str,
+        more_values: list[Any],
+        decoders: Optional[dict[str, Callable[[Any], Any]]] = None
+) -> None:
+
+    """
+    Replace a ranged attribute of an Object dictionary with the attribute of all values in place.
+    :param values:                      Object Dictionary
+    :param attr_key:                    Ranged Attribute Type
+    :param attr_name:                   Attribute Name
+    :param more_values:                 Values of the Following Ranges
+    :param decoders:                    Attribute Decoders by Lower Case Attribute Name or None
+    :return:
+    """
+
+    first_values = values.pop(attr_key)
+    for key in [key for key in values if key.lower() == attr_name.lower()]:
+        del values[key]
+    if first_values is None:
+        first_values = []
+    elif not isinstance(first_values, list):
+        first_values = [first_values]
+    value = ldap_attr_value(first_values + more_values)
+    decoder = decoders.get(attr_name.lower()) if decoders else None
+    values[attr_name] = ldap_attr_decode(value, decoder) if decoder is not None else value
+
+
+def ldap_range_search(conn: Connection, dn: str, attr_name: str, low: int) -> tuple[list[Any], Optional[int]]:
+
+    """
+    Read one range of an attribute.
+    :param conn:                        Bound Connection
+    :param dn:                          Object `distinguishedName` Attribute Value
+    :param attr_name:                   Attribute Name
+    :param low:                         Index of the First Value
+    :return:                            Values & Next Range Low Bound (None After the Last Range)
+    """
+
+    with ldap_range_request(conn):
+        conn.search(
+            search_base=dn,
+            search_filter="(objectClass=*)",
+            search_scope=BASE,
+            attributes=[ldap_range_attr(attr_name, low)]
+        )
+    return ldap_range_response(conn.response, attr_name)
+
+
+def ldap_iter_range_values(conn: Connection, dn: str, attr_name: str, low: int = 0) -> Iterator[list[Any]]:
+
+    """
+    Range retrieval generator. Yields the values of each range, ranges are requested one by one on the connection.
+    :param conn:                        Bound Connection
+    :param dn:                          Object `distinguishedName` Attribute Value
+    :param attr_name:                   Attribute Name
+    :param low:                         Index of the First Value
+    :return:
+    """
+
+    while low is not None:
+        values, low = ldap_range_search(conn, dn, attr_name, low)
+        yield values
+
+
+def ldap_items_complete_ranges(
+        conn: Connection,
+        items: list[tuple[str, dict[str, Any]]],
+        decoders: Optional[dict[str, Callable[[Any], Any]]] = None
+) -> list[tuple[str, dict[str, Any]]]:
+
+    """
+    Fetch the remaining values of ranged attributes and merge them into the (DN, Object dictionary) pairs in place.
+    :param conn:                        Bound Connection (the Search Result Must Be Already Converted)
+    :param items:                       (DN, Object Dictionary) Pairs
+    :param decoders:                    Attribute Decoders by Lower Case Attribute Name or None
+    :return:
+    """
+
+    for dn, values in items:
+        for attr_key, attr_name, low in ldap_range_pending(values):
+            more_values = []
+            if low is not None:
+                for range_values in ldap_iter_range_values(conn, dn, attr_name, low):
+                    more_values.extend(range_values)
+            ldap_range_merge(values, attr_key, attr_name, more_values, decoders)
+    return items
+
+
+class LdapRangeValues(LdapLoggedIterator):
+
+    """
+        Range retrieval iterator over the values of a multi-valued attribute. Only one range is kept in memory.
+        The pooled connection is held until the iterator is exhausted or closed.
+        """
+
+    def __init__(
+            self,
+            connection_pool: LdapConnectionPool,
+            dn: str,
+            attr_name: str,
+            decoders: Optional[dict[str, Callable[[Any], Any]]] = None
+    ):
+
+        """
+        :param connection_pool:             Connection Pool
+        :param dn:                          Object `distinguishedName` Attribute Value
+        :param attr_name:                   Attribute Name
+        :param decoders:                    Attribute Decoders by Lower Case Attribute Name or None
+        """
+
+        # Index of the next range, None after the last range
+        self.low = 0
+        self.ranges = 0
+        self.done = False
+
+        self.__connection_pool = connection_pool
+        self.__dn = dn
+        self.__attr_name = attr_name
+        self.__decoder = decoders.get(attr_name.lower()) if decoders else None
+        self.__iterator = self.__iterate()
+
+    def _next(self) -> Any:
+        return next(self.__iterator)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iterate(self) -> Iterator[Any]:
+        with self.__connection_pool.connection() as conn:
+            while self.low is not None:
+                values, self.low = ldap_range_search(conn, self.__dn, self.__attr_name, self.low)
+                self.ranges += 1
+                yield from (map(self.__decoder, values) if self.__decoder is not None else values)
+        self.done = True
+
+    def close(self) -> None:
+
+        """
+        Stop the retrieval and return the connection to the pool.
+        :return:
+        """
+
+        self.__iterator.close()
@@ -0,0 +1,491 @@
+import base64, datetime, json, sqlite3, threading, time
+from ldap3 import BASE, Connection
+from ldap3.core.exceptions import LDAPException
+from typing import Any, Iterable, Iterator, Optional
+from .models import (
+    LDAP_PERSON_AUTH_RETURNED_ATTRS_TUPLE,
+    LDAP_PERSON_SEARCH_BY_ATTRS_TUPLE,
+    ldap_objects_returned_attrs_schema
+)
+from .paging import ldap_paged_search
+from .queries import LDAP_CN_SEARCH_BY_ATTRS_TUPLE, ldap_deleted_objects_query, ldap_objects_changed_query
+from .results import ldap_dn_key, ldap_domain_root
+
+
+""" ######################################################### """
+""" ****************** TINY LDAP3 REPLICA ******************* """
+""" ######################################################### """
+
+
+# Version of the replica file format
+LDAP_REPLICA_VERSION = 1
+
+LDAP_REPLICA_CATEGORIES_TUPLE = (
+    "person",
+    "group",
+    "computer",
+)
+
+# Attributes required by the replica: identity, change tracking and the active users filter
+LDAP_REPLICA_SYSTEM_ATTRS_TUPLE = (
+    "distinguishedName",
+    "objectGUID",
+    "uSNChanged",
+    "userAccountControl",
+)
+
+# Values of DN lists and binary attributes aren't indexed
+LDAP_REPLICA_NOT_INDEXED_ATTRS_TUPLE = (
+    "member",
+    "memberof",
+    "objectguid",
+    "thumbnailphoto",
+)
+
+# Ambiguous Name Resolution is approximated by a prefix match over the naming attributes
+LDAP_REPLICA_ANR_ATTRS_TUPLE = (
+    "cn",
+    "displayName",
+    "givenName",
+    "mail",
+    "name",
+    "sAMAccountName",
+    "sn",
+)
+
+# Show Deleted control: tombstones are returned by searches. Non-critical, it's ignored by directories without it.
+LDAP_SHOW_DELETED_CONTROL = ("1.2.840.113556.1.4.417", False, None)
+
+_LDAP_REPLICA_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    CREATE TABLE IF NOT EXISTS objects (
+        guid TEXT PRIMARY KEY, dn TEXT NOT NULL, dn_key TEXT NOT NULL, category TEXT NOT NULL,
+        usn INTEGER, sync_id INTEGER NOT NULL, data TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS objects_dn_key ON objects (dn_key);
+    CREATE INDEX IF NOT EXISTS objects_sync_id ON objects (sync_id);
+    CREATE TABLE IF NOT EXISTS attrs (
+        guid TEXT NOT NULL, category TEXT NOT NULL, attr_name TEXT NOT NULL, value TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS attrs_value ON attrs (category, attr_name, value);
+    CREATE INDEX IF NOT EXISTS attrs_guid ON attrs (guid);
+"""
+
+
+def ldap_replica_attrs(object_category: str) -> tuple[str, ...]:
+
+    """
+    Default replicated attributes of a category: returned and searched attributes of all methods.
+    :param object_category:             Object Category: `person`, `group` or `computer`
+    :return:
+    """
+
+    attrs = [
+        *ldap_objects_returned_attrs_schema[object_category]["detail"],
+        *ldap_objects_returned_attrs_schema[object_category]["search"],
+        *LDAP_CN_SEARCH_BY_ATTRS_TUPLE,
+    ]
+    if object_category == "person":
+        attrs += [*LDAP_PERSON_AUTH_RETURNED_ATTRS_TUPLE, *LDAP_PERSON_SEARCH_BY_ATTRS_TUPLE]
+    return tuple(dict.fromkeys(attrs))
+
+
+def ldap_highest_usn(conn: Connection) -> Optional[int]:
+
+    """
+    Highest committed update sequence number of the connection server from the Root DSE.
+    :param conn:                        Bound Connection
+    :return:
+    """
+
+    try:
+        conn.search(
+            search_base="", search_filter="(objectClass=*)", search_scope=BASE, attributes=["highestCommittedUSN"]
+        )
+    except LDAPException:
+        return None
+    for item in conn.response or ():
+        value = item.get("raw_attributes", {}).get("highestCommittedUSN")
+        if value:
+            return int(value[0])
+    return None
+
+
+def _ldap_json_default(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, datetime.timedelta):
+        return {"$td": value.total_seconds()}
+    if isinstance(value, (bytes, bytearray)):
+        return {"$b": base64.b64encode(value).decode("ascii")}
+    return str(value)
+
+
+def _ldap_json_hook(value: dict) -> Any:
+    if len(value) == 1:
+        if "$dt" in value:
+            return datetime.datetime.fromisoformat(value["$dt"])
+        if "$td" in value:
+            return datetime.timedelta(seconds=value["$td"])
+        if "$b" in value:
+            return base64.b64decode(value["$b"])
+    return value
+
+
+def _ldap_system_values(values: dict[str, Any]) -> tuple[str, str, int]:
+    values = {key.lower(): value for key, value in values.items()}
+    return str(values["objectguid"]), values["distinguishedname"], int(values.get("usnchanged") or 0)
+
+
+def _ldap_index_values(value: Any) -> Iterator[str]:
+    for item in value if isinstance(value, list) else (value,):
+        if isinstance(item, str):
+            yield item.lower()
+        elif isinstance(item, int):
+            yield str(item)
+
+
+class LdapReplica:
+
+    """
+        tinyLDAP3 Directory Replica. Person, Group and Computer Objects are stored in a SQLite file with the attribute
+        values index. The first sync is a paged full pull, the next syncs pull the Objects changed since the last
+        `uSNChanged` and the deleted Objects (tombstones). The change numbers are local to a domain controller,
+        so a full pull is repeated if the sync server has been changed and every `full_sync_interval`.
+        """
+
+    def __init__(
+            self,
+            path: str,
+            attrs: Optional[dict[str, Iterable[str]]] = None,
+            page_size: int = 1000,
+            full_sync_interval: float = 86400
+    ):
+
+        """
+        :param path:                        SQLite File Path
+        :param attrs:                       Replicated Attributes by Object Category or None (Defaults)
+        :param page_size:                   Sync Paged Search Page Size
+        :param full_sync_interval:          Time (sec.) After Which the Next Sync Is a Full Pull
+        """
+
+        self._path = path
+        self._page_size = page_size
+        self._full_sync_interval = full_sync_interval
+        self._attrs = {
+            category: tuple(
+                dict.fromkeys(
+                    [*LDAP_REPLICA_SYSTEM_ATTRS_TUPLE, *((attrs or {}).get(category) or ldap_replica_attrs(category))]
+                )
+            ) for category in LDAP_REPLICA_CATEGORIES_TUPLE
+        }
+        self.__attrs_lower = {category: {attr.lower() for attr in attrs} for category, attrs in self._attrs.items()}
+
+        self.__local = threading.local()
+        self.__sync_lock = threading.Lock()
+        with self.__db() as db:
+            db.executescript(_LDAP_REPLICA_SCHEMA)
+
+    def __db(self) -> sqlite3.Connection:
+
+        """
+        SQLite connection of the current thread. WAL journal: reads aren't blocked by a running sync.
+        :return:
+        """
+
+        db = getattr(self.__local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self._path, timeout=30)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self.__local.db = db
+        return db
+
+    def __meta(self) -> dict[str, str]:
+        return dict(self.__db().execute("SELECT key, value FROM meta"))
+
+    @property
+    def stats(self) -> dict[str, Any]:
+
+        """
+        Replica state: number of Objects, sync server, highest synced `uSNChanged`, sync times and staleness (sec.).
+        :return:
+        """
+
+        meta = self.__meta()
+        return {
+            "objects": self.__db().execute("SELECT COUNT(*) FROM objects").fetchone()[0],
+            "host": meta.get("host"),
+            "usn": int(meta["usn"]) if meta.get("usn") else None,
+            "synced_at": float(meta["synced_at"]) if meta.get("synced_at") else None,
+            "full_synced_at": float(meta["full_synced_at"]) if meta.get("full_synced_at") else None,
+            "staleness": self.staleness(),
+        }
+
+    def staleness(self) -> Optional[float]:
+
+        """
+        Time (sec.) since the last successful sync or None (Never Synced).
+        :return:
+        """
+
+        row = self.__db().execute("SELECT value FROM meta WHERE key = 'synced_at'").fetchone()
+        return time.time() - float(row[0]) if row else None
+
+    def covers(self, object_category: str, attrs: Iterable[str]) -> bool:
+
+        """
+        All attributes are replicated for the category.
+        :param object_category:             Object Category: `person`, `group` or `computer`
+        :param attrs:                       Attribute Names
+        :return:
+        """
+
+        replicated = self.__attrs_lower.get(object_category)
+        return replicated is not None and all(attr.lower() in replicated for attr in attrs)
+
+    def __indexed(self, object_category: str, attr_name: str) -> bool:
+        return (
+            self.covers(object_category, (attr_name,))
+            and attr_name.lower() not in LDAP_REPLICA_NOT_INDEXED_ATTRS_TUPLE
+        )
+
+    @staticmethod
+    def __delete(db: sqlite3.Connection, guid: str) -> int:
+        db.execute("DELETE FROM attrs WHERE guid = ?", (guid,))
+        return db.execute("DELETE FROM objects WHERE guid = ?", (guid,)).rowcount
+
+    def __upsert(self, db: sqlite3.Connection, category: str, values: dict[str, Any], sync_id: int) -> None:
+        guid, dn, usn = _ldap_system_values(values)
+        db.execute("DELETE FROM attrs WHERE guid = ?", (guid,))
+        db.execute(
+            "INSERT OR REPLACE INTO objects (guid, dn, dn_key, category, usn, sync_id, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                guid,
+                dn,
+                ldap_dn_key(dn),
+                category,
+                usn,
+                sync_id,
+                json.dumps(values, default=_ldap_json_default)
+            )
+        )
+        db.executemany(
+            "INSERT INTO attrs (guid, category, attr_name, value) VALUES (?, ?, ?, ?)",
+            [
+                (guid, category, key.lower(), value)
+                for key, attr_value in values.items() if key.lower() not in LDAP_REPLICA_NOT_INDEXED_ATTRS_TUPLE
+                for value in _ldap_index_values(attr_value)
+            ]
+        )
+
+    def sync(self, conn: Connection, search_base: str, full: bool = False) -> dict[str, Any]:
+
+        """
+        Pull the changes. The replica is updated in one transaction, readers see the previous state until it's done.
+        :param conn:                        Bound Connection
+        :param search_base:                 Search Base
+        :param full:                        Force a Full Pull
+        :return:                            Sync Mode, Numbers of Upserted & Deleted Objects, Highest `uSNChanged`
+        """
+
+        with self.__sync_lock:
+            meta = self.__meta()
+            full = (
+                full
+                or not meta.get("usn")
+                or meta.get("version") != str(LDAP_REPLICA_VERSION)
+                or meta.get("host") != conn.server.host
+                or meta.get("search_base") != search_base
+                or time.time() - float(meta.get("full_synced_at") or 0) >= self._full_sync_interval
+            )
+            started_at = time.time()
+            # Read before the pull, so changes committed during the pull are pulled again by the next sync
+            highest_usn = ldap_highest_usn(conn)
+            sync_id = int(meta.get("sync_id") or 0) + (1 if full else 0)
+            usn = None if full else int(meta["usn"]) + 1
+            max_usn = 0 if full else int(meta["usn"])
+            base_key = ldap_dn_key(search_base)
+            # Changed Objects are searched in the whole domain, so the Objects moved out of the search base are deleted
+            pull_base = search_base if full else ldap_domain_root(search_base)
+            upserted = deleted = 0
+
+            db = self.__db()
+            with db:
+                for category in LDAP_REPLICA_CATEGORIES_TUPLE:
+                    for page, _ in ldap_paged_search(
+                            conn,
+                            search_base=pull_base,
+                            search_query=ldap_objects_changed_query(category, usn),
+                            returned_attrs_collection=self._attrs[category],
+                            page_size=self._page_size
+                    ):
+                        for values in page:
+                            guid, dn, object_usn = _ldap_system_values(values)
+                            max_usn = max(max_usn, object_usn)
+                            dn_key = ldap_dn_key(dn)
+                            if dn_key != base_key and not dn_key.endswith("," + base_key):
+                                deleted += self.__delete(db, guid)
+                                continue
+                            self.__upsert(db, category, values, sync_id)
+                            upserted += 1
+                if full:
+                    # Objects not seen by the full pull
+                    db.execute(
+                        "DELETE FROM attrs WHERE guid IN (SELECT guid FROM objects WHERE sync_id != ?)", (sync_id,)
+                    )
+                    deleted += db.execute("DELETE FROM objects WHERE sync_id != ?", (sync_id,)).rowcount
+                else:
+                    for page, _ in ldap_paged_search(
+                            conn,
+                            search_base=pull_base,
+                            search_query=ldap_deleted_objects_query(usn),
+                            returned_attrs_collection=["objectGUID", "uSNChanged"],
+                            page_size=self._page_size,
+                            controls=[LDAP_SHOW_DELETED_CONTROL]
+                    ):
+                        for values in page:
+                            values = {key.lower(): value for key, value in values.items()}
+                            max_usn = max(max_usn, int(values.get("usnchanged") or 0))
+                            deleted += self.__delete(db, str(values["objectguid"]))
+                meta_values = {
+                    "version": LDAP_REPLICA_VERSION,
+                    "host": conn.server.host,
+                    "search_base": search_base,
+                    "sync_id": sync_id,
+                    "usn": highest_usn if highest_usn is not None else max_usn,
+                    "synced_at": started_at,
+                }
+                if full:
+                    meta_values["full_synced_at"] = started_at
+                db.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [(key, str(value)) for key, value in meta_values.items()]
+                )
+            return {
+                "mode": "full" if full else "incremental",
+                "upserted": upserted,
+                "deleted": deleted,
+                "usn": int(meta_values["usn"]),
+            }
+
+    @staticmethod
+    def __project(data: str, returned_attrs: Iterable[str]) -> dict[str, Any]:
+        values = {key.lower(): value for key, value in json.loads(data, object_hook=_ldap_json_hook).items()}
+        return {attr_name: values.get(attr_name.lower()) for attr_name in returned_attrs}
+
+    def __select(
+            self,
+            condition: str,
+            params: Iterable[Any],
+            returned_attrs: Iterable[str],
+            limit: Optional[int] = None
+    ) -> list[tuple[str, dict[str, Any]]]:
+        returned_attrs = tuple(returned_attrs)
+        rows = self.__db().execute(
+            "SELECT o.dn, o.data FROM objects o WHERE o.guid IN "
+            f"(SELECT a.guid FROM attrs a WHERE {condition}) ORDER BY o.dn_key" + (" LIMIT ?" if limit else ""),
+            (*params, limit) if limit else tuple(params)
+        )
+        return [(dn, self.__project(data, returned_attrs)) for dn, data in rows]
+
+    def detail(
+            self,
+            object_category: str,
+            attr_name: str,
+            attr_value: str,
+            is_active: bool,
+            returned_attrs: Iterable[str]
+    ) -> Optional[list[tuple[str, dict[str, Any]]]]:
+
+        """
+        Objects matched by an attribute value (case-insensitive), as `object_detail` query.
+        :param object_category:             Object Category: `person`, `group` or `computer`
+        :param attr_name:                   Attribute Name for Searching
+        :param attr_value:                  Attributes Value for Searching
+        :param is_active:                   Person (User) Search Scope (Active or All Users)
+        :param returned_attrs:              Returned Attributes
+        :return:                            (DN, Object Dictionary) Pairs or None (Attribute Isn't Indexed)
+        """
+
+        if not self.__indexed(object_category, attr_name):
+            return None
+        returned_attrs = tuple(returned_attrs)
+        items = self.__select(
+            "a.category = ? AND a.attr_name = ? AND a.value = ?",
+            (object_category, attr_name.lower(), attr_value.lower()),
+            returned_attrs + ("userAccountControl",)
+        )
+        if is_active and object_category == "person":
+            # Disabled accounts: ACCOUNTDISABLE (0x2) flag of `userAccountControl`
+            items = [(dn, values) for dn, values in items if not int(values["userAccountControl"] or 0) & 2]
+        return [(dn, {name: values[name] for name in returned_attrs}) for dn, values in items]
+
+    def search(
+            self,
+            object_category: str,
+            attr_value: str,
+            search_by_attrs: Iterable[str],
+            search_mode: str,
+            returned_attrs: Iterable[str],
+            limit: Optional[int] = None
+    ) -> Optional[list[tuple[str, dict[str, Any]]]]:
+
+        """
+        Objects matched by a prefix or a substring of the attributes values (case-insensitive), as `objects_search`
+        query. `anr` mode is a prefix match over the replicated naming attributes.
+        :param object_category:             Object Category: `person`, `group` or `computer`
+        :param attr_value:                  Attributes Value for Searching
+        :param search_by_attrs:             Attribute Names for Searching
+        :param search_mode:                 Search Mode: `prefix`, `contains` or `anr`
+        :param returned_attrs:              Returned Attributes
+        :param limit:                       Maximum Number of Objects or None
+        :return:                            (DN, Object Dictionary) Pairs or None (Not Indexed or Empty Value)
+        """
+
+        if not attr_value:
+            # An empty prefix has no index range, the query is left to the directory
+            return None
+        if search_mode == "anr":
+            search_by_attrs = [
+                attr_name for attr_name in LDAP_REPLICA_ANR_ATTRS_TUPLE if self.__indexed(object_category, attr_name)
+            ]
+        search_by_attrs = [attr_name.lower() for attr_name in search_by_attrs]
+        if not search_by_attrs or not all(self.__indexed(object_category, attr_name) for attr_name in search_by_attrs):
+            return None
+        value = attr_value.lower()
+        if search_mode == "contains":
+            escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            value_condition, value_params = "a.value LIKE ? ESCAPE '\\'", (f"%{escaped}%",)
+        else:
+            # Index range of the prefix: the values >= prefix and < prefix with the last character incremented
+            value_condition = "a.value >= ? AND a.value < ?"
+            value_params = (value, value[:-1] + chr(ord(value[-1]) + 1))
+        return self.__select(
+            f"a.category = ? AND a.attr_name IN ({', '.join('?' * len(search_by_attrs))}) AND {value_condition}",
+            (object_category, *search_by_attrs, *value_params),
+            returned_attrs,
+            limit
+        )
+
+    def read(
+            self,
+            object_category: str,
+            dn: str,
+            returned_attrs: Iterable[str]
+    ) -> list[tuple[str, dict[str, Any]]]:
+
+        """
+        Object by DN, as `object_read` query.
+        :param object_category:             Object Category: `person`, `group` or `computer`
+        :param dn:                          Object `distinguishedName` Attribute Value
+        :param returned_attrs:              Returned Attributes
+        :return:                            (DN, Object Dictionary) Pairs
+        """
+
+        returned_attrs = tuple(returned_attrs)
+        rows = self.__db().execute(
+            "SELECT dn, data FROM objects WHERE dn_key = ? AND category = ?", (ldap_dn_key(dn), object_category)
+        )
+        return [(row_dn, self.__project(data, returned_attrs)) for row_dn, data in rows]
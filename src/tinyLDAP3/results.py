@@ -0,0 +1,286 @@
+from ldap3.core.exceptions import LDAPException, LDAPInvalidDnError
+from ldap3.utils.dn import parse_dn
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+from .normalizers import ldap_normalize_columns
+
+
+""" ######################################################### """
+""" ******************* TINY LDAP3 RESULTS ****************** """
+""" ######################################################### """
+
+
+def ldap_attr_value(value: Any) -> Any:
+
+    """
+    Attribute value shaped as `ldap3.abstract.attribute.Attribute.value`: None, a single value or a list of values.
+    :param value:                       Attribute Value from `conn.response`
+    :return:
+    """
+
+    if isinstance(value, list):
+        if not value:
+            return None
+        return value[0] if len(value) == 1 else value
+    return value
+
+
+def ldap_attr_decode(value: Any, decoder: Callable[[Any], Any]) -> Any:
+
+    """
+    Apply an attribute decoder to each value of a shaped attribute value.
+    :param value:                       Attribute Value: None, a Single Value or a List of Values
+    :param decoder:                     Attribute Decoder
+    :return:
+    """
+
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [decoder(item) for item in value]
+    return decoder(value)
+
+
+def ldap_attrs_decode(values: dict[str, Any], decoders: dict[str, Callable[[Any], Any]]) -> dict[str, Any]:
+
+    """
+    Decode Object dictionary values in place.
+    :param values:                      Object Dictionary
+    :param decoders:                    Attribute Decoders by Lower Case Attribute Name
+    :return:
+    """
+
+    for key, value in values.items():
+        decoder = decoders.get(key.lower())
+        if decoder is not None:
+            values[key] = ldap_attr_decode(value, decoder)
+    return values
+
+
+def ldap_dn_key(dn: str) -> str:
+
+    """
+    Case and spacing insensitive DN key.
+    :param dn:                          Object `distinguishedName` Attribute Value
+    :return:
+    """
+
+    try:
+        return ",".join(f"{attr_type}={attr_value}" for attr_type, attr_value, _ in parse_dn(dn, strip=True)).lower()
+    except LDAPInvalidDnError:
+        return dn.lower()
+
+
+def ldap_domain_root(dn: str) -> str:
+
+    """
+    Domain naming context of a DN: its `DC=` components.
+    :param dn:                          Object or Search Base `distinguishedName`
+    :return:                            Domain Root or the DN (No `DC=` Components)
+    """
+
+    try:
+        dc_rdns = [f"{attr_type}={attr_value}" for attr_type, attr_value, _ in parse_dn(dn, strip=True)
+                   if attr_type.lower() == "dc"]
+    except LDAPException:
+        return dn
+    return ",".join(dc_rdns) or dn
+
+
+def ldap_response_to_items(
+        response: Iterable[dict],
+        decoders: Optional[dict[str, Callable[[Any], Any]]] = None
+) -> list[tuple[str, dict[str, Any]]]:
+
+    """
+    Convert `conn.response` search entries to (DN, Object dictionary) pairs without building `ldap3` Entries.
+    References and intermediate messages are skipped.
+    :param response:                    Search Response Messages
+    :param decoders:                    Attribute Decoders by Lower Case Attribute Name or None
+    :return:
+    """
+
+    items = []
+    for item in response or ():
+        if item.get("type") != "searchResEntry":
+            continue
+        values = {key: ldap_attr_value(value) for key, value in item["attributes"].items()}
+        items.append((item["dn"], ldap_attrs_decode(values, decoders) if decoders else values))
+    return items
+
+
+def ldap_entries_to_items(
+        entries: Iterable,
+        decoders: Optional[dict[str, Callable[[Any], Any]]] = None
+) -> list[tuple[str, dict[str, Any]]]:
+
+    """
+    Convert `ldap3` Entries to (DN, Object dictionary) pairs.
+    :param entries:                     `conn.entries` or Reader Entries
+    :param decoders:                    Attribute Decoders by Lower Case Attribute Name or None
+    :return:
+    """
+
+    items = []
+    for entry in entries:
+        values = {attr.key: attr.value for attr in entry}
+        items.append((entry.entry_dn, ldap_attrs_decode(values, decoders) if decoders else values))
+    return items
+
+
+def ldap_response_to_dicts(
+        response: Iterable[dict],
+        decoders: Optional[dict[str, Callable[[Any], Any]]] = None
+) -> list[dict[str, Any]]:
+
+    """
+    Convert `conn.response` search entries to Objects dictionaries. References and intermediate messages are skipped.
+    :param response:                    Search Response Messages
+    :param decoders:                    Attribute Decoders by Lower Case Attribute Name or None
+    :return:
+    """
+
+    return [values for _, values in ldap_response_to_items(response, decoders)]
+
+
+class LdapObjectsDetailManyResult(NamedTuple):
+
+    """
+        Bulk Objects detail result.
+        `objects`    - Object dictionary (or a collection of Objects dictionaries for `duplicates`) by requested value.
+        `missing`    - Requested values without Objects.
+        `duplicates` - Requested values matched by more than one Object.
+        `repeated`   - Values requested more than once (case-insensitive), searched once.
+        """
+
+    objects: dict[str, Union[dict[str, Any], tuple[dict, ...]]]
+    missing: tuple[str, ...]
+    duplicates: tuple[str, ...]
+    repeated: tuple[str, ...]
+
+
+class LdapResultSet:
+
+    """
+        Compact Objects collection. Attribute names are stored once, Objects are stored as tuples of values
+        in the attribute names order. Supports row, column and dictionaries access.
+        """
+
+    __slots__ = ("attrs", "rows", "_index")
+
+    def __init__(self, attrs: Iterable[str], rows: Optional[list[tuple]] = None):
+
+        """
+        :param attrs:                       Attribute Names
+        :param rows:                        Objects Values Tuples in the Attribute Names Order
+        """
+
+        self.attrs = tuple(attrs)
+        self.rows = rows if rows is not None else []
+        self._index = {attr_name.lower(): i for i, attr_name in enumerate(self.attrs)}
+
+    @classmethod
+    def from_dicts(cls, dicts: Iterable[dict[str, Any]], attrs: Iterable[str] = None) -> "LdapResultSet":
+
+        """
+        Build from Objects dictionaries. Attribute names are matched case-insensitively, missing values are None.
+        :param dicts:                       Objects Dictionaries
+        :param attrs:                       Attribute Names or None (Keys in Order of Appearance)
+        :return:
+        """
+
+        dicts = dicts if isinstance(dicts, (list, tuple)) else list(dicts)
+        if attrs is None:
+            attrs = {}
+            for item in dicts:
+                for key in item:
+                    attrs.setdefault(key.lower(), key)
+            attrs = attrs.values()
+        result = cls(attrs)
+        for item in dicts:
+            values = {key.lower(): value for key, value in item.items()}
+            result.rows.append(tuple(values.get(attr_name) for attr_name in result._index))
+        return result
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(self.rows)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[tuple, list[tuple]]:
+        return self.rows[index]
+
+    def __repr__(self) -> str:
+        return f"LdapResultSet(attrs={self.attrs!r}, rows={len(self.rows)})"
+
+    def __column_index(self, attr_name: str) -> int:
+        try:
+            return self._index[attr_name.lower()]
+        except KeyError:
+            raise KeyError(f"Attribute '{attr_name}' isn't in the result set.") from None
+
+    def column(self, attr_name: str) -> list[Any]:
+
+        """
+        Values of one attribute for all Objects.
+        :param attr_name:                   Attribute Name (Case-Insensitive)
+        :return:
+        """
+
+        i = self.__column_index(attr_name)
+        return [row[i] for row in self.rows]
+
+    def row_dict(self, index: int) -> dict[str, Any]:
+
+        """
+        Object dictionary by row index.
+        :param index:                       Row Index
+        :return:
+        """
+
+        return dict(zip(self.attrs, self.rows[index]))
+
+    def to_dicts(self) -> tuple[dict[str, Any], ...]:
+
+        """
+        Convert to a collection of Objects dictionaries.
+        :return:
+        """
+
+        return tuple(dict(zip(self.attrs, row)) for row in self.rows)
+
+    def normalize(
+            self,
+            normalizers: Optional[dict[str, Callable[[Any], Any]]] = None,
+            vectorize: Optional[bool] = None
+    ) -> "LdapResultSet":
+
+        """
+        Normalize values in place column by column: FILETIME attributes to naive UTC datetimes, `userAccountControl`
+        to flag names sets, `sAMAccountType` to names, GUIDs and SIDs to strings (see `ldap_normalize_columns`).
+        :param normalizers:                 Additional Value Normalizers by Attribute Name or None
+        :param vectorize:                   Use NumPy for FILETIME Columns or None (When Installed)
+        :return:
+        """
+
+        if self.rows:
+            columns = ldap_normalize_columns(self.attrs, zip(*self.rows), normalizers, vectorize)
+            self.rows = list(zip(*columns))
+        return self
+
+    def sort(self, attr_name: str, reverse: bool = False) -> "LdapResultSet":
+
+        """
+        Sort rows in place by an attribute.
+        :param attr_name:                   Attribute Name (Case-Insensitive)
+        :param reverse:                     Descending Order
+        :return:
+        """
+
+        i = self.__column_index(attr_name)
+        # Rows without a value are sorted after the others, as the server does
+        missing = [row for row in self.rows if row[i] is None]
+        self.rows = [row for row in self.rows if row[i] is not None]
+        self.rows.sort(key=lambda row: row[i], reverse=reverse)
+        self.rows.extend(missing)
+        return self
@@ -0,0 +1,242 @@
+import json, logging, os, tempfile, threading, time
+from ldap3 import ALL, BASE, AttrDef, Connection, ObjectDef
+from ldap3.core.exceptions import LDAPException
+from ldap3.protocol.rfc4512 import DsaInfo, SchemaInfo
+from typing import Iterable, Optional
+
+
+""" ######################################################### """
+""" **************** TINY LDAP3 SCHEMA CACHE **************** """
+""" ######################################################### """
+
+
+# Version of the cache file format
+LDAP_SCHEMA_CACHE_VERSION = 1
+
+
+class LdapSchemaCache:
+
+    """
+        tinyLDAP3 Schema Cache. Server info (Root DSE) and schema are downloaded once, saved to a JSON file and attached
+        to the servers of new connections, which are created with `get_info=NONE`. The cached schema is validated
+        against the subschema entry `modifyTimeStamp` on the first connection and every `check_interval`.
+        """
+
+    def __init__(self, path: str, check_interval: float = 3600):
+
+        """
+        :param path:                        Cache File Path
+        :param check_interval:              Time (sec.) After Which the Schema Version Is Checked on a New Connection
+        """
+
+        self._path = path
+        self._check_interval = check_interval
+
+        self.__lock = threading.Lock()
+        self.__info: Optional[DsaInfo] = None
+        self.__schema: Optional[SchemaInfo] = None
+        self.__stamp: Optional[tuple[str, str]] = None
+        self.__checked_at: Optional[float] = None
+        self.__counters = {"loaded": 0, "downloaded": 0, "checked": 0, "attached": 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+
+        """
+        Schema cache counters.
+        :return:
+        """
+
+        with self.__lock:
+            return dict(self.__counters)
+
+    @staticmethod
+    def __search(conn: Connection, search_base: str, attr_name: str) -> Optional[str]:
+
+        """
+        Read a single attribute value with base scoped search. Works with sync and async strategies.
+        :param conn:                        Bound Connection
+        :param search_base:                 Entry DN
+        :param attr_name:                   Attribute Name
+        :return:
+        """
+
+        result = conn.search(
+            search_base=search_base, search_filter="(objectClass=*)", search_scope=BASE, attributes=[attr_name]
+        )
+        response = conn.response if conn.strategy.sync else conn.get_response(result)[0]
+        for item in response or ():
+            values = item.get("raw_attributes", {}).get(attr_name)
+            if values:
+                return values[0].decode("utf-8") if isinstance(values[0], bytes) else str(values[0])
+        return None
+
+    def __read_stamp(self, conn: Connection) -> Optional[tuple[str, str]]:
+
+        """
+        Current schema version: subschema entry DN and its `modifyTimeStamp`.
+        :param conn:                        Bound Connection
+        :return:
+        """
+
+        schema_entry = self.__stamp[0] if self.__stamp else None
+        if not schema_entry and self.__info is not None and self.__info.schema_entry:
+            schema_entry = self.__info.schema_entry
+        if not schema_entry:
+            schema_entry = self.__search(conn, "", "subschemaSubentry")
+        if not schema_entry:
+            return None
+        modify_timestamp = self.__search(conn, schema_entry, "modifyTimeStamp")
+        return (schema_entry, modify_timestamp) if modify_timestamp else None
+
+    def __load(self) -> None:
+
+        """
+        Load the cache file. A missing, corrupted or incompatible file is ignored.
+        :return:
+        """
+
+        try:
+            with open(self._path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") != LDAP_SCHEMA_CACHE_VERSION:
+                return
+            schema = SchemaInfo.from_json(data["schema"])
+            info = DsaInfo.from_json(data["info"], schema)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            logging.warning(f"@ LDAP Schema Cache @ - Cache file '{self._path}' ignored: {repr(err)}.")
+            return
+        self.__info, self.__schema, self.__stamp = info, schema, tuple(data["stamp"]) if data.get("stamp") else None
+        self.__counters["loaded"] += 1
+
+    def __save(self) -> None:
+
+        """
+        Save the cache file atomically.
+        :return:
+        """
+
+        data = {
+            "version": LDAP_SCHEMA_CACHE_VERSION,
+            "stamp": self.__stamp,
+            "info": self.__info.to_json(),
+            "schema": self.__schema.to_json(),
+        }
+        directory = os.path.dirname(os.path.abspath(self._path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, delete=False) as file:
+                json.dump(data, file)
+            os.replace(file.name, self._path)
+        except OSError as err:
+            logging.warning(f"@ LDAP Schema Cache @ - Cache file '{self._path}' not saved: {repr(err)}.")
+
+    def __download(self, conn: Connection) -> bool:
+
+        """
+        Download the server info and schema via the connection.
+        :param conn:                        Bound Connection
+        :return:
+        """
+
+        server = conn.server
+        get_info, server.get_info = server.get_info, ALL
+        try:
+            conn.refresh_server_info()
+        finally:
+            server.get_info = get_info
+        if server.info is None or server.schema is None:
+            logging.warning("@ LDAP Schema Cache @ - Server info or schema not available.")
+            return False
+        self.__info, self.__schema = server.info, server.schema
+        self.__counters["downloaded"] += 1
+        return True
+
+    def attach(self, conn: Connection) -> None:
+
+        """
+        Attach the cached server info and schema to the connection server. Load the cache file on the first call,
+        download and save the schema if it's missing or changed.
+        :param conn:                        Bound Connection
+        :return:
+        """
+
+        with self.__lock:
+            if self.__schema is None and self.__checked_at is None:
+                self.__load()
+            now = time.monotonic()
+            if self.__schema is None or self.__checked_at is None or now - self.__checked_at > self._check_interval:
+                try:
+                    stamp = self.__read_stamp(conn)
+                except LDAPException as err:
+                    logging.warning(f"@ LDAP Schema Cache @ - Schema version check failed: {repr(err)}.")
+                    stamp = self.__stamp
+                self.__counters["checked"] += 1
+                if self.__schema is None or stamp is None or stamp != self.__stamp:
+                    if self.__download(conn):
+                        self.__stamp = stamp
+                        self.__save()
+                self.__checked_at = now
+            if self.__schema is not None and conn.server.schema is not self.__schema:
+                conn.server.attach_dsa_info(self.__info)
+                conn.server.attach_schema_info(self.__schema)
+                self.__counters["attached"] += 1
+
+    def invalidate(self) -> None:
+
+        """
+        Check the schema version on the next connection.
+        :return:
+        """
+
+        with self.__lock:
+            self.__checked_at = None
+            self.__stamp = None
+
+
+class LdapObjectDefCache:
+
+    """
+        Thread-safe cache of `ldap3` ObjectDef definitions by the set of Object Categories & Classes.
+        A definition is rebuilt if the server schema object has been replaced.
+        """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__items: dict[frozenset[str], tuple[Optional[SchemaInfo], ObjectDef]] = {}
+
+    def get(self, object_category: Iterable[str], conn: Connection) -> ObjectDef:
+
+        """
+        Get a cached definition or build a new one. `sAMAccountName` is added for `computer`, `group`, `person`
+        and `user` definitions. The definition is shared and must not be changed by the caller.
+        :param object_category:             Object Categories & Classes Collection
+        :param conn:                        Bound Connection
+        :return:
+        """
+
+        object_category = list(object_category)
+        key = frozenset(value.lower() for value in object_category)
+        schema = conn.server.schema
+        with self.__lock:
+            cached = self.__items.get(key)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+        object_def = ObjectDef(object_category, conn)
+        if any(value in object_category for value in ["computer", "group", "person", "user"]):
+            object_def += AttrDef("sAMAccountName")
+        with self.__lock:
+            self.__items[key] = (schema, object_def)
+        return object_def
+
+    def clear(self) -> None:
+
+        """
+        Remove all cached definitions.
+        :return:
+        """
+
+        with self.__lock:
+            self.__items.clear()
@@ -0,0 +1,322 @@
+import logging, random, threading, time
+from ldap3 import Connection, Server
+from ldap3.core.exceptions import LDAPResponseTimeoutError, LDAPSocketOpenError
+from typing import Any, Callable, Iterable, Optional
+from .pool import LDAP_STALE_CONNECTION_ERRORS_TUPLE
+
+
+""" ######################################################### """
+""" *************** TINY LDAP3 SERVER SELECTOR ************** """
+""" ######################################################### """
+
+
+# `p2c` - the better of two random hosts, `least_latency` - the best host, `round_robin` - hosts in turn
+LDAP_SERVER_SELECTION_STRATEGIES_TUPLE = (
+    "p2c",
+    "least_latency",
+    "round_robin",
+)
+
+# Errors of an unavailable or overloaded host. Operation results (no such object, size limit, etc.) aren't counted.
+LDAP_HOST_ERRORS_TUPLE = (
+    *LDAP_STALE_CONNECTION_ERRORS_TUPLE,
+    LDAPResponseTimeoutError,
+    LDAPSocketOpenError,
+)
+
+
+class _LdapHostState:
+
+    """
+        Host health: EWMA latency & error rate and the circuit breaker state.
+        """
+
+    __slots__ = (
+        "server", "latency", "error_rate", "updated_at", "failures", "ejected_at",
+        "requests", "errors", "ejections", "probes"
+    )
+
+    def __init__(self, server: Server):
+        self.server = server
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.updated_at = time.monotonic()
+        # Consecutive failures, the circuit is opened at `failure_threshold`
+        self.failures = 0
+        self.ejected_at: Optional[float] = None
+        self.requests = self.errors = self.ejections = self.probes = 0
+
+
+class LdapServerSelector:
+
+    """
+        Thread-safe latency and health aware server selection. Each host keeps the EWMA of the request latency
+        and of the error rate. A host with `failure_threshold` consecutive failures is ejected (the circuit is open)
+        and readmitted by a successful background probe. Without a probe an ejected host is tried again by a request
+        after `eject_time`. If all hosts are ejected, the least recently ejected one is selected.
+        """
+
+    def __init__(
+            self,
+            servers: Iterable[Server],
+            strategy: str = "p2c",
+            alpha: float = 0.2,
+            failure_threshold: int = 3,
+            eject_time: float = 30,
+            error_penalty: float = 10,
+            error_half_life: float = 60,
+            probe: Optional[Callable[[Server], Any]] = None,
+            probe_interval: float = 10
+    ):
+
+        """
+        :param servers:                     Servers
+        :param strategy:                    Selection Strategy: `p2c`, `least_latency` or `round_robin`
+        :param alpha:                       EWMA Smoothing Factor (Weight of the Last Request)
+        :param failure_threshold:           Consecutive Failures After Which a Host Is Ejected
+        :param eject_time:                  Time (sec.) Before an Ejected Host Is Probed
+        :param error_penalty:               Latency (sec.) Added per Error Rate Unit to the Host Score
+        :param error_half_life:             Time (sec.) Halving the Error Rate of a Host Without Requests
+        :param probe:                       Callable Raising an `LDAPException` if the Server Is Unavailable or None
+        :param probe_interval:              Background Probes Interval (sec.)
+        """
+
+        if strategy not in LDAP_SERVER_SELECTION_STRATEGIES_TUPLE:
+            raise ValueError(
+                f"server_selection must be one of: {', '.join(map(repr, LDAP_SERVER_SELECTION_STRATEGIES_TUPLE))}."
+            )
+        if failure_threshold < 1:
+            raise ValueError("Selector failure_threshold must be >= 1.")
+
+        self._strategy = strategy
+        self._alpha = alpha
+        self._failure_threshold = failure_threshold
+        self._eject_time = eject_time
+        self._error_penalty = error_penalty
+        self._error_half_life = error_half_life
+        self._probe_interval = probe_interval
+
+        self.__probe = probe
+        self.__lock = threading.Lock()
+        self.__hosts = {server.host: _LdapHostState(server) for server in servers}
+        if not self.__hosts:
+            raise ValueError("Selector requires at least one server.")
+        self.__next = 0
+        self.__closed = threading.Event()
+        self.__probe_thread: Optional[threading.Thread] = None
+
+    @property
+    def servers(self) -> list[Server]:
+        return [state.server for state in self.__hosts.values()]
+
+    @property
+    def stats(self) -> dict[str, dict[str, Any]]:
+
+        """
+        Hosts gauges and counters: state (`closed` - in rotation, `open` - ejected), EWMA latency (sec.),
+        EWMA error rate, requests, errors, ejections and probes.
+        :return:
+        """
+
+        now = time.monotonic()
+        with self.__lock:
+            return {
+                host: {
+                    "state": "closed" if state.ejected_at is None else "open",
+                    "latency": state.latency,
+                    "error_rate": self.__error_rate(state, now),
+                    "requests": state.requests,
+                    "errors": state.errors,
+                    "ejections": state.ejections,
+                    "probes": state.probes,
+                } for host, state in self.__hosts.items()
+            }
+
+    def __available(self, state: _LdapHostState, now: float) -> bool:
+        if state.ejected_at is None:
+            return True
+        # Half-open: without a probe the next request is the trial
+        return self.__probe is None and now - state.ejected_at >= self._eject_time
+
+    def __error_rate(self, state: _LdapHostState, now: float) -> float:
+        # The error rate decays with time, so a host avoided after errors gets requests again
+        return state.error_rate * 0.5 ** ((now - state.updated_at) / self._error_half_life)
+
+    def __score(self, state: _LdapHostState, now: float) -> float:
+        # Hosts without samples score 0, so they are tried first
+        return (state.latency or 0.0) + self.__error_rate(state, now) * self._error_penalty
+
+    def available(self, host: str) -> bool:
+
+        """
+        The host isn't ejected. Unknown hosts are available.
+        :param host:                        Host
+        :return:
+        """
+
+        with self.__lock:
+            state = self.__hosts.get(host)
+            return state is None or self.__available(state, time.monotonic())
+
+    def select(self, exclude: Iterable[str] = ()) -> Optional[Server]:
+
+        """
+        Select a server by the strategy.
+        :param exclude:                     Hosts Excluded from the Selection (Already Failed by the Caller)
+        :return:                            Server or None (All Hosts Are Excluded)
+        """
+
+        exclude = set(exclude)
+        now = time.monotonic()
+        with self.__lock:
+            states = [state for host, state in self.__hosts.items() if host not in exclude]
+            if not states:
+                return None
+            candidates = [state for state in states if self.__available(state, now)]
+            if not candidates:
+                # All hosts are ejected: fail open to the host ejected the longest time ago
+                return min(states, key=lambda state: state.ejected_at).server
+            match self._strategy:
+                case "round_robin":
+                    self.__next += 1
+                    return candidates[self.__next % len(candidates)].server
+                case "least_latency":
+                    return min(candidates, key=lambda state: self.__score(state, now)).server
+                case _:
+                    if len(candidates) == 1:
+                        return candidates[0].server
+                    return min(random.sample(candidates, 2), key=lambda state: self.__score(state, now)).server
+
+    def __eject(self, state: _LdapHostState) -> None:
+
+        """
+        Open the circuit of the host and start the probe thread. Must be called under the selector lock.
+        :param state:                       Host State
+        :return:
+        """
+
+        state.ejected_at = time.monotonic()
+        state.ejections += 1
+        logging.warning(
+            f"@ LDAP Server Selector @ - Host `{state.server.host}` ejected "
+            f"after {state.failures} consecutive failures."
+        )
+        if self.__probe is not None and self.__probe_thread is None and not self.__closed.is_set():
+            self.__probe_thread = threading.Thread(target=self.__probe_loop, name="tinyLDAP3-probe", daemon=True)
+            self.__probe_thread.start()
+
+    def record(self, host: str, latency: Optional[float], failed: bool = False) -> None:
+
+        """
+        Record a request result of the host.
+        :param host:                        Host
+        :param latency:                     Request Time (sec.) or None (Not an Operation Latency Sample)
+        :param failed:                      The Request Failed with a Host Error
+        :return:
+        """
+
+        with self.__lock:
+            state = self.__hosts.get(host)
+            if state is None:
+                return
+            now = time.monotonic()
+            state.requests += 1
+            state.error_rate = self.__error_rate(state, now)
+            state.error_rate += self._alpha * (float(failed) - state.error_rate)
+            state.updated_at = now
+            if failed:
+                state.errors += 1
+                state.failures += 1
+                if state.ejected_at is not None:
+                    # Failed trial of a half-open host
+                    state.ejected_at = now
+                elif state.failures >= self._failure_threshold:
+                    self.__eject(state)
+                return
+            state.failures = 0
+            if latency is not None:
+                state.latency = latency if state.latency is None else \
+                    state.latency + self._alpha * (latency - state.latency)
+            if state.ejected_at is not None:
+                state.ejected_at = None
+                logging.warning(f"@ LDAP Server Selector @ - Host `{host}` readmitted.")
+
+    def observe(self, conn: Connection, latency: float, error: Optional[BaseException]) -> None:
+
+        """
+        Record a request result of the connection server. Used as a connection pool observer.
+        :param conn:                        Connection
+        :param latency:                     Request Time (sec.)
+        :param error:                       Request Error or None
+        :return:
+        """
+
+        self.record(conn.server.host, latency, failed=isinstance(error, LDAP_HOST_ERRORS_TUPLE))
+
+    def __probe_loop(self) -> None:
+
+        """
+        Probe the ejected hosts every `probe_interval` until all hosts are readmitted or the selector is closed.
+        :return:
+        """
+
+        while not self.__closed.wait(self._probe_interval):
+            now = time.monotonic()
+            with self.__lock:
+                ejected = [state for state in self.__hosts.values() if state.ejected_at is not None]
+                if not ejected:
+                    self.__probe_thread = None
+                    return
+                due = [state for state in ejected if now - state.ejected_at >= self._eject_time]
+            for state in due:
+                try:
+                    self.__probe(state.server)
+                except Exception as err:
+                    logging.debug(f"@ LDAP Server Selector @ - Probe of `{state.server.host}` failed: {repr(err)}.")
+                    failed = True
+                else:
+                    failed = False
+                with self.__lock:
+                    state.probes += 1
+                # A probe opens a new connection, its time isn't an operation latency sample
+                self.record(state.server.host, None, failed=failed)
+        with self.__lock:
+            self.__probe_thread = None
+
+    def connect(
+            self,
+            open_connection: Callable[[Server], Connection],
+            server: Optional[Server] = None
+    ) -> Connection:
+
+        """
+        Open a connection to the selected server. On a host error the next selected server is tried,
+        each host once. The connect time (TCP, TLS and bind) isn't an operation latency sample: it would penalise
+        the hosts without opened connections.
+        :param open_connection:             Callable Returning a New Connection to the Server
+        :param server:                      Server (No Other Host Is Tried) or None (Selected)
+        :return:
+        """
+
+        failed_hosts = []
+        while True:
+            selected = server or self.select(exclude=failed_hosts)
+            try:
+                conn = open_connection(selected)
+            except LDAP_HOST_ERRORS_TUPLE:
+                self.record(selected.host, None, failed=True)
+                failed_hosts.append(selected.host)
+                if server is not None or len(failed_hosts) >= len(self.__hosts):
+                    raise
+                continue
+            self.record(selected.host, None)
+            return conn
+
+    def close(self) -> None:
+
+        """
+        Stop the background probes.
+        :return:
+        """
+
+        self.__closed.set()
@@ -0,0 +1,273 @@
+from ldap3.core.exceptions import LDAPException
+from ldap3.protocol.controls import build_control
+from ldap3.protocol.rfc4511 import Control
+from pyasn1.codec.ber import decoder, encoder
+from pyasn1.type.namedtype import NamedType, NamedTypes, OptionalNamedType, DefaultedNamedType
+from pyasn1.type.tag import Tag, tagClassContext, tagFormatConstructed, tagFormatSimple
+from pyasn1.type.univ import Boolean, Choice, Enumerated, Integer, OctetString, Sequence, SequenceOf
+from typing import Any, Iterable, NamedTuple, Optional
+
+
+""" ######################################################### """
+""" ***************** TINY LDAP3 SORTING ******************** """
+""" ######################################################### """
+
+
+# Server Side Sort control (RFC 2891)
+LDAP_SERVER_SORT_CONTROL_OID = "1.2.840.113556.1.4.473"
+LDAP_SERVER_SORT_RESPONSE_OID = "1.2.840.113556.1.4.474"
+
+# Virtual List View control (draft-ietf-ldapext-ldapv3-vlv), requires the Server Side Sort control
+LDAP_VLV_REQUEST_CONTROL_OID = "2.16.840.1.113730.3.4.9"
+LDAP_VLV_RESPONSE_CONTROL_OID = "2.16.840.1.113730.3.4.10"
+
+
+class _LdapSortKey(Sequence):
+    # SortKey ::= SEQUENCE {
+    #     attributeType   AttributeDescription,
+    #     orderingRule    [0] MatchingRuleId OPTIONAL,
+    #     reverseOrder    [1] BOOLEAN DEFAULT FALSE }
+    componentType = NamedTypes(
+        NamedType("attributeType", OctetString()),
+        OptionalNamedType("orderingRule", OctetString().subtype(
+            implicitTag=Tag(tagClassContext, tagFormatSimple, 0)
+        )),
+        DefaultedNamedType("reverseOrder", Boolean(False).subtype(
+            implicitTag=Tag(tagClassContext, tagFormatSimple, 1)
+        ))
+    )
+
+
+class _LdapSortKeyList(SequenceOf):
+    # SortKeyList ::= SEQUENCE OF SortKey
+    componentType = _LdapSortKey()
+
+
+class _LdapSortResult(Sequence):
+    # SortResult ::= SEQUENCE {
+    #     sortResult      ENUMERATED,
+    #     attributeType   [0] AttributeDescription OPTIONAL }
+    componentType = NamedTypes(
+        NamedType("sortResult", Enumerated()),
+        OptionalNamedType("attributeType", OctetString().subtype(
+            implicitTag=Tag(tagClassContext, tagFormatSimple, 0)
+        ))
+    )
+
+
+class _LdapVlvByOffset(Sequence):
+    # byOffset [0] SEQUENCE { offset INTEGER (0 .. maxInt), contentCount INTEGER (0 .. maxInt) }
+    tagSet = Sequence.tagSet.tagImplicitly(Tag(tagClassContext, tagFormatConstructed, 0))
+    componentType = NamedTypes(
+        NamedType("offset", Integer()),
+        NamedType("contentCount", Integer())
+    )
+
+
+class _LdapVlvTarget(Choice):
+    # target CHOICE { byOffset [0] SEQUENCE {...}, greaterThanOrEqual [1] AssertionValue }
+    componentType = NamedTypes(
+        NamedType("byOffset", _LdapVlvByOffset()),
+        NamedType("greaterThanOrEqual", OctetString().subtype(
+            implicitTag=Tag(tagClassContext, tagFormatSimple, 1)
+        ))
+    )
+
+
+class _LdapVlvRequest(Sequence):
+    # VirtualListViewRequest ::= SEQUENCE {
+    #     beforeCount     INTEGER (0..maxInt),
+    #     afterCount      INTEGER (0..maxInt),
+    #     target          CHOICE {...},
+    #     contextID       OCTET STRING OPTIONAL }
+    componentType = NamedTypes(
+        NamedType("beforeCount", Integer()),
+        NamedType("afterCount", Integer()),
+        NamedType("target", _LdapVlvTarget()),
+        OptionalNamedType("contextID", OctetString())
+    )
+
+
+class _LdapVlvResponse(Sequence):
+    # VirtualListViewResponse ::= SEQUENCE {
+    #     targetPosition          INTEGER (0 .. maxInt),
+    #     contentCount            INTEGER (0 .. maxInt),
+    #     virtualListViewResult   ENUMERATED,
+    #     contextID               OCTET STRING OPTIONAL }
+    componentType = NamedTypes(
+        NamedType("targetPosition", Integer()),
+        NamedType("contentCount", Integer()),
+        NamedType("virtualListViewResult", Enumerated()),
+        OptionalNamedType("contextID", OctetString())
+    )
+
+
+class LdapVlvResponse(NamedTuple):
+
+    """
+        Decoded Virtual List View response control.
+        `target_position` - Position (from 1) of the target entry in the sorted list.
+        `content_count`   - Server estimate of the sorted list size.
+        `context_id`      - Server context of the list, sent back with the next window request, or None.
+        """
+
+    target_position: int
+    content_count: int
+    context_id: Optional[bytes]
+
+
+class LdapWindowResult(NamedTuple):
+
+    """
+        `objects_window` result: a window of the server sorted list.
+        `items`      - Objects dictionaries of the window in the sort order.
+        `offset`     - Offset (from 0) of the first Object of the window in the sorted list.
+        `total`      - Server estimate of the sorted list size.
+        `context_id` - Server context of the list for the next window request or None.
+        """
+
+    items: tuple[dict[str, Any], ...]
+    offset: int
+    total: int
+    context_id: Optional[bytes]
+
+
+def ldap_server_sort_control(
+        order_by: str,
+        reverse: bool = False,
+        ordering_rule: Optional[str] = None,
+        critical: bool = False
+) -> Control:
+
+    """
+    Server Side Sort request control by one attribute. A non-critical control is ignored by directories without it,
+    the entries are returned unsorted.
+    :param order_by:                    Attribute Name for Sorting
+    :param reverse:                     Descending Order
+    :param ordering_rule:               Ordering Matching Rule OID or None (Attribute Ordering Rule)
+    :param critical:                    Fail the Search if the Server Can't Sort
+    :return:
+    """
+
+    sort_key = _LdapSortKey()
+    sort_key["attributeType"] = order_by
+    if ordering_rule is not None:
+        sort_key["orderingRule"] = ordering_rule
+    if reverse:
+        sort_key["reverseOrder"] = True
+    sort_keys = _LdapSortKeyList()
+    sort_keys.append(sort_key)
+    # The value is BER encoded here, `build_control` encodes only ldap3 ASN.1 types
+    return build_control(
+        LDAP_SERVER_SORT_CONTROL_OID, critical, encoder.encode(sort_keys), encode_control_value=False
+    )
+
+
+def ldap_vlv_control(
+        before_count: int,
+        after_count: int,
+        offset: Optional[int] = None,
+        content_count: int = 0,
+        value: Optional[str] = None,
+        context_id: Optional[bytes] = None
+) -> Control:
+
+    """
+    Virtual List View request control (critical). The target entry is set by its position in the sorted list
+    or by the first entry with the sort attribute value >= `value`.
+    :param before_count:                Number of Entries Before the Target Entry
+    :param after_count:                 Number of Entries After the Target Entry
+    :param offset:                      Target Entry Position (from 1) or None (Target by Value)
+    :param content_count:               Client Estimate of the List Size (0 - the Offset Is Absolute)
+    :param value:                       Target Entry Sort Attribute Value or None (Target by Offset)
+    :param context_id:                  Context of the Previous Response or None
+    :return:
+    """
+
+    if (offset is None) == (value is None):
+        raise ValueError("Virtual List View target requires either offset or value.")
+    request = _LdapVlvRequest()
+    request["beforeCount"] = before_count
+    request["afterCount"] = after_count
+    if offset is not None:
+        by_offset = _LdapVlvByOffset()
+        by_offset["offset"] = offset
+        by_offset["contentCount"] = content_count
+        request["target"]["byOffset"] = by_offset
+    else:
+        request["target"]["greaterThanOrEqual"] = value
+    if context_id:
+        request["contextID"] = context_id
+    return build_control(LDAP_VLV_REQUEST_CONTROL_OID, True, encoder.encode(request), encode_control_value=False)
+
+
+def _ldap_response_control_value(result: dict, oid: str) -> Optional[bytes]:
+    control = (result.get("controls") or {}).get(oid)
+    return control["value"] if control else None
+
+
+def ldap_server_sort_applied(result: dict) -> bool:
+
+    """
+    Whether the entries of a search result are sorted by the server: the Server Side Sort response control
+    is returned with the `success` result.
+    :param result:                      Search Result (`conn.result`)
+    :return:
+    """
+
+    value = _ldap_response_control_value(result, LDAP_SERVER_SORT_RESPONSE_OID)
+    if value is None:
+        return False
+    sort_result, _ = decoder.decode(value, asn1Spec=_LdapSortResult())
+    return int(sort_result["sortResult"]) == 0
+
+
+def ldap_vlv_response(result: dict) -> LdapVlvResponse:
+
+    """
+    Decode the Virtual List View response control of a search result.
+    :param result:                      Search Result (`conn.result`)
+    :return:
+    """
+
+    value = _ldap_response_control_value(result, LDAP_VLV_RESPONSE_CONTROL_OID)
+    if value is None:
+        raise LDAPException("Virtual List View response control isn't returned.")
+    response, _ = decoder.decode(value, asn1Spec=_LdapVlvResponse())
+    if int(response["virtualListViewResult"]) != 0:
+        raise LDAPException(f"Virtual List View failed with result: {int(response['virtualListViewResult'])}.")
+    context_id = response["contextID"]
+    return LdapVlvResponse(
+        target_position=int(response["targetPosition"]),
+        content_count=int(response["contentCount"]),
+        context_id=bytes(context_id) if context_id.isValue else None
+    )
+
+
+def ldap_sort_items(
+        items: Iterable[dict[str, Any]],
+        order_by: str,
+        reverse: bool = False
+) -> list[dict[str, Any]]:
+
+    """
+    Sort Objects dictionaries locally by an attribute. The attribute name is case-insensitive and a missing
+    attribute is sorted as None.
+    :param items:                       Objects Dictionaries
+    :param order_by:                    Attribute Name for Sorting
+    :param reverse:                     Descending Order (Objects Without a Value Stay Last)
+    :return:
+    """
+
+    order_by_lower = order_by.lower()
+
+    def value(item: dict[str, Any]) -> Any:
+        if order_by in item:
+            return item[order_by]
+        return next((item_value for key, item_value in item.items() if key.lower() == order_by_lower), None)
+
+    items = list(items)
+    present = [item for item in items if value(item) is not None]
+    missing = [item for item in items if value(item) is None]
+    present.sort(key=value, reverse=reverse)
+    return present + missing
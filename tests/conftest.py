@@ -0,0 +1,32 @@
+import pytest
+from ldap3 import MOCK_SYNC, Connection
+from suite import HOST, SEARCH_BASE, SERVICE_DN, SERVICE_PASS, Directory, mock_connections
+from tinyLDAP3 import tinyLDAP3Client
+
+
+@pytest.fixture
+def directory() -> Directory:
+    # Small synthetic directory of the benchmark suite: 100 persons, 10 groups, 10 computers
+    directory = Directory(scale=0.001, seed=1)
+    directory.populate()
+    with mock_connections(directory):
+        yield directory
+
+
+@pytest.fixture
+def mock_connection(directory: Directory):
+    def connect() -> Connection:
+        conn = Connection(directory.server, user=SERVICE_DN, password=SERVICE_PASS, client_strategy=MOCK_SYNC)
+        conn.bind()
+        return conn
+    return connect
+
+
+@pytest.fixture
+def client(directory: Directory):
+    def create(hosts: tuple[str, ...] = (HOST,), **kwargs) -> tinyLDAP3Client:
+        # Connections to all hosts are opened to the mock server of the directory
+        return tinyLDAP3Client(
+            user_dn=SERVICE_DN, user_pass=SERVICE_PASS, search_base=SEARCH_BASE, hosts=list(hosts), **kwargs
+        )
+    return create
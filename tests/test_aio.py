@@ -0,0 +1,132 @@
+import asyncio, threading, time
+import pytest
+from ldap3.core.exceptions import LDAPResponseTimeoutError
+from suite import HOST, SEARCH_BASE, SERVICE_DN, SERVICE_PASS
+from tinyLDAP3 import AsyncTinyLDAP3Client
+from tinyLDAP3.aio import _AsyncLdapChannel
+from tinyLDAP3.exceptions import LdapConnectionError
+
+
+class FakeStrategy:
+
+    """
+        ASYNC strategy state written by the receiver thread.
+        """
+
+    no_real_dsa = False
+
+    def __init__(self):
+        self._responses = {}
+        self._events = {}
+        self.async_lock = threading.Lock()
+        self.event_lock = threading.Lock()
+
+    def set_event_for_message(self, message_id: int) -> None:
+        with self.event_lock:
+            self._events.setdefault(message_id, threading.Event()).set()
+
+    def receive(self, message_id: int) -> None:
+        with self.async_lock:
+            self._responses.setdefault(message_id, []).append({"type": "searchResDone"})
+            self.set_event_for_message(message_id)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.strategy = FakeStrategy()
+        self.abandoned = []
+
+    def abandon(self, message_id: int) -> None:
+        self.abandoned.append(message_id)
+
+    def get_response(self, message_id: int) -> tuple[list, dict]:
+        with self.strategy.event_lock:
+            self.strategy._events.pop(message_id)
+        with self.strategy.async_lock:
+            return self.strategy._responses.pop(message_id), {}
+
+
+def async_client(**kwargs) -> AsyncTinyLDAP3Client:
+    return AsyncTinyLDAP3Client(
+        user_dn=SERVICE_DN, user_pass=SERVICE_PASS, search_base=SEARCH_BASE, hosts=[HOST], **kwargs
+    )
+
+
+def test_channel_drops_late_responses():
+    async def run():
+        conn = FakeConnection()
+        channel = _AsyncLdapChannel(conn, asyncio.get_running_loop())
+        # Completed before the waiter is registered
+        conn.strategy.receive(1)
+        assert (await channel.response(1, timeout=1)) == ([{"type": "searchResDone"}], {})
+        conn.strategy._events[2] = threading.Event()
+        with pytest.raises(LDAPResponseTimeoutError):
+            await channel.response(2, timeout=0.01)
+        assert conn.abandoned == [2]
+        conn.strategy.receive(2)
+        assert conn.strategy._responses == {} and conn.strategy._events == {}
+        assert channel._AsyncLdapChannel__completed == set()
+        assert channel._AsyncLdapChannel__abandoned == {}
+
+    asyncio.run(run())
+
+
+def test_concurrent_requests_share_the_channels(directory):
+    async def run():
+        async with async_client(async_connections=2) as ldap:
+            results = await asyncio.gather(*(
+                ldap.object_detail("person", "cn", f"user{i}", returned_attrs_collection=("cn",)) for i in range(20)
+            ))
+            assert [result["cn"] for result in results] == [f"user{i}" for i in range(20)]
+            assert len(ldap._AsyncTinyLDAP3Client__channels) <= 2
+
+    asyncio.run(run())
+
+
+def test_person_auth_without_person(directory):
+    async def no_person(**kwargs) -> list:
+        return []
+
+    async def run():
+        async with async_client() as ldap:
+            # Mock binds are DN based and can't match the active persons filter (extensible match)
+            ldap._AsyncTinyLDAP3Client__ldap_person_bind = lambda login, password: {"result": 0}
+            ldap._AsyncTinyLDAP3Client__ldap_search = no_person
+            assert await ldap.person_auth("nobody@example.com", "Password-1") == (True, {})
+
+    asyncio.run(run())
+
+
+def test_close_waits_for_opening_channels(directory):
+    async def run():
+        ldap = async_client()
+        ldap_connection = ldap._AsyncTinyLDAP3Client__ldap_connection
+        opened = []
+
+        def slow_connection(*args, **kwargs):
+            time.sleep(0.1)
+            opened.append(ldap_connection(*args, **kwargs))
+            return opened[-1]
+        ldap._AsyncTinyLDAP3Client__ldap_connection = slow_connection
+        request = asyncio.ensure_future(ldap.object_detail("person", "cn", "user1"))
+        await asyncio.sleep(0.02)
+        await ldap.close()
+        assert opened and opened[0].closed
+        with pytest.raises(LdapConnectionError):
+            await request
+        assert ldap._AsyncTinyLDAP3Client__channels == []
+
+    asyncio.run(run())
+
+
+def test_person_auth_reuses_the_auth_pool(directory):
+    async def run():
+        async with async_client() as ldap:
+            for _ in range(3):
+                # Mock binds are DN based: the UPN bind is rejected
+                is_bound, result = await ldap.person_auth("user1@example.com", "Wrong-Pass-1")
+                assert not is_bound and result["result"] == 49
+            stats = ldap.auth_pool_stats
+            assert stats["created"] == 1 and stats["idle"] == 1
+
+    asyncio.run(run())
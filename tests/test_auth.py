@@ -0,0 +1,54 @@
+import pytest
+from ldap3 import ANONYMOUS
+from ldap3.core.exceptions import LDAPSocketReceiveError
+from suite import SERVICE_DN, SERVICE_PASS
+
+
+def test_bind_attrs_source_is_rejected(client):
+    with pytest.raises(ValueError):
+        client(auth_attrs_source="bind")
+
+
+def test_invalid_credentials_reuse_the_auth_pool(client):
+    ldap = client()
+    for _ in range(3):
+        # Mock binds are DN based: the UPN bind is rejected
+        is_bound, result = ldap.person_auth("user1@example.com", "Wrong-Pass-1")
+        assert not is_bound and result["result"] == 49
+    stats = ldap._tinyLDAP3Client__auth_connection_pool.stats
+    assert stats["created"] == 1 and stats["idle"] == 1
+
+
+def test_auth_connection_is_released_anonymous(client):
+    ldap = client()
+    pool = ldap._tinyLDAP3Client__auth_connection_pool
+    with pool.connection() as conn:
+        bind = conn.bind
+
+        def upn_bind(*args, **kwargs):
+            # Mock binds are DN based: the service account UPN is bound with its DN
+            if conn.user == "service@example.com":
+                conn.user = SERVICE_DN
+            return bind(*args, **kwargs)
+        conn.bind = upn_bind
+    # The mock can't run the extensible match of the active persons filter
+    ldap._tinyLDAP3Client__ldap_entries = lambda *args, **kwargs: []
+    is_bound, _ = ldap.person_auth("service@example.com", SERVICE_PASS)
+    assert is_bound
+    assert conn.user is None and conn.password is None and conn.authentication == ANONYMOUS
+    assert conn.bound and pool.stats["idle"] == 1
+
+
+def test_rebind_on_a_closed_socket_is_stale(client):
+    ldap = client()
+    pool = ldap._tinyLDAP3Client__auth_connection_pool
+    with pool.connection() as conn:
+        def closed_bind(*args, **kwargs):
+            conn.strategy.close()
+            raise LDAPSocketReceiveError("socket closed")
+        conn.bind = closed_bind
+    is_bound, result = ldap.person_auth("user1@example.com", "Wrong-Pass-1")
+    # Repeated on a new connection
+    assert not is_bound and result["result"] == 49
+    stats = pool.stats
+    assert stats["created"] == 2 and stats["discarded"] == 1 and stats["idle"] == 1
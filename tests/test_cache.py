@@ -0,0 +1,47 @@
+import time
+from ldap3 import MODIFY_REPLACE
+from suite import Directory
+
+
+def read(ldap) -> dict:
+    return ldap.object_detail("person", "cn", "user1", returned_attrs_collection=("cn", "mail"))
+
+
+def test_hits_are_copies(client):
+    ldap = client(cache_max_size=10)
+    first = read(ldap)
+    first["mail"] = "changed"
+    assert read(ldap)["mail"] == "user000001@example.com"
+    assert ldap.cache_stats["hits"] == 1
+    ldap.cache_clear()
+    assert ldap.cache_stats["size"] == 0
+
+
+def test_unchanged_stale_result_is_revalidated(client):
+    ldap = client(cache_max_size=10, cache_ttl=0.05, cache_revalidate=True)
+    expected = read(ldap)
+    assert expected == {"cn": "user1", "mail": "user000001@example.com"}
+    time.sleep(0.1)
+    assert read(ldap) == expected
+    stats = ldap.cache_stats
+    assert stats["stale"] == 1 and stats["revalidated"] == 1 and stats["invalidations"] == 0
+
+
+def test_changed_stale_result_is_invalidated(client, mock_connection):
+    ldap = client(cache_max_size=10, cache_ttl=0.05, cache_revalidate=True)
+    read(ldap)
+    mock_connection().modify(
+        Directory.person_dn(1),
+        {"uSNChanged": [(MODIFY_REPLACE, [9999])], "mail": [(MODIFY_REPLACE, ["new@example.com"])]}
+    )
+    time.sleep(0.1)
+    assert read(ldap)["mail"] == "new@example.com"
+    stats = ldap.cache_stats
+    assert stats["revalidated"] == 0 and stats["invalidations"] == 1
+
+
+def test_lru_eviction(client):
+    ldap = client(cache_max_size=2)
+    for i in range(3):
+        ldap.object_detail("person", "cn", f"user{i}", returned_attrs_collection=("cn",))
+    assert ldap.cache_stats["size"] == 2 and ldap.cache_stats["evictions"] == 1
@@ -0,0 +1,50 @@
+import pickle
+import pytest
+from ldap3 import MOCK_SYNC, Connection
+from suite import SERVICE_DN, SERVICE_PASS
+from tinyLDAP3.deferred import LdapDeferredObject
+from tinyLDAP3.exceptions import LdapDeferredError
+
+
+def counted_searches(ldap) -> list:
+    searches = []
+    pool = ldap._tinyLDAP3Client__connection_pool
+    with pool.connection() as conn:
+        search = conn.search
+
+        def counted_search(*args, **kwargs):
+            searches.append(kwargs.get("attributes"))
+            return search(*args, **kwargs)
+        conn.search = counted_search
+    return searches
+
+
+def test_deferred_attrs_are_read_once(client, directory):
+    ldap = client(cache_max_size=100, pool_max_size=1)
+    searches = counted_searches(ldap)
+    obj = ldap.object_detail("person", "cn", "user1", returned_attrs_collection=("cn", "memberOf"), deferred=True)
+    assert isinstance(obj, LdapDeferredObject)
+    assert obj.deferred == ("memberOf",)
+    assert "memberOf" not in obj
+    assert len(searches) == 1
+    assert len(obj["memberOf"]) == 3
+    assert obj.deferred == ()
+    assert len(searches) == 2
+    # The deferred read is cached like the detail
+    again = ldap.object_detail("person", "cn", "user1", returned_attrs_collection=("cn", "memberOf"), deferred=True)
+    assert again["memberOf"] == obj["memberOf"]
+    assert len(searches) == 2
+    assert pickle.loads(pickle.dumps(obj)) == dict(obj)
+
+
+def test_deleted_object(client, directory):
+    ldap = client()
+    obj = ldap.object_detail("person", "cn", "user2", returned_attrs_collection=("cn", "memberOf"), deferred=True)
+    conn = Connection(directory.server, user=SERVICE_DN, password=SERVICE_PASS, client_strategy=MOCK_SYNC)
+    conn.bind()
+    conn.delete(obj.dn)
+    with pytest.raises(KeyError):
+        obj["memberOf"]
+    with pytest.raises(LdapDeferredError):
+        obj.load()
+    assert obj.deferred == ("memberOf",)
@@ -0,0 +1,35 @@
+def test_missing_duplicate_and_repeated_values(client):
+    ldap = client()
+    result = ldap.objects_detail_many(
+        "person", "sAMAccountName", ["user000001", "USER000001", "user000002", "missing"],
+        returned_attrs_collection=("cn", "sAMAccountName")
+    )
+    # The first spelling of a value requested more than once is kept
+    assert result.objects == {
+        "user000001": {"cn": "user1", "sAMAccountName": "user000001"},
+        "user000002": {"cn": "user2", "sAMAccountName": "user000002"},
+    }
+    assert result.missing == ("missing",) and result.duplicates == () and result.repeated == ("USER000001",)
+
+
+def test_values_matched_by_several_objects(client):
+    ldap = client()
+    # Departments are shared by the persons `i` and `i + 50`
+    result = ldap.objects_detail_many(
+        "person", "department", ["Department 1"], returned_attrs_collection=("cn", "department")
+    )
+    assert result.duplicates == ("Department 1",)
+    assert sorted(values["cn"] for values in result.objects["Department 1"]) == ["user1", "user51"]
+
+
+def test_chunks_searched_in_parallel(client):
+    ldap = client()
+    values = [f"user{i:06d}" for i in range(10)] + ["missing"]
+    sequential = ldap.objects_detail_many(
+        "person", "sAMAccountName", values, returned_attrs_collection=("cn",), chunk_size=3
+    )
+    parallel = ldap.objects_detail_many(
+        "person", "sAMAccountName", values, returned_attrs_collection=("cn",), chunk_size=3, workers=3
+    )
+    assert parallel == sequential
+    assert len(parallel.objects) == 10 and parallel.missing == ("missing",)
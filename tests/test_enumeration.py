@@ -0,0 +1,80 @@
+import pytest
+from ldap3.core.exceptions import LDAPBusyResult
+from suite import SEARCH_BASE
+from tinyLDAP3.enumeration import (
+    LdapPartition,
+    LdapPartitionedEnumeration,
+    ldap_ou_partitions,
+    ldap_prefix_partitions,
+    ldap_usn_partitions
+)
+from tinyLDAP3.exceptions import LdapUnexpectedError
+from tinyLDAP3.filters import ldap_filter_compile
+
+
+def pages_source(pages: dict[str, list[list[str]]], failures: dict[str, int] = None, error=LDAPBusyResult):
+    failures = dict(failures or {})
+
+    def source(index, partition, attempt):
+        for page in pages[partition.key]:
+            yield [(dn, {"dn": dn}) for dn in page]
+            if failures.get(partition.key, 0) > attempt:
+                raise error("failed")
+    return source
+
+
+PAGES = {"a": [["CN=a1", "CN=a2"], ["CN=a3"]], "b": [["CN=b1"]], "c": [["CN=c1", "CN=c2"]]}
+
+
+def enumeration(source, **kwargs) -> LdapPartitionedEnumeration:
+    return LdapPartitionedEnumeration([LdapPartition(key) for key in PAGES], source, retry_delay=0, **kwargs)
+
+
+def test_ordered_partitions():
+    items = enumeration(pages_source(PAGES), workers=3, ordered=True)
+    assert [values["dn"] for values in items] == ["CN=a1", "CN=a2", "CN=a3", "CN=b1", "CN=c1", "CN=c2"]
+    assert items.stats == {"partitions": 3, "completed": 3, "retries": 0, "pages": 4, "objects": 6, "duplicates": 0}
+
+
+def test_retried_partition_skips_returned_objects():
+    items = enumeration(pages_source(PAGES, failures={"a": 1}), workers=2)
+    assert sorted(values["dn"] for values in items) == ["CN=a1", "CN=a2", "CN=a3", "CN=b1", "CN=c1", "CN=c2"]
+    assert items.stats["retries"] == 1 and items.stats["duplicates"] == 2
+
+
+def test_failed_partition_raises():
+    with pytest.raises(LDAPBusyResult):
+        list(enumeration(pages_source(PAGES, failures={"b": 3}), retries=2))
+    # Other errors aren't retried
+    items = enumeration(pages_source(PAGES, failures={"b": 1}, error=KeyError), ordered=True)
+    with pytest.raises(KeyError):
+        list(items)
+    assert items.stats["retries"] == 0
+
+
+def test_partition_builders():
+    assert ldap_ou_partitions(["OU=A", "OU=B"]) == (LdapPartition("OU=A", "OU=A"), LdapPartition("OU=B", "OU=B"))
+    partitions = ldap_prefix_partitions("cn", ("g", "m"))
+    assert [partition.key for partition in partitions] == ["cn:[, g)", "cn:[g, m)", "cn:[m, )"]
+    assert [ldap_filter_compile(partition.search_filter) for partition in partitions] == \
+        ["(!(cn>=g))", "(&(cn>=g)(!(cn>=m)))", "(cn>=m)"]
+    partitions = ldap_usn_partitions(100, 200, 4, host="dc1")
+    assert [partition.key for partition in partitions] == \
+        ["uSNChanged:[, 100)", "uSNChanged:[100, 150)", "uSNChanged:[150, 200)", "uSNChanged:[200, )"]
+    assert {partition.host for partition in partitions} == {"dc1"}
+    assert ldap_usn_partitions(1, 1, 1)[0].search_filter is None
+    with pytest.raises(ValueError):
+        ldap_usn_partitions(200, 100, 4)
+
+
+def test_client_enumerates_the_partitions(client):
+    ldap = client(hosts=("dc1", "dc2"))
+    partitions = ldap_ou_partitions([f"OU=Groups,{SEARCH_BASE}", f"OU=Computers,{SEARCH_BASE}"])
+    items = ldap.iter_objects_partitioned(
+        "group", partitions, returned_attrs_collection=("cn",), page_size=3, ordered=True
+    )
+    assert sorted(values["cn"] for values in items) == sorted(f"group{i}" for i in range(10))
+    assert items.stats["completed"] == 2 and items.stats["objects"] == 10
+    # Method errors are converted by `ldap_logging`
+    with pytest.raises(LdapUnexpectedError):
+        ldap.iter_objects_partitioned("group", [LdapPartition("x", host="dc3")])
@@ -0,0 +1,94 @@
+import gzip, io, json, uuid
+import pytest
+from suite import SEARCH_BASE
+from tinyLDAP3.enumeration import ldap_ou_partitions
+from tinyLDAP3.export import LdapExportWriter, ldap_export
+
+
+GUID = uuid.UUID("01234567-89ab-cdef-0123-456789abcdef")
+SID = bytes.fromhex("010500000000000515000000a1b2c3d4a1b2c3d4a1b2c3d4e8030000")
+ITEM = {
+    "CN": "user1",
+    "objectGUID": GUID.bytes_le,
+    "objectSid": SID,
+    "lastLogon": 132000000000000000,
+    "accountExpires": 0,
+    "thumbnailPhoto": b"\x00\x01",
+    "memberOf": ["CN=a", "CN=b"],
+    "title": "skipped",
+}
+ATTRS = ("cn", "objectGUID", "objectSid", "lastLogon", "accountExpires", "thumbnailPhoto", "memberOf", "mail")
+
+
+def test_ndjson_values_are_normalized():
+    stream = io.StringIO()
+    writer = LdapExportWriter(stream, ATTRS)
+    writer.write(ITEM)
+    # Keys are matched case-insensitively, other attributes are skipped, missing ones are null
+    assert json.loads(stream.getvalue()) == {
+        "cn": "user1",
+        "objectGUID": "{01234567-89ab-cdef-0123-456789abcdef}",
+        "objectSid": "S-1-5-21-3569595041-3569595041-3569595041-1000",
+        "lastLogon": "2019-04-17T18:40:00+00:00",
+        "accountExpires": None,
+        "thumbnailPhoto": "AAE=",
+        "memberOf": ["CN=a", "CN=b"],
+        "mail": None,
+    }
+    assert writer.objects == 1
+
+
+def test_csv_rows():
+    stream = io.StringIO()
+    writer = LdapExportWriter(stream, ("cn", "memberOf", "mail"), export_format="csv", multi_value_separator="|")
+    writer.write(ITEM)
+    assert stream.getvalue().splitlines() == ["cn,memberOf,mail", "user1,CN=a|CN=b,"]
+    with pytest.raises(ValueError):
+        LdapExportWriter(stream, ATTRS, export_format="xml")
+
+
+class Items:
+
+    """
+        Objects iterator with `close`, as the paged searches and enumerations.
+        """
+
+    def __init__(self, count: int):
+        self.closed = False
+        self.__items = iter({"cn": f"user{i}"} for i in range(count))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.__items)
+
+    def close(self):
+        self.closed = True
+
+
+def test_gzip_file_and_progress(tmp_path):
+    path = tmp_path / "persons.ndjson.gz"
+    items, reports = Items(5), []
+    result = ldap_export(items, path, ("cn",), progress=reports.append, progress_interval=2)
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        assert [json.loads(line)["cn"] for line in file] == [f"user{i}" for i in range(5)]
+    assert [report.objects for report in reports] == [2, 4, 5] and reports[-1] == result
+    assert result.bytes == path.stat().st_size and items.closed
+
+
+def test_client_export(client, tmp_path):
+    ldap = client()
+    stream = io.StringIO()
+    result = ldap.export_objects("group", stream, returned_attrs_collection=("cn", "member"), page_size=3)
+    rows = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert result.objects == 10 and result.bytes is None
+    assert sorted(row["cn"] for row in rows) == sorted(f"group{i}" for i in range(10))
+    assert all(isinstance(row["member"], list) for row in rows)
+    path = tmp_path / "computers.csv"
+    result = ldap.export_objects(
+        "computer", path, export_format="csv", returned_attrs_collection=("cn", "dNSHostName"),
+        partitions=ldap_ou_partitions([f"OU=Computers,{SEARCH_BASE}", f"OU=Users,{SEARCH_BASE}"]), workers=2
+    )
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert result.objects == 10 and lines[0] == "cn,dNSHostName" and len(lines) == 11
@@ -0,0 +1,101 @@
+import pytest
+from tinyLDAP3.filters import (
+    LdapAnd,
+    LdapEq,
+    LdapNot,
+    LdapOr,
+    LdapParam,
+    LdapSubstring,
+    ldap_filter_compile,
+    ldap_filter_format,
+    ldap_filter_optimize
+)
+from tinyLDAP3.queries import (
+    ldap_object_detail_query_selector,
+    ldap_object_read_query,
+    ldap_objects_detail_many_query_selector,
+    ldap_objects_partition_query,
+    ldap_objects_read_many_query,
+    ldap_objects_search_query_selector
+)
+
+
+GPO_DN = "CN={31B2F340-016D-11D2-945F-00C04FB984F9},CN=Policies,CN=System,DC=example,DC=com"
+
+
+def test_literal_braces_are_sent_as_is():
+    assert ldap_filter_compile(LdapEq("distinguishedName", GPO_DN)) == f"(distinguishedName={GPO_DN})"
+
+
+def test_template_braces_round_trip():
+    template = ldap_filter_compile(LdapAnd((LdapEq("cn", "{a}"), LdapEq("mail", LdapParam("mail")))))
+    assert ldap_filter_format(template, mail="{b}*") == r"(&(cn={a})(mail={b}\2a))"
+
+
+def test_substring_params():
+    template = ldap_filter_compile(LdapSubstring("cn", initial=LdapParam("prefix")))
+    assert ldap_filter_format(template, prefix="a(b") == r"(cn=a\28b*)"
+
+
+def test_optimize_flattens_and_drops_double_negation():
+    node = LdapAnd((LdapAnd((LdapEq("a", "1"), LdapEq("a", "1"))), LdapNot(LdapNot(LdapEq("b", "2")))))
+    assert ldap_filter_optimize(node) == LdapAnd((LdapEq("a", "1"), LdapEq("b", "2")))
+    assert ldap_filter_optimize(LdapOr((LdapEq("a", "1"),))) == LdapEq("a", "1")
+
+
+def test_queries_with_braced_values():
+    assert ldap_objects_detail_many_query_selector("group", "cn", ["{abc}", "x*"], False) == \
+        r"(&(objectCategory=Group)(|(cn={abc})(cn=x\2a)))"
+    assert ldap_objects_read_many_query(("group",), [GPO_DN]) == \
+        f"(&(objectClass=group)(distinguishedName={GPO_DN}))"
+    assert ldap_object_detail_query_selector("group", "cn", "{abc}", False) == "(&(objectCategory=Group)(cn={abc}))"
+
+
+def test_parameterless_queries():
+    assert ldap_object_read_query(("top", "group")) == "(&(objectClass=top)(objectClass=group))"
+    assert ldap_objects_partition_query("group", is_active=False) == "(objectCategory=Group)"
+    assert ldap_objects_partition_query("group", LdapSubstring("cn", initial="{a")) == \
+        "(&(objectCategory=Group)(cn={a*))"
+
+
+def test_rfc4515_specials_are_escaped():
+    value = "a*(b)\\c\x00"
+    escaped = r"a\2a\28b\29\5cc\00"
+    assert ldap_filter_compile(LdapEq("cn", value)) == f"(cn={escaped})"
+    assert ldap_filter_format(ldap_filter_compile(LdapEq("cn", LdapParam("cn"))), cn=value) == f"(cn={escaped})"
+    assert ldap_filter_compile(LdapSubstring("cn", initial=value, final=value)) == f"(cn={escaped}*{escaped})"
+
+
+@pytest.mark.parametrize(("search_mode", "expected"), [
+    ("contains", r"(&(objectCategory=Person)(objectClass=User)(|(cn=*a\2a\28b\29*)(mail=*a\2a\28b\29*)))"),
+    ("prefix", r"(&(objectCategory=Person)(objectClass=User)(|(cn=a\2a\28b\29*)(mail=a\2a\28b\29*)))"),
+    ("anr", r"(&(objectCategory=Person)(objectClass=User)(anr=a\2a\28b\29))"),
+    (None, r"(&(objectCategory=Person)(objectClass=User)(|(cn=a\2a\28b\29*)(mail=a\2a\28b\29*)))"),
+])
+def test_search_modes(search_mode, expected):
+    assert ldap_objects_search_query_selector("person", "a*(b)", ("cn", "mail"), search_mode) == expected
+
+
+def test_search_mode_defaults_by_category():
+    assert ldap_objects_search_query_selector("group", "a", None) == "(&(objectCategory=Group)(cn=*a*))"
+    assert ldap_objects_search_query_selector("computer", "a", None, "prefix") == "(&(objectCategory=Computer)(cn=a*))"
+
+
+def test_optimize_drops_negations_of_other_object_categories():
+    node = LdapAnd((LdapEq("objectCategory", "Person"), LdapNot(LdapEq("objectCategory", "Computer"))))
+    assert ldap_filter_optimize(node) == LdapEq("objectCategory", "Person")
+
+
+def test_optimize_keeps_negations_that_may_match():
+    person = LdapEq("objectCategory", "Person")
+    for node in (
+        # Multi-valued attribute: a computer is also a user
+        LdapAnd((LdapEq("objectClass", "user"), LdapNot(LdapEq("objectClass", "computer")))),
+        # The same category: the filter matches nothing
+        LdapAnd((person, LdapNot(LdapEq("objectCategory", "person")))),
+        LdapAnd((person, LdapNot(LdapEq("objectCategory", "CN=Person,CN=Schema,CN=Configuration,DC=example,DC=com")))),
+        # The parameter may be formatted to the same category
+        LdapAnd((person, LdapNot(LdapEq("objectCategory", LdapParam("category"))))),
+        LdapAnd((LdapEq("objectCategory", LdapParam("category")), LdapNot(LdapEq("objectCategory", "Computer")))),
+    ):
+        assert ldap_filter_optimize(node) == node
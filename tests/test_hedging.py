@@ -0,0 +1,105 @@
+import socket, threading, time
+import pytest
+from concurrent.futures import Future
+from ldap3.core.exceptions import LDAPSessionTerminatedByServerError, LDAPSocketReceiveError
+from types import SimpleNamespace
+from tinyLDAP3.hedging import LdapHedgeLeg, ldap_hedge_answer
+from tinyLDAP3.pool import LDAP_STALE_CONNECTION_ERRORS_TUPLE
+
+
+def test_primary_waiting_for_the_pool_isnt_hedged(client):
+    ldap = client(
+        hosts=("benchmark", "replica"), hedge=True, hedge_delay=0.01, hedge_budget=1, pool_max_size=1,
+        pool_wait_timeout=2
+    )
+    results = []
+    with ldap._tinyLDAP3Client__connection_pool.connection():
+        thread = threading.Thread(
+            target=lambda: results.append(
+                ldap.object_detail("person", "cn", "user1", returned_attrs_collection=("cn",))
+            )
+        )
+        thread.start()
+        time.sleep(0.1)
+    thread.join()
+    assert results == [{"cn": "user1"}]
+    assert ldap.hedge_stats["hedged"] == 0
+
+
+def test_slow_primary_is_hedged(client):
+    ldap = client(hosts=("benchmark", "replica"), hedge=True, hedge_delay=0.01, hedge_budget=1)
+    pool = ldap._tinyLDAP3Client__connection_pool
+    with pool.connection() as conn:
+        search = conn.search
+
+        def slow_search(*args, **kwargs):
+            time.sleep(0.1)
+            return search(*args, **kwargs)
+        conn.search = slow_search
+    assert ldap.object_detail("person", "cn", "user1", returned_attrs_collection=("cn",)) == {"cn": "user1"}
+    assert ldap.hedge_stats["hedged"] == 1
+
+
+def test_success_wins_over_a_failure_completed_together():
+    primary, hedge = Future(), Future()
+    primary.set_exception(LDAPSocketReceiveError("socket closed"))
+    hedge.set_result("answer")
+    assert ldap_hedge_answer((primary, hedge), {primary, hedge}, set()) is hedge
+    assert ldap_hedge_answer((primary, hedge), {primary}, {hedge}) is None
+    hedge = Future()
+    hedge.set_exception(LDAPSocketReceiveError("socket closed"))
+    assert ldap_hedge_answer((primary, hedge), {primary, hedge}, set()) is primary
+
+
+def test_abandoned_leg_isnt_run(mock_connection):
+    calls = []
+    leg = LdapHedgeLeg(calls.append)
+    leg.abandon()
+    with pytest.raises(Exception, match="abandoned"):
+        leg(mock_connection())
+    assert calls == []
+
+
+def test_abandoned_running_leg_socket_is_shut_down():
+    local, remote = socket.socketpair()
+    conn = SimpleNamespace(server=SimpleNamespace(host="benchmark"), socket=local, closed=False)
+    conn.strategy = SimpleNamespace(close=lambda: setattr(conn, "closed", True))
+
+    def operation(leg_conn):
+        if not leg_conn.socket.recv(1):
+            raise LDAPSessionTerminatedByServerError("session terminated by server")
+
+    leg = LdapHedgeLeg(operation)
+    errors = []
+
+    def run():
+        try:
+            leg(conn)
+        except Exception as err:
+            errors.append(err)
+    thread = threading.Thread(target=run)
+    thread.start()
+    while leg.host is None:
+        time.sleep(0.01)
+    leg.abandon()
+    thread.join(1)
+    # Not a stale connection error: the pool doesn't repeat the abandoned operation
+    assert not isinstance(errors[0], LDAP_STALE_CONNECTION_ERRORS_TUPLE)
+    assert conn.closed
+    local.close()
+    remote.close()
+
+
+def test_slow_primary_connection_is_discarded(client):
+    ldap = client(hosts=("benchmark", "replica"), hedge=True, hedge_delay=0.01, hedge_budget=1)
+    pool = ldap._tinyLDAP3Client__connection_pool
+    with pool.connection() as conn:
+        search = conn.search
+
+        def slow_search(*args, **kwargs):
+            time.sleep(0.1)
+            return search(*args, **kwargs)
+        conn.search = slow_search
+    ldap.object_detail("person", "cn", "user1", returned_attrs_collection=("cn",))
+    time.sleep(0.2)
+    assert pool.stats["discarded"] == 1 and pool.stats["size"] == 0
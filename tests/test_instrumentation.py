@@ -0,0 +1,133 @@
+import pytest
+from tinyLDAP3 import instrumentation
+from tinyLDAP3.instrumentation import (
+    LdapInMemoryCollector,
+    LdapInstrumentation,
+    LdapOtelSpanHook,
+    ldap_metrics_prometheus
+)
+
+
+def metric(snapshot: dict, kind: str, name: str, **labels) -> dict:
+    return next(item for item in snapshot[kind] if item["name"] == name and item["labels"] == labels)
+
+
+def test_histograms_are_cumulative():
+    collector = LdapInMemoryCollector(buckets={"x_seconds": (0.1, 1)})
+    for value in (0.05, 0.1, 0.5, 5):
+        collector.observe("x_seconds", value, {"method": "m"})
+    collector.inc("x_total", 2)
+    snapshot = collector.snapshot()
+    histogram = metric(snapshot, "histograms", "x_seconds", method="m")
+    assert histogram["buckets"] == {0.1: 2, 1: 3, float("inf"): 4}
+    assert histogram["count"] == 4 and histogram["sum"] == pytest.approx(5.65)
+    assert metric(snapshot, "counters", "x_total")["value"] == 2
+
+
+def test_client_methods_and_phases_are_recorded(client):
+    metrics = LdapInstrumentation()
+    ldap = client(instrumentation=metrics)
+    ldap.object_detail("group", "cn", "group1", returned_attrs_collection=("cn",))
+    with pytest.raises(Exception):
+        ldap.object_detail("unknown", "cn", "group1")
+    snapshot = metrics.snapshot()
+    assert metric(snapshot, "histograms", "method_duration_seconds", method="object_detail")["count"] == 2
+    assert [item["labels"]["method"] for item in snapshot["counters"] if item["name"] == "method_errors_total"] == \
+        ["object_detail"]
+    for phase in ("search", "decode"):
+        assert metric(snapshot, "histograms", "phase_duration_seconds", method="object_detail", phase=phase)["count"]
+    assert metric(snapshot, "histograms", "entries_returned", method="object_detail")["sum"] == 1
+    assert any(gauge["name"].startswith("pool_") for gauge in snapshot["gauges"])
+
+
+def test_prometheus_text_format():
+    snapshot = {
+        "counters": [{"name": "errors_total", "labels": {"type": 'a\\b"c\nd'}, "value": 3}],
+        "gauges": [{"name": "pool_idle", "labels": {}, "value": 2.5}],
+        "histograms": [
+            {"name": "x_seconds", "labels": {"m": "o"}, "count": 1, "sum": 0.5, "buckets": {1: 1, float("inf"): 1}}
+        ],
+    }
+    assert ldap_metrics_prometheus(snapshot).splitlines() == [
+        "# TYPE tinyldap3_errors_total counter",
+        # A line feed in a label value is escaped, not removed
+        'tinyldap3_errors_total{type="a\\\\b\\"c\\nd"} 3',
+        "# TYPE tinyldap3_pool_idle gauge",
+        "tinyldap3_pool_idle 2.5",
+        "# TYPE tinyldap3_x_seconds histogram",
+        'tinyldap3_x_seconds_bucket{m="o",le="1"} 1',
+        'tinyldap3_x_seconds_bucket{m="o",le="+Inf"} 1',
+        'tinyldap3_x_seconds_sum{m="o"} 0.5',
+        'tinyldap3_x_seconds_count{m="o"} 1',
+    ]
+
+
+class FakeSpan:
+    def __init__(self, name: str, parent):
+        self.name, self.parent, self.ended, self.errors = name, parent, False, []
+
+    def record_exception(self, error):
+        self.errors.append(error)
+
+    def set_attribute(self, key, value):
+        pass
+
+    def end(self):
+        self.ended = True
+
+
+class FakeOtel:
+
+    """
+        OpenTelemetry context & trace API: the current span is the top of the attached contexts.
+        """
+
+    def __init__(self):
+        self.stack, self.spans = [None], []
+
+    def attach(self, span_context):
+        self.stack.append(span_context)
+        return len(self.stack) - 1
+
+    def detach(self, token):
+        # Tokens must be detached in the reverse order of attaching
+        assert token == len(self.stack) - 1
+        self.stack.pop()
+
+    @staticmethod
+    def set_span_in_context(span):
+        return span
+
+    def start_span(self, name, attributes=None):
+        span = FakeSpan(name, self.stack[-1])
+        self.spans.append(span)
+        return span
+
+
+def test_otel_phase_spans_are_children_of_the_method_span(client, monkeypatch):
+    otel = FakeOtel()
+    monkeypatch.setattr(instrumentation, "otel_context", otel)
+    monkeypatch.setattr(instrumentation, "otel_trace", otel)
+    ldap = client(instrumentation=LdapInstrumentation(span_hooks=[LdapOtelSpanHook(otel)]))
+    ldap.object_detail("group", "cn", "group1", returned_attrs_collection=("cn",))
+    method_span = next(span for span in otel.spans if span.name == "tinyldap3.object_detail")
+    phase_spans = [span for span in otel.spans if span is not method_span]
+    assert method_span.parent is None and {span.name for span in phase_spans} >= {"tinyldap3.search"}
+    assert all(span.parent is method_span for span in phase_spans)
+    assert all(span.ended for span in otel.spans) and otel.stack == [None]
+
+
+def test_otel_span_records_the_error(monkeypatch):
+    otel = FakeOtel()
+    monkeypatch.setattr(instrumentation, "otel_context", otel)
+    monkeypatch.setattr(instrumentation, "otel_trace", otel)
+    metrics = LdapInstrumentation(span_hooks=[LdapOtelSpanHook(otel)])
+    error = ValueError("failed")
+    metrics.method_end(metrics.method_start("object_detail"), error)
+    assert otel.spans[0].errors == [error] and otel.spans[0].ended and otel.stack == [None]
+
+
+def test_otel_hook_requires_opentelemetry(monkeypatch):
+    monkeypatch.setattr(instrumentation, "otel_context", None)
+    with pytest.raises(ImportError):
+        LdapOtelSpanHook(object())
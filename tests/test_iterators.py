@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+from ldap3.core.exceptions import LDAPSocketReceiveError
+from suite import HOST, SEARCH_BASE, SERVICE_DN, SERVICE_PASS
+from tinyLDAP3 import AsyncTinyLDAP3Client
+from tinyLDAP3.exceptions import LdapConnectionError
+
+
+def test_paged_search_pages(client):
+    ldap = client()
+    search = ldap.iter_objects_search("group", "group", page_size=3, search_by_attrs_collection=("cn",))
+    assert len(list(search)) == 10
+    assert search.pages == 4 and search.done
+
+
+def test_paged_search_cookie_advances_after_the_page(client):
+    ldap = client()
+    search = ldap.iter_objects_search("group", "group", page_size=3, search_by_attrs_collection=("cn",))
+    items = [next(search) for _ in range(2)]
+    # The rest of the first page hasn't been consumed
+    assert search.pages == 1 and search.cookie is None
+    items += [next(search) for _ in range(2)]
+    assert search.pages == 2 and search.cookie is not None
+    # The stopped search is resumed by the same iterator on its held connection
+    items += list(search)
+    assert len({item["distinguishedName"] for item in items}) == 10
+    assert search.cookie is None and search.done
+
+
+def test_iteration_errors_are_converted(client):
+    ldap = client()
+    with ldap._tinyLDAP3Client__connection_pool.connection() as conn:
+        search = conn.search
+
+        def failing_search(*args, **kwargs):
+            if kwargs.get("paged_cookie"):
+                raise LDAPSocketReceiveError("socket closed")
+            return search(*args, **kwargs)
+        conn.search = failing_search
+    iterator = ldap.iter_objects_search("group", "group", page_size=3, search_by_attrs_collection=("cn",))
+    with pytest.raises(LdapConnectionError):
+        list(iterator)
+
+
+def test_missing_object_ends_the_iteration(client):
+    ldap = client()
+    assert list(ldap.iter_attr_values(f"CN=missing,{SEARCH_BASE}")) == []
+
+
+def test_async_missing_object_ends_the_iteration(directory):
+    async def run():
+        async with AsyncTinyLDAP3Client(
+                user_dn=SERVICE_DN, user_pass=SERVICE_PASS, search_base=SEARCH_BASE, hosts=[HOST]
+        ) as ldap:
+            return [value async for value in ldap.iter_attr_values(f"CN=missing,{SEARCH_BASE}")]
+
+    assert asyncio.run(run()) == []
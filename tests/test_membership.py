@@ -0,0 +1,95 @@
+import pytest
+from ldap3 import BASE, MODIFY_ADD
+from suite import Directory
+from tinyLDAP3.membership import LdapGroupGraph
+
+
+def graph_fetch(graph: dict[str, tuple[str, ...]], calls: list[list[str]]):
+    def fetch(dns: list[str], groups_only: bool) -> list[tuple[str, tuple[str, ...]]]:
+        calls.append(dns)
+        return [(dn, graph[dn]) for dn in dns if dn in graph]
+    return fetch
+
+
+def test_expansion_terminates_and_reports_cycles():
+    calls = []
+    fetch = graph_fetch({"CN=u": ("CN=g1",), "CN=g1": ("CN=g2",), "CN=g2": ("CN=g1", "CN=g3")}, calls)
+    result = LdapGroupGraph().expand("CN=u", "groups", fetch)
+    assert result.dns == ("CN=g1", "CN=g2", "CN=g3")
+    # (member, group) edge closing the cycle
+    assert result.cycles == (("CN=g2", "CN=g1"),)
+    # One batch per level
+    assert calls == [["CN=u"], ["CN=g1"], ["CN=g2"], ["CN=g3"]]
+    with pytest.raises(ValueError):
+        LdapGroupGraph().expand("CN=u", "parents", fetch)
+
+
+def test_graph_nodes_are_memoised():
+    calls = []
+    fetch = graph_fetch({"CN=a": ("CN=g1",), "CN=b": ("CN=g1",), "CN=g1": ("CN=g2",)}, calls)
+    graph = LdapGroupGraph()
+    graph.expand("CN=a", "groups", fetch)
+    assert graph.expand("CN=b", "groups", fetch).dns == ("CN=g1", "CN=g2")
+    # Groups of `CN=b` are read once
+    assert calls[3:] == [["CN=b"]]
+    stats = graph.stats
+    assert stats["size"] == 4 and stats["expansions"] == 2 and stats["hits"] == 2
+    expired = LdapGroupGraph(ttl=0)
+    for _ in range(2):
+        expired.expand("CN=a", "groups", fetch)
+    assert expired.stats["hits"] == 0
+
+
+def test_graph_size_is_bounded():
+    fetch = graph_fetch({f"CN=u{i}": ("CN=g",) for i in range(3)}, [])
+    graph = LdapGroupGraph(max_size=2)
+    for i in range(3):
+        graph.expand(f"CN=u{i}", "groups", fetch)
+    assert graph.stats["size"] == 2 and graph.stats["evictions"] > 0
+    with pytest.raises(ValueError):
+        LdapGroupGraph(max_size=0)
+
+
+def nest(mock_connection, member: int, group: int) -> None:
+    # The mock doesn't maintain the `memberOf` back link
+    conn = mock_connection()
+    conn.modify(Directory.group_dn(group), {"member": [(MODIFY_ADD, [Directory.group_dn(member)])]})
+    conn.modify(Directory.group_dn(member), {"memberOf": [(MODIFY_ADD, [Directory.group_dn(group)])]})
+
+
+def linked_values(mock_connection, dn: str, attr_name: str) -> list[str]:
+    conn = mock_connection()
+    conn.search(dn, "(objectClass=*)", BASE, attributes=[attr_name])
+    return list(conn.response[0]["attributes"][attr_name])
+
+
+def test_bfs_expansion_of_nested_groups(client, mock_connection):
+    nest(mock_connection, 1, 0)
+    nest(mock_connection, 0, 1)
+    ldap = client()
+    members = ldap.group_members(Directory.group_dn(0), strategy="bfs")
+    expected = set(linked_values(mock_connection, Directory.group_dn(0), "member")) | \
+        set(linked_values(mock_connection, Directory.group_dn(1), "member"))
+    assert set(members.dns) == expected and Directory.group_dn(0) in members.dns
+    assert members.cycles
+    person_dn = next(dn for dn in linked_values(mock_connection, Directory.group_dn(1), "member") if "user" in dn)
+    groups = ldap.object_groups(person_dn, strategy="BFS")
+    assert {Directory.group_dn(0), Directory.group_dn(1)} <= set(groups.dns)
+    assert ldap.membership_stats["expansions"] == 2
+
+
+def test_chain_strategy_query(client):
+    ldap = client()
+    queries = []
+
+    def membership_chain(search_query):
+        queries.append(search_query)
+        return ["CN=b", "CN=a"]
+    # The mock can't run the `LDAP_MATCHING_RULE_IN_CHAIN` extensible match
+    ldap._tinyLDAP3Client__ldap_membership_chain = membership_chain
+    assert ldap.object_groups("CN=u(1),DC=example,DC=com").dns == ("CN=a", "CN=b")
+    ldap.group_members("CN=g,DC=example,DC=com")
+    assert queries == [
+        r"(&(objectCategory=Group)(member:1.2.840.113556.1.4.1941:=CN=u\281\29,DC=example,DC=com))",
+        "(memberOf:1.2.840.113556.1.4.1941:=CN=g,DC=example,DC=com)",
+    ]
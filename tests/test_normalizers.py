@@ -0,0 +1,94 @@
+import datetime, uuid
+import pytest
+from tinyLDAP3 import normalizers
+from tinyLDAP3.normalizers import (
+    ldap_filetime_to_datetime,
+    ldap_guid_to_str,
+    ldap_normalize_columns,
+    ldap_normalize_items,
+    ldap_sam_account_type,
+    ldap_sid_to_str,
+    ldap_uac_flags
+)
+from tinyLDAP3.results import LdapResultSet
+
+
+FILETIME = 132000000000000000
+FILETIME_UTC = datetime.datetime(2019, 4, 17, 18, 40)
+GUID = uuid.UUID("01234567-89ab-cdef-0123-456789abcdef")
+SID = bytes.fromhex("010500000000000515000000a1b2c3d4a1b2c3d4a1b2c3d4e8030000")
+
+
+def test_filetime_values():
+    assert ldap_filetime_to_datetime(FILETIME) == FILETIME_UTC.replace(tzinfo=datetime.timezone.utc)
+    assert ldap_filetime_to_datetime(str(FILETIME), naive=True) == FILETIME_UTC
+    # Not set, never expires, invalid and out of the datetime range values
+    for value in (0, 0x7FFFFFFFFFFFFFFF, -1, 0x7FFFFFFFFFFFFFFE):
+        assert ldap_filetime_to_datetime(value) is None
+
+
+def test_binary_and_flag_values():
+    assert ldap_guid_to_str(GUID.bytes_le) == "{01234567-89ab-cdef-0123-456789abcdef}"
+    assert ldap_sid_to_str(SID) == "S-1-5-21-3569595041-3569595041-3569595041-1000"
+    assert ldap_uac_flags(0x202) == {"ACCOUNTDISABLE", "NORMAL_ACCOUNT"}
+    assert ldap_uac_flags(0x200 | 0x8000000) == {"NORMAL_ACCOUNT", "0x8000000"}
+    assert ldap_sam_account_type(805306368) == "SAM_NORMAL_USER_ACCOUNT" and ldap_sam_account_type(1) is None
+
+
+def test_items_are_normalized_in_place():
+    items = [
+        {
+            "pwdLastSet": FILETIME,
+            "accountExpires": datetime.datetime(9999, 12, 31, 23, 59, 59, tzinfo=datetime.timezone.utc),
+            "lastLogon": datetime.datetime(2019, 4, 17, 20, 40, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+            "objectGUID": GUID.bytes_le,
+            "sIDHistory": [SID],
+            "userAccountControl": "514",
+            "sAMAccountType": 805306368,
+            "cn": "user1",
+        },
+        {"userAccountControl": 514, "pwdLastSet": None, "cn": "user2"},
+    ]
+    result = ldap_normalize_items(items, normalizers={"CN": str.upper})
+    assert result is items
+    assert items[0] == {
+        "pwdLastSet": FILETIME_UTC,
+        "accountExpires": None,
+        "lastLogon": FILETIME_UTC,
+        "objectGUID": "{01234567-89ab-cdef-0123-456789abcdef}",
+        "sIDHistory": ["S-1-5-21-3569595041-3569595041-3569595041-1000"],
+        "userAccountControl": frozenset({"ACCOUNTDISABLE", "NORMAL_ACCOUNT"}),
+        "sAMAccountType": "SAM_NORMAL_USER_ACCOUNT",
+        "cn": "USER1",
+    }
+    assert items[1] == {"userAccountControl": frozenset({"ACCOUNTDISABLE", "NORMAL_ACCOUNT"}), "pwdLastSet": None,
+                        "cn": "USER2"}
+
+
+COLUMNS_ATTRS = ("pwdLastSet", "userAccountControl", "memberOf")
+COLUMNS = [[FILETIME, None, 0, str(FILETIME)], [512, 514, 512, None], [["CN=a"], None, "CN=b", []]]
+
+
+def test_columns_match_the_items():
+    items = [dict(zip(COLUMNS_ATTRS, row)) for row in zip(*COLUMNS)]
+    expected = [[item[attr_name] for item in ldap_normalize_items(items)] for attr_name in COLUMNS_ATTRS]
+    assert ldap_normalize_columns(COLUMNS_ATTRS, COLUMNS, vectorize=False) == expected
+    assert expected[0] == [FILETIME_UTC, None, None, FILETIME_UTC]
+
+
+def test_vectorized_columns():
+    if normalizers.numpy is None:
+        with pytest.raises(ImportError):
+            ldap_normalize_columns(COLUMNS_ATTRS, COLUMNS, vectorize=True)
+        # Without NumPy the columns are normalized value by value
+        assert ldap_normalize_columns(COLUMNS_ATTRS, COLUMNS) == \
+            ldap_normalize_columns(COLUMNS_ATTRS, COLUMNS, vectorize=False)
+    else:
+        assert ldap_normalize_columns(COLUMNS_ATTRS, COLUMNS, vectorize=True) == \
+            ldap_normalize_columns(COLUMNS_ATTRS, COLUMNS, vectorize=False)
+
+
+def test_result_set_normalize():
+    result_set = LdapResultSet(("cn", "pwdLastSet"), [("user1", FILETIME), ("user2", 0)]).normalize()
+    assert result_set.rows == [("user1", FILETIME_UTC), ("user2", None)]
+    assert LdapResultSet(("cn",)).normalize().rows == []
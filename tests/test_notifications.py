@@ -0,0 +1,124 @@
+import itertools, threading, uuid
+from ldap3 import SYNC
+from types import SimpleNamespace
+from suite import HOST, SEARCH_BASE, Directory
+from tinyLDAP3.notifications import (
+    LDAP_NOTIFICATION_CONTROL,
+    LdapChangeCheckpoint,
+    LdapChangeSubscription,
+    ldap_change_event
+)
+
+
+PERSON_CLASSES = ["top", "person", "organizationalPerson", "user"]
+GUID = uuid.UUID("01234567-89ab-cdef-0123-456789abcdef")
+
+
+class StreamConnection:
+
+    """
+        `ASYNC_STREAM` connection of the notification searches: entries are pushed by `notify`.
+        """
+
+    def __init__(self, server):
+        self.server = server
+        self.closed, self.bound, self.listening = False, True, True
+        self.strategy = SimpleNamespace(async_lock=threading.Lock(), _responses={}, accumulate_stream=None)
+        self.searches, self.abandoned = {}, []
+        self.__message_ids = itertools.count(1)
+
+    def search(self, search_base, search_filter, search_scope, attributes, controls):
+        message_id = next(self.__message_ids)
+        self.searches[message_id] = (search_base, controls)
+        return message_id
+
+    def abandon(self, message_id):
+        self.abandoned.append(message_id)
+
+    def unbind(self):
+        self.closed = True
+
+    def notify(self, dn: str, **attributes):
+        for message_id in self.searches:
+            self.strategy.accumulate_stream(message_id, {"type": "searchResEntry", "dn": dn, "attributes": attributes})
+
+
+def subscription(mock_connection, streams: list, **kwargs) -> LdapChangeSubscription:
+
+    def connect(server, client_strategy):
+        if client_strategy != SYNC:
+            streams.append(StreamConnection(server))
+            return streams[-1]
+        conn = mock_connection()
+        search = conn.search
+
+        def search_without_controls(*args, **search_kwargs):
+            # The mock can't run searches with the Show Deleted control
+            return search(*args, **{**search_kwargs, "controls": None})
+        conn.search = search_without_controls
+        return conn
+
+    return LdapChangeSubscription([SEARCH_BASE], connect, check_interval=0.05, **kwargs).start()
+
+
+def person_entry(i: int, usn: int, **attributes) -> dict:
+    return {
+        "objectClass": PERSON_CLASSES, "objectGUID": GUID.bytes_le, "uSNChanged": usn, "uSNCreated": 1000 + i,
+        "distinguishedName": Directory.person_dn(i), "userAccountControl": 514, **attributes
+    }
+
+
+def test_change_events():
+    event = ldap_change_event("CN=x", person_entry(1, 1001), HOST, ("person",))
+    assert (event.change_type, event.object_category, event.dn) == ("added", "person", Directory.person_dn(1))
+    assert event.guid == "{01234567-89ab-cdef-0123-456789abcdef}" and event.disabled
+    assert ldap_change_event("CN=x", person_entry(1, 2000), HOST, ("person",)).change_type == "modified"
+    assert ldap_change_event("CN=x", person_entry(1, 2000, isDeleted="TRUE"), HOST, ("person",)).change_type == \
+        "deleted"
+    # `computer` is derived from `user`
+    computer = {"objectClass": [*PERSON_CLASSES, "computer"], "uSNChanged": 5}
+    assert ldap_change_event("CN=ws", computer, HOST, ("person", "computer")).object_category == "computer"
+    assert ldap_change_event("CN=ws", computer, HOST, ("person",)) is None
+    assert ldap_change_event("CN=g", {"objectClass": ["top", "group"]}, HOST, ("group",)).disabled is None
+
+
+def test_notified_changes_are_delivered_once(mock_connection):
+    streams = []
+    with subscription(mock_connection, streams, object_categories=("person",)) as changes:
+        stream = streams[0]
+        assert all(controls[0] == LDAP_NOTIFICATION_CONTROL for _, controls in stream.searches.values())
+        stream.notify(Directory.person_dn(1), **person_entry(1, 5000))
+        stream.notify(Directory.person_dn(1), **person_entry(1, 5000))
+        stream.notify(Directory.group_dn(1), objectClass=["top", "group"], uSNChanged=5001)
+        event = next(changes)
+        assert (event.change_type, event.usn, event.host, event.catch_up) == ("modified", 5000, HOST, False)
+        assert changes.checkpoints[SEARCH_BASE].usn == 5001
+        assert changes.stats["events"] == 1 and changes.stats["duplicates"] == 1
+    assert list(changes) == [] and stream.closed and sorted(stream.abandoned) == sorted(stream.searches)
+
+
+def test_missed_changes_are_caught_up(mock_connection):
+    streams, events = [], []
+    # Persons `uSNChanged` are 1001-1100
+    checkpoints = {SEARCH_BASE: LdapChangeCheckpoint(host=HOST, usn=1097, time=0)}
+    with subscription(
+            mock_connection, streams, object_categories=("person",), callback=events.append, checkpoints=checkpoints
+    ) as changes:
+        assert sorted(event.usn for event in events) == [1098, 1099, 1100]
+        assert all(event.catch_up for event in events) and changes.stats["catch_up"] == 3
+        assert changes.checkpoints[SEARCH_BASE].usn == 1097
+        # A caught up change notified again isn't delivered twice
+        streams[0].notify(events[0].dn, **events[0].values)
+        assert len(events) == 3 and changes.stats["duplicates"] == 1
+
+
+def test_ended_stream_is_reopened(mock_connection):
+    streams = []
+    with subscription(mock_connection, streams) as changes:
+        streams[0].listening = False
+        for _ in range(100):
+            if changes.stats["reconnects"]:
+                break
+            threading.Event().wait(0.05)
+        assert changes.stats["reconnects"] == 1 and len(streams) == 2 and streams[0].closed
+        assert changes.stats["connected"] == 1
@@ -0,0 +1,104 @@
+import pytest
+from pydantic import ValidationError
+from tinyLDAP3.models import LdapObjectDetailModel, LdapObjecsSearchModel, LdapPersonAuthModel
+from tinyLDAP3.plans import ldap_object_detail_plan, ldap_objects_search_plan, ldap_person_auth_plan
+from tinyLDAP3.queries import ldap_object_detail_query_selector, ldap_objects_search_query_selector
+
+
+# Requests as they were validated per call by the models before the plans
+
+def model_detail(object_category, attr_name, attr_value, is_active, returned_attrs_collection) -> tuple:
+    data = LdapObjectDetailModel(
+        method_type="detail", object_category=object_category, attr_name=attr_name, attr_value=attr_value,
+        returned_attrs_collection=returned_attrs_collection
+    ).model_dump()
+    category = data["object_category"].value
+    return (
+        category, data["attr_name"], tuple(data["returned_attrs_collection"]),
+        ldap_object_detail_query_selector(category, data["attr_name"], data["attr_value"], is_active)
+    )
+
+
+def plan_detail(object_category, attr_name, attr_value, is_active, returned_attrs_collection) -> tuple:
+    plan = ldap_object_detail_plan(object_category, attr_name, attr_value, is_active, returned_attrs_collection)
+    return plan.object_category, plan.attr_name, plan.returned_attrs, plan.query(attr_value)
+
+
+def model_search(object_category, attr_value, order_by, search_by_attrs, returned_attrs, search_mode) -> tuple:
+    data = LdapObjecsSearchModel(
+        method_type="search", object_category=object_category, attr_value=attr_value, order_by=order_by,
+        search_by_attrs_collection=search_by_attrs, returned_attrs_collection=returned_attrs, search_mode=search_mode
+    ).model_dump()
+    category = data["object_category"].value
+    search_mode = data["search_mode"].value if data["search_mode"] else None
+    return (
+        category, tuple(data["returned_attrs_collection"]), search_mode,
+        ldap_objects_search_query_selector(category, attr_value, data["search_by_attrs_collection"], search_mode)
+    )
+
+
+def plan_search(object_category, attr_value, order_by, search_by_attrs, returned_attrs, search_mode) -> tuple:
+    plan = ldap_objects_search_plan(object_category, attr_value, order_by, search_by_attrs, returned_attrs, search_mode)
+    return plan.object_category, plan.returned_attrs, plan.search_mode, plan.query(attr_value)
+
+
+def outcome(function, *args) -> tuple:
+    try:
+        return "result", function(*args)
+    except ValidationError as err:
+        return "error", ValidationError, [(error["loc"], error["type"]) for error in err.errors()]
+    except Exception as err:
+        return "error", type(err), str(err)
+
+
+@pytest.mark.parametrize("args", [
+    ("person", "sAMAccountName", "user1", True, None),
+    ("person", "mail", "a*(b)", False, ["cn", "mail"]),
+    ("group", "cn", "{abc}", False, ("cn",)),
+    ("computer", "cn", "ws1", True, ["cn", "dNSHostName"]),
+    # Invalid input: validated by the model
+    ("person", "cn", "", True, None),
+    ("person", "cn", None, True, None),
+    ("person", "cn", 1, True, None),
+    ("person", "", "user1", True, None),
+    ("user", "cn", "user1", True, None),
+    # Unhashable returned attributes: the plan memoisation raises TypeError
+    ("group", "cn", "group1", False, [["cn"]]),
+])
+def test_object_detail_parity(args):
+    assert outcome(plan_detail, *args) == outcome(model_detail, *args)
+
+
+@pytest.mark.parametrize("args", [
+    ("person", "user", "sAMAccountName", None, None, None),
+    ("person", "user", "sAMAccountName", ("cn", "mail"), ["cn"], "anr"),
+    ("group", "a*b", "cn", None, None, "contains"),
+    ("computer", "ws", "cn", ["cn"], None, "prefix"),
+    # Invalid input: validated by the model
+    ("person", "", "sAMAccountName", None, None, None),
+    ("person", "user", "", None, None, None),
+    ("group", "a", "cn", None, None, "fuzzy"),
+    ("printer", "a", "cn", None, None, None),
+])
+def test_objects_search_parity(args):
+    assert outcome(plan_search, *args) == outcome(model_search, *args)
+
+
+@pytest.mark.parametrize(("login", "password", "returned_attrs"), [
+    ("user1@example.com", "Password-1", None),
+    ("first.last@sub.example.com", "Password-1", ["cn", "mail"]),
+    ("user1@example.com", "short", None),
+    ("user1", "Password-1", None),
+    ("User@Example.com", "Password-1", None),
+    (None, "Password-1", None),
+])
+def test_person_auth_parity(login, password, returned_attrs):
+    def model(*args) -> tuple:
+        data = LdapPersonAuthModel(login=args[0], password=args[1], returned_attrs_collection=args[2]).model_dump()
+        return tuple(data["returned_attrs_collection"])
+
+    def plan(*args) -> tuple:
+        return ldap_person_auth_plan(*args).returned_attrs
+
+    assert outcome(plan, login, password, returned_attrs) == outcome(model, login, password, returned_attrs)
+
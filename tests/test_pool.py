@@ -0,0 +1,88 @@
+import time
+import pytest
+from ldap3 import SUBTREE
+from ldap3.core.exceptions import LDAPSocketReceiveError
+from suite import SEARCH_BASE
+from tinyLDAP3.pool import LdapConnectionPool
+
+
+def observed_pool(mock_connection, **kwargs) -> tuple[LdapConnectionPool, list]:
+    observed = []
+    pool = LdapConnectionPool(
+        connection_factory=mock_connection,
+        observer=lambda conn, latency, error: observed.append((latency, error)),
+        **kwargs
+    )
+    return pool, observed
+
+
+def test_reuses_connections(mock_connection):
+    pool, _ = observed_pool(mock_connection, min_size=0, max_size=2)
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        assert second is first
+    assert pool.stats == {
+        "size": 1, "idle": 1, "borrowed": 0, "created": 1, "discarded": 0, "evicted": 0, "rebound": 0, "waits": 0
+    }
+
+
+def test_observes_operations_not_borrows(mock_connection):
+    pool, observed = observed_pool(mock_connection)
+    with pool.connection() as conn:
+        conn.search(SEARCH_BASE, "(cn=user1)", SUBTREE, attributes=["cn"])
+        # Consumer time of a streamed result holds the connection
+        time.sleep(0.2)
+        conn.search(SEARCH_BASE, "(cn=user2)", SUBTREE, attributes=["cn"])
+    assert len(observed) == 2
+    assert all(latency < 0.2 and error is None for latency, error in observed)
+
+
+def test_early_generator_close_is_not_observed(mock_connection):
+    pool, observed = observed_pool(mock_connection)
+
+    def pages():
+        with pool.connection() as conn:
+            for i in range(3):
+                conn.search(SEARCH_BASE, f"(cn=user{i})", SUBTREE, attributes=["cn"])
+                yield conn.entries
+
+    iterator = pages()
+    next(iterator)
+    iterator.close()
+    assert [error for _, error in observed] == [None]
+    assert pool.stats["idle"] == 1
+
+
+def test_stale_connection_is_discarded_and_retried(mock_connection):
+    pool, observed = observed_pool(mock_connection)
+    calls = []
+
+    def operation(conn):
+        calls.append(conn)
+        if len(calls) == 1:
+            raise LDAPSocketReceiveError("socket closed")
+        return conn.search(SEARCH_BASE, "(cn=user1)", SUBTREE, attributes=["cn"])
+
+    assert pool.execute(operation)
+    assert calls[0] is not calls[1]
+    assert pool.stats["discarded"] == 1
+    assert len(observed) == 1
+
+
+def test_wait_timeout(mock_connection):
+    pool, _ = observed_pool(mock_connection, min_size=0, max_size=1, wait_timeout=0.05)
+    with pool.connection():
+        with pytest.raises(Exception, match="exhausted"):
+            with pool.connection():
+                pass
+
+
+def test_selector_latency_excludes_consumer_time(client):
+    ldap = client(pool_min_size=0)
+    for _ in ldap.iter_objects_search("group", "group", page_size=2, search_by_attrs_collection=("cn",)):
+        time.sleep(0.05)
+    stats = ldap.server_stats["benchmark"]
+    assert stats["requests"] >= 5
+    assert stats["latency"] < 0.05
+    assert stats["errors"] == 0
@@ -0,0 +1,96 @@
+import math
+from ldap3 import BASE
+from suite import Directory
+from tinyLDAP3.ranges import ldap_range_parse
+
+
+# AD `MaxValRange` emulated on the mock server
+MAX_VAL_RANGE = 3
+
+
+def max_val_range(conn) -> list[list[str]]:
+
+    """
+    Return at most `MAX_VAL_RANGE` values of `member` as `member;range=low-high`, the last range
+    as `member;range=low-*`.
+    :param conn:                        Mock Connection
+    :return:                            Requested Attributes of Each Search
+    """
+
+    search = conn.search
+    requests = []
+
+    def ranged_search(*args, **kwargs):
+        attributes = list(kwargs.get("attributes") or ())
+        requests.append(list(attributes))
+        ranges = {}
+        for i, attr in enumerate(attributes):
+            attr_range = ldap_range_parse(attr)
+            if attr_range is not None:
+                ranges[attr_range[0].lower()] = attr_range[1]
+                attributes[i] = attr_range[0]
+        result = search(*args, **{**kwargs, "attributes": attributes or kwargs.get("attributes")})
+        for entry in conn.response or ():
+            if entry.get("type") != "searchResEntry":
+                continue
+            for attrs in (entry["attributes"], entry["raw_attributes"]):
+                for key in [key for key in attrs if key.lower() == "member" and isinstance(attrs[key], list)]:
+                    values, low = attrs[key], ranges.get("member", 0)
+                    if "member" not in ranges and len(values) <= MAX_VAL_RANGE:
+                        continue
+                    high = low + MAX_VAL_RANGE - 1
+                    del attrs[key]
+                    if high >= len(values) - 1:
+                        attrs[f"{key};range={low}-*"] = values[low:]
+                    else:
+                        attrs[f"{key};range={low}-{high}"] = values[low:high + 1]
+        return result
+
+    conn.search = ranged_search
+    return requests
+
+
+def group_members(mock_connection, i: int) -> list[str]:
+    conn = mock_connection()
+    conn.search(Directory.group_dn(i), "(objectClass=*)", BASE, attributes=["member"])
+    return list(conn.response[0]["attributes"]["member"])
+
+
+def ranged_client(client):
+    ldap = client(pool_min_size=0)
+    with ldap._tinyLDAP3Client__connection_pool.connection() as conn:
+        requests = max_val_range(conn)
+    return ldap, requests
+
+
+def test_object_detail_completes_the_ranges(client, mock_connection):
+    members = group_members(mock_connection, 0)
+    assert len(members) > 2 * MAX_VAL_RANGE
+    ldap, requests = ranged_client(client)
+    result = ldap.object_detail("group", "cn", "group0", returned_attrs_collection=("cn", "member"))
+    assert result["member"] == members
+    # The first window is returned by the search, the following ones by base searches up to the `N-*` terminator
+    windows = math.ceil(len(members) / MAX_VAL_RANGE)
+    assert [request for request in requests if any(";range=" in attr for attr in request)] == [
+        [f"member;range={low}-*"] for low in range(MAX_VAL_RANGE, len(members), MAX_VAL_RANGE)
+    ]
+    assert len(requests) == windows
+
+
+def test_iter_attr_values_streams_the_ranges(client, mock_connection):
+    members = group_members(mock_connection, 1)
+    ldap, requests = ranged_client(client)
+    values = ldap.iter_attr_values(Directory.group_dn(1))
+    assert list(values) == members
+    assert values.ranges == math.ceil(len(members) / MAX_VAL_RANGE) and values.low is None and values.done
+    assert requests[-1] == [f"member;range={(values.ranges - 1) * MAX_VAL_RANGE}-*"]
+
+
+def test_iter_attr_values_close_releases_the_connection(client, mock_connection):
+    members = group_members(mock_connection, 2)
+    ldap, requests = ranged_client(client)
+    with ldap.iter_attr_values(Directory.group_dn(2)) as values:
+        assert [next(values) for _ in range(MAX_VAL_RANGE + 1)] == members[:MAX_VAL_RANGE + 1]
+    assert values.ranges == 2 and not values.done
+    assert requests == [["member;range=0-*"], [f"member;range={MAX_VAL_RANGE}-*"]]
+    assert ldap._tinyLDAP3Client__connection_pool.stats["idle"] == 1
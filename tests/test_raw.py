@@ -0,0 +1,51 @@
+import pytest
+from suite import Directory
+
+
+PERSON_ATTRS = ("cn", "department", "mail", "memberOf", "userAccountControl", "thumbnailPhoto")
+
+
+def compare(client, method, *args, **kwargs):
+    entries = getattr(client(), method)(*args, **kwargs)
+    raw = getattr(client(result_mode="raw"), method)(*args, **kwargs)
+    assert raw == entries
+    return raw
+
+
+def test_unknown_result_mode_is_rejected(client):
+    with pytest.raises(ValueError):
+        client(result_mode="rows")
+
+
+def test_object_detail_parity(client):
+    result = compare(client, "object_detail", "person", "sAMAccountName", "user000003",
+                     returned_attrs_collection=PERSON_ATTRS)
+    # Single values are unwrapped, multiple values are lists
+    assert result["cn"] == "user3" and len(result["memberOf"]) > 1
+
+
+def test_objects_search_parity(client):
+    result = compare(client, "objects_search", "group", "group", search_by_attrs_collection=("cn",),
+                     returned_attrs_collection=("cn", "member", "description"))
+    assert len(result) == 10
+
+
+def test_object_read_parity(client):
+    result = compare(client, "object_read", ("group",), Directory.group_dn(1),
+                     returned_attrs_collection=("cn", "member"))
+    assert result["cn"] == "group1"
+
+
+def test_objects_detail_many_parity(client):
+    result = compare(client, "objects_detail_many", "computer", "cn", ["ws000001", "ws000002"],
+                     returned_attrs_collection=("cn", "dNSHostName"))
+    assert len(result.objects) == 2
+
+
+def test_decoders_are_applied(client):
+    decoders = {"CN": str.upper}
+    entries = client(attr_decoders=decoders).object_detail("group", "cn", "group2", returned_attrs_collection=("cn",))
+    raw = client(result_mode="raw", attr_decoders=decoders).object_detail(
+        "group", "cn", "group2", returned_attrs_collection=("cn",)
+    )
+    assert raw == entries == {"cn": "GROUP2"}
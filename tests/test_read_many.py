@@ -0,0 +1,50 @@
+from suite import SEARCH_BASE, Directory
+from tinyLDAP3.schema import LdapObjectDefCache
+
+
+def count_searches(ldap) -> list[str]:
+    filters = []
+    with ldap._tinyLDAP3Client__connection_pool.connection() as conn:
+        search = conn.search
+
+        def counted_search(*args, **kwargs):
+            filters.append(kwargs.get("search_filter"))
+            return search(*args, **kwargs)
+        conn.search = counted_search
+    return filters
+
+
+def test_read_many_matches_object_read(client):
+    ldap = client(pool_min_size=0)
+    dns = [Directory.group_dn(i) for i in range(7)]
+    missing_dn = f"CN=missing,OU=Groups,{SEARCH_BASE}"
+    filters = count_searches(ldap)
+    # Repeated DNs are matched case and spacing insensitively and read once
+    objects = ldap.object_read_many(
+        ("group",), dns + [dns[0].upper().replace(",", ", "), missing_dn], returned_attrs_collection=("cn", "member"),
+        chunk_size=3
+    )
+    assert list(objects) == dns + [missing_dn] and objects[missing_dn] is None
+    assert len(filters) == 3
+    for dn in dns:
+        assert objects[dn] == ldap.object_read(("group",), dn, returned_attrs_collection=("cn", "member"))
+
+
+def test_cached_objects_are_not_read(client):
+    ldap = client(pool_min_size=0, cache_max_size=100)
+    filters = count_searches(ldap)
+    dns = [Directory.group_dn(i) for i in range(3)]
+    first = ldap.object_read_many(("group",), dns[:2], returned_attrs_collection=("cn",))
+    second = ldap.object_read_many(("group",), dns, returned_attrs_collection=("cn",))
+    assert second == {**first, dns[2]: {"cn": "group2"}}
+    assert len(filters) == 2 and dns[0] not in filters[1] and dns[2] in filters[1]
+
+
+def test_object_defs_are_cached_by_schema(mock_connection):
+    cache = LdapObjectDefCache()
+    conn = mock_connection()
+    object_def = cache.get(("group",), conn)
+    assert cache.get(("GROUP",), conn) is object_def and "sAMAccountName" in object_def
+    # A replaced schema rebuilds the definition
+    conn.server.attach_schema_info(conn.server.schema.from_json(conn.server.schema.to_json()))
+    assert cache.get(("group",), conn) is not object_def
@@ -0,0 +1,30 @@
+from tinyLDAP3.replica import LdapReplica
+
+
+# Exchange attributes of the default replicated attributes aren't in the mock schema
+REPLICA_ATTRS = {
+    "person": ("cn", "displayName", "mail", "sAMAccountName", "userPrincipalName"),
+    "group": ("cn", "description", "mail", "member", "sAMAccountName"),
+    "computer": ("cn", "dNSHostName", "operatingSystem", "sAMAccountName"),
+}
+
+
+def test_full_sync_and_search(client, tmp_path):
+    ldap = client(replica_path=str(tmp_path / "replica.db"), replica_attrs=REPLICA_ATTRS)
+    result = ldap.replica_sync()
+    assert result["mode"] == "full"
+    assert result["upserted"] == 120
+    assert ldap.replica_stats["objects"] == 120
+    groups = ldap.objects_search(
+        "group", "group1", search_by_attrs_collection=("cn",), returned_attrs_collection=("cn",), search_mode="prefix"
+    )
+    assert sorted(group["cn"] for group in groups) == ["group1"]
+
+
+def test_empty_prefix_falls_through(client, tmp_path):
+    ldap = client(replica_path=str(tmp_path / "replica.db"), replica_attrs=REPLICA_ATTRS)
+    ldap.replica_sync()
+    replica: LdapReplica = ldap._tinyLDAP3Client__replica
+    for search_mode in ("prefix", "anr", "contains"):
+        assert replica.search("person", "", ("cn",), search_mode, ("cn",)) is None
+    assert replica.search("person", "user1", ("cn",), "prefix", ("cn",))
@@ -0,0 +1,36 @@
+import pytest
+from tinyLDAP3.results import LdapResultSet
+
+
+def test_from_dicts_matches_attribute_names_case_insensitively():
+    result_set = LdapResultSet.from_dicts([{"cn": "a", "Mail": "a@x"}, {"CN": "b", "title": "t"}])
+    # Names are kept as first spelled, missing values are None
+    assert result_set.attrs == ("cn", "Mail", "title")
+    assert result_set.rows == [("a", "a@x", None), ("b", None, "t")]
+    assert LdapResultSet.from_dicts([{"CN": "a", "mail": "a@x"}], attrs=("cn",)).rows == [("a",)]
+
+
+def test_row_column_and_dictionaries_access():
+    dicts = ({"cn": "a", "mail": "a@x"}, {"cn": "b", "mail": None})
+    result_set = LdapResultSet.from_dicts(dicts)
+    assert len(result_set) == 2 and result_set[0] == ("a", "a@x") and list(result_set) == result_set.rows
+    assert result_set.column("MAIL") == ["a@x", None]
+    assert result_set.row_dict(1) == dicts[1] and result_set.to_dicts() == dicts
+    with pytest.raises(KeyError):
+        result_set.column("title")
+
+
+def test_sort_keeps_missing_values_last():
+    result_set = LdapResultSet.from_dicts([{"cn": "b"}, {"cn": None}, {"cn": "a"}])
+    assert result_set.sort("CN").column("cn") == ["a", "b", None]
+    assert result_set.sort("cn", reverse=True).column("cn") == ["b", "a", None]
+
+
+def test_compact_search_matches_the_dictionaries(client):
+    ldap = client()
+    kwargs = {"search_by_attrs_collection": ("cn",), "returned_attrs_collection": ("cn", "description", "member")}
+    items = ldap.objects_search("group", "group", order_by="cn", **kwargs)
+    result_set = ldap.objects_search("group", "group", order_by="cn", compact=True, **kwargs)
+    assert isinstance(result_set, LdapResultSet)
+    assert result_set.attrs == ("cn", "description", "member")
+    assert result_set.to_dicts() == items
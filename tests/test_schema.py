@@ -0,0 +1,69 @@
+import json
+from ldap3 import MOCK_SYNC, NONE, Connection, Server
+from suite import Directory
+from tinyLDAP3.schema import LDAP_SCHEMA_CACHE_VERSION, LdapSchemaCache
+
+
+STAMP = ("CN=Aggregate,CN=Schema,CN=Configuration,DC=example,DC=com", "20240101000000.0Z")
+
+
+def schema_cache(path, stamp=STAMP, **kwargs) -> LdapSchemaCache:
+    cache = LdapSchemaCache(str(path), **kwargs)
+    # The mock server has no subschema entry: the version is read from the stamp
+    cache._LdapSchemaCache__read_stamp = lambda conn: stamp
+    return cache
+
+
+def offline_connection() -> Connection:
+    return Connection(Server("offline", get_info=NONE), client_strategy=MOCK_SYNC)
+
+
+def test_schema_is_persisted_and_loaded(mock_connection, tmp_path):
+    path = tmp_path / "schema.json"
+    cache = schema_cache(path)
+    cache.attach(mock_connection())
+    assert cache.stats["downloaded"] == 1
+    data = json.loads(path.read_text())
+    assert data["version"] == LDAP_SCHEMA_CACHE_VERSION and tuple(data["stamp"]) == STAMP
+    # A new process loads the file and attaches the schema without downloading it
+    cache = schema_cache(path)
+    conn = offline_connection()
+    cache.attach(conn)
+    assert cache.stats == {"loaded": 1, "downloaded": 0, "checked": 1, "attached": 1}
+    assert conn.server.schema is not None and conn.server.info is not None
+
+
+def test_changed_schema_is_downloaded_again(mock_connection, tmp_path):
+    path = tmp_path / "schema.json"
+    schema_cache(path).attach(mock_connection())
+    cache = schema_cache(path, stamp=(STAMP[0], "20250101000000.0Z"))
+    cache.attach(mock_connection())
+    assert cache.stats["loaded"] == 1 and cache.stats["downloaded"] == 1
+    assert json.loads(path.read_text())["stamp"][1] == "20250101000000.0Z"
+
+
+def test_corrupted_file_is_ignored(mock_connection, tmp_path):
+    path = tmp_path / "schema.json"
+    path.write_text("{")
+    cache = schema_cache(path)
+    cache.attach(mock_connection())
+    assert cache.stats["loaded"] == 0 and cache.stats["downloaded"] == 1
+    assert json.loads(path.read_text())["version"] == LDAP_SCHEMA_CACHE_VERSION
+
+
+def test_version_is_checked_after_the_interval(mock_connection, tmp_path):
+    cache = schema_cache(tmp_path / "schema.json")
+    for _ in range(3):
+        cache.attach(mock_connection())
+    assert cache.stats["checked"] == 1
+    cache.invalidate()
+    cache.attach(mock_connection())
+    assert cache.stats["checked"] == 2 and cache.stats["downloaded"] == 2
+
+
+def test_client_uses_the_schema_cache(client, tmp_path):
+    ldap = client(schema_cache_path=str(tmp_path / "schema.json"))
+    assert ldap.object_read(("group",), Directory.group_dn(1), returned_attrs_collection=("cn",)) == {"cn": "group1"}
+    assert ldap.schema_cache_stats["downloaded"] == 1 and (tmp_path / "schema.json").exists()
+    assert client().schema_cache_stats is None
+
@@ -0,0 +1,64 @@
+import time
+import pytest
+from ldap3 import Server
+from tinyLDAP3.selector import LdapServerSelector
+
+
+def selector(**kwargs) -> LdapServerSelector:
+    return LdapServerSelector([Server("primary"), Server("secondary")], **kwargs)
+
+
+def test_least_latency_selection():
+    hosts = selector(strategy="least_latency")
+    hosts.record("primary", 0.5)
+    hosts.record("secondary", 0.1)
+    assert hosts.select().host == "secondary"
+    assert hosts.select(exclude=("secondary",)).host == "primary"
+    assert hosts.select(exclude=("primary", "secondary")) is None
+
+
+def test_consecutive_failures_eject_the_host():
+    hosts = selector(failure_threshold=2)
+    hosts.record("primary", 0.1, failed=True)
+    hosts.record("primary", 0.1)
+    hosts.record("primary", 0.1, failed=True)
+    assert hosts.available("primary")
+    hosts.record("primary", 0.1, failed=True)
+    assert not hosts.available("primary")
+    assert {hosts.select().host for _ in range(10)} == {"secondary"}
+    stats = hosts.stats["primary"]
+    assert stats["state"] == "open"
+    assert (stats["requests"], stats["errors"], stats["ejections"]) == (4, 3, 1)
+    assert stats["latency"] == pytest.approx(0.1)
+
+
+def test_all_ejected_fails_open_and_success_readmits():
+    hosts = selector(failure_threshold=1)
+    hosts.record("primary", 0.1, failed=True)
+    hosts.record("secondary", 0.1, failed=True)
+    assert hosts.select().host == "primary"
+    hosts.record("primary", 0.1)
+    assert hosts.stats["primary"]["state"] == "closed"
+    assert hosts.select().host == "primary"
+
+
+def test_unknown_hosts_are_ignored():
+    hosts = selector()
+    hosts.record("unknown", 0.1, failed=True)
+    assert hosts.available("unknown")
+    assert set(hosts.stats) == {"primary", "secondary"}
+
+
+def test_connect_time_isnt_a_latency_sample():
+    hosts = selector(strategy="least_latency")
+    hosts.record("primary", 0.01)
+
+    def open_connection(server):
+        time.sleep(0.05)
+        return server
+    assert hosts.connect(open_connection, Server("primary")).host == "primary"
+    stats = hosts.stats["primary"]
+    assert stats["latency"] == pytest.approx(0.01) and stats["requests"] == 2
+    # A cold host isn't penalised by the connect time of its first connection
+    hosts.connect(open_connection, Server("secondary"))
+    assert hosts.stats["secondary"]["latency"] is None
@@ -0,0 +1,142 @@
+import pytest
+from ldap3.core.exceptions import LDAPException
+from pyasn1.codec.ber import decoder, encoder
+from tinyLDAP3 import client as client_module
+from tinyLDAP3.sorting import (
+    LDAP_SERVER_SORT_CONTROL_OID,
+    LDAP_SERVER_SORT_RESPONSE_OID,
+    LDAP_VLV_REQUEST_CONTROL_OID,
+    LDAP_VLV_RESPONSE_CONTROL_OID,
+    LdapVlvResponse,
+    _LdapSortKeyList,
+    _LdapSortResult,
+    _LdapVlvRequest,
+    _LdapVlvResponse,
+    ldap_server_sort_applied,
+    ldap_server_sort_control,
+    ldap_vlv_control,
+    ldap_vlv_response
+)
+
+
+GROUP_ATTRS = ("cn", "description")
+
+
+def sort_result(code: int) -> dict:
+    value = _LdapSortResult()
+    value["sortResult"] = code
+    return {"value": encoder.encode(value)}
+
+
+def vlv_result(position: int, count: int, code: int = 0, context_id: bytes = None) -> dict:
+    value = _LdapVlvResponse()
+    value["targetPosition"], value["contentCount"], value["virtualListViewResult"] = position, count, code
+    if context_id is not None:
+        value["contextID"] = context_id
+    return {"value": encoder.encode(value)}
+
+
+def test_sort_control_encoding():
+    control = ldap_server_sort_control("cn", reverse=True, ordering_rule="2.5.13.3", critical=True)
+    assert str(control["controlType"]) == LDAP_SERVER_SORT_CONTROL_OID and bool(control["criticality"])
+    sort_keys, _ = decoder.decode(bytes(control["controlValue"]), asn1Spec=_LdapSortKeyList())
+    assert str(sort_keys[0]["attributeType"]) == "cn" and bool(sort_keys[0]["reverseOrder"])
+    assert str(sort_keys[0]["orderingRule"]) == "2.5.13.3"
+
+
+def test_vlv_control_encoding():
+    control = ldap_vlv_control(1, 2, offset=5, context_id=b"ctx")
+    assert str(control["controlType"]) == LDAP_VLV_REQUEST_CONTROL_OID and bool(control["criticality"])
+    request, _ = decoder.decode(bytes(control["controlValue"]), asn1Spec=_LdapVlvRequest())
+    assert (int(request["beforeCount"]), int(request["afterCount"])) == (1, 2)
+    assert int(request["target"]["byOffset"]["offset"]) == 5 and bytes(request["contextID"]) == b"ctx"
+    request, _ = decoder.decode(bytes(ldap_vlv_control(0, 1, value="m")["controlValue"]), asn1Spec=_LdapVlvRequest())
+    assert str(request["target"]["greaterThanOrEqual"]) == "m" and not request["contextID"].isValue
+    for target in ({}, {"offset": 1, "value": "m"}):
+        with pytest.raises(ValueError):
+            ldap_vlv_control(0, 1, **target)
+
+
+def test_response_controls_decoding():
+    assert ldap_server_sort_applied({"controls": {LDAP_SERVER_SORT_RESPONSE_OID: sort_result(0)}})
+    # Unsupported sort attribute, no control (the server ignored the request)
+    assert not ldap_server_sort_applied({"controls": {LDAP_SERVER_SORT_RESPONSE_OID: sort_result(53)}})
+    assert not ldap_server_sort_applied({})
+    assert ldap_vlv_response({"controls": {LDAP_VLV_RESPONSE_CONTROL_OID: vlv_result(3, 10, context_id=b"c")}}) == \
+        LdapVlvResponse(target_position=3, content_count=10, context_id=b"c")
+    with pytest.raises(LDAPException):
+        ldap_vlv_response({"controls": {LDAP_VLV_RESPONSE_CONTROL_OID: vlv_result(0, 10, code=61)}})
+    with pytest.raises(LDAPException):
+        ldap_vlv_response({"controls": {}})
+
+
+def sort_and_list(ldap, supported: bool = True) -> None:
+
+    """
+    Emulate the Server Side Sort & Virtual List View controls on a pooled mock connection.
+    :param ldap:                        Client
+    :param supported:                   Controls Are Supported or Ignored by the Server
+    :return:
+    """
+
+    with ldap._tinyLDAP3Client__connection_pool.connection() as conn:
+        search = conn.search
+
+        def controlled_search(*args, **kwargs):
+            controls = {str(control["controlType"]): bytes(control["controlValue"]) for control in
+                        kwargs.get("controls") or ()}
+            # The mock can't run searches with the controls it doesn't support
+            result = search(*args, **{**kwargs, "controls": None})
+            if not supported or LDAP_SERVER_SORT_CONTROL_OID not in controls:
+                return result
+            sort_keys, _ = decoder.decode(controls[LDAP_SERVER_SORT_CONTROL_OID], asn1Spec=_LdapSortKeyList())
+            attr_name = str(sort_keys[0]["attributeType"])
+
+            def key(entry: dict) -> str:
+                return str(entry["attributes"][attr_name]).lower()
+            entries = sorted((entry for entry in conn.response if entry["type"] == "searchResEntry"), key=key)
+            response_controls = {LDAP_SERVER_SORT_RESPONSE_OID: sort_result(0)}
+            if LDAP_VLV_REQUEST_CONTROL_OID in controls:
+                request, _ = decoder.decode(controls[LDAP_VLV_REQUEST_CONTROL_OID], asn1Spec=_LdapVlvRequest())
+                target = request["target"]
+                if target.getName() == "byOffset":
+                    position = int(target["byOffset"]["offset"])
+                else:
+                    value = str(target["greaterThanOrEqual"]).lower()
+                    position = next((i for i, entry in enumerate(entries, 1) if key(entry) >= value), len(entries))
+                low = max(position - int(request["beforeCount"]) - 1, 0)
+                response_controls[LDAP_VLV_RESPONSE_CONTROL_OID] = vlv_result(position, len(entries), context_id=b"c")
+                entries = entries[low:position + int(request["afterCount"])]
+            conn.response[:] = entries
+            conn.result["controls"] = response_controls
+            return result
+        conn.search = controlled_search
+
+
+def test_server_sorted_search_is_not_sorted_again(client, monkeypatch):
+    ldap = client(pool_min_size=0)
+    # The server ignores the sort control: entries are sorted locally
+    sort_and_list(ldap, supported=False)
+    locally_sorted = ldap.objects_search("group", "group", order_by="cn", returned_attrs_collection=GROUP_ATTRS,
+                                         server_sort=True)
+    assert [values["cn"] for values in locally_sorted] == [f"group{i}" for i in range(10)]
+    ldap = client(pool_min_size=0)
+    sort_and_list(ldap)
+
+    def local_sort(*args, **kwargs):
+        raise AssertionError("Server sorted entries are sorted again.")
+    monkeypatch.setattr(client_module, "ldap_sort_items", local_sort)
+    assert ldap.objects_search("group", "group", order_by="cn", returned_attrs_collection=GROUP_ATTRS,
+                               server_sort=True) == locally_sorted
+
+
+def test_windows_by_offset_and_by_value(client):
+    ldap = client(pool_min_size=0)
+    sort_and_list(ldap)
+    window = ldap.objects_window("group", "group", offset=2, limit=3, order_by="cn",
+                                 returned_attrs_collection=GROUP_ATTRS)
+    assert [values["cn"] for values in window.items] == ["group2", "group3", "group4"]
+    assert (window.offset, window.total, window.context_id) == (2, 10, b"c")
+    window = ldap.objects_window("group", "group", limit=3, order_by="cn", around_value="group5", before=1,
+                                 context_id=window.context_id, returned_attrs_collection=GROUP_ATTRS)
+    assert [values["cn"] for values in window.items] == ["group4", "group5", "group6"] and window.offset == 4